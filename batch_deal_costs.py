@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Cost candidate flips in bulk from a CSV or JSONL list export
+
+Usage:
+    python batch_deal_costs.py deals.csv                       # JSONL to stdout
+    python batch_deal_costs.py deals.jsonl --output costs.csv --workers 8 --chunk-size 2000
+
+Input rows need state, county, purchase_price, arv and rehab (an optional id is passed
+through); CSV input must have one record per line. Each output row has the county third-party
+fees, title insurance, transfer tax and holding costs, using the same fee templates as
+generate_counties.py plus data/stateDefaults.json.
+Deals are costed in chunks across a process pool with a bounded number of chunks in flight, so
+memory stays flat however large the input is. Throughput is reported on stderr.
+"""
+
+import argparse
+import csv
+import io
+import json
+import math
+import os
+import sys
+import time
+from collections import deque
+from multiprocessing import Pool
+
+from county_cost_engine import FEE_FIELDS, alias_query_keys, build_name_index
+from generate_counties import COUNTY_DATA_PATH, build_matrix, load_county_data
+
+STATE_DEFAULTS_PATH = os.path.join('data', 'stateDefaults.json')
+DEFAULT_HOLDING_MONTHS = 6
+DEFAULT_CHUNK_SIZE = 1000
+PROGRESS_INTERVAL = 5.0  # seconds between throughput reports
+
+OUTPUT_FIELDS = [
+    'id', 'state', 'county', 'resolved_county', 'match', 'purchase_price', 'arv', 'rehab',
+    'third_party_costs', 'title_insurance', 'transfer_tax', 'holding_costs', 'total_costs',
+    'all_in_cost', 'spread', 'error',
+]
+
+# Columns read from the input; camelCase names from the app's exports are accepted too
+INPUT_ALIASES = {
+    'purchasePrice': 'purchase_price',
+    'rehabBudget': 'rehab',
+}
+
+# Key used to pass unparseable input lines through to the output as errors
+PARSE_ERROR = '_parse_error'
+
+def js_round(value):
+    """Math.round semantics (half up), matching the estimates in utils/stateHoldingCosts.ts"""
+    return math.floor(value + 0.5)
+
+def build_cost_tables(county_data, state_defaults):
+    """
+    Per-state lookup tables shared by every worker:
+    {state: (default_costs, {county_name: costs}, {alias: county_name})} plus stateDefaults
+    """
+    matrix = build_matrix(county_data)
+    states = {}
+    for state_code, _, counties, default in matrix.states():
+        by_name = dict(counties)
+        names = [name for name, _ in counties]
+        aliases = {key: names[row] for key, row in build_name_index(names)}
+        states[state_code] = (default, by_name, aliases)
+    return {'states': states, 'state_defaults': state_defaults}
+
+def resolve_county(tables, state, county):
+    """Return (county_costs, resolved_name, match) with match in exact/alias/default/none"""
+    entry = tables['states'].get(state)
+    if entry is None:
+        return None, '', 'none'
+    default, by_name, aliases = entry
+    if county:
+        if county in by_name:
+            return by_name[county], county, 'exact'
+        name = next((aliases[key] for key in alias_query_keys(county) if key in aliases), None)
+        if name:
+            return by_name[name], name, 'alias'
+    return default, 'Default', 'default'
+
+def parse_amount(value):
+    """Parse a dollar amount from CSV/JSON ('$250,000' and '' included)"""
+    if value is None or value == '':
+        return 0.0
+    if isinstance(value, (int, float)):
+        return float(value)
+    return float(str(value).replace('$', '').replace(',', '').strip())
+
+def cost_deal(tables, deal, holding_months):
+    """Cost one deal; bad rows come back with an error instead of raising"""
+    if PARSE_ERROR in deal:
+        return {'error': deal[PARSE_ERROR]}
+    deal = {INPUT_ALIASES.get(key, key): value for key, value in deal.items()}
+    state = str(deal.get('state') or '').strip().upper()
+    county = str(deal.get('county') or '').strip()
+    result = {'id': deal.get('id', ''), 'state': state, 'county': county}
+    try:
+        price = parse_amount(deal.get('purchase_price'))
+        arv = parse_amount(deal.get('arv'))
+        rehab = parse_amount(deal.get('rehab'))
+    except ValueError as e:
+        result['error'] = f"invalid amount: {e}"
+        return result
+
+    county_costs, resolved, match = resolve_county(tables, state, county)
+    state_defaults = tables['state_defaults'].get(state)
+    if county_costs is None and state_defaults is None:
+        result['error'] = f"unknown state '{state}'"
+        return result
+
+    third_party = 0
+    county_title_rate = None
+    if county_costs is not None:
+        for (key, _), value in zip(FEE_FIELDS, county_costs):
+            if key == 'title':
+                county_title_rate = value
+            else:
+                third_party += value
+
+    if state_defaults is not None:
+        # States priced from a rate table (PA) have no flat rate; use the county title percentage
+        title_rate = state_defaults['titleInsuranceRate'] / 100 or county_title_rate or 0
+        title = price * title_rate
+        transfer_tax = price * state_defaults['transferTaxRate'] / 100
+        monthly_taxes = js_round(price * state_defaults['propertyTaxRate'] / 100 / 12)
+        monthly_insurance = js_round(price / 100000 * state_defaults['insurancePerMonthPer100k'])
+    else:
+        title = price * (county_title_rate or 0)
+        transfer_tax = 0.0
+        monthly_taxes = monthly_insurance = 0
+    holding = (monthly_taxes + monthly_insurance) * holding_months
+    total = third_party + title + transfer_tax + holding
+    all_in = price + rehab + total
+
+    result.update({
+        'resolved_county': resolved,
+        'match': match,
+        'purchase_price': price,
+        'arv': arv,
+        'rehab': rehab,
+        'third_party_costs': third_party,
+        'title_insurance': round(title, 2),
+        'transfer_tax': round(transfer_tax, 2),
+        'holding_costs': holding,
+        'total_costs': round(total, 2),
+        'all_in_cost': round(all_in, 2),
+        'spread': round(arv - all_in, 2),
+    })
+    return result
+
+# ---------------------------------------------------------------------------
+# Input / output
+# ---------------------------------------------------------------------------
+
+def detect_format(path, explicit):
+    """csv or jsonl, from --*-format or the file extension"""
+    if explicit:
+        return explicit
+    return 'csv' if path.lower().endswith('.csv') else 'jsonl'
+
+def parse_lines(lines, fmt, header):
+    """Yield deal dicts from raw CSV (one record per line) or JSONL lines"""
+    if fmt == 'csv':
+        yield from csv.DictReader(lines, fieldnames=header)
+        return
+    for line in lines:
+        line = line.strip()
+        if line:
+            try:
+                deal = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield {PARSE_ERROR: f"invalid JSON: {e}"}
+                continue
+            yield deal if isinstance(deal, dict) else {PARSE_ERROR: 'expected a JSON object'}
+
+def format_results(results, fmt):
+    """Serialize costed deals as CSV rows (no header) or JSONL"""
+    if fmt == 'csv':
+        buffer = io.StringIO()
+        csv.DictWriter(buffer, OUTPUT_FIELDS, extrasaction='ignore').writerows(results)
+        return buffer.getvalue()
+    return ''.join(json.dumps(result) + '\n' for result in results)
+
+def read_header(handle, fmt):
+    """Consume and return the CSV header row (None for JSONL)"""
+    if fmt != 'csv':
+        return None
+    return next(csv.reader([handle.readline()]), [])
+
+# ---------------------------------------------------------------------------
+# Worker pool
+# ---------------------------------------------------------------------------
+
+# Per-process state set by _init_worker: (tables, holding_months, input format, CSV header, output format)
+_worker = None
+
+def _init_worker(tables, holding_months, input_format, header, output_format):
+    global _worker
+    _worker = (tables, holding_months, input_format, header, output_format)
+
+def cost_lines(lines):
+    """
+    Parse, cost and serialize one chunk of raw input lines inside a worker
+    Returns (serialized output, deal count) so the parent only moves text
+    """
+    tables, holding_months, input_format, header, output_format = _worker
+    results = [cost_deal(tables, deal, holding_months) for deal in parse_lines(lines, input_format, header)]
+    return format_results(results, output_format), len(results)
+
+def chunked(rows, size):
+    """Group an iterable into lists of at most size items"""
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def bounded_imap(pool, func, chunks, max_pending):
+    """
+    Ordered pool.imap that never reads more than max_pending chunks ahead
+    (Pool.imap drains its input eagerly, which defeats streaming on large files)
+    """
+    pending = deque()
+    for chunk in chunks:
+        pending.append(pool.apply_async(func, (chunk,)))
+        if len(pending) >= max_pending:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+def run(in_handle, out_handle, tables, holding_months, input_format, output_format,
+        workers, chunk_size, log=sys.stderr):
+    """Cost every deal and stream the results; returns (deal count, elapsed seconds)"""
+    start = last_report = time.perf_counter()
+    count = 0
+
+    def report(final=False):
+        elapsed = time.perf_counter() - start
+        rate = count / elapsed if elapsed > 0 else 0.0
+        label = 'Done' if final else 'Progress'
+        print(f"  - {label}: {count:,} deals in {elapsed:.1f}s ({rate:,.0f} deals/sec)", file=log)
+
+    header = read_header(in_handle, input_format)
+    if output_format == 'csv':
+        csv.writer(out_handle).writerow(OUTPUT_FIELDS)
+    init_args = (tables, holding_months, input_format, header, output_format)
+    chunks = chunked(in_handle, chunk_size)
+    if workers <= 1:
+        _init_worker(*init_args)
+        results = map(cost_lines, chunks)
+        pool = None
+    else:
+        pool = Pool(workers, initializer=_init_worker, initargs=init_args)
+        results = bounded_imap(pool, cost_lines, chunks, max_pending=workers * 2)
+    try:
+        for text, costed in results:
+            out_handle.write(text)
+            count += costed
+            now = time.perf_counter()
+            if now - last_report >= PROGRESS_INTERVAL:
+                report()
+                last_report = now
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    report(final=True)
+    return count, time.perf_counter() - start
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('input', help="CSV or JSONL of deals ('-' for stdin)")
+    parser.add_argument('--output', default='-', help="CSV or JSONL to write ('-' for stdout, the default)")
+    parser.add_argument('--input-format', choices=['csv', 'jsonl'], help='default: from the file extension')
+    parser.add_argument('--output-format', choices=['csv', 'jsonl'], help='default: from the file extension')
+    parser.add_argument('--holding-months', type=int, default=DEFAULT_HOLDING_MONTHS,
+                        help=f'months of property tax and insurance (default: {DEFAULT_HOLDING_MONTHS})')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='worker processes; 1 costs in-process (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f'deals per worker task (default: {DEFAULT_CHUNK_SIZE})')
+    parser.add_argument('--county-data', default=COUNTY_DATA_PATH, help='county database JSON')
+    parser.add_argument('--state-defaults', default=STATE_DEFAULTS_PATH, help='state defaults JSON')
+    args = parser.parse_args(argv)
+
+    with open(args.state_defaults, 'r') as f:
+        state_defaults = json.load(f)
+    tables = build_cost_tables(load_county_data(args.county_data), state_defaults)
+
+    in_handle = sys.stdin if args.input == '-' else open(args.input, 'r', newline='')
+    out_handle = sys.stdout if args.output == '-' else open(args.output, 'w', newline='', buffering=io.DEFAULT_BUFFER_SIZE * 16)
+    try:
+        print(f"✓ Costing deals from {args.input} with {args.workers} worker(s)", file=sys.stderr)
+        run(
+            in_handle, out_handle, tables, args.holding_months,
+            detect_format(args.input, args.input_format), detect_format(args.output, args.output_format),
+            args.workers, args.chunk_size,
+        )
+    finally:
+        if in_handle is not sys.stdin:
+            in_handle.close()
+        if out_handle is not sys.stdout:
+            out_handle.close()
+
+if __name__ == '__main__':
+    main()
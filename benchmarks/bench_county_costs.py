@@ -0,0 +1,462 @@
+#!/usr/bin/env python3
+"""
+Benchmark the county-cost generation and lookup pipeline
+
+Usage (from the repo root):
+    python benchmarks/bench_county_costs.py                      # compare against the baseline
+    python benchmarks/bench_county_costs.py --update-baseline    # record a new baseline
+    python benchmarks/bench_county_costs.py --scales 1,10 --formats columnar,split --lookups 50000 --repeats 3
+
+For each scale (1x, 10x, 100x the real county_data.json) and output format this builds a
+synthetic input. One child process runs the generator (load, compute, then emit+write streamed
+through write_stream / write_split_states exactly as generate_counties.py does) and records the
+phase times, output bytes, gzip bytes and the generator's peak RSS. A second child loads the
+emitted artifact back and times a batch of random state/county lookups.
+The split format is the --split-states manifest plus per-state chunks that
+utils/thirdPartyCosts.ts loads; its chunks are loaded lazily on first lookup, like the app does.
+Every phase time is the best of --repeats runs and end_to_end_s is the sum of those bests.
+Each run is bracketed by a short calibration workload, so a metric only counts as a regression
+if it is slower in wall time and relative to the host's speed around it, by more than both the
+threshold and the repeat-to-repeat spread of this run and the baseline's.
+Lookups are compared per lookup, and baseline entries are keyed by lookup count.
+Results are written as JSON and compared with benchmarks/baseline.json.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import platform
+import random
+import re
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import generate_counties  # noqa: E402
+from county_cost_engine import FEE_FIELDS, FIELD_SCALES  # noqa: E402
+
+BASELINE_PATH = os.path.join(REPO_ROOT, 'benchmarks', 'baseline.json')
+DEFAULT_SCALES = '1,10,100'
+SPLIT_FORMAT = 'split'
+DEFAULT_FORMATS = f'object,columnar,{SPLIT_FORMAT}'
+DEFAULT_LOOKUPS = 100000
+DEFAULT_REPEATS = 5
+MISS_RATE = 0.1  # share of lookups that ask for a county that does not exist
+SEED = 1234
+
+# Metrics compared against the baseline; lower is better for all of them
+COMPARED_METRICS = [
+    'load_s', 'compute_s', 'emit_write_s', 'end_to_end_s', 'output_bytes', 'gzip_bytes', 'peak_rss_kb',
+    'artifact_load_s', 'state_load_s', 'lookup_us', 'artifact_peak_rss_kb',
+]
+REGRESSION_THRESHOLD = 0.10  # flag metrics more than 10% worse than baseline
+# Timings (*_s) must also be this many seconds worse: sub-millisecond phases jitter by more than 10%
+TIME_NOISE_FLOOR_S = 0.002
+
+# ---------------------------------------------------------------------------
+# Synthetic inputs
+# ---------------------------------------------------------------------------
+
+def synthesize_county_data(county_data, scale):
+    """county_data with every state's county list repeated scale times under distinct names"""
+    if scale == 1:
+        return county_data
+    synthetic = {}
+    for state_code, state_info in county_data.items():
+        counties = [
+            dict(county, name=f"{county['name']} {copy}" if copy else county['name'])
+            for copy in range(scale)
+            for county in state_info.get('counties', [])
+        ]
+        synthetic[state_code] = dict(state_info, counties=counties)
+    return synthetic
+
+# ---------------------------------------------------------------------------
+# Artifact readers (Python stand-ins for the TypeScript accessors)
+# ---------------------------------------------------------------------------
+
+OBJECT_STATE_RE = re.compile(r"^  '([A-Z]{2})': \{$")
+OBJECT_ENTRY_RE = re.compile(r"^    '((?:[^'\\]|\\.)*)': \{$")
+OBJECT_FIELD_RE = re.compile(r'(\w+): ([0-9.]+)')
+
+def load_object_artifact(path):
+    """Parse an object-literal module into {state: {county: costs}}"""
+    table = {}
+    state = county = None
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            match = OBJECT_STATE_RE.match(line)
+            if match:
+                state = match.group(1)
+                table[state] = {}
+                continue
+            match = OBJECT_ENTRY_RE.match(line)
+            if match and state:
+                county = match.group(1).replace("\\'", "'")
+                table[state][county] = {}
+                continue
+            if county and line.startswith('      '):
+                table[state][county].update((k, float(v)) for k, v in OBJECT_FIELD_RE.findall(line))
+            elif line.startswith('    }'):
+                county = None
+    return table
+
+def object_lookup(table, state, county):
+    costs = table.get(state)
+    if costs is None:
+        return None
+    return costs.get(county) or costs.get('Default')
+
+class ColumnarArtifact:
+    """Decoded columnar module with the same lookup rules as its TypeScript accessor"""
+
+    def __init__(self, path):
+        consts = generate_counties.read_columnar_module(path)
+        scales = [FIELD_SCALES.get(key, 1) for key, _ in FEE_FIELDS]
+        self.fields = consts['FIELDS']
+        self.columns = [generate_counties.unpack_column(c, s) for c, s in zip(consts['COUNTY_COLUMNS'], scales)]
+        self.defaults = [generate_counties.unpack_column(c, s) for c, s in zip(consts['DEFAULT_COLUMNS'], scales)]
+        self.offsets = consts['STATE_OFFSETS']
+        self.names = consts['COUNTY_NAMES']
+        self.state_index = {code: i for i, code in enumerate(consts['STATE_CODES'])}
+        self.rows_by_state = {}
+
+    def lookup(self, state, county):
+        s = self.state_index.get(state)
+        if s is None:
+            return None
+        rows = self.rows_by_state.get(s)
+        if rows is None:
+            rows = {self.names[r]: r for r in range(self.offsets[s], self.offsets[s + 1])}
+            self.rows_by_state[s] = rows
+        row = rows.get(county)
+        if row is None:
+            return dict(zip(self.fields, (column[s] for column in self.defaults)))
+        return dict(zip(self.fields, (column[row] for column in self.columns)))
+
+def read_chunk_consts(path):
+    """{NAME: value} for the single-line `export const NAME: type = <json>;` lines of a chunk"""
+    consts = {}
+    with open(path, 'r') as f:
+        for line in f:
+            if line.startswith('export const ') and line.rstrip().endswith(';') and ' = ' in line:
+                declaration, value = line.split(' = ', 1)
+                consts[declaration[len('export const '):].split(':', 1)[0]] = json.loads(value.rstrip().rstrip(';'))
+    return consts
+
+MANIFEST_ENTRY_RE = re.compile(r"^  '([A-Z0-9]{2})': (.*),$")
+
+class SplitArtifact:
+    """Manifest plus lazily loaded state chunks, looked up like utils/thirdPartyCosts.ts does"""
+
+    def __init__(self, out_dir):
+        self.out_dir = out_dir
+        self.defaults = {}
+        self.chunked = set()
+        block = None
+        with open(os.path.join(out_dir, 'manifest.ts'), 'r') as f:
+            for line in f:
+                if line.startswith('export const '):
+                    block = line[len('export const '):].split(':', 1)[0]
+                    continue
+                match = MANIFEST_ENTRY_RE.match(line.rstrip('\n'))
+                if match and block == 'STATE_DEFAULTS':
+                    self.defaults[match.group(1)] = json.loads(match.group(2))
+                elif match and block == 'STATE_CHUNKS':
+                    self.chunked.add(match.group(1))
+        self.fields = [field for _, field in FEE_FIELDS]
+        self.scales = [FIELD_SCALES.get(key, 1) for key, _ in FEE_FIELDS]
+        self.states = {}
+        self.state_loads = []
+
+    def load_state(self, state):
+        start = time.perf_counter()
+        consts = read_chunk_consts(os.path.join(self.out_dir, f'{state}.ts'))
+        columns = [generate_counties.unpack_column(c, s) for c, s in zip(consts['COUNTY_COLUMNS'], self.scales)]
+        rows = {name: row for row, name in enumerate(consts['COUNTY_NAMES'])}
+        self.states[state] = (rows, columns)
+        self.state_loads.append(time.perf_counter() - start)
+        return self.states[state]
+
+    def lookup(self, state, county):
+        default = self.defaults.get(state)
+        if default is None:
+            return None
+        if state in self.chunked:
+            rows, columns = self.states.get(state) or self.load_state(state)
+            row = rows.get(county)
+            if row is not None:
+                return dict(zip(self.fields, (column[row] for column in columns)))
+        return dict(zip(self.fields, default))
+
+def build_queries(county_data, count):
+    """Deterministic random (state, county) lookups, MISS_RATE of them misses"""
+    rng = random.Random(SEED)
+    pairs = [(code, c['name']) for code, info in county_data.items() for c in info.get('counties', [])]
+    states = sorted(county_data)
+    queries = []
+    for _ in range(count):
+        if rng.random() < MISS_RATE:
+            queries.append((rng.choice(states), 'Nonexistent County'))
+        else:
+            queries.append(rng.choice(pairs))
+    return queries
+
+# ---------------------------------------------------------------------------
+# One measured run (executed in a fresh process for a clean peak RSS)
+# ---------------------------------------------------------------------------
+
+CALIBRATION_LOOPS = 30000
+
+def calibrate():
+    """
+    Best-of-three time of a fixed pure-Python workload (dict, string and arithmetic ops)
+    Shared and throttled hosts swing in speed for seconds at a time, so every timed run is
+    bracketed by calibrations and the baseline is compared on time relative to them
+    """
+    times = []
+    for _ in range(3):
+        start = time.perf_counter()
+        table = {}
+        for i in range(CALIBRATION_LOOPS):
+            table[str(i)] = i * 3 % 7
+        sum(table.values())
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def spread(times):
+    """Relative spread of repeated timings: how far a best-of-repeats can move between runs"""
+    return (max(times) - min(times)) / min(times) if min(times) > 0 else 0.0
+
+def timed(fn, *args):
+    """(result, elapsed seconds, elapsed relative to the host speed around the call) of fn(*args)"""
+    before = calibrate()
+    start = time.perf_counter()
+    value = fn(*args)
+    elapsed = time.perf_counter() - start
+    return value, elapsed, elapsed / ((before + calibrate()) / 2)
+
+def peak_rss_kb():
+    # ru_maxrss is KB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+def generate_artifact(county_data, matrix, fmt, out_dir):
+    """Stream one format to disk exactly as generate_counties.py does; returns the written paths"""
+    if fmt == SPLIT_FORMAT:
+        written, _ = generate_counties.write_split_states(matrix, out_dir, county_data, price_bands=True)
+        return [os.path.join(out_dir, filename) for filename in written]
+    path = os.path.join(out_dir, f'thirdPartyCosts_{fmt}.ts')
+    generate_counties.write_stream(generate_counties.RENDERERS[fmt](matrix), path)
+    return [path]
+
+def measure_generator(input_path, fmt, out_dir, repeats=DEFAULT_REPEATS):
+    """
+    Best-of-repeats time of each generator phase; the last run's artifact is left in out_dir
+    Runs in its own process, so peak_rss_kb is the generator's peak and nothing else's
+    """
+    result = {'format': fmt, 'repeats': repeats}
+    phases = {'load_s': [], 'compute_s': [], 'emit_write_s': []}
+    relative = {phase: [] for phase in phases}
+    for _ in range(repeats):
+        # Fresh directory per run: the split writer skips files whose content is unchanged
+        shutil.rmtree(out_dir, ignore_errors=True)
+        os.makedirs(out_dir)
+        county_data, *load = timed(generate_counties.load_county_data, input_path)
+        matrix, *compute = timed(generate_counties.build_matrix, county_data)
+        paths, *emit_write = timed(generate_artifact, county_data, matrix, fmt, out_dir)
+        for phase, (elapsed, rel) in zip(phases, (load, compute, emit_write)):
+            phases[phase].append(elapsed)
+            relative[phase].append(rel)
+        result['counties'] = len(matrix)
+        del county_data, matrix
+    result.update((phase, min(times)) for phase, times in phases.items())
+    result['relative'] = {phase: min(times) for phase, times in relative.items()}
+    result['spread'] = {phase: spread(times) for phase, times in relative.items()}
+    # Sum of the phase bests: the best end-to-end run without one noisy phase dragging it up
+    result['end_to_end_s'] = sum(result[phase] for phase in phases)
+    result['relative']['end_to_end_s'] = sum(result['relative'][phase] for phase in phases)
+    result['spread']['end_to_end_s'] = spread([sum(run) for run in zip(*relative.values())])
+    result['peak_rss_kb'] = peak_rss_kb()
+
+    result['output_bytes'] = sum(os.path.getsize(path) for path in paths)
+    # Chunks are fetched one at a time, so each is compressed on its own
+    gzip_bytes = 0
+    for path in paths:
+        with open(path, 'rb') as f:
+            gzip_bytes += len(gzip.compress(f.read()))
+    result['gzip_bytes'] = gzip_bytes
+    return result
+
+def measure_artifact(input_path, fmt, out_dir, lookups, repeats=DEFAULT_REPEATS):
+    """Best-of-repeats time to load the artifact in out_dir back and to run the random lookups"""
+    result = {'relative': {}, 'spread': {}}
+
+    def load():
+        if fmt == SPLIT_FORMAT:
+            return SplitArtifact(out_dir).lookup
+        path = os.path.join(out_dir, f'thirdPartyCosts_{fmt}.ts')
+        if fmt == 'columnar':
+            return ColumnarArtifact(path).lookup
+        table = load_object_artifact(path)
+        return lambda state, county: object_lookup(table, state, county)
+
+    load_runs = [timed(load) for _ in range(repeats)]
+    lookup = load_runs[-1][0]
+    result['artifact_load_s'] = min(elapsed for _, elapsed, _ in load_runs)
+    result['relative']['artifact_load_s'] = min(rel for _, _, rel in load_runs)
+    result['spread']['artifact_load_s'] = spread([rel for _, _, rel in load_runs])
+
+    def run_queries():
+        for state, county in queries:
+            lookup(state, county)
+
+    # The first pass over the queries loads split chunks on demand; the best pass is warm
+    queries = build_queries(generate_counties.load_county_data(input_path), lookups)
+    lookup_runs = [timed(run_queries) for _ in range(repeats)]
+    if fmt == SPLIT_FORMAT:
+        state_loads = lookup.__self__.state_loads
+        result['state_load_s'] = sum(state_loads) / len(state_loads)
+        # Chunks all load during the first pass, so they share its host speed
+        _, elapsed, rel = lookup_runs[0]
+        result['relative']['state_load_s'] = result['state_load_s'] * rel / elapsed
+    best = min(elapsed for _, elapsed, _ in lookup_runs)
+    result['lookups'] = lookups
+    result['lookup_us'] = best / lookups * 1e6
+    result['relative']['lookup_us'] = min(rel for _, _, rel in lookup_runs) / lookups * 1e6
+    # The cold first pass is slower by design; only the warm passes show the host's noise
+    result['spread']['lookup_us'] = spread([rel for _, _, rel in lookup_runs[1:] or lookup_runs])
+    result['lookups_per_sec'] = lookups / best if best > 0 else None
+    result['artifact_peak_rss_kb'] = peak_rss_kb()
+    return result
+
+def run_isolated(input_path, fmt, lookups, repeats):
+    """Run the generator and artifact measurements in separate child processes and merge them"""
+    result = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        out_dir = os.path.join(tmp, 'artifact')
+        for phase in ('generate', 'artifact'):
+            completed = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--measure', input_path, '--phase', phase,
+                 '--artifact-dir', out_dir, '--formats', fmt, '--lookups', str(lookups), '--repeats', str(repeats)],
+                check=True, capture_output=True, text=True, cwd=REPO_ROOT,
+            )
+            measured = json.loads(completed.stdout)
+            for key in ('relative', 'spread'):
+                result[key] = dict(result.get(key, {}), **measured.pop(key))
+            result.update(measured)
+    return result
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+def result_key(result):
+    return f"{result['scale']}x/{result['format']}/{result['lookups']} lookups"
+
+def host_speed(result, base, metric):
+    """How much slower the host ran for this result than for the baseline, by the calibrations around metric"""
+    if not result.get('relative', {}).get(metric) or not base.get('relative', {}).get(metric):
+        return 1.0
+    return (result[metric] / result['relative'][metric]) / (base[metric] / base['relative'][metric])
+
+def compare(results, baseline, threshold=REGRESSION_THRESHOLD):
+    """Print each metric against the baseline; returns the number of regressions"""
+    previous = {result_key(r): r for r in baseline.get('results', [])}
+    regressions = 0
+    for result in results:
+        base = previous.get(result_key(result))
+        print(f"\n{result_key(result)} ({result['counties']:,} counties)")
+        for metric in COMPARED_METRICS:
+            if metric not in result:
+                continue
+            value = result[metric]
+            line = f"  {metric:<20} {value:>14,.4f}" if isinstance(value, float) else f"  {metric:<20} {value:>14,}"
+            if base and base.get(metric):
+                # Only excuse a slower host: a regression must show in wall time and relative to calibration
+                expected = base[metric] * max(1.0, host_speed(result, base, metric))
+                change = (value - expected) / expected
+                noise = metric.endswith('_s') and value - expected < TIME_NOISE_FLOOR_S
+                # Proportional floor: each best-of-repeats can sit anywhere in its run's spread,
+                # so a change within the two spreads combined is noise
+                floor = max(threshold, result.get('spread', {}).get(metric, 0) + base.get('spread', {}).get(metric, 0))
+                flag = '  REGRESSION' if change > floor and not noise else ''
+                regressions += bool(flag)
+                line += f"  ({change:+.1%} vs baseline, noise {floor:.0%}){flag}"
+            print(line)
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', default=DEFAULT_SCALES, help=f'comma-separated multiples (default: {DEFAULT_SCALES})')
+    parser.add_argument('--formats', default=DEFAULT_FORMATS, help=f'comma-separated formats (default: {DEFAULT_FORMATS})')
+    parser.add_argument('--lookups', type=int, default=DEFAULT_LOOKUPS, help=f'lookups per run (default: {DEFAULT_LOOKUPS})')
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS,
+                        help=f'runs per measurement; the best is kept (default: {DEFAULT_REPEATS})')
+    parser.add_argument('--input', default=os.path.join(REPO_ROOT, generate_counties.COUNTY_DATA_PATH),
+                        help='real county database to scale up')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='baseline JSON to compare against')
+    parser.add_argument('--output', help='also write this run\'s results to this JSON file')
+    parser.add_argument('--update-baseline', action='store_true', help='overwrite the baseline with this run')
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help=f'relative change flagged as a regression (default: {REGRESSION_THRESHOLD}); '
+                             'raise it on shared or throttled machines')
+    parser.add_argument('--measure', metavar='INPUT', help=argparse.SUPPRESS)
+    parser.add_argument('--phase', choices=['generate', 'artifact'], help=argparse.SUPPRESS)
+    parser.add_argument('--artifact-dir', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.measure:
+        if args.phase == 'generate':
+            result = measure_generator(args.measure, args.formats, args.artifact_dir, args.repeats)
+        else:
+            result = measure_artifact(args.measure, args.formats, args.artifact_dir, args.lookups, args.repeats)
+        print(json.dumps(result))
+        return 0
+
+    county_data = generate_counties.load_county_data(args.input)
+    formats = args.formats.split(',')
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in (int(s) for s in args.scales.split(',')):
+            input_path = os.path.join(tmp, f'county_data_{scale}x.json')
+            with open(input_path, 'w') as f:
+                json.dump(synthesize_county_data(county_data, scale), f)
+            for fmt in formats:
+                print(f"  - {scale}x {fmt} ...", file=sys.stderr)
+                result = run_isolated(input_path, fmt, args.lookups, args.repeats)
+                result['scale'] = scale
+                results.append(result)
+
+    report = {
+        'generated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+
+    for path in filter(None, [args.output, args.baseline if args.update_baseline else None]):
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(f"\n✓ Wrote {path}")
+    if regressions and not args.update_baseline:
+        print(f"\n{regressions} metric(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Load-test cost_lookup_server.py over keep-alive connections
+
+Usage (from the repo root):
+    python benchmarks/bench_lookup_service.py                          # start a server, hammer it, stop it
+    python benchmarks/bench_lookup_service.py --url http://127.0.0.1:8787 --connections 64 --requests 200000
+
+Requests mix single lookups (MISS_RATE of them for unknown counties, half of the rest by alias)
+with bulk lookups of BULK_SIZE pairs. Reports requests/sec, client-side latency percentiles and
+the server's /stats.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from urllib.parse import quote, urlsplit
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import generate_counties  # noqa: E402
+from county_cost_engine import strip_county_suffix  # noqa: E402
+
+DEFAULT_CONNECTIONS = 32
+DEFAULT_REQUESTS = 50000
+BULK_SHARE = 0.05  # share of requests that are bulk lookups
+BULK_SIZE = 100
+MISS_RATE = 0.1
+SEED = 1234
+
+def build_requests(county_data, count):
+    """Deterministic mix of raw HTTP requests against the lookup endpoints"""
+    rng = random.Random(SEED)
+    pairs = [(code, c['name']) for code, info in county_data.items() for c in info.get('counties', [])]
+    states = sorted(county_data)
+
+    def pick():
+        if rng.random() < MISS_RATE:
+            return rng.choice(states), 'Nonexistent County'
+        state, county = rng.choice(pairs)
+        return state, strip_county_suffix(county.lower()) if rng.random() < 0.5 else county
+
+    requests = []
+    for _ in range(count):
+        if rng.random() < BULK_SHARE:
+            body = json.dumps([{'state': s, 'county': c} for s, c in (pick() for _ in range(BULK_SIZE))]).encode('utf-8')
+            requests.append(
+                b'POST /lookup/bulk HTTP/1.1\r\nHost: bench\r\nContent-Type: application/json\r\n'
+                + f'Content-Length: {len(body)}\r\n\r\n'.encode('latin-1') + body
+            )
+        else:
+            state, county = pick()
+            requests.append(f'GET /lookup?state={state}&county={quote(county)} HTTP/1.1\r\nHost: bench\r\n\r\n'.encode('latin-1'))
+    return requests
+
+async def read_response(reader):
+    head = await reader.readuntil(b'\r\n\r\n')
+    status = int(head.split(b' ', 2)[1])
+    length = next(
+        int(line.split(b':', 1)[1]) for line in head.split(b'\r\n') if line.lower().startswith(b'content-length:')
+    )
+    return status, await reader.readexactly(length)
+
+async def worker(host, port, requests, latencies, statuses):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for request in requests:
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status, _ = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        writer.close()
+
+async def fetch_stats(host, port):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(b'GET /stats HTTP/1.1\r\nHost: bench\r\nConnection: close\r\n\r\n')
+    await writer.drain()
+    _, body = await read_response(reader)
+    writer.close()
+    return json.loads(body)
+
+async def run(host, port, requests, connections):
+    latencies = []
+    statuses = {}
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        worker(host, port, requests[i::connections], latencies, statuses) for i in range(connections)
+    ))
+    elapsed = time.perf_counter() - start
+    return elapsed, sorted(latencies), statuses, await fetch_stats(host, port)
+
+async def wait_for_port(host, port, timeout=30.0):
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            return
+        except OSError:
+            if time.perf_counter() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', help='running server to test (default: start one on --port)')
+    parser.add_argument('--port', type=int, default=18787, help='port for the server started by this script')
+    parser.add_argument('--connections', type=int, default=DEFAULT_CONNECTIONS,
+                        help=f'concurrent keep-alive connections (default: {DEFAULT_CONNECTIONS})')
+    parser.add_argument('--requests', type=int, default=DEFAULT_REQUESTS,
+                        help=f'total requests (default: {DEFAULT_REQUESTS})')
+    parser.add_argument('--input', default=os.path.join(REPO_ROOT, generate_counties.COUNTY_DATA_PATH),
+                        help='county database the requests are drawn from')
+    args = parser.parse_args(argv)
+
+    requests = build_requests(generate_counties.load_county_data(args.input), args.requests)
+    server = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port
+    else:
+        host, port = '127.0.0.1', args.port
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(REPO_ROOT, 'cost_lookup_server.py'), '--port', str(port),
+             '--county-data', args.input],
+            cwd=REPO_ROOT,
+        )
+    try:
+        asyncio.run(wait_for_port(host, port))
+        elapsed, latencies, statuses, stats = asyncio.run(run(host, port, requests, args.connections))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+    print(f"\n{len(latencies):,} requests over {args.connections} connections in {elapsed:.2f}s")
+    print(f"  requests/sec     {len(latencies) / elapsed:>12,.0f}")
+    print(f"  latency p50      {percentile(0.50):>12.3f} ms")
+    print(f"  latency p95      {percentile(0.95):>12.3f} ms")
+    print(f"  latency p99      {percentile(0.99):>12.3f} ms")
+    print(f"  statuses         {statuses}")
+    print(f"  server stats     {json.dumps(stats)}")
+    return 0 if set(statuses) == {200} else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -9,7 +9,7 @@ import { getAllStateCodes, getStateName, getStateDefaults, applyStateDefaults }
 import { analyzeRehabBudget } from '../utils/rehabBudgetAnalysis';
 import { getLoanTypeDefaults, calculatePMI } from '../utils/loanTypeDefaults';
 import { validateLoanInputs } from '../utils/inputValidator';
-import { getCountiesForState, getCountyThirdPartyCosts, convertCountyCostsToFormData } from '../utils/thirdPartyCosts';
+import { loadStateCosts, getCountyThirdPartyCosts, convertCountyCostsToFormData } from '../utils/thirdPartyCosts';
 import { ValidationAlert } from './ValidationAlert';
 
 interface InputSectionsProps {
@@ -88,6 +88,24 @@ export const InputSections: React.FC<InputSectionsProps> = ({
     }
   };
 
+  // County lists are lazy-loaded per state
+  const [countyOptions, setCountyOptions] = useState<string[]>([]);
+  useEffect(() => {
+    if (!inputs.state) {
+      setCountyOptions([]);
+      return;
+    }
+    let cancelled = false;
+    loadStateCosts(inputs.state)
+      .then((counties) => {
+        if (!cancelled) setCountyOptions(counties);
+      })
+      .catch((error) => console.error(`Failed to load county costs for ${inputs.state}:`, error));
+    return () => {
+      cancelled = true;
+    };
+  }, [inputs.state]);
+
   // Auto-estimate holding costs when holding months >= 3
   const hasAutoEstimatedRef = useRef<string>('');
   useEffect(() => {
@@ -259,7 +277,7 @@ export const InputSections: React.FC<InputSectionsProps> = ({
                   }}
                 >
                   <option value="">Select County (Optional)</option>
-                  {getCountiesForState(inputs.state).map((county) => (
+                  {countyOptions.map((county) => (
                     <option key={county} value={county}>
                       {county}
                     </option>
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Local HTTP service for county third-party cost lookups
+
+Usage:
+    python cost_lookup_server.py                                  # http://127.0.0.1:8787
+    python cost_lookup_server.py --port 9000 --county-data county_data.sqlite --cache-size 10000
+
+Endpoints (all responses are JSON):
+    GET  /lookup?state=PA&county=Philadelphia    one state/county lookup
+    GET  /geoid/42101                            lookup by 5-digit county geoid
+    POST /lookup/bulk                            body: [{"state": "PA", "county": "..."}, ...]
+    GET  /stats                                  request latency percentiles and hit rates
+    GET  /health
+
+The fee table is built once at startup with the same templates as generate_counties.py and
+resolved the same way as batch_deal_costs.py: exact name, then normalized name / alias, then
+the state Default. Exact names are a dict hit; alias and Default resolutions are kept in an LRU
+cache so repeated misspellings and unknown counties skip normalization.
+Standard library only (asyncio streams with HTTP/1.1 keep-alive); binds to localhost by default.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import OrderedDict, deque
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from batch_deal_costs import build_cost_tables, resolve_county
+from county_cost_engine import FEE_FIELDS
+from generate_counties import COUNTY_DATA_PATH, load_county_data
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8787
+DEFAULT_CACHE_SIZE = 4096
+LATENCY_WINDOW = 10000  # most recent requests kept for the /stats percentiles
+MAX_BODY_BYTES = 8 * 1024 * 1024
+MAX_BULK_LOOKUPS = 10000
+
+STATUS_TEXT = {
+    200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+    413: 'Payload Too Large', 500: 'Internal Server Error',
+}
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+class CostIndex:
+    """In-memory county cost index with an LRU cache for alias and Default resolutions"""
+
+    def __init__(self, county_data, cache_size=DEFAULT_CACHE_SIZE):
+        self.tables = build_cost_tables(county_data, {})
+        self.by_geoid = {
+            county.get('geoid') or info.get('state_fips', '') + county.get('county_fips', ''): (code, county.get('name'))
+            for code, info in county_data.items()
+            for county in info.get('counties', [])
+        }
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.matches = {'exact': 0, 'alias': 0, 'default': 0, 'none': 0}
+
+    def lookup(self, state, county):
+        """Lookup result dict for one state/county pair"""
+        state = (state or '').strip().upper()
+        county = (county or '').strip()
+        entry = self.tables['states'].get(state)
+        if entry is not None and county in entry[1]:
+            resolved = (entry[1][county], county, 'exact')
+        else:
+            resolved = self._resolve_cached(state, county)
+        costs, name, match = resolved
+        self.matches[match] += 1
+        result = {'state': state, 'county': county, 'resolved_county': name, 'match': match}
+        if costs is None:
+            result['error'] = f"unknown state '{state}'"
+        else:
+            result['costs'] = {field: value for (_, field), value in zip(FEE_FIELDS, costs)}
+        return result
+
+    def lookup_geoid(self, geoid):
+        state, name = self.by_geoid.get(geoid, (None, None))
+        if state is None:
+            raise HttpError(404, f"unknown geoid '{geoid}'")
+        return dict(self.lookup(state, name), geoid=geoid)
+
+    def _resolve_cached(self, state, county):
+        key = (state, county)
+        resolved = self.cache.get(key)
+        if resolved is not None:
+            self.cache.move_to_end(key)
+            self.cache_hits += 1
+            return resolved
+        self.cache_misses += 1
+        resolved = resolve_county(self.tables, state, county)
+        if self.cache_size > 0:
+            self.cache[key] = resolved
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return resolved
+
+    def stats(self):
+        lookups = sum(self.matches.values())
+        cache_lookups = self.cache_hits + self.cache_misses
+        return {
+            'lookups': lookups,
+            'matches': dict(self.matches),
+            'exact_hit_rate': self.matches['exact'] / lookups if lookups else None,
+            'cache': {
+                'size': len(self.cache),
+                'max_size': self.cache_size,
+                'hits': self.cache_hits,
+                'misses': self.cache_misses,
+                'hit_rate': self.cache_hits / cache_lookups if cache_lookups else None,
+            },
+        }
+
+class RequestStats:
+    """Request counts per route plus a rolling latency window"""
+
+    def __init__(self):
+        self.started = time.time()
+        self.requests = {}
+        self.errors = {}
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def record(self, route, status, elapsed):
+        self.requests[route] = self.requests.get(route, 0) + 1
+        if status >= 400:
+            self.errors[route] = self.errors.get(route, 0) + 1
+        self.latencies.append(elapsed)
+
+    def snapshot(self):
+        ordered = sorted(self.latencies)
+
+        def percentile(p):
+            return ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000 if ordered else None
+
+        return {
+            'uptime_s': time.time() - self.started,
+            'requests': dict(self.requests),
+            'errors': dict(self.errors),  # 4xx/5xx responses per route
+            'latency_ms': {
+                'window': len(ordered),
+                'p50': percentile(0.50),
+                'p95': percentile(0.95),
+                'p99': percentile(0.99),
+                'max': ordered[-1] * 1000 if ordered else None,
+            },
+        }
+
+class CostLookupServer:
+    """Routes parsed HTTP requests to the CostIndex"""
+
+    def __init__(self, index):
+        self.index = index
+        self.stats = RequestStats()
+
+    def route(self, name, method, url, body):
+        """Return (status, payload) for one request to the named route"""
+        if name == 'unknown':
+            raise HttpError(404, f"no route for {url.path}")
+        expected = ROUTE_METHODS[name]
+        if method != expected:
+            raise HttpError(405, f"use {expected}")
+        if name == 'lookup':
+            query = parse_qs(url.query)
+            if 'state' not in query:
+                raise HttpError(400, "missing 'state' query parameter")
+            return 200, self.index.lookup(query['state'][0], query.get('county', [''])[0])
+        if name == 'bulk':
+            return 200, {'results': [self.index.lookup(*pair) for pair in parse_bulk(body)]}
+        if name == 'geoid':
+            return 200, self.index.lookup_geoid(unquote(normalize_path(url.path)[len(GEOID_PREFIX):]))
+        if name == 'stats':
+            return 200, dict(self.stats.snapshot(), **self.index.stats())
+        return 200, {'status': 'ok'}
+
+    async def handle_connection(self, reader, writer):
+        """Serve requests on one connection until the client closes it or asks to"""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                start = time.perf_counter()
+                route = 'invalid'
+                keep_alive = False
+                try:
+                    method, target, version, headers = parse_head(head)
+                    url = urlsplit(target)
+                    route = route_name(url.path)
+                    keep_alive = keep_alive_requested(version, headers)
+                    length = int(headers.get('content-length') or 0)
+                    if length > MAX_BODY_BYTES:
+                        keep_alive = False
+                        raise HttpError(413, f"body larger than {MAX_BODY_BYTES:,} bytes")
+                    body = await reader.readexactly(length) if length else b''
+                    status, payload = self.route(route, method, url, body)
+                except HttpError as e:
+                    status, payload = e.status, {'error': str(e)}
+                except (ValueError, UnicodeDecodeError) as e:
+                    status, payload = 400, {'error': f"bad request: {e}"}
+                    keep_alive = False
+                except Exception as e:  # unexpected failure: answer 500 rather than drop the connection
+                    print(f"  - {route} request failed: {e!r}", file=sys.stderr)
+                    status, payload = 500, {'error': 'internal server error'}
+                    keep_alive = False
+                writer.write(render_response(status, payload, keep_alive))
+                await writer.drain()
+                self.stats.record(route, status, time.perf_counter() - start)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+# Route name -> allowed method; /geoid/<geoid> is matched by prefix
+ROUTE_METHODS = {'lookup': 'GET', 'bulk': 'POST', 'geoid': 'GET', 'stats': 'GET', 'health': 'GET'}
+ROUTE_PATHS = {'/lookup': 'lookup', '/lookup/bulk': 'bulk', '/stats': 'stats', '/health': 'health'}
+GEOID_PREFIX = '/geoid/'
+
+def normalize_path(path):
+    return path.rstrip('/') or '/'
+
+def route_name(path):
+    """Route a request path belongs to ('unknown' if none), known before dispatch so stats can count failures"""
+    path = normalize_path(path)
+    if path.startswith(GEOID_PREFIX):
+        return 'geoid'
+    return ROUTE_PATHS.get(path, 'unknown')
+
+def parse_head(head):
+    """(method, target, version, lower-cased headers) from the raw request head"""
+    lines = head.decode('latin-1').split('\r\n')
+    parts = lines[0].split(' ')
+    if len(parts) != 3:
+        raise ValueError(f"malformed request line {lines[0]!r}")
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+    return parts[0], parts[1], parts[2], headers
+
+def keep_alive_requested(version, headers):
+    connection = headers.get('connection', '').lower()
+    return connection == 'keep-alive' if version == 'HTTP/1.0' else connection != 'close'
+
+def parse_bulk(body):
+    """(state, county) pairs from a bulk body: a JSON list, or {"lookups": [...]}"""
+    try:
+        data = json.loads(body or b'[]')
+    except json.JSONDecodeError as e:
+        raise HttpError(400, f"invalid JSON body: {e}") from e
+    if isinstance(data, dict):
+        data = data.get('lookups')
+    if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
+        raise HttpError(400, 'body must be a list of {"state", "county"} objects')
+    if len(data) > MAX_BULK_LOOKUPS:
+        raise HttpError(413, f"at most {MAX_BULK_LOOKUPS:,} lookups per request")
+    return [(str(item.get('state') or ''), str(item.get('county') or '')) for item in data]
+
+def render_response(status, payload, keep_alive):
+    body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    head = (
+        f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode('latin-1') + body
+
+async def serve(index, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    server = CostLookupServer(index)
+    listener = await asyncio.start_server(server.handle_connection, host, port)
+    address = listener.sockets[0].getsockname()
+    print(f"✓ Serving county cost lookups on http://{address[0]}:{address[1]}", file=sys.stderr)
+    async with listener:
+        await listener.serve_forever()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f'interface to bind (default: {DEFAULT_HOST})')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'port (default: {DEFAULT_PORT})')
+    parser.add_argument('--county-data', default=COUNTY_DATA_PATH,
+                        help='county database JSON, or a store built by county_store.py')
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE,
+                        help=f'LRU entries for alias/Default resolutions (default: {DEFAULT_CACHE_SIZE})')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    index = CostIndex(load_county_data(args.county_data), args.cache_size)
+    print(f"  - Indexed {len(index.by_geoid):,} counties in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+    try:
+        asyncio.run(serve(index, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,313 @@
+"""
+Batched county cost engine used by generate_counties.py and the other county-cost tools
+
+The fee templates ({state: {fee: (low, high)}}) are turned into a states x fields matrix once,
+each geography gets a variation factor, and every scenario (a percentile of the (low, high)
+ranges) is computed one field column at a time over all geographies. The result is a
+CostMatrix: geography x field columns per scenario plus one Default row per state.
+
+Only the standard library is used (the repo has no Python dependencies), so "vectorized" here
+means column-at-a-time list comprehensions rather than NumPy arrays.
+"""
+
+import hashlib
+import re
+import unicodedata
+
+# Template key -> CountyLevelCosts field, in the order fields are emitted
+FEE_FIELDS = [
+    ('inspection', 'inspectionCost'),
+    ('appraisal', 'appraisalCost'),
+    ('survey', 'surveyFee'),
+    ('pest', 'pestInspectionCost'),
+    ('lawyer', 'lawyerFee'),
+    ('title', 'titleInsuranceCost'),
+    ('recording', 'recordingFees'),
+    ('credit', 'creditReportFee'),
+    ('flood', 'floodDeterminationFee'),
+]
+
+# Title insurance is a 4-decimal percentage; everything else is whole dollars.
+# Columnar output stores every field as an integer of value * scale.
+FIELD_SCALES = {'title': 10000}
+
+# States without a template use this state's fees
+FALLBACK_TEMPLATE_STATE = 'OH'
+
+# Scenario name -> position within each (low, high) range
+MID_SCENARIO = 'mid'
+RANGE_SCENARIOS = {'low': 0.0, MID_SCENARIO: 0.5, 'high': 1.0}
+
+def stable_hash(text):
+    """Deterministic replacement for hash(): identical across runs, processes and machines"""
+    return int.from_bytes(hashlib.sha256(text.encode('utf-8')).digest()[:8], 'little')
+
+def round_fee(key, value):
+    """Round a fee the way the generator always has: title to 4 decimals, the rest to dollars"""
+    return round(value, 4) if key == 'title' else round(value)
+
+# Trailing words dropped when building short aliases ("Saint Louis County" -> "saint louis")
+COUNTY_SUFFIXES = ('city and borough', 'census area', 'municipality', 'borough', 'parish', 'county', 'city')
+
+def normalize_county_name(name):
+    """
+    Canonical lookup key for a county name: accents stripped, lower case, punctuation
+    removed, "St."/"Ste." spelled out. Mirrored by normalizeCountyName in utils/thirdPartyCosts.ts
+    """
+    text = unicodedata.normalize('NFKD', name)
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    text = text.replace('&', ' and ')
+    text = re.sub(r"[.'\u2019]", '', text)
+    text = re.sub(r'[^a-z0-9]+', ' ', text).strip()
+    text = re.sub(r'\bst\b', 'saint', text)
+    return re.sub(r'\bste\b', 'sainte', text)
+
+def strip_county_suffix(key):
+    """Drop a trailing COUNTY_SUFFIXES word from a normalized key (unchanged if none)"""
+    for suffix in COUNTY_SUFFIXES:
+        if key.endswith(' ' + suffix):
+            return key[:-len(suffix) - 1]
+    return key
+
+# The only suffix a lookup query may drop: "Orleans County" can still find "Orleans Parish", but
+# "St. Louis city" must not resolve to "St. Louis County" (independent cities are separate geographies)
+QUERY_SUFFIX = 'county'
+
+def alias_query_keys(name):
+    """
+    Alias keys to try, in order, for a looked-up county name: its normalized key, then its
+    short form if the query ends in "county". Mirrored by aliasQueryKeys in utils/thirdPartyCosts.ts
+    """
+    key = normalize_county_name(name)
+    if key.endswith(' ' + QUERY_SUFFIX):
+        return [key, key[:-len(QUERY_SUFFIX) - 1]]
+    return [key]
+
+def build_name_index(names):
+    """
+    Sorted (alias, row) pairs for one state's county names
+    Every name gets its normalized key; the suffix-less short form is added only when no
+    other county in the state shares it ("Baltimore city" vs "Baltimore County")
+    """
+    index = {}
+    short_forms = {}
+    for row, name in enumerate(names):
+        key = normalize_county_name(name)
+        index.setdefault(key, row)
+        short = strip_county_suffix(key)
+        if short != key:
+            short_forms.setdefault(short, set()).add(row)
+    for short, rows in short_forms.items():
+        if len(rows) == 1 and short not in index:
+            index[short] = rows.pop()
+    return sorted(index.items())
+
+def template_matrix(templates, state_codes, fallback=FALLBACK_TEMPLATE_STATE):
+    """states x fields matrices of range lows and highs"""
+    rows = [templates.get(code, templates[fallback]) for code in state_codes]
+    lows = [[template[key][0] for key, _ in FEE_FIELDS] for template in rows]
+    highs = [[template[key][1] for key, _ in FEE_FIELDS] for template in rows]
+    return lows, highs
+
+def interpolate(lows, highs, percentile):
+    """states x fields base costs at a percentile of every (low, high) range"""
+    # lo * (1 - p) + hi * p is exactly (lo + hi) / 2 at p = 0.5, matching the old midpoints
+    return [
+        [round_fee(key, lo * (1 - percentile) + hi * percentile) for (key, _), lo, hi in zip(FEE_FIELDS, low_row, high_row)]
+        for low_row, high_row in zip(lows, highs)
+    ]
+
+def variation_vector(names):
+    """Per-geography variation buckets (0-99) derived from the geography name"""
+    return [stable_hash(name) % 100 for name in names]
+
+def vary_columns(base, state_rows, variation):
+    """
+    Expand a states x fields base matrix to geography x field columns
+    Whole-dollar fees scale by 0.95-1.049, title by 0.95-0.9698 (same factors as before)
+    """
+    dollar_factors = [0.95 + v / 1000 for v in variation]
+    title_factors = [0.95 + v / 5000 for v in variation]
+    columns = []
+    for f, (key, _) in enumerate(FEE_FIELDS):
+        state_base = [row[f] for row in base]
+        if key == 'title':
+            columns.append([round(state_base[s] * factor, 4) for s, factor in zip(state_rows, title_factors)])
+        else:
+            columns.append([int(state_base[s] * factor) for s, factor in zip(state_rows, dollar_factors)])
+    return columns
+
+# Purchase prices at which total third-party closing cost is tabulated for interpolation
+PRICE_BANDS = [50000, 100000, 150000, 200000, 250000, 300000, 400000, 500000, 750000, 1000000, 1500000, 2000000]
+
+def closing_cost_at_price(costs, price):
+    """Total third-party closing cost of one cost row at a purchase price (title is a rate)"""
+    return sum(price * value if key == 'title' else value for (key, _), value in zip(FEE_FIELDS, costs))
+
+def price_band_columns(columns, bands=PRICE_BANDS):
+    """
+    band x geography totals, rounded to dollars: the flat fees summed once per geography,
+    then one column per band as flat + title_rate * band
+    """
+    title = next(f for f, (key, _) in enumerate(FEE_FIELDS) if key == 'title')
+    flat = [sum(values) for values in zip(*(column for f, column in enumerate(columns) if f != title))]
+    return [[round(fees + rate * band) for fees, rate in zip(flat, columns[title])] for band in bands]
+
+# A variant is a named list of transforms applied in order to the fee templates, e.g.
+#   {"name": "high-2027", "transforms": [{"op": "percentile", "value": 0.9},
+#                                        {"op": "inflate", "rate": 0.03, "years": 2}]}
+# Every transform takes optional "states" (default: all) and "fields" (template keys)
+# and returns new templates; the input templates are never modified.
+
+ALL_FIELDS = [key for key, _ in FEE_FIELDS]
+DOLLAR_FIELDS = [key for key in ALL_FIELDS if key not in FIELD_SCALES]
+
+def _transform_targets(templates, params, default_fields):
+    states = params.get('states') or list(templates)
+    fields = params.get('fields') or default_fields
+    unknown = set(fields) - set(ALL_FIELDS)
+    if unknown:
+        raise ValueError(f"unknown fee field(s): {', '.join(sorted(unknown))}")
+    return [state for state in states if state in templates], fields
+
+def _map_ranges(templates, params, default_fields, func):
+    states, fields = _transform_targets(templates, params, default_fields)
+    result = {state: dict(template) for state, template in templates.items()}
+    for state in states:
+        for key in fields:
+            result[state][key] = func(key, result[state][key])
+    return result
+
+def percentile_transform(templates, params):
+    """Collapse each (low, high) range to the point at params['value'] (0 = low, 1 = high)"""
+    p = float(params['value'])
+    if not 0 <= p <= 1:
+        raise ValueError(f"percentile must be between 0 and 1, got {p}")
+    return _map_ranges(templates, params, ALL_FIELDS, lambda key, r: (r[0] + (r[1] - r[0]) * p,) * 2)
+
+def inflate_transform(templates, params):
+    """Compound params['rate'] over params['years'] (default 1); title rates are left alone by default"""
+    factor = (1 + float(params['rate'])) ** float(params.get('years', 1))
+    return _map_ranges(templates, params, DOLLAR_FIELDS, lambda key, r: (r[0] * factor, r[1] * factor))
+
+def scale_transform(templates, params):
+    """Multiply ranges by params['factor'] (lender overlays such as a 10% attorney premium)"""
+    factor = float(params['factor'])
+    return _map_ranges(templates, params, DOLLAR_FIELDS, lambda key, r: (r[0] * factor, r[1] * factor))
+
+def set_transform(templates, params):
+    """Replace ranges outright: params['values'] maps field -> [low, high] (or one number)"""
+    values = {
+        key: tuple(value) if isinstance(value, (list, tuple)) else (value, value)
+        for key, value in params['values'].items()
+    }
+    return _map_ranges(templates, dict(params, fields=list(values)), ALL_FIELDS, lambda key, r: values[key])
+
+TEMPLATE_TRANSFORMS = {
+    'percentile': percentile_transform,
+    'inflate': inflate_transform,
+    'scale': scale_transform,
+    'set': set_transform,
+}
+
+def apply_transforms(templates, transforms):
+    """Fee templates after applying a variant's transforms in order"""
+    for transform in transforms:
+        op = transform.get('op')
+        if op not in TEMPLATE_TRANSFORMS:
+            raise ValueError(f"unknown template transform '{op}' (expected one of: {', '.join(TEMPLATE_TRANSFORMS)})")
+        templates = TEMPLATE_TRANSFORMS[op](templates, transform)
+    return templates
+
+class CostMatrix:
+    """
+    Geography x field cost matrix for one or more scenarios
+
+    Geographies of state s are rows state_offsets[s]..state_offsets[s + 1]; names and geoids
+    are row-aligned. For each scenario, columns[scenario][f] holds field f for every geography
+    and defaults[scenario][s] is the state Default row (the un-varied template costs) in
+    FEE_FIELDS order.
+    """
+
+    def __init__(self, state_codes, state_names, state_fips, state_offsets, names, geoids, columns, defaults):
+        self.state_codes = state_codes
+        self.state_names = state_names
+        self.state_fips = state_fips
+        self.state_offsets = state_offsets
+        self.names = names
+        self.geoids = geoids
+        self.columns = columns
+        self.defaults = defaults
+
+    @property
+    def scenarios(self):
+        return list(self.columns)
+
+    def __len__(self):
+        return len(self.names)
+
+    def state_range(self, state_idx):
+        """Row range of one state's geographies"""
+        return range(self.state_offsets[state_idx], self.state_offsets[state_idx + 1])
+
+    def row(self, row, scenario=MID_SCENARIO):
+        """One geography's costs in FEE_FIELDS order"""
+        return [column[row] for column in self.columns[scenario]]
+
+    def state_columns(self, state_idx, scenario=MID_SCENARIO):
+        """One state's slice of every field column"""
+        start, end = self.state_offsets[state_idx], self.state_offsets[state_idx + 1]
+        return [column[start:end] for column in self.columns[scenario]]
+
+    def price_bands(self, state_idx, bands=PRICE_BANDS, scenario=MID_SCENARIO):
+        """band x county closing-cost totals for one state (see price_band_columns)"""
+        return price_band_columns(self.state_columns(state_idx, scenario), bands)
+
+    def default_price_bands(self, state_idx, bands=PRICE_BANDS, scenario=MID_SCENARIO):
+        """Closing-cost totals of the state Default row at each band"""
+        default = self.defaults[scenario][state_idx]
+        return [round(closing_cost_at_price(default, band)) for band in bands]
+
+    def states(self, scenario=MID_SCENARIO):
+        """
+        Yield (state_code, state_name, counties, default) per state,
+        where counties is a list of (name, costs) pairs
+        """
+        columns = self.columns[scenario]
+        for s, (code, name) in enumerate(zip(self.state_codes, self.state_names)):
+            rows = self.state_range(s)
+            counties = [(self.names[r], [column[r] for column in columns]) for r in rows]
+            yield code, name, counties, self.defaults[scenario][s]
+
+def build_cost_matrix(county_data, templates, scenarios=None, fallback=FALLBACK_TEMPLATE_STATE):
+    """
+    Compute the full geography x field matrix for every scenario in one pass per field
+
+    county_data is the county_data.json structure; scenarios maps scenario name to a
+    percentile of each template range (default: mid only)
+    """
+    scenarios = scenarios or {MID_SCENARIO: RANGE_SCENARIOS[MID_SCENARIO]}
+    state_codes = sorted(county_data.keys())
+    state_names = [county_data[code].get('state_name', code) for code in state_codes]
+    state_fips = [county_data[code].get('state_fips', '') for code in state_codes]
+
+    offsets = [0]
+    names = []
+    geoids = []
+    state_rows = []
+    for s, code in enumerate(state_codes):
+        for county in county_data[code].get('counties', []):
+            names.append(county.get('name', 'Unknown'))
+            geoids.append(county.get('geoid') or state_fips[s] + county.get('county_fips', ''))
+            state_rows.append(s)
+        offsets.append(len(names))
+
+    lows, highs = template_matrix(templates, state_codes, fallback)
+    variation = variation_vector(names)
+    columns = {}
+    defaults = {}
+    for scenario, percentile in scenarios.items():
+        base = interpolate(lows, highs, percentile)
+        columns[scenario] = vary_columns(base, state_rows, variation)
+        defaults[scenario] = base
+    return CostMatrix(state_codes, state_names, state_fips, offsets, names, geoids, columns, defaults)
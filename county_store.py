@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Compact indexed store for the county geography database
+
+Usage:
+    python county_store.py ingest county_data.json            # build or refresh county_data.sqlite
+    python county_store.py ingest release.jsonl --prune       # upsert a Census release, drop removed rows
+    python county_store.py info                               # row counts per state and kind
+    python generate_counties.py --input county_data.sqlite --states PA,NJ
+
+The store is a single SQLite file (standard library only) keyed by (state, kind, geoid), so
+finer geographies (ZCTAs, places, tracts) can sit next to counties and the generator reads just
+the states it needs instead of parsing the whole source. Ingest accepts the county_data.json
+layout or JSONL with one geography per line:
+    {"state": "PA", "geoid": "42101", "name": "Philadelphia County", "kind": "county",
+     "county_fips": "101", "state_name": "Pennsylvania", "state_fips": "42"}
+Re-ingesting upserts: unchanged rows are left alone, changed rows are updated in place and new
+rows are appended after their state's existing ones, so partial releases never reorder a state.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+
+DEFAULT_STORE_PATH = 'county_data.sqlite'
+STORE_SUFFIXES = ('.sqlite', '.db')
+COUNTY_KIND = 'county'
+INGEST_BATCH = 5000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS states (
+    code TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    fips TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS geographies (
+    state TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    geoid TEXT NOT NULL,
+    name TEXT NOT NULL,
+    county_fips TEXT NOT NULL DEFAULT '',
+    seq INTEGER NOT NULL,  -- insertion order within (state, kind), so reads keep the source order
+    PRIMARY KEY (state, kind, geoid)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS geographies_geoid ON geographies (geoid);
+CREATE INDEX IF NOT EXISTS geographies_seq ON geographies (state, kind, seq);
+"""
+
+UPSERT_STATE = """
+INSERT INTO states (code, name, fips) VALUES (?, ?, ?)
+ON CONFLICT (code) DO UPDATE SET name = excluded.name, fips = excluded.fips
+WHERE name IS NOT excluded.name OR fips IS NOT excluded.fips
+"""
+
+# New rows go after the existing ones of their (state, kind); updated rows keep their position,
+# so a partial release neither reorders a state nor counts unchanged rows as changes
+UPSERT_GEOGRAPHY = """
+INSERT INTO geographies (state, kind, geoid, name, county_fips, seq)
+SELECT ?1, ?2, ?3, ?4, ?5, COALESCE(MAX(seq) + 1, 0) FROM geographies WHERE state = ?1 AND kind = ?2
+ON CONFLICT (state, kind, geoid) DO UPDATE
+SET name = excluded.name, county_fips = excluded.county_fips
+WHERE name IS NOT excluded.name OR county_fips IS NOT excluded.county_fips
+"""
+
+def is_store_path(path):
+    """True if path names a store rather than a county_data.json file"""
+    return path.lower().endswith(STORE_SUFFIXES)
+
+def open_store(path, readonly=True):
+    """Connection to a store; read-only opens fail instead of creating an empty file"""
+    if readonly:
+        return sqlite3.connect(f'file:{os.path.abspath(path)}?mode=ro', uri=True)
+    connection = sqlite3.connect(path)
+    connection.executescript(SCHEMA)
+    return connection
+
+# ---------------------------------------------------------------------------
+# Ingest
+# ---------------------------------------------------------------------------
+
+def iter_county_data_records(county_data):
+    """Flatten the county_data.json layout into (state row, geography rows) pairs"""
+    for code, info in county_data.items():
+        state = (code, info.get('state_name', code), info.get('state_fips', ''))
+        counties = info.get('counties', [])
+        yield state, [
+            (code, COUNTY_KIND, c.get('geoid') or state[2] + c.get('county_fips', ''), c.get('name', 'Unknown'),
+             c.get('county_fips', ''))
+            for c in counties
+        ]
+
+def iter_jsonl_records(handle):
+    """Stream geography rows from JSONL in file order"""
+    for number, line in enumerate(handle, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+            code = record['state']
+            geoid = record['geoid']
+        except (json.JSONDecodeError, KeyError) as e:
+            raise ValueError(f"line {number}: invalid geography record ({e})") from e
+        kind = record.get('kind', COUNTY_KIND)
+        state = None
+        if 'state_name' in record or 'state_fips' in record:
+            state = (code, record.get('state_name', code), record.get('state_fips', geoid[:2]))
+        yield state, [(code, kind, geoid, record.get('name', 'Unknown'), record.get('county_fips', ''))]
+
+def ingest(source, store_path=DEFAULT_STORE_PATH, prune=False):
+    """
+    Upsert a county_data.json file or a JSONL release into the store
+    With prune, geographies of the (state, kind) pairs in the source that the source no longer
+    lists are deleted. Returns {'states': rows changed, 'geographies': rows changed, 'pruned': n}
+    """
+    connection = open_store(store_path, readonly=False)
+    counts = {'states': 0, 'geographies': 0, 'pruned': 0}
+    try:
+        with connection:
+            if prune:
+                connection.execute('CREATE TEMP TABLE seen (state TEXT, kind TEXT, geoid TEXT, PRIMARY KEY (state, kind, geoid))')
+            with open(source, 'r') as f:
+                if source.lower().endswith('.jsonl'):
+                    records = iter_jsonl_records(f)
+                else:
+                    records = iter_county_data_records(json.load(f))
+                known_states = set()
+                batch = []
+                for state, rows in records:
+                    if state is not None:
+                        before = connection.total_changes
+                        connection.execute(UPSERT_STATE, state)
+                        counts['states'] += connection.total_changes - before
+                        known_states.add(state[0])
+                    batch.extend(rows)
+                    if len(batch) >= INGEST_BATCH:
+                        counts['geographies'] += _upsert_geographies(connection, batch, prune)
+                        batch = []
+                counts['geographies'] += _upsert_geographies(connection, batch, prune)
+
+            missing = [
+                code for (code,) in connection.execute('SELECT DISTINCT state FROM geographies')
+                if code not in known_states
+                and connection.execute('SELECT 1 FROM states WHERE code = ?', (code,)).fetchone() is None
+            ]
+            if missing:
+                raise ValueError(f"no state_name/state_fips for new state(s): {', '.join(sorted(missing))}")
+
+            if prune:
+                counts['pruned'] = connection.execute("""
+                    DELETE FROM geographies
+                    WHERE (state, kind) IN (SELECT DISTINCT state, kind FROM seen)
+                    AND (state, kind, geoid) NOT IN (SELECT state, kind, geoid FROM seen)
+                """).rowcount
+    finally:
+        connection.close()
+    return counts
+
+def _upsert_geographies(connection, rows, prune):
+    before = connection.total_changes
+    connection.executemany(UPSERT_GEOGRAPHY, rows)
+    changed = connection.total_changes - before
+    if prune:
+        connection.executemany('INSERT OR IGNORE INTO seen VALUES (?, ?, ?)', [row[:3] for row in rows])
+    return changed
+
+# ---------------------------------------------------------------------------
+# Reads
+# ---------------------------------------------------------------------------
+
+def read_county_data(store_path=DEFAULT_STORE_PATH, states=None):
+    """
+    The county_data.json structure for the given states (default: all), read from the store
+    Only the requested states' rows are touched, via the (state, kind, geoid) primary key
+    """
+    connection = open_store(store_path)
+    try:
+        if states is None:
+            state_rows = connection.execute('SELECT code, name, fips FROM states ORDER BY code').fetchall()
+        else:
+            state_rows = [
+                row for code in sorted(set(states))
+                for row in connection.execute('SELECT code, name, fips FROM states WHERE code = ?', (code,))
+            ]
+        county_data = {}
+        for code, name, fips in state_rows:
+            counties = connection.execute(
+                'SELECT name, county_fips, geoid FROM geographies WHERE state = ? AND kind = ? ORDER BY seq, geoid',
+                (code, COUNTY_KIND),
+            )
+            county_data[code] = {
+                'state_fips': fips,
+                'state_name': name,
+                'counties': [{'name': n, 'county_fips': c, 'geoid': g} for n, c, g in counties],
+            }
+        return county_data
+    finally:
+        connection.close()
+
+def lookup_geoid(store_path, geoid, kind=COUNTY_KIND):
+    """(state, name) for a geoid, or None"""
+    connection = open_store(store_path)
+    try:
+        return connection.execute(
+            'SELECT state, name FROM geographies WHERE geoid = ? AND kind = ?', (geoid, kind)
+        ).fetchone()
+    finally:
+        connection.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+    ingest_parser = commands.add_parser('ingest', help='upsert a county_data.json or JSONL release')
+    ingest_parser.add_argument('source', help='county_data.json layout, or .jsonl with one geography per line')
+    ingest_parser.add_argument('--store', default=DEFAULT_STORE_PATH, help=f'store to update (default: {DEFAULT_STORE_PATH})')
+    ingest_parser.add_argument('--prune', action='store_true',
+                               help='delete geographies of the ingested states and kinds that the source no longer lists')
+    info_parser = commands.add_parser('info', help='row counts per state and kind')
+    info_parser.add_argument('--store', default=DEFAULT_STORE_PATH, help=f'store to read (default: {DEFAULT_STORE_PATH})')
+    args = parser.parse_args(argv)
+
+    if args.command == 'ingest':
+        counts = ingest(args.source, args.store, args.prune)
+        print(f"✓ Ingested {args.source} into {args.store}")
+        print(f"  - States changed: {counts['states']:,}")
+        print(f"  - Geographies changed: {counts['geographies']:,}")
+        if args.prune:
+            print(f"  - Geographies pruned: {counts['pruned']:,}")
+        return 0
+
+    connection = open_store(args.store)
+    try:
+        rows = connection.execute(
+            'SELECT state, kind, COUNT(*) FROM geographies GROUP BY state, kind ORDER BY state, kind'
+        ).fetchall()
+    finally:
+        connection.close()
+    for state, kind, count in rows:
+        print(f"  {state} {kind:<8} {count:>8,}")
+    print(f"✓ {sum(count for _, _, count in rows):,} geographies in {args.store} ({os.path.getsize(args.store):,} bytes)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,14 +1,37 @@
 #!/usr/bin/env python3
 """
 Generate thirdPartyCosts.ts with all US counties and realistic NORMAL version fees
+
+Usage:
+    python generate_counties.py                      # legacy object-literal module
+    python generate_counties.py --format columnar    # packed columnar module
+    python generate_counties.py --output - | gzip > thirdPartyCosts.ts.gz   # stream to stdout
+    python generate_counties.py --split-states       # manifest + per-state chunks in utils/countyCosts
+    python generate_counties.py --split-states --incremental   # only rewrite states whose inputs changed
+    python generate_counties.py --split-states --no-price-bands   # omit the closing-cost price-band tables
+    python generate_counties.py --variants --workers 4   # every variant in data/countyCostVariants.json
+    python generate_counties.py --input county_data.sqlite --states PA,NJ   # read two states from the store
 """
 
+import argparse
+import base64
+import hashlib
 import json
-import re
+import os
+import struct
+import sys
+import time
+import zlib
+from multiprocessing import Pool
+
+from county_cost_engine import (
+    FEE_FIELDS, FIELD_SCALES, FALLBACK_TEMPLATE_STATE, MID_SCENARIO, PRICE_BANDS, apply_transforms, build_cost_matrix,
+    build_name_index,
+)
+from county_store import is_store_path, read_county_data
 
-# Read the county data
-with open('county_data.json', 'r') as f:
-    county_data = json.load(f)
+COUNTY_DATA_PATH = 'county_data.json'
+DEFAULT_OUTPUT = 'thirdPartyCosts_generated.ts'
 
 # Define fee ranges by state (realistic NORMAL version costs)
 # These are based on typical real estate closing costs by region
@@ -128,21 +151,28 @@ state_fee_templates = {
            'lawyer': (700, 1050), 'title': (0.0055, 0.0075), 'recording': (200, 320), 'credit': (50, 75), 'flood': (30, 50)},
 }
 
-def get_midpoint(range_tuple):
-    """Get midpoint of a range"""
-    return round((range_tuple[0] + range_tuple[1]) / 2)
+def load_county_data(path=COUNTY_DATA_PATH, states=None):
+    """
+    Read the county database, optionally only some states
+    path is county_data.json or a store built by county_store.py; a store reads just those states
+    """
+    if is_store_path(path):
+        return read_county_data(path, states)
+    with open(path, 'r') as f:
+        county_data = json.load(f)
+    if states is None:
+        return county_data
+    return {code: info for code, info in county_data.items() if code in states}
 
-def generate_cost(template, key):
-    """Generate a cost value from template range"""
-    if key == 'title':
-        # Title is a percentage
-        val = (template[key][0] + template[key][1]) / 2
-        return round(val, 4)
-    else:
-        return get_midpoint(template[key])
+def build_matrix(county_data, scenarios=None, templates=None):
+    """Cost matrix for county_data using this script's fee templates (or a variant of them)"""
+    return build_cost_matrix(county_data, templates or state_fee_templates, scenarios)
+
+# ---------------------------------------------------------------------------
+# Object-literal output (original format)
+# ---------------------------------------------------------------------------
 
-# Build the output TypeScript code
-output = """/**
+OBJECT_HEADER = """/**
  * County-level 3rd party cost averages for NORMAL version
  * Includes: inspection, appraisal, survey, pest, lawyer fees, title insurance, recording, credit, flood
  * Automatically generated from US county database with realistic NORMAL version fees
@@ -175,69 +205,7 @@ type StateMap = {
 export const COUNTY_THIRD_PARTY_COSTS: StateMap = {
 """
 
-# Process each state
-for state_code in sorted(county_data.keys()):
-    state_info = county_data[state_code]
-    state_name = state_info.get('state_name', state_code)
-    counties = state_info.get('counties', [])
-    
-    # Get the fee template for this state, or use a default
-    template = state_fee_templates.get(state_code, state_fee_templates['OH'])
-    
-    output += f"  // {state_name.upper()}\n"
-    output += f"  '{state_code}': {{\n"
-    
-    if not counties:
-        # Empty state - just add default
-        output += f"    'Default': {{\n"
-        output += f"      inspectionCost: {generate_cost(template, 'inspection')}, "
-        output += f"appraisalCost: {generate_cost(template, 'appraisal')}, "
-        output += f"surveyFee: {generate_cost(template, 'survey')}, "
-        output += f"pestInspectionCost: {generate_cost(template, 'pest')},\n"
-        output += f"      lawyerFee: {generate_cost(template, 'lawyer')}, "
-        output += f"titleInsuranceCost: {generate_cost(template, 'title')}, "
-        output += f"recordingFees: {generate_cost(template, 'recording')}, "
-        output += f"creditReportFee: {generate_cost(template, 'credit')}, "
-        output += f"floodDeterminationFee: {generate_cost(template, 'flood')}\n"
-        output += f"    }},\n"
-    else:
-        # Add all counties for this state
-        for county in counties:
-            county_name = county.get('name', 'Unknown')
-            # Escape apostrophes in county names for TypeScript
-            county_name_escaped = county_name.replace("'", "\\'")
-            # Slight variation per county to make it realistic
-            var_factor = 0.95 + (hash(county_name) % 100) / 1000
-            
-            output += f"    '{county_name_escaped}': {{\n"
-            output += f"      inspectionCost: {int(generate_cost(template, 'inspection') * var_factor)}, "
-            output += f"appraisalCost: {int(generate_cost(template, 'appraisal') * var_factor)}, "
-            output += f"surveyFee: {int(generate_cost(template, 'survey') * var_factor)}, "
-            output += f"pestInspectionCost: {int(generate_cost(template, 'pest') * var_factor)},\n"
-            output += f"      lawyerFee: {int(generate_cost(template, 'lawyer') * var_factor)}, "
-            output += f"titleInsuranceCost: {round(generate_cost(template, 'title') * (0.95 + (hash(county_name) % 100) / 5000), 4)}, "
-            output += f"recordingFees: {int(generate_cost(template, 'recording') * var_factor)}, "
-            output += f"creditReportFee: {int(generate_cost(template, 'credit') * var_factor)}, "
-            output += f"floodDeterminationFee: {int(generate_cost(template, 'flood') * var_factor)}\n"
-            output += f"    }},\n"
-        
-        # Add Default entry
-        output += f"    'Default': {{\n"
-        output += f"      inspectionCost: {generate_cost(template, 'inspection')}, "
-        output += f"appraisalCost: {generate_cost(template, 'appraisal')}, "
-        output += f"surveyFee: {generate_cost(template, 'survey')}, "
-        output += f"pestInspectionCost: {generate_cost(template, 'pest')},\n"
-        output += f"      lawyerFee: {generate_cost(template, 'lawyer')}, "
-        output += f"titleInsuranceCost: {generate_cost(template, 'title')}, "
-        output += f"recordingFees: {generate_cost(template, 'recording')}, "
-        output += f"creditReportFee: {generate_cost(template, 'credit')}, "
-        output += f"floodDeterminationFee: {generate_cost(template, 'flood')}\n"
-        output += f"    }},\n"
-    
-    output += f"  }},\n"
-
-# Close the object
-output += """};
+OBJECT_FOOTER = """};
 
 /**
  * Get 3rd party costs for a specific county (NORMAL version)
@@ -289,7 +257,9 @@ export const getCountiesForState = (state: string): string[] => {
     .filter((county) => county !== 'Default')
     .sort();
 };
+"""
 
+COST_LABEL_TS = """
 /**
  * Get a breakdown label for a specific cost
  */
@@ -309,10 +279,569 @@ export const getCostLabel = (key: keyof CountyLevelCosts): string => {
 };
 """
 
-# Write output
-with open('thirdPartyCosts_generated.ts', 'w') as f:
-    f.write(output)
+def render_object_entry(label, values):
+    """Render one county (or Default) entry of the object literal"""
+    fields = [
+        f"{ts_field}: {value}" for (_, ts_field), value in zip(FEE_FIELDS, values)
+    ]
+    return (
+        f"    '{label}': {{\n"
+        f"      {', '.join(fields[:4])},\n"
+        f"      {', '.join(fields[4:])}\n"
+        f"    }},\n"
+    )
+
+def iter_object_module(matrix):
+    """Stream the original object-literal TypeScript module, one entry at a time"""
+    yield OBJECT_HEADER
+    for s, (state_code, state_name) in enumerate(zip(matrix.state_codes, matrix.state_names)):
+        yield f"  // {state_name.upper()}\n"
+        yield f"  '{state_code}': {{\n"
+        for row in matrix.state_range(s):
+            # Escape apostrophes in county names for TypeScript
+            county_name_escaped = matrix.names[row].replace("'", "\\'")
+            yield render_object_entry(county_name_escaped, matrix.row(row))
+        # Add Default entry
+        yield render_object_entry('Default', matrix.defaults[MID_SCENARIO][s])
+        yield f"  }},\n"
+    yield OBJECT_FOOTER
+    yield COST_LABEL_TS
+
+# ---------------------------------------------------------------------------
+# Columnar output
+# ---------------------------------------------------------------------------
+
+# Values per base64 piece when streaming a column; a multiple of 3 so pieces need no padding
+PACK_BATCH = 3 * 1024
+
+def iter_packed_column(values, scale=1):
+    """Stream a column of fee values as base64 little-endian Uint16, PACK_BATCH values at a time"""
+    for start in range(0, len(values), PACK_BATCH):
+        ints = [int(round(value * scale)) for value in values[start:start + PACK_BATCH]]
+        for value in ints:
+            if not 0 <= value <= 0xFFFF:
+                raise ValueError(f"value {value} does not fit in a Uint16 column")
+        yield base64.b64encode(struct.pack(f'<{len(ints)}H', *ints)).decode('ascii')
+
+def pack_column(values, scale=1):
+    """Pack a column of fee values as base64 little-endian Uint16"""
+    return ''.join(iter_packed_column(values, scale))
+
+def pack_columns(columns):
+    """Pack one column per field (FEE_FIELDS order)"""
+    return [pack_column(column, FIELD_SCALES.get(key, 1)) for (key, _), column in zip(FEE_FIELDS, columns)]
+
+def pack_rows(rows):
+    """Pack a list of cost rows (FEE_FIELDS order) into one column per field"""
+    return pack_columns([[row[i] for row in rows] for i in range(len(FEE_FIELDS))])
+
+def iter_json_array(items, batch=1024):
+    """Stream a compact JSON array, batch items at a time"""
+    yield '['
+    for start in range(0, len(items), batch):
+        yield (',' if start else '') + ','.join(json.dumps(item) for item in items[start:start + batch])
+    yield ']'
+
+def iter_packed_columns(columns):
+    """Stream one packed column per field as a JSON array of base64 strings"""
+    yield '['
+    for f, ((key, _), column) in enumerate(zip(FEE_FIELDS, columns)):
+        yield ',"' if f else '"'
+        yield from iter_packed_column(column, FIELD_SCALES.get(key, 1))
+        yield '"'
+    yield ']'
+
+COLUMNAR_HEADER = """/**
+ * County-level 3rd party cost averages for NORMAL version
+ * Includes: inspection, appraisal, survey, pest, lawyer fees, title insurance, recording, credit, flood
+ * Automatically generated from US county database with realistic NORMAL version fees
+ * NO Hideout-specific fees (Walker fees, acquisition fees, etc.)
+ *
+ * Columnar layout: counties of STATE_CODES[i] are rows STATE_OFFSETS[i]..STATE_OFFSETS[i + 1]
+ * of COUNTY_NAMES and of each COUNTY_COLUMNS entry. Columns are base64 little-endian Uint16
+ * arrays of value * FIELD_SCALES[field]; DEFAULT_COLUMNS holds one row per state.
+ */
+
+export interface CountyLevelCosts {
+  // Standard closing costs
+  inspectionCost: number; // Professional home inspection
+  appraisalCost: number; // Appraisal fee
+  surveyFee: number; // Property survey (often optional but common)
+  pestInspectionCost: number; // Termite/pest inspection
+  lawyerFee: number; // Attorney/closing agent fee (varies by state)
+  titleInsuranceCost: number; // Title insurance as % of property value (e.g., 0.006 = 0.6%)
+  recordingFees: number; // Recording deed and mortgage documents
+  creditReportFee: number; // Credit check/report fee
+  floodDeterminationFee: number; // Flood zone determination
+}
+
+"""
+
+COLUMNAR_ACCESSOR = """
+// National average fallback (all 9 fields)
+const nationalAverage: CountyLevelCosts = {
+  inspectionCost: 360,
+  appraisalCost: 460,
+  surveyFee: 420,
+  pestInspectionCost: 120,
+  lawyerFee: 500,
+  titleInsuranceCost: 0.0052,
+  recordingFees: 140,
+  creditReportFee: 45,
+  floodDeterminationFee: 24,
+};
+
+const decodeColumn = (packed: string): Uint16Array => {
+  const bytes = atob(packed);
+  const column = new Uint16Array(bytes.length / 2);
+  for (let i = 0; i < column.length; i++) {
+    column[i] = bytes.charCodeAt(2 * i) | (bytes.charCodeAt(2 * i + 1) << 8);
+  }
+  return column;
+};
+
+// Columns are decoded on first lookup, not at module load
+let countyColumns: Uint16Array[] | null = null;
+let defaultColumns: Uint16Array[] | null = null;
+const stateIndex = new Map(STATE_CODES.map((state, i) => [state, i]));
+const countyRowsByState = new Map<number, Map<string, number>>();
+
+const readRow = (columns: Uint16Array[], row: number): CountyLevelCosts => {
+  const costs = {} as CountyLevelCosts;
+  FIELDS.forEach((field, i) => {
+    costs[field] = columns[i][row] / FIELD_SCALES[i];
+  });
+  return costs;
+};
+
+const getCountyRows = (stateIdx: number): Map<string, number> => {
+  let rows = countyRowsByState.get(stateIdx);
+  if (!rows) {
+    rows = new Map();
+    for (let row = STATE_OFFSETS[stateIdx]; row < STATE_OFFSETS[stateIdx + 1]; row++) {
+      rows.set(COUNTY_NAMES[row], row);
+    }
+    countyRowsByState.set(stateIdx, rows);
+  }
+  return rows;
+};
+
+/**
+ * Get 3rd party costs for a specific county (NORMAL version)
+ * Falls back to state default if county not found
+ */
+export const getCountyThirdPartyCosts = (state: string, county?: string): CountyLevelCosts => {
+  const stateIdx = stateIndex.get(state);
+
+  if (stateIdx === undefined) {
+    // Return national average if state not in database
+    return nationalAverage;
+  }
+
+  if (county && county.trim() !== '') {
+    // Try exact county name first
+    const row = getCountyRows(stateIdx).get(county);
+    if (row !== undefined) {
+      countyColumns = countyColumns || COUNTY_COLUMNS.map(decodeColumn);
+      return readRow(countyColumns, row);
+    }
+  }
+
+  // Fall back to state default
+  defaultColumns = defaultColumns || DEFAULT_COLUMNS.map(decodeColumn);
+  return readRow(defaultColumns, stateIdx);
+};
+
+/**
+ * Get list of counties available for a state
+ */
+export const getCountiesForState = (state: string): string[] => {
+  const stateIdx = stateIndex.get(state);
+  if (stateIdx === undefined) return [];
+
+  return COUNTY_NAMES.slice(STATE_OFFSETS[stateIdx], STATE_OFFSETS[stateIdx + 1]).sort();
+};
+"""
+
+def ts_const(name, value, ts_type):
+    """Render one `const NAME: type = <json>;` line"""
+    return f"const {name}: {ts_type} = {json.dumps(value, separators=(',', ':'))};\n"
+
+def iter_columnar_module(matrix):
+    """Stream the packed columnar TypeScript module"""
+    columns = matrix.columns[MID_SCENARIO]
+    defaults = matrix.defaults[MID_SCENARIO]
+
+    yield COLUMNAR_HEADER
+    yield ts_const('FIELDS', [ts_field for _, ts_field in FEE_FIELDS], '(keyof CountyLevelCosts)[]')
+    yield ts_const('FIELD_SCALES', [FIELD_SCALES.get(key, 1) for key, _ in FEE_FIELDS], 'number[]')
+    yield ts_const('STATE_CODES', matrix.state_codes, 'string[]')
+    yield ts_const('STATE_OFFSETS', matrix.state_offsets, 'number[]')
+    yield "const COUNTY_NAMES: string[] = "
+    yield from iter_json_array(matrix.names)
+    yield ";\nconst COUNTY_COLUMNS: string[] = "
+    yield from iter_packed_columns(columns)
+    yield ";\n"
+    yield ts_const('DEFAULT_COLUMNS', pack_rows(defaults), 'string[]')
+    yield COLUMNAR_ACCESSOR
+    yield COST_LABEL_TS
+
+def unpack_column(packed, scale=1):
+    """Decode a base64 little-endian Uint16 column (inverse of pack_column)"""
+    data = base64.b64decode(packed)
+    values = struct.unpack(f'<{len(data) // 2}H', data)
+    return list(values) if scale == 1 else [value / scale for value in values]
+
+def read_columnar_module(path):
+    """
+    Read the data constants back out of a columnar module as {NAME: value}
+    Every `const NAME: type = <json>;` data line is plain JSON, so no TypeScript parsing is needed
+    """
+    consts = {}
+    with open(path, 'r') as f:
+        for line in f:
+            if line.startswith('const ') and line.rstrip().endswith(';') and ' = ' in line:
+                declaration, value = line.split(' = ', 1)
+                name = declaration[len('const '):].split(':', 1)[0]
+                try:
+                    consts[name] = json.loads(value.rstrip().rstrip(';'))
+                except json.JSONDecodeError:
+                    continue  # accessor code, not data
+    return consts
+
+# ---------------------------------------------------------------------------
+# Per-state chunks (lazy-loaded by utils/thirdPartyCosts.ts)
+# ---------------------------------------------------------------------------
+
+DEFAULT_SPLIT_DIR = 'utils/countyCosts'
+
+MANIFEST_HEADER = """/**
+ * County cost chunk manifest - generated by generate_counties.py, do not edit
+ * STATE_DEFAULTS resolve synchronously; county rows live in one lazily imported chunk per state.
+ * Chunk columns are base64 little-endian Uint16 arrays of value * FIELD_SCALES[field].
+ * COUNTY_FIPS (row-aligned) and ALIAS_ROWS are packed the same way; ALIAS_KEYS are sorted
+ * normalized county names and short aliases, so they double as an autocomplete prefix table.
+ * Unless --no-price-bands is given, PRICE_BAND_TOTALS holds one packed column per PRICE_BANDS entry: each
+ * county's total third-party closing cost (flat fees + title rate * price) at that price.
+ */
+
+export interface StateCostChunk {
+  COUNTY_NAMES: string[];
+  COUNTY_COLUMNS: string[];
+  COUNTY_FIPS: string;
+  ALIAS_KEYS: string[];
+  ALIAS_ROWS: string;
+  PRICE_BAND_TOTALS?: string[];
+}
+
+"""
+
+def render_state_chunk(state_code, state_name, names, geoids, columns, band_columns=None):
+    """Render the lazily loaded chunk holding one state's county rows, lookup index and price bands"""
+    aliases = build_name_index(names)
+    output = f"// {state_name.upper()} ({state_code}) county costs - generated by generate_counties.py, do not edit\n"
+    output += f"export const COUNTY_NAMES: string[] = {json.dumps(names, separators=(',', ':'))};\n"
+    output += f"export const COUNTY_COLUMNS: string[] = {json.dumps(pack_columns(columns), separators=(',', ':'))};\n"
+    output += f"export const COUNTY_FIPS: string = {json.dumps(pack_column([int(geoid[2:]) for geoid in geoids]))};\n"
+    output += f"export const ALIAS_KEYS: string[] = {json.dumps([key for key, _ in aliases], separators=(',', ':'))};\n"
+    output += f"export const ALIAS_ROWS: string = {json.dumps(pack_column([row for _, row in aliases]))};\n"
+    if band_columns is not None:
+        packed = [pack_column(column) for column in band_columns]
+        output += f"export const PRICE_BAND_TOTALS: string[] = {json.dumps(packed, separators=(',', ':'))};\n"
+    return output
+
+def chunked_states(matrix):
+    """Indexes of states that have county rows (and therefore a chunk)"""
+    return [s for s in range(len(matrix.state_codes)) if matrix.state_range(s)]
+
+def render_manifest(matrix, price_bands=False):
+    """Render the manifest module: fields, state defaults, price bands and chunk loaders"""
+    output = MANIFEST_HEADER
+    output += f"export {ts_const('FIELDS', [ts_field for _, ts_field in FEE_FIELDS], 'string[]')}"
+    output += f"export {ts_const('FIELD_SCALES', [FIELD_SCALES.get(key, 1) for key, _ in FEE_FIELDS], 'number[]')}"
+    output += "\n// State code by 2-digit state FIPS, for geoid lookups\n"
+    output += "export const STATE_BY_FIPS: Record<string, string> = {\n"
+    for state_code, state_fips in sorted(zip(matrix.state_codes, matrix.state_fips), key=lambda pair: pair[1]):
+        output += f"  '{state_fips}': '{state_code}',\n"
+    output += "};\n"
+    output += "\n// State Default costs in FIELDS order\n"
+    output += "export const STATE_DEFAULTS: Record<string, number[]> = {\n"
+    for state_code, default in zip(matrix.state_codes, matrix.defaults[MID_SCENARIO]):
+        output += f"  '{state_code}': {json.dumps(default, separators=(',', ':'))},\n"
+    output += "};\n"
+    output += "\n// Purchase prices tabulated in each chunk's PRICE_BAND_TOTALS (empty with --no-price-bands)\n"
+    output += f"export {ts_const('PRICE_BANDS', PRICE_BANDS if price_bands else [], 'number[]')}"
+    output += "\n// State Default closing-cost totals at each PRICE_BANDS entry\n"
+    output += "export const STATE_DEFAULT_BAND_TOTALS: Record<string, number[]> = {\n"
+    if price_bands:
+        for s, state_code in enumerate(matrix.state_codes):
+            output += f"  '{state_code}': {json.dumps(matrix.default_price_bands(s), separators=(',', ':'))},\n"
+    output += "};\n"
+    output += "\n// One dynamic import per state that has county rows\n"
+    output += "export const STATE_CHUNKS: Record<string, () => Promise<StateCostChunk>> = {\n"
+    for s in chunked_states(matrix):
+        output += f"  '{matrix.state_codes[s]}': () => import('./{matrix.state_codes[s]}'),\n"
+    output += "};\n"
+    return output
+
+def render_split_states(matrix, skip=frozenset(), price_bands=False):
+    """Yield (filename, content) for the manifest and every state chunk not in skip"""
+    yield 'manifest.ts', render_manifest(matrix, price_bands)
+    for s in chunked_states(matrix):
+        state_code = matrix.state_codes[s]
+        if state_code not in skip:
+            rows = matrix.state_range(s)
+            names = [matrix.names[r] for r in rows]
+            geoids = [matrix.geoids[r] for r in rows]
+            band_columns = matrix.price_bands(s) if price_bands else None
+            content = render_state_chunk(
+                state_code, matrix.state_names[s], names, geoids, matrix.state_columns(s), band_columns
+            )
+            yield f'{state_code}.ts', content
+
+# ---------------------------------------------------------------------------
+# Incremental regeneration
+# ---------------------------------------------------------------------------
+
+# Bump when the emitted format or the cost formulas change, so every chunk is rebuilt
+GENERATOR_VERSION = 2
+INPUT_HASHES_FILE = '.input-hashes.json'
+
+def state_input_hash(state_code, state_info, options=None):
+    """Content hash of everything a state's chunk is derived from (options: output flags)"""
+    template = state_fee_templates.get(state_code, state_fee_templates[FALLBACK_TEMPLATE_STATE])
+    payload = json.dumps(
+        {'version': GENERATOR_VERSION, 'template': template, 'state': state_info, 'options': options or {}},
+        sort_keys=True, separators=(',', ':'),
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def read_input_hashes(out_dir):
+    """Input hashes recorded by the previous run ({} if there is none)"""
+    try:
+        with open(os.path.join(out_dir, INPUT_HASHES_FILE), 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def write_if_changed(path, content):
+    """Write content unless the file already holds exactly it; returns True if written"""
+    try:
+        with open(path, 'r') as f:
+            if f.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, 'w') as f:
+        f.write(content)
+    return True
+
+def write_split_states(matrix, out_dir, county_data, incremental=False, price_bands=False, transforms=None):
+    """
+    Write the manifest and state chunks, returning ({filename: bytes written}, unchanged count)
+    Every run records per-state input hashes; in incremental mode chunks whose hash matches
+    the previous run are neither rendered nor rewritten, and chunks of removed states are deleted
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    options = {}
+    if price_bands:
+        options['price_bands'] = PRICE_BANDS
+    if transforms:
+        options['transforms'] = transforms
+    hashes = {code: state_input_hash(code, county_data[code], options) for code in matrix.state_codes}
+    chunks = [f'{matrix.state_codes[s]}.ts' for s in chunked_states(matrix)]
+    skip = set()
+    if incremental:
+        previous = read_input_hashes(out_dir)
+        skip = {
+            code for code, digest in hashes.items()
+            if previous.get(code) == digest and os.path.exists(os.path.join(out_dir, f'{code}.ts'))
+        }
+        for code in previous:
+            stale = os.path.join(out_dir, f'{code}.ts')
+            if f'{code}.ts' not in chunks and os.path.exists(stale):
+                os.remove(stale)
+
+    written = {}
+    for filename, content in render_split_states(matrix, skip, price_bands):
+        if write_if_changed(os.path.join(out_dir, filename), content):
+            written[filename] = len(content.encode('utf-8'))
+
+    write_if_changed(
+        os.path.join(out_dir, INPUT_HASHES_FILE),
+        json.dumps(hashes, indent=2, sort_keys=True) + '\n',
+    )
+    return written, len([filename for filename in chunks if filename not in written])
+
+# ---------------------------------------------------------------------------
+# Streaming output
+# ---------------------------------------------------------------------------
+
+RENDERERS = {
+    'object': iter_object_module,
+    'columnar': iter_columnar_module,
+}
+
+# Write buffer for streamed output
+WRITE_BUFFER_SIZE = 1 << 16
+
+def write_stream(pieces, path):
+    """
+    Write streamed pieces to path ('-' for stdout) through a buffered handle
+    Returns the number of bytes written; memory stays bounded by the largest piece
+    """
+    written = 0
+    if path == '-':
+        out = sys.stdout.buffer
+        for piece in pieces:
+            data = piece.encode('utf-8')
+            out.write(data)
+            written += len(data)
+        out.flush()
+        return written
+    with open(path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        for piece in pieces:
+            data = piece.encode('utf-8')
+            f.write(data)
+            written += len(data)
+    return written
+
+def byte_sizes(pieces):
+    """Raw and gzip byte counts of a streamed module, without holding it in memory"""
+    raw = 0
+    gz = 0
+    compressor = zlib.compressobj(9, wbits=31)  # gzip container
+    for piece in pieces:
+        data = piece.encode('utf-8')
+        raw += len(data)
+        gz += len(compressor.compress(data))
+    gz += len(compressor.flush())
+    return raw, gz
+
+# ---------------------------------------------------------------------------
+# Variants: several template transforms generated in parallel from one load
+# ---------------------------------------------------------------------------
+
+DEFAULT_VARIANTS_PATH = os.path.join('data', 'countyCostVariants.json')
+SPLIT_FORMAT = 'split'
+
+def load_variants(path=DEFAULT_VARIANTS_PATH):
+    """
+    Read a variant spec: a JSON list of {name, transforms, format?, output?, price_bands?}
+    format is a RENDERERS key or 'split' (output is then a chunk directory)
+    """
+    with open(path, 'r') as f:
+        variants = json.load(f)
+    names = set()
+    for variant in variants:
+        name = variant.get('name')
+        if not name or name in names:
+            raise ValueError(f"{path}: every variant needs a unique name (got {name!r})")
+        names.add(name)
+        fmt = variant.setdefault('format', 'object')
+        if fmt not in RENDERERS and fmt != SPLIT_FORMAT:
+            raise ValueError(f"{path}: variant '{name}' has unknown format '{fmt}'")
+        default_output = f'{DEFAULT_SPLIT_DIR}_{name}' if fmt == SPLIT_FORMAT else f'thirdPartyCosts_{name}.ts'
+        variant.setdefault('output', default_output)
+        variant.setdefault('transforms', [])
+        # Fail on bad transforms before any worker starts
+        apply_transforms(state_fee_templates, variant['transforms'])
+    return variants
+
+# County data shared by every variant worker, set by _init_variant_worker. With the fork start
+# method the parent's copy is inherited rather than pickled, so it is parsed exactly once.
+_variant_county_data = None
+
+def _init_variant_worker(county_data):
+    global _variant_county_data
+    _variant_county_data = county_data
+
+def generate_variant(variant):
+    """Build and write one variant; returns (name, output, bytes written, seconds)"""
+    start = time.perf_counter()
+    templates = apply_transforms(state_fee_templates, variant['transforms'])
+    matrix = build_matrix(_variant_county_data, templates=templates)
+    if variant['format'] == SPLIT_FORMAT:
+        written, _ = write_split_states(
+            matrix, variant['output'], _variant_county_data,
+            price_bands=variant.get('price_bands', True), transforms=variant['transforms'],
+        )
+        size = sum(written.values())
+    else:
+        size = write_stream(RENDERERS[variant['format']](matrix), variant['output'])
+    return variant['name'], variant['output'], size, time.perf_counter() - start
+
+def write_variants(county_data, variants, workers):
+    """Yield generate_variant results as variants finish, one process per variant up to workers"""
+    workers = max(1, min(workers, len(variants)))
+    if workers == 1:
+        _init_variant_worker(county_data)
+        yield from map(generate_variant, variants)
+        return
+    with Pool(workers, initializer=_init_variant_worker, initargs=(county_data,)) as pool:
+        yield from pool.imap_unordered(generate_variant, variants)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--format', choices=sorted(RENDERERS), default='object',
+                        help='output layout (default: object)')
+    parser.add_argument('--input', default=COUNTY_DATA_PATH,
+                        help='county database JSON, or a store built by county_store.py (.sqlite/.db)')
+    parser.add_argument('--states', help='comma-separated state codes to generate (default: all)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="TypeScript file to write ('-' for stdout)")
+    parser.add_argument('--split-states', nargs='?', const=DEFAULT_SPLIT_DIR, metavar='DIR',
+                        help=f'write a manifest plus one lazily loaded chunk per state (default DIR: {DEFAULT_SPLIT_DIR})')
+    parser.add_argument('--incremental', action='store_true',
+                        help='with --split-states, only rewrite states whose inputs changed')
+    parser.add_argument('--price-bands', action=argparse.BooleanOptionalAction, default=True,
+                        help='with --split-states, add per-county closing-cost totals at fixed purchase prices '
+                             '(default: on; the committed utils/countyCosts chunks include them)')
+    parser.add_argument('--variants', nargs='?', const=DEFAULT_VARIANTS_PATH, metavar='SPEC',
+                        help=f'generate every variant in a JSON spec (default SPEC: {DEFAULT_VARIANTS_PATH})')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='with --variants, worker processes (default: CPU count)')
+    args = parser.parse_args(argv)
+    if args.states and args.split_states:
+        parser.error('--states cannot be combined with --split-states (the manifest lists every state)')
+
+    states = args.states.upper().split(',') if args.states else None
+    county_data = load_county_data(args.input, states)
+
+    if args.variants:
+        variants = load_variants(args.variants)
+        start = time.perf_counter()
+        for name, output, size, elapsed in write_variants(county_data, variants, args.workers):
+            print(f"  - {name}: {output} ({size:,} bytes, {elapsed:.2f}s)")
+        print(f"✓ Generated {len(variants)} variants in {time.perf_counter() - start:.2f}s")
+        return
+
+    matrix = build_matrix(county_data)
+
+    if args.split_states:
+        written, unchanged = write_split_states(
+            matrix, args.split_states, county_data, args.incremental, args.price_bands
+        )
+        chunk_sizes = [size for filename, size in written.items() if filename != 'manifest.ts']
+        print(f"✓ Generated {args.split_states}: {len(chunk_sizes)} state chunks written, {unchanged} unchanged")
+        if 'manifest.ts' in written:
+            print(f"  - Manifest: {written['manifest.ts']:,} bytes")
+        if chunk_sizes:
+            print(f"  - Chunks: {min(chunk_sizes):,}-{max(chunk_sizes):,} bytes ({sum(chunk_sizes):,} total)")
+        return
+
+    # Status goes to stderr when the module itself is streamed to stdout
+    log = sys.stderr if args.output == '-' else sys.stdout
+    write_stream(RENDERERS[args.format](matrix), args.output)
+
+    print(f"✓ Generated {args.output}", file=log)
+    print(f"  - States: {len([k for k in county_data.keys() if county_data[k].get('counties')])}", file=log)
+    print(f"  - Total counties: {sum(len(county_data.get(state, {}).get('counties', [])) for state in county_data)}", file=log)
+
+    if args.format != 'object':
+        before, before_gz = byte_sizes(iter_object_module(matrix))
+        after, after_gz = byte_sizes(RENDERERS[args.format](matrix))
+        print(f"  - Size: {before:,} -> {after:,} bytes ({100 * (1 - after / before):.1f}% smaller)", file=log)
+        print(f"  - Gzip: {before_gz:,} -> {after_gz:,} bytes ({100 * (1 - after_gz / before_gz):.1f}% smaller)", file=log)
 
-print(f"✓ Generated thirdPartyCosts_generated.ts")
-print(f"  - States: {len([k for k in county_data.keys() if county_data[k].get('counties')])}")
-print(f"  - Total counties: {sum(len(county_data.get(state, {}).get('counties', [])) for state in county_data)}")
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,9 @@
+from batch_deal_costs import PARSE_ERROR, parse_lines
+
+def test_non_object_jsonl_lines_become_parse_errors():
+    lines = ['{"state": "PA"}\n', '[1, 2]\n', 'null\n', '42\n', '{bad\n', '\n']
+    deals = list(parse_lines(lines, 'jsonl', None))
+    assert deals[0] == {'state': 'PA'}
+    assert [deal[PARSE_ERROR] for deal in deals[1:4]] == ['expected a JSON object'] * 3
+    assert deals[4][PARSE_ERROR].startswith('invalid JSON')
+    assert len(deals) == 5
@@ -0,0 +1,68 @@
+import copy
+
+import pytest
+
+from county_cost_engine import alias_query_keys, apply_transforms, build_name_index
+
+NAMES = ['St. Louis County', 'Baltimore County', 'Orleans Parish']
+
+TEMPLATES = {
+    'PA': {'inspection': (400, 500), 'appraisal': (450, 650), 'survey': (350, 500), 'pest': (120, 180),
+           'lawyer': (600, 900), 'title': (0.005, 0.0075), 'recording': (130, 200), 'credit': (40, 60), 'flood': (20, 30)},
+    'NJ': {'inspection': (450, 550), 'appraisal': (500, 700), 'survey': (400, 600), 'pest': (100, 150),
+           'lawyer': (800, 1200), 'title': (0.006, 0.008), 'recording': (150, 250), 'credit': (40, 60), 'flood': (20, 30)},
+}
+
+def resolve(query):
+    aliases = dict(build_name_index(NAMES))
+    row = next((aliases[key] for key in alias_query_keys(query) if key in aliases), None)
+    return None if row is None else NAMES[row]
+
+def test_short_and_full_forms_resolve():
+    assert resolve('St. Louis') == 'St. Louis County'
+    assert resolve('saint louis county') == 'St. Louis County'
+    assert resolve('Orleans County') == 'Orleans Parish'
+
+def test_independent_cities_do_not_resolve_to_counties():
+    assert resolve('St. Louis city') is None
+    assert resolve('Baltimore city') is None
+
+def transformed(*transforms):
+    """apply_transforms on a copy of TEMPLATES, checking the input is left untouched"""
+    templates = copy.deepcopy(TEMPLATES)
+    result = apply_transforms(templates, list(transforms))
+    assert templates == TEMPLATES
+    return result
+
+def test_percentile_collapses_every_range():
+    result = transformed({'op': 'percentile', 'value': 0.5})
+    assert result['PA']['inspection'] == (450, 450)
+    assert result['NJ']['lawyer'] == (1000, 1000)
+    assert result['PA']['title'] == pytest.approx((0.00625, 0.00625))
+
+def test_inflate_compounds_dollar_fields_only():
+    result = transformed({'op': 'inflate', 'rate': 0.1, 'years': 2})
+    assert result['PA']['inspection'] == pytest.approx((484, 605))
+    assert result['PA']['title'] == TEMPLATES['PA']['title']
+
+def test_scale_honours_state_and_field_filters():
+    result = transformed({'op': 'scale', 'factor': 1.1, 'states': ['NJ'], 'fields': ['lawyer']})
+    assert result['NJ']['lawyer'] == pytest.approx((880, 1320))
+    assert result['NJ']['inspection'] == TEMPLATES['NJ']['inspection']
+    assert result['PA'] == TEMPLATES['PA']
+
+def test_set_replaces_ranges_and_accepts_single_values():
+    result = transformed({'op': 'set', 'values': {'survey': [0, 0], 'flood': 25}})
+    assert result['PA']['survey'] == (0, 0)
+    assert result['NJ']['flood'] == (25, 25)
+    assert result['NJ']['credit'] == TEMPLATES['NJ']['credit']
+
+def test_transforms_apply_in_order():
+    result = transformed({'op': 'set', 'values': {'credit': 50}}, {'op': 'scale', 'factor': 2})
+    assert result['PA']['credit'] == (100, 100)
+
+def test_unknown_op_or_field_is_rejected():
+    with pytest.raises(ValueError):
+        transformed({'op': 'discount', 'factor': 0.9})
+    with pytest.raises(ValueError):
+        transformed({'op': 'scale', 'factor': 2, 'fields': ['hoa']})
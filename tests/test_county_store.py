@@ -0,0 +1,60 @@
+import json
+
+from county_store import ingest, read_county_data
+
+COUNTY_DATA = {
+    'PA': {
+        'state_fips': '42',
+        'state_name': 'Pennsylvania',
+        'counties': [
+            {'name': 'Adams County', 'county_fips': '001', 'geoid': '42001'},
+            {'name': 'Allegheny County', 'county_fips': '003', 'geoid': '42003'},
+            {'name': 'York County', 'county_fips': '133', 'geoid': '42133'},
+            {'name': 'Armstrong County', 'county_fips': '005', 'geoid': '42005'},
+        ],
+    },
+}
+
+def write_json(path, data):
+    path.write_text(json.dumps(data))
+    return str(path)
+
+def write_jsonl(path, records):
+    path.write_text(''.join(json.dumps(record) + '\n' for record in records))
+    return str(path)
+
+def test_round_trip_keeps_source_order(tmp_path):
+    store = str(tmp_path / 'store.sqlite')
+    ingest(write_json(tmp_path / 'county_data.json', COUNTY_DATA), store)
+    assert read_county_data(store) == COUNTY_DATA
+
+def test_reingesting_unchanged_record_changes_nothing(tmp_path):
+    store = str(tmp_path / 'store.sqlite')
+    ingest(write_json(tmp_path / 'county_data.json', COUNTY_DATA), store)
+    release = write_jsonl(tmp_path / 'release.jsonl', [
+        {'state': 'PA', 'geoid': '42133', 'name': 'York County', 'county_fips': '133'},
+    ])
+    assert ingest(release, store)['geographies'] == 0
+    assert read_county_data(store) == COUNTY_DATA
+
+def test_partial_release_updates_in_place_and_appends_new_rows(tmp_path):
+    store = str(tmp_path / 'store.sqlite')
+    ingest(write_json(tmp_path / 'county_data.json', COUNTY_DATA), store)
+    release = write_jsonl(tmp_path / 'release.jsonl', [
+        {'state': 'PA', 'geoid': '42999', 'name': 'New County', 'county_fips': '999'},
+        {'state': 'PA', 'geoid': '42003', 'name': 'Allegheny Co', 'county_fips': '003'},
+    ])
+    assert ingest(release, store)['geographies'] == 2
+    names = [county['name'] for county in read_county_data(store)['PA']['counties']]
+    assert names == ['Adams County', 'Allegheny Co', 'York County', 'Armstrong County', 'New County']
+
+def test_prune_drops_rows_missing_from_release(tmp_path):
+    store = str(tmp_path / 'store.sqlite')
+    ingest(write_json(tmp_path / 'county_data.json', COUNTY_DATA), store)
+    release = write_jsonl(tmp_path / 'release.jsonl', [
+        {'state': 'PA', 'geoid': geoid, 'name': name, 'county_fips': geoid[2:]}
+        for geoid, name in [('42001', 'Adams County'), ('42005', 'Armstrong County')]
+    ])
+    assert ingest(release, store, prune=True)['pruned'] == 2
+    names = [county['name'] for county in read_county_data(store)['PA']['counties']]
+    assert names == ['Adams County', 'Armstrong County']
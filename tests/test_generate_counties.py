@@ -0,0 +1,88 @@
+import copy
+import os
+
+from generate_counties import build_matrix, write_split_states
+
+COUNTY_DATA = {
+    'PA': {
+        'state_fips': '42',
+        'state_name': 'Pennsylvania',
+        'counties': [
+            {'name': 'Adams County', 'county_fips': '001', 'geoid': '42001'},
+            {'name': 'Allegheny County', 'county_fips': '003', 'geoid': '42003'},
+        ],
+    },
+    'NJ': {
+        'state_fips': '34',
+        'state_name': 'New Jersey',
+        'counties': [
+            {'name': 'Atlantic County', 'county_fips': '001', 'geoid': '34001'},
+            {'name': 'Bergen County', 'county_fips': '003', 'geoid': '34003'},
+        ],
+    },
+    'DE': {
+        'state_fips': '10',
+        'state_name': 'Delaware',
+        'counties': [
+            {'name': 'Kent County', 'county_fips': '001', 'geoid': '10001'},
+        ],
+    },
+}
+
+CHUNKS = ['DE.ts', 'NJ.ts', 'PA.ts']
+OLD_MTIME_NS = 10**18  # 2001-09-09
+
+def write(county_data, out_dir, incremental=False):
+    return write_split_states(build_matrix(county_data), str(out_dir), county_data, incremental=incremental)
+
+def snapshot(out_dir):
+    """Chunk bytes by filename, with every chunk's mtime pushed into the past so rewrites show"""
+    chunks = {}
+    for filename in sorted(os.listdir(out_dir)):
+        if filename in CHUNKS:
+            path = os.path.join(out_dir, filename)
+            os.utime(path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+            with open(path, 'rb') as f:
+                chunks[filename] = f.read()
+    return chunks
+
+def test_first_run_writes_every_chunk(tmp_path):
+    written, unchanged = write(COUNTY_DATA, tmp_path)
+    assert set(CHUNKS) <= set(written)
+    assert unchanged == 0
+
+def test_incremental_run_rewrites_only_the_changed_state(tmp_path):
+    write(COUNTY_DATA, tmp_path)
+    before = snapshot(tmp_path)
+    changed = copy.deepcopy(COUNTY_DATA)
+    changed['NJ']['counties'][1]['name'] = 'Burlington County'
+
+    written, unchanged = write(changed, tmp_path, incremental=True)
+
+    assert 'NJ.ts' in written and 'PA.ts' not in written and 'DE.ts' not in written
+    assert unchanged == 2
+    for filename in ('DE.ts', 'PA.ts'):
+        path = tmp_path / filename
+        assert path.read_bytes() == before[filename]
+        assert path.stat().st_mtime_ns == OLD_MTIME_NS
+    assert b'Burlington County' in (tmp_path / 'NJ.ts').read_bytes()
+
+def test_unchanged_incremental_run_writes_no_chunks(tmp_path):
+    write(COUNTY_DATA, tmp_path)
+    before = snapshot(tmp_path)
+    written, unchanged = write(COUNTY_DATA, tmp_path, incremental=True)
+    assert not set(CHUNKS) & set(written)
+    assert unchanged == len(CHUNKS)
+    assert snapshot(tmp_path) == before
+
+def test_incremental_run_deletes_removed_state_chunk(tmp_path):
+    write(COUNTY_DATA, tmp_path)
+    before = snapshot(tmp_path)
+    remaining = {code: info for code, info in COUNTY_DATA.items() if code != 'DE'}
+
+    written, _ = write(remaining, tmp_path, incremental=True)
+
+    assert not (tmp_path / 'DE.ts').exists()
+    assert not {'NJ.ts', 'PA.ts'} & set(written)
+    for filename in ('NJ.ts', 'PA.ts'):
+        assert (tmp_path / filename).read_bytes() == before[filename]
@@ -304,19 +304,23 @@ export const calculateLoan = (inputs: LoanInputs, maxLTVPercent: number = 0.75):
   // Per HUD comparison: the PA rate table has SALE/OWNER rates ($1,213 for $130k),
   // but lender's title policy is much lower ($365 for $226k loan). Use dollar override.
   // In HIDEOUT mode: NEVER fall back to rate table — Walker/Penn Attorneys price separately.
+  // Priced as a function of purchase price so the purchase sensitivity scenarios reuse the same model.
   const totalLoanAmount = purchasePrice + rehabBudget;
-  let titleInsuranceCost = 0;
-  if (lendersTitleInsurance && lendersTitleInsurance > 0) {
-    // Dollar override: use exact amount from HUD (e.g., lender's title policy)
-    titleInsuranceCost = lendersTitleInsurance;
-  } else if (titleInsuranceRate && titleInsuranceRate > 0) {
-    // Manual override: use percentage rate on purchase price
-    titleInsuranceCost = purchasePrice * (titleInsuranceRate / 100);
-  } else if (appVersion !== 'HIDEOUT') {
-    // Default (NORMAL only): use PA Title Insurance Rate Table chart based on purchase price
-    // In HIDEOUT mode, skip — user must enter the actual lender's policy amount
-    titleInsuranceCost = calculatePATitleInsurance(purchasePrice);
-  }
+  const titleCostAtPrice = (price: number): number => {
+    if (lendersTitleInsurance && lendersTitleInsurance > 0) {
+      // Dollar override: use exact amount from HUD (e.g., lender's title policy); fixed at any price
+      return lendersTitleInsurance;
+    } else if (titleInsuranceRate && titleInsuranceRate > 0) {
+      // Manual override: use percentage rate on purchase price
+      return price * (titleInsuranceRate / 100);
+    } else if (appVersion !== 'HIDEOUT') {
+      // Default (NORMAL only): use PA Title Insurance Rate Table chart based on purchase price
+      // In HIDEOUT mode, skip — user must enter the actual lender's policy amount
+      return calculatePATitleInsurance(price);
+    }
+    return 0;
+  };
+  const titleInsuranceCost = titleCostAtPrice(purchasePrice);
   
   // Hideout Transfer Fee: Manual dollar entry ONLY
   // Per HUD comparison: Hideout POA transfer fee is NOT related to PA title insurance rates.
@@ -898,6 +902,11 @@ export const calculateLoan = (inputs: LoanInputs, maxLTVPercent: number = 0.75):
     }
   }
 
+  // Price-dependent closing costs for the purchase sensitivity scenarios: title insurance and
+  // transfer tax, priced exactly as titleInsuranceCost and transferTaxCost above
+  const closingCostAtPrice = (price: number): number =>
+    titleCostAtPrice(price) + price * (transferTaxRate / 100);
+
   return {
     maxLTVPercent: MAX_LTV_PERCENT * 100,
     maxLoanAmountDollars: maxLoanBasedOnARV,
@@ -1038,7 +1047,8 @@ export const calculateLoan = (inputs: LoanInputs, maxLTVPercent: number = 0.75):
       totalHoldingCosts,
       totalExitCosts,
       financingPercent,
-      MAX_LTV_PERCENT
+      MAX_LTV_PERCENT,
+      closingCostAtPrice
     ),
     rehabSensitivityScenarios: generateRehabSensitivity(
       rehabBudget,
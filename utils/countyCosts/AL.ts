@@ -0,0 +1,7 @@
+// ALABAMA (AL) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Autauga County","Baldwin County","Barbour County","Bibb County","Blount County","Bullock County","Butler County","Calhoun County","Chambers County","Cherokee County","Chilton County","Choctaw County","Clarke County","Clay County","Cleburne County","Coffee County","Colbert County","Conecuh County","Coosa County","Covington County","Crenshaw County","Cullman County","Dale County","Dallas County","DeKalb County","Elmore County","Escambia County","Etowah County","Fayette County","Franklin County","Geneva County","Greene County","Hale County","Henry County","Houston County","Jackson County","Jefferson County","Lamar County","Lauderdale County","Lawrence County","Lee County","Limestone County","Lowndes County","Macon County","Madison County","Marengo County","Marion County","Marshall County","Mobile County","Monroe County","Montgomery County","Morgan County","Perry County","Pickens County","Pike County","Randolph County","Russell County","Shelby County","St. Clair County","Sumter County","Talladega County","Tallapoosa County","Tuscaloosa County","Walker County","Washington County","Wilcox County","Winston County"];
+export const COUNTY_COLUMNS: string[] = ["WQFhAW4BXgF0AWYBcAFzAWgBYAFgAV4BZgFlAV4BdAFZAW4BbQFkAVwBagFiAW8BZwFxAVYBZQF5AWoBVwF0AXYBWAFdAWwBdAFfAWwBXwFYAXYBZAFYAVcBXQF3AVcBXQFnAVkBWQFpAXQBbwFkAV8BaQFxAXYBZQFmAWYBaAFXAWIBeAE=","pgGwAb8BrAHGAbYBwgHFAbgBrwGuAawBtgG1AawBxgGmAcABvwGzAakBuwGxAcABtwHDAaIBtAHNAbsBowHHAckBpAGqAb0BxwGtAb0BrQGkAckBtAGkAaMBqwHLAaMBqgG3AaYBpgG6AccBwQG0Aa0BuQHDAcoBtAG2AbUBuAGkAbABzAE=","UAFXAWQBVAFpAVwBZgFoAV4BVwFWAVQBXAFbAVQBaQFQAWQBYwFaAVIBYAFYAWUBXQFnAUwBWwFvAWABTQFqAWsBTgFTAWIBagFVAWIBVQFOAWsBWgFOAU0BUwFtAU0BUwFdAVABUAFfAWoBZQFaAVUBXwFnAWwBWwFcAVwBXgFOAVgBbgE=","fAB/AIQAfgCGAIEAhQCGAIIAfwB/AH4AgQCBAH4AhgB8AIQAhACAAH0AgwCAAIQAgQCFAHsAgQCIAIMAewCGAIcAfAB+AIMAhgB+AIMAfgB8AIcAgAB8AHsAfgCHAHwAfgCBAHwAfACCAIYAhACAAH4AggCFAIcAgQCBAIEAggB8AH8AhwA=","EAIcAi8CFwI4AiMCMwI3AiYCGwIaAhcCIwIiAhcCOAIQAjACLgIfAhMCKgIdAjECJAI0AgoCIgJAAioCDAI5AjsCDQIVAi0COQIYAiwCGAINAjsCIQINAgwCFgI+AgwCFQIlAhACEAIoAjkCMQIhAhgCJwI0AjwCIgIkAiMCJgINAh0CPwI=","NAA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA0ADUANQA1ADQANQA1ADUANQA1ADQANQA1ADUANAA1ADUANAA0ADUANQA1ADUANQA0ADUANQA0ADQANAA1ADQANAA1ADQANAA1ADUANQA1ADUANQA1ADUANQA1ADUANQA0ADUANQA=","fAB/AIQAfgCGAIEAhQCGAIIAfwB/AH4AgQCBAH4AhgB8AIQAhACAAH0AgwCAAIQAgQCFAHsAgQCIAIMAewCGAIcAfAB+AIMAhgB+AIMAfgB8AIcAgAB8AHsAfgCHAHwAfgCBAHwAfACCAIYAhACAAH4AggCFAIcAgQCBAIEAggB8AH8AhwA=","KAApACoAKAArACkAKwArACoAKQApACgAKQApACgAKwAoACoAKgApACgAKgApACoAKQArACcAKQAsACoAKAArACsAKAAoACoAKwAoACoAKAAoACsAKQAoACgAKAArACgAKAApACgAKAAqACsAKgApACgAKgArACsAKQApACkAKgAoACkAKwA=","FQAVABYAFQAWABUAFgAWABYAFQAVABUAFQAVABUAFgAVABYAFgAVABUAFgAVABYAFQAWABQAFQAXABYAFAAWABYAFQAVABYAFgAVABYAFQAVABYAFQAVABQAFQAWABQAFQAVABUAFQAWABYAFgAVABUAFgAWABYAFQAVABUAFgAVABUAFwA="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBXAFkAWwBdAF8AYQBjAGUAZwBpAGsAbQBvAHEAdQBzAHcAeQB7AH0AfwCBAIMAhQA=";
+export const ALIAS_KEYS: string[] = ["autauga","autauga county","baldwin","baldwin county","barbour","barbour county","bibb","bibb county","blount","blount county","bullock","bullock county","butler","butler county","calhoun","calhoun county","chambers","chambers county","cherokee","cherokee county","chilton","chilton county","choctaw","choctaw county","clarke","clarke county","clay","clay county","cleburne","cleburne county","coffee","coffee county","colbert","colbert county","conecuh","conecuh county","coosa","coosa county","covington","covington county","crenshaw","crenshaw county","cullman","cullman county","dale","dale county","dallas","dallas county","dekalb","dekalb county","elmore","elmore county","escambia","escambia county","etowah","etowah county","fayette","fayette county","franklin","franklin county","geneva","geneva county","greene","greene county","hale","hale county","henry","henry county","houston","houston county","jackson","jackson county","jefferson","jefferson county","lamar","lamar county","lauderdale","lauderdale county","lawrence","lawrence county","lee","lee county","limestone","limestone county","lowndes","lowndes county","macon","macon county","madison","madison county","marengo","marengo county","marion","marion county","marshall","marshall county","mobile","mobile county","monroe","monroe county","montgomery","montgomery county","morgan","morgan county","perry","perry county","pickens","pickens county","pike","pike county","randolph","randolph county","russell","russell county","saint clair","saint clair county","shelby","shelby county","sumter","sumter county","talladega","talladega county","tallapoosa","tallapoosa county","tuscaloosa","tuscaloosa county","walker","walker county","washington","washington county","wilcox","wilcox county","winston","winston county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOgA6ADkAOQA7ADsAPAA8AD0APQA+AD4APwA/AEAAQABBAEEAQgBCAA==";
+export const PRICE_BAND_TOTALS: string[] = ["mAjJCBEJtwgxCeQIHwktCfEIxgjDCLcI5AjgCLcIMQmYCBMJDgnXCKUI/gjPCBYJ6AgjCYMI3whRCf4IiQg0CT0JkAisCAcJNAm7CAYJuwiQCD0J2giQCIkIrghFCYsIrAjpCJgImAj3CDQJFwnaCLsI9QgjCUAJ3wjlCOMI8QiPCMwISgk=","nAnSCRoKwAk6Cu0JKAo2CvoJzwnMCcAJ7QnpCcAJOgqcCRwKFwrgCakJBwrYCR8K8QksCocJ6AlaCgcKjQk9CkYKlAmwCRAKPQrECQ8KxAmUCUYK4wmUCY0JsglOCo8JsAnyCZwJnAkACj0KIArjCcQJ/gksCkkK6AnuCewJ+gmTCdUJUwo=","oArbCiMLyQpDC/YKMQs/CwML2ArVCskK9gryCskKQwugCiULIAvpCq0KEAvhCigL+go1C4sK8QpjCxALkQpGC08LmAq0ChkLRgvNChgLzQqYCk8L7AqYCpEKtgpXC5MKtAr7CqAKoAoJC0YLKQvsCs0KBws1C1IL8Qr3CvUKAwuXCt4KXAs=","pAvkCywM0gtMDP8LOgxIDAwM4QveC9IL/wv7C9ILTAykCy4MKQzyC7ELGQzqCzEMAww+DI8L+gtsDBkMlQtPDFgMnAu4CyIMTwzWCyEM1gucC1gM9QucC5ULugtgDJcLuAsEDKQLpAsSDE8MMgz1C9YLEAw+DFsM+gsADP4LDAybC+cLZQw=","qAztDDUN2wxVDQgNQw1RDRUN6gznDNsMCA0EDdsMVQ2oDDcNMg37DLUMIg3zDDoNDA1HDZMMAw11DSINmQxYDWENoAy8DCsNWA3fDCoN3wygDGEN/gygDJkMvgxpDZsMvAwNDagMqAwbDVgNOw3+DN8MGQ1HDWQNAw0JDQcNFQ2fDPAMbg0=","rA32DT4O5A1eDhEOTA5aDh4O8w3wDeQNEQ4NDuQNXg6sDUAOOw4EDrkNKw78DUMOFQ5QDpcNDA5+DisOnQ1hDmoOpA3ADTQOYQ7oDTMO6A2kDWoOBw6kDZ0Nwg1yDp8NwA0WDqwNrA0kDmEORA4HDugNIg5QDm0ODA4SDhAOHg6jDfkNdw4=","tA8IEFAQ9g9wECMQXhBsEDAQBRACEPYPIxAfEPYPcBC0D1IQTRAWEMEPPRAOEFUQJxBiEJ8PHhCQED0QpQ9zEHwQrA/ID0YQcxD6D0UQ+g+sD3wQGRCsD6UPyg+EEKcPyA8oELQPtA82EHMQVhAZEPoPNBBiEH8QHhAkECIQMBCrDwsQiRA=","vBEaEmISCBKCEjUScBJ+EkISFxIUEggSNRIxEggSghK8EWQSXxIoEskRTxIgEmcSORJ0EqcRMBKiEk8SrRGFEo4StBHQEVgShRIMElcSDBK0EY4SKxK0Ea0R0hGWEq8R0BE6ErwRvBFIEoUSaBIrEgwSRhJ0EpESMBI2EjQSQhKzER0SmxI=","0BZHF48XNRevF2IXnRerF28XRBdBFzUXYhdeFzUXrxfQFpEXjBdVF90WfBdNF5QXZhehF7sWXRfPF3wXwRayF7sXyBbkFoUXshc5F4QXORfIFrsXWBfIFsEW5hbDF8MW5BZnF9AW0BZ1F7IXlRdYFzkXcxehF74XXRdjF2EXbxfHFkoXyBc=","5Bt0HLwcYhzcHI8cyhzYHJwccRxuHGIcjxyLHGIc3BzkG74cuRyCHPEbqRx6HMEckxzOHM8bihz8HKkc1RvfHOgc3Bv4G7Ic3xxmHLEcZhzcG+gchRzcG9Ub+hvwHNcb+BuUHOQb5BuiHN8cwhyFHGYcoBzOHOscihyQHI4cnBzbG3cc9Rw=","DCbOJhYnvCY2J+kmJCcyJ/YmyybIJrwm6SblJrwmNicMJhgnEyfcJhkmAyfUJhsn7SYoJ/cl5CZWJwMn/SU5J0InBCYgJgwnOSfAJgsnwCYEJkIn3yYEJv0lIiZKJ/8lICbuJgwmDCb8JjknHCffJsAm+iYoJ0Un5CbqJugm9iYDJtEmTyc=","NDAoMXAxFjGQMUMxfjGMMVAxJTEiMRYxQzE/MRYxkDE0MHIxbTE2MUEwXTEuMXUxRzGCMR8wPjGwMV0xJTCTMZwxLDBIMGYxkzEaMWUxGjEsMJwxOTEsMCUwSjCkMScwSDBIMTQwNDBWMZMxdjE5MRoxVDGCMZ8xPjFEMUIxUDErMCsxqTE="];
@@ -0,0 +1,7 @@
+// ARKANSAS (AR) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Arkansas County","Ashley County","Baxter County","Benton County","Boone County","Bradley County","Calhoun County","Carroll County","Chicot County","Clark County","Clay County","Cleburne County","Cleveland County","Columbia County","Conway County","Craighead County","Crawford County","Crittenden County","Cross County","Dallas County","Desha County","Drew County","Faulkner County","Franklin County","Fulton County","Garland County","Grant County","Greene County","Hempstead County","Hot Spring County","Howard County","Independence County","Izard County","Jackson County","Jefferson County","Johnson County","Lafayette County","Lawrence County","Lee County","Lincoln County","Little River County","Logan County","Lonoke County","Madison County","Marion County","Miller County","Mississippi County","Monroe County","Montgomery County","Nevada County","Newton County","Ouachita County","Perry County","Phillips County","Pike County","Poinsett County","Polk County","Pope County","Prairie County","Pulaski County","Randolph County","Saline County","Scott County","Searcy County","Sebastian County","Sevier County","Sharp County","St. Francis County","Stone County","Union County","Van Buren County","Washington County","White County","Woodruff County","Yell County"];
+export const COUNTY_COLUMNS: string[] = ["QQFQAVgBRgFYAVABVAFQAToBSQFIAUEBRQFHAVkBTwFEAUsBQwFQAUIBVQFIAUwBSQFYAVcBVQFBAUgBSQFGAVkBTgFVAU8BWQFCATsBRwFQAVgBRQE6AVgBQgFGAUkBPAFIATwBTgFLAVYBUAFHATwBUQFNAUABRwFXAUcBOwFYAVEBPgFTAVQBVgFUATsBSAFEAVkB","jwGiAawBlQGrAaEBpgGiAYYBmQGXAY8BkwGWAa0BoQGTAZwBkgGiAZABqAGYAZ0BmQGsAaoBqAGPAZgBmAGVAa0BnwGoAaEBrQGQAYcBlwGhAasBlAGGAawBkAGVAZkBiQGYAYkBnwGcAakBogGWAYgBowGeAY4BlgGqAZYBiAGsAaMBiwGmAacBqQGmAYcBlwGSAa0B","OAFGAU4BPAFNAUYBSQFGATABPwE+ATcBOwE9AU8BRQE6AUEBOQFGATgBSwE+AUIBPwFOAU0BSwE3AT4BPwE8AU8BRAFLAUUBTwE4ATEBPQFGAU0BOwEwAU4BOAE8AT8BMwE+ATMBRAFBAUwBRgE9ATIBRwFDATcBPQFNAT0BMgFOAUcBNAFJAUoBTAFJATEBPgE6AU8B","cAB1AHgAcQB3AHUAdgB1AG0AcgByAHAAcQBxAHgAdQBxAHMAcAB1AHAAdwByAHMAcgB4AHcAdwBwAHIAcgBxAHgAdAB3AHUAeABwAG0AcgB1AHcAcQBtAHgAcABxAHIAbgByAG4AdABzAHcAdQBxAG4AdQB0AG8AcQB3AHIAbgB4AHUAbgB2AHYAdwB2AG0AcgBwAHgA","5wH+AQoC7wEJAv0BAwL+AdwB8wHxAecB7AHvAQsC/QHsAfcB6gH+AekBBgLyAfgB8wEKAggCBQLnAfIB8gHuAQwC+gEFAv0BDALoAd4B8AH9AQkC7QHcAQoC6AHuAfMB4AHyAeAB+wH2AQcC/gHvAd8B/wH5AeYB7wEIAvAB3gEKAgAC4gEDAgQCBwIDAt0B8QHrAQwC","MAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAA","dQB6AH0AdgB9AHoAewB6AHIAdwB3AHQAdgB2AH0AegB2AHgAdQB6AHUAfAB3AHgAdwB9AHwAfAB0AHcAdwB2AH0AeQB8AHoAfQB1AHIAdwB6AH0AdgByAH0AdQB2AHcAcwB3AHMAeQB4AHwAegB2AHIAegB5AHQAdgB8AHcAcgB9AHoAcwB7AHsAfAB7AHIAdwB1AH0A","JQAmACcAJQAnACYAJwAmACQAJQAlACUAJQAlACcAJgAlACYAJQAmACUAJwAlACYAJQAnACcAJwAlACUAJQAlACcAJgAnACYAJwAlACQAJQAmACcAJQAkACcAJQAlACUAJAAlACQAJgAmACcAJgAlACQAJgAmACQAJQAnACUAJAAnACYAJAAnACcAJwAnACQAJQAlACcA","FQAWABYAFQAWABYAFgAWABQAFQAVABUAFQAVABcAFgAVABYAFQAWABUAFgAVABYAFQAWABYAFgAVABUAFQAVABcAFgAWABYAFwAVABUAFQAWABYAFQAUABYAFQAVABUAFQAVABUAFgAWABYAFgAVABUAFgAWABUAFQAWABUAFQAWABYAFQAWABYAFgAWABUAFQAVABcA"];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBXAFkAWwBdAF8AYQBjAGUAZwBpAGsAbQBvAHEAcwB1AHcAeQB9AH8AgQCDAIUAhwB7AIkAiwCNAI8AkQCTAJUA";
+export const ALIAS_KEYS: string[] = ["arkansas","arkansas county","ashley","ashley county","baxter","baxter county","benton","benton county","boone","boone county","bradley","bradley county","calhoun","calhoun county","carroll","carroll county","chicot","chicot county","clark","clark county","clay","clay county","cleburne","cleburne county","cleveland","cleveland county","columbia","columbia county","conway","conway county","craighead","craighead county","crawford","crawford county","crittenden","crittenden county","cross","cross county","dallas","dallas county","desha","desha county","drew","drew county","faulkner","faulkner county","franklin","franklin county","fulton","fulton county","garland","garland county","grant","grant county","greene","greene county","hempstead","hempstead county","hot spring","hot spring county","howard","howard county","independence","independence county","izard","izard county","jackson","jackson county","jefferson","jefferson county","johnson","johnson county","lafayette","lafayette county","lawrence","lawrence county","lee","lee county","lincoln","lincoln county","little river","little river county","logan","logan county","lonoke","lonoke county","madison","madison county","marion","marion county","miller","miller county","mississippi","mississippi county","monroe","monroe county","montgomery","montgomery county","nevada","nevada county","newton","newton county","ouachita","ouachita county","perry","perry county","phillips","phillips county","pike","pike county","poinsett","poinsett county","polk","polk county","pope","pope county","prairie","prairie county","pulaski","pulaski county","randolph","randolph county","saint francis","saint francis county","saline","saline county","scott","scott county","searcy","searcy county","sebastian","sebastian county","sevier","sevier county","sharp","sharp county","stone","stone county","union","union county","van buren","van buren county","washington","washington county","white","white county","woodruff","woodruff county","yell","yell county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5ADoAOgA7ADsAPAA8AEMAQwA9AD0APgA+AD8APwBAAEAAQQBBAEIAQgBEAEQARQBFAEYARgBHAEcASABIAEkASQBKAEoA";
+export const PRICE_BAND_TOTALS: string[] = ["/gdRCH4IFwh6CE8IZAhRCNMHJwghCPwHEAgaCIMITQgOCDYIBwhRCAIIbggjCDoIJwh+CHYIbQj8ByMIJQgWCIQIRAhtCE0IhAgBCNkHHghPCHoIEgjTB34IAQgWCCcI4gcjCOIHRQg1CHIIUQgaCN4HVQhACPcHGgh2CB0I3Ad+CFYI6QdjCGcIcghkCNgHIQgKCIQI","7ghBCW4JBwlqCT8JVAlBCcMIFwkRCewIAAkKCXMJPQn+CCYJ9whBCfIIXgkTCSoJFwluCWYJXQnsCBMJFQkGCXQJNAldCT0JdAnxCMkIDgk/CWoJAgnDCG4J8QgGCRcJ0ggTCdIINQklCWIJQQkKCc4IRQkwCecICglmCQ0JzAhuCUYJ2QhTCVcJYglUCcgIEQn6CHQJ","3gkxCl4K9wlaCi8KRAoxCrMJBwoBCtwJ8An6CWMKLQruCRYK5wkxCuIJTgoDChoKBwpeClYKTQrcCQMKBQr2CWQKJApNCi0KZArhCbkJ/gkvCloK8gmzCV4K4Qn2CQcKwgkDCsIJJQoVClIKMQr6Cb4JNQogCtcJ+glWCv0JvAleCjYKyQlDCkcKUgpECrgJAQrqCWQK","zgohC04L5wpKCx8LNAshC6MK9wrxCswK4ArqClMLHQveCgYL1wohC9IKPgvzCgoL9wpOC0YLPQvMCvMK9QrmClQLFAs9Cx0LVAvRCqkK7gofC0oL4gqjCk4L0QrmCvcKsgrzCrIKFQsFC0ILIQvqCq4KJQsQC8cK6gpGC+0KrApOCyYLuQozCzcLQgs0C6gK8QraClQL","vgsRDD4M1ws6DA8MJAwRDJML5wvhC7wL0AvaC0MMDQzOC/YLxwsRDMILLgzjC/oL5ws+DDYMLQy8C+ML5QvWC0QMBAwtDA0MRAzBC5kL3gsPDDoM0guTCz4MwQvWC+cLogvjC6ILBQz1CzIMEQzaC54LFQwADLcL2gs2DN0LnAs+DBYMqQsjDCcMMgwkDJgL4QvKC0QM","rgwBDS4NxwwqDf8MFA0BDYMM1wzRDKwMwAzKDDMN/Qy+DOYMtwwBDbIMHg3TDOoM1wwuDSYNHQ2sDNMM1QzGDDQN9AwdDf0MNA2xDIkMzgz/DCoNwgyDDC4NsQzGDNcMkgzTDJIM9QzlDCINAQ3KDI4MBQ3wDKcMygwmDc0MjAwuDQYNmQwTDRcNIg0UDYgM0Qy6DDQN","jg7hDg4Ppw4KD98O9A7hDmMOtw6xDowOoA6qDhMP3Q6eDsYOlw7hDpIO/g6zDsoOtw4ODwYP/Q6MDrMOtQ6mDhQP1A79Dt0OFA+RDmkOrg7fDgoPog5jDg4PkQ6mDrcOcg6zDnIO1Q7FDgIP4Q6qDm4O5Q7QDocOqg4GD60ObA4OD+YOeQ7zDvcOAg/0DmgOsQ6aDhQP","bhDBEO4QhxDqEL8Q1BDBEEMQlxCREGwQgBCKEPMQvRB+EKYQdxDBEHIQ3hCTEKoQlxDuEOYQ3RBsEJMQlRCGEPQQtBDdEL0Q9BBxEEkQjhC/EOoQghBDEO4QcRCGEJcQUhCTEFIQtRClEOIQwRCKEE4QxRCwEGcQihDmEI0QTBDuEMYQWRDTENcQ4hDUEEgQkRB6EPQQ","HhVxFZ4VNxWaFW8VhBVxFfMURxVBFRwVMBU6FaMVbRUuFVYVJxVxFSIVjhVDFVoVRxWeFZYVjRUcFUMVRRU2FaQVZBWNFW0VpBUhFfkUPhVvFZoVMhXzFJ4VIRU2FUcVAhVDFQIVZRVVFZIVcRU6Ff4UdRVgFRcVOhWWFT0V/BSeFXYVCRWDFYcVkhWEFfgUQRUqFaQV","zhkhGk4a5xlKGh8aNBohGqMZ9xnxGcwZ4BnqGVMaHRreGQYa1xkhGtIZPhrzGQoa9xlOGkYaPRrMGfMZ9RnmGVQaFBo9Gh0aVBrRGakZ7hkfGkoa4hmjGU4a0RnmGfcZshnzGbIZFRoFGkIaIRrqGa4ZJRoQGscZ6hlGGu0ZrBlOGiYauRkzGjcaQho0GqgZ8RnaGVQa","LiOBI64jRyOqI38jlCOBIwMjVyNRIywjQCNKI7MjfSM+I2YjNyOBIzIjniNTI2ojVyOuI6YjnSMsI1MjVSNGI7QjdCOdI30jtCMxIwkjTiN/I6ojQiMDI64jMSNGI1cjEiNTIxIjdSNlI6IjgSNKIw4jhSNwIycjSiOmI00jDCOuI4YjGSOTI5cjoiOUIwgjUSM6I7Qj","jizhLA4tpywKLd8s9CzhLGMstyyxLIwsoCyqLBMt3SyeLMYslyzhLJIs/iyzLMostywOLQYt/SyMLLMstSymLBQt1Cz9LN0sFC2RLGksrizfLAotoixjLA4tkSymLLcsciyzLHIs1SzFLAIt4SyqLG4s5SzQLIcsqiwGLa0sbCwOLeYseSzzLPcsAi30LGgssSyaLBQt"];
@@ -0,0 +1,7 @@
+// ARIZONA (AZ) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Apache County","Cochise County","Coconino County","Gila County","Graham County","Greenlee County","La Paz County","Maricopa County","Mohave County","Navajo County","Pima County","Pinal County","Santa Cruz County","Yavapai County","Yuma County"];
+export const COUNTY_COLUMNS: string[] = ["wQHEAbYBwgHXAbQBsAHRAdQBuQG/AbUByAGvAdYB","LgIyAiECMAJKAh4CGgJDAkYCJQIsAiACOAIYAkkC","TAJQAj4CTgJpAjsCNgJiAmUCQwJKAj4CVgI1AmkC","cgBzAHAAcwB4AG8AbgB3AHcAcAByAG8AdABuAHgA","qAGrAZ0BqQG8AZsBmAG3AboBoQGmAZ0BrwGXAbwB","OAA4ADcAOAA4ADcANwA4ADgANwA4ADcAOAA3ADgA","swC0AK8AtAC8AK4ArAC6ALsAsACyAK8AtgCsALwA","MAAxAC8AMQAzAC8ALwAyADIAMAAwAC8AMQAuADMA","GQAaABkAGgAbABkAGAAaABsAGQAZABkAGgAYABsA"];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADAANAA8AEQATABUAFwAZABsA";
+export const ALIAS_KEYS: string[] = ["apache","apache county","cochise","cochise county","coconino","coconino county","gila","gila county","graham","graham county","greenlee","greenlee county","la paz","la paz county","maricopa","maricopa county","mohave","mohave county","navajo","navajo county","pima","pima county","pinal","pinal county","santa cruz","santa cruz county","yavapai","yavapai county","yuma","yuma county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4A";
+export const PRICE_BAND_TOTALS: string[] = ["aQp7CiwKcwrgCiAKDArCCtAKPgpgCikKkgoGCt4K","gQuTCz8Liwv4CzMLHwvaC+gLUQt4CzwLqgsZC/YL","mQyrDFIMowwQDUYMMgzyDAANZAyQDE8MwgwsDA4N","sQ3DDWUNuw0oDlkNRQ0KDhgOdw2oDWIN2g0/DSYO","yQ7bDngO0w5AD2wOWA4iDzAPig7ADnUO8g5SDj4P","4Q/zD4sP6w9YEH8Paw86EEgQnQ/YD4gPChBlD1YQ","ERIjErERGxKIEqURkRFqEngSwxEIEq4ROhKLEYYS","QRRTFNcTSxS4FMsTtxOaFKgU6RM4FNQTahSxE7YU","uRnLGTYZwxkwGioZFhkSGiAaSBmwGTMZ4hkQGS4a","MR9DH5UeOx+oH4kedR6KH5gfpx4oH5IeWh9vHqYf","ISozKlMpKyqYKkcpMyl6KogqZSkYKlApSiotKZYq","ETUjNRE0GzWINQU08TNqNXg1IzQINQ40OjXrM4Y1"];
@@ -0,0 +1,7 @@
+// CALIFORNIA (CA) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Alameda County","Alpine County","Amador County","Butte County","Calaveras County","Colusa County","Contra Costa County","Del Norte County","El Dorado County","Fresno County","Glenn County","Humboldt County","Imperial County","Inyo County","Kern County","Kings County","Lake County","Lassen County","Los Angeles County","Madera County","Marin County","Mariposa County","Mendocino County","Merced County","Modoc County","Mono County","Monterey County","Napa County","Nevada County","Orange County","Placer County","Plumas County","Riverside County","Sacramento County","San Benito County","San Bernardino County","San Diego County","San Francisco County","San Joaquin County","San Luis Obispo County","San Mateo County","Santa Barbara County","Santa Clara County","Santa Cruz County","Shasta County","Sierra County","Siskiyou County","Solano County","Sonoma County","Stanislaus County","Sutter County","Tehama County","Trinity County","Tulare County","Tuolumne County","Ventura County","Yolo County","Yuba County"];
+export const COUNTY_COLUMNS: string[] = ["TwJOAlYCYQI+AmgCPQJzAmACbgJ0AnQCTQJNAlkCVwJtAjsCUwJLAmQCZwJdAlcCZgJVAnECZAJVAmoCUwJkAmcCPAJHAlYCWgJKAnUCOwJfAlgCYgJgAnMCRgJqAnMCaAJwAl4CSAJlAlACSgJyAm4CQwI=","/AL6AgQDEwPmAhsD5AIqAxEDJAMrAywD+QL5AggDBgMiA+ECAAP2AhcDGwMNAwYDGQMDAygDFgMDAx4DAAMWAxsD4wLxAgQDCgP1AiwD4QIRAwcDFAMSAyoD8AIeAykDHAMmAw8D8gIYA/wC9QIpAyMD7AI=","4wLiAusC+gLOAgIDzQIQA/gCCgMRAxID4ALhAu8C7QIJA8oC6ALeAv0CAQP0Au0CAAPqAg4D/QLrAgQD6AL9AgEDywLZAusC8QLcAhIDygL3Au4C+wL5AhAD2AIEAw8DAwMMA/YC2gL/AuQC3QIPAwkD1AI=","9gD2APkA/gDvAAAB7wAFAf0AAwEFAQYB9QD1APoA+QADAe4A+AD0AP8AAAH8APkAAAH4AAQB/wD5AAEB+AD/AAAB7gDzAPkA+wD0AAYB7gD9APoA/gD9AAUB8gABAQUBAQEEAfwA8wD/APYA9AAFAQMB8QA=","2gPYA+UD+AO+AwMEvAMWBPYDDgQXBBgE1gPXA+oD5wMMBLgD4APTA/wDAgTwA+cDAATjAxME/APkAwYE4AP8AwIEugPMA+UD7APRAxkEuAP0A+gD+gP2AxYEywMGBBUEBAQRBPIDzgP+A9sD0gMUBA0ExgM=","OQA5ADoAOgA5ADoAOQA6ADoAOgA6ADoAOQA5ADoAOgA6ADkAOgA5ADoAOgA6ADoAOgA6ADoAOgA6ADoAOgA6ADoAOQA5ADoAOgA5ADoAOQA6ADoAOgA6ADoAOQA6ADoAOgA6ADoAOQA6ADkAOQA6ADoAOQA=","QAE/AUQBSgE3AU0BNgFTAUkBUQFUAVQBPwE/AUUBRAFQATUBQgE+AUsBTQFHAUQBTAFDAVIBSwFDAU4BQgFLAU0BNgE7AUQBRgE9AVQBNQFJAUUBSgFJAVMBOwFOAVMBTgFSAUgBPAFMAUABPQFTAVEBOQE=","QwBCAEMARQBBAEUAQQBHAEQARgBHAEcAQgBCAEQAQwBGAEAAQwBCAEUARQBEAEMARQBDAEYARQBDAEYAQwBFAEUAQABCAEMARABCAEcAQABEAEQARQBFAEcAQgBGAEcARQBGAEQAQgBFAEMAQgBGAEYAQQA=","LwAvAC8AMAAtADEALQAyADAAMQAyADIALwAvADAALwAxAC0ALwAuADEAMQAwAC8AMQAvADIAMAAvADEALwAwADEALQAuAC8AMAAuADIALQAwADAAMAAwADIALgAxADIAMQAxADAALgAxAC8ALgAyADEALgA="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBXAFkAWwBdAF8AYQBjAGUAZwBpAGsAbQBvAHEAcwA=";
+export const ALIAS_KEYS: string[] = ["alameda","alameda county","alpine","alpine county","amador","amador county","butte","butte county","calaveras","calaveras county","colusa","colusa county","contra costa","contra costa county","del norte","del norte county","el dorado","el dorado county","fresno","fresno county","glenn","glenn county","humboldt","humboldt county","imperial","imperial county","inyo","inyo county","kern","kern county","kings","kings county","lake","lake county","lassen","lassen county","los angeles","los angeles county","madera","madera county","marin","marin county","mariposa","mariposa county","mendocino","mendocino county","merced","merced county","modoc","modoc county","mono","mono county","monterey","monterey county","napa","napa county","nevada","nevada county","orange","orange county","placer","placer county","plumas","plumas county","riverside","riverside county","sacramento","sacramento county","san benito","san benito county","san bernardino","san bernardino county","san diego","san diego county","san francisco","san francisco county","san joaquin","san joaquin county","san luis obispo","san luis obispo county","san mateo","san mateo county","santa barbara","santa barbara county","santa clara","santa clara county","santa cruz","santa cruz county","shasta","shasta county","sierra","sierra county","siskiyou","siskiyou county","solano","solano county","sonoma","sonoma county","stanislaus","stanislaus county","sutter","sutter county","tehama","tehama county","trinity","trinity county","tulare","tulare county","tuolumne","tuolumne county","ventura","ventura county","yolo","yolo county","yuba","yuba county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5AA==";
+export const PRICE_BAND_TOTALS: string[] = ["zQ/FD/sPRRBhD20QWg+2EDsQlxC7EL8Qvg/ADw8QAhCQEEsP6Q+xD1YQahAnEAIQYxD0D6oQVBD3D3oQ6Q9UEGoQUg+YD/sPGBCqD8EQSw83EAoQShA+ELYQkw96ELMQchCiEC8Qng9dENAPrA+wEJQQfw8=","6hDiEB0RZxF+EI8RdxDYEV0RuRHdEeER2xDdEDERJBGyEWgQCxHOEHgRjBFJESQRhREWEcwRdhEZEZwRCxF2EYwRbxC1EB0ROhHHEOMRaBBZESwRbBFgEdgRsBCcEdURlBHEEVERuxB/Ee0QyRDSEbYRnBA=","BxL/ET8SiRKbEbESlBH6En8S2xL/EgMT+BH6EVMSRhLUEoURLRLrEZoSrhJrEkYSpxI4Eu4SmBI7Er4SLRKYEq4SjBHSET8SXBLkEQUThRF7Ek4SjhKCEvoSzRG+EvcSthLmEnMS2BGhEgoS5hH0EtgSuRE=","JBMcE2ETqxO4EtMTsRIcFKET/RMhFCUUFRMXE3UTaBP2E6ISTxMIE7wT0BONE2gTyRNaExAUuhNdE+ATTxO6E9ATqRLvEmETfhMBEycUohKdE3ATsBOkExwU6hLgExkU2BMIFJUT9RLDEycTAxMWFPoT1hI=","QRQ5FIMUzRTVE/UUzhM+FcMUHxVDFUcVMhQ0FJcUihQYFb8TcRQlFN4U8hSvFIoU6xR8FDIV3BR/FAIVcRTcFPIUxhMMFIMUoBQeFEkVvxO/FJIU0hTGFD4VBxQCFTsV+hQqFbcUEhTlFEQUIBQ4FRwV8xM=","XhVWFaUV7xXyFBcW6xRgFuUVQRZlFmkWTxVRFbkVrBU6FtwUkxVCFQAWFBbRFawVDRaeFVQW/hWhFSQWkxX+FRQW4xQpFaUVwhU7FWsW3BThFbQV9BXoFWAWJBUkFl0WHBZMFtkVLxUHFmEVPRVaFj4WEBU=","mBeQF+kXMxgsF1sYJRekGCkYhRipGK0YiReLF/0X8Bd+GBYX1xd8F0QYWBgVGPAXURjiF5gYQhjlF2gY1xdCGFgYHRdjF+kXBhh1F68YFhclGPgXOBgsGKQYXhdoGKEYYBiQGB0YaRdLGJsXdxeeGIIYShc=","0hnKGS0adxpmGZ8aXxnoGm0ayRrtGvEawxnFGUEaNBrCGlAZGxq2GYganBpZGjQalRomGtwahhopGqwaGxqGGpwaVxmdGS0aShqvGfMaUBlpGjwafBpwGugamBmsGuUapBrUGmEaoxmPGtUZsRniGsYahBk=","Yx9bH9cfISD3Hkkg8B6SIBcgcyCXIJsgVB9WH+sf3h9sIOEexR9HHzIgRiADIN4fPyDQH4YgMCDTH1YgxR8wIEYg6B4uH9cf9B9AH50g4R4TIOYfJiAaIJIgKR9WII8gTiB+IAsgNB85IGYfQh+MIHAgFR8=","9CTsJIElyyWIJPMlgSQ8JsElHSZBJkUm5STnJJUliCUWJnIkbyXYJNwl8CWtJYgl6SV6JTAm2iV9JQAmbyXaJfAleSS/JIElniXRJEcmciS9JZAl0CXEJTwmuiQAJjkm+CUoJrUlxSTjJfck0yQ2JhompiQ=","FjAOMNUwHzGqL0cxoy+QMRUxcTGVMZkxBzAJMOkw3DBqMZQvwzD6LzAxRDEBMdwwPTHOMIQxLjHRMFQxwzAuMUQxmy/hL9Uw8jDzL5sxlC8RMeQwJDEYMZAx3C9UMY0xTDF8MQkx5y83MRkw9S+KMW4xyC8=","ODswOyk8czzMOps8xTrkPGk8xTzpPO08KTsrOz08MDy+PLY6FzwcO4Q8mDxVPDA8kTwiPNg8gjwlPKg8FzyCPJg8vToDOyk8RjwVO+88tjplPDg8eDxsPOQ8/jqoPOE8oDzQPF08CTuLPDs7FzvePMI86jo="];
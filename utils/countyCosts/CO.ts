@@ -0,0 +1,7 @@
+// COLORADO (CO) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Adams County","Alamosa County","Arapahoe County","Archuleta County","Baca County","Bent County","Boulder County","Broomfield County","Chaffee County","Cheyenne County","Clear Creek County","Conejos County","Costilla County","Crowley County","Custer County","Delta County","Denver County","Dolores County","Douglas County","Eagle County","El Paso County","Elbert County","Fremont County","Garfield County","Gilpin County","Grand County","Gunnison County","Hinsdale County","Huerfano County","Jackson County","Jefferson County","Kiowa County","Kit Carson County","La Plata County","Lake County","Larimer County","Las Animas County","Lincoln County","Logan County","Mesa County","Mineral County","Moffat County","Montezuma County","Montrose County","Morgan County","Otero County","Ouray County","Park County","Phillips County","Pitkin County","Prowers County","Pueblo County","Rio Blanco County","Rio Grande County","Routt County","Saguache County","San Juan County","San Miguel County","Sedgwick County","Summit County","Teller County","Washington County","Weld County","Yuma County"];
+export const COUNTY_COLUMNS: string[] = ["uAHFAdAB0wHFAa4BwgHGAbMBrgHPAb8B1wHLAcUBtwHWAcEBuAG5AbUB1wG0AcUBtQG9AbQBvAHUAccB0QHYAcoBxgHSAa0BugG+AdUByAHOAbQBuwHCAbABwwGuAc4B0wHDAdcBwAG/AbQBswG4AbcB1gHWAcsB1AGtAcsB1gE=","IwIzAkECRQIzAhcCMQI2Ah4CFwJBAiwCSgI7AjQCIgJJAi8CIwIlAiACSgIeAjMCIAIqAh8CKQJGAjcCQwJLAjoCNQJEAhYCJwIsAkgCNwI/Ah8CJwIwAhkCMgIXAj8CRQIyAkoCLgItAh8CHQIkAiICSQJJAjsCRgIWAjsCSQI=","QQJSAmACZAJSAjQCTwJUAjsCNAJgAkoCagJZAlICPwJoAk0CQQJCAj0CagI7AlICPgJIAjwCRgJmAlUCYgJqAlgCUwJjAjICRAJJAmcCVgJeAjwCRQJOAjYCUAI0Al0CZQJQAmkCTAJLAjwCOgJBAj8CaAJpAlkCZQIzAloCaQI=","iACMAJAAkQCMAIUAjACNAIcAhQCQAIsAkgCOAI0AiACSAIsAiACJAIgAkgCHAIwAiACKAIcAigCRAI0AkACSAI4AjQCRAIUAiQCLAJIAjQCPAIcAiQCMAIYAjACFAI8AkQCMAJIAiwCLAIcAhwCJAIgAkgCSAI4AkQCFAI4AkgA=","GQIpAjcCOgIpAg4CJwIsAhQCDQI3AiICQAIxAioCGAI+AiUCGQIbAhYCQAIUAikCFwIhAhYCHwI8Ai0COQJAAi8CKwI5AgwCHQIiAj0CLQI1AhYCHQImAhACKAINAjQCOwIoAj8CJAIjAhYCEwIaAhgCPgI/AjECPAINAjECPwI=","NwA4ADgAOAA4ADcAOAA4ADcANwA4ADgAOAA4ADgANwA4ADgANwA3ADcAOAA3ADgANwA4ADcAOAA4ADgAOAA4ADgAOAA4ADcANwA4ADgAOAA4ADcAOAA4ADcAOAA3ADgAOAA4ADgAOAA4ADcANwA3ADcAOAA4ADgAOAA3ADgAOAA=","uQC/AMQAxQC/ALUAvgDAALcAtQDDALwAxwDBAL8AuQDGAL0AuQC6ALgAxwC4AL8AuAC8ALgAuwDFAMAAxADHAMEAvwDEALUAugC8AMYAwADDALgAuwC+ALYAvgC1AMMAxQC+AMYAvQC9ALgAtwC6ALkAxgDGAMEAxQC1AMEAxgA=","MQAzADQANAAzADAAMwAzADEAMAA0ADIANQA0ADMAMQA1ADIAMQAyADEANQAxADMAMQAyADEAMgA1ADMANAA1ADMAMwA0ADAAMgAyADUAMwA0ADEAMgAzADAAMwAwADQANAAzADUAMgAyADEAMQAxADEANQA1ADQANQAwADQANQA=","GwAcABwAHQAcABoAHAAcABsAGgAcABsAHQAcABwAGwAdABsAGwAbABsAHQAbABwAGwAbABsAGwAdABwAHAAdABwAHAAdABoAGwAbAB0AHAAcABsAGwAcABoAHAAaABwAHQAcAB0AGwAbABsAGwAbABsAHQAdABwAHQAaABwAHQA="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAOAA8AEQATABUAFwAZABsAHQAfACEAIwAlACkAJwArAC0ALwAxADMANQA3ADkAOwA9AD8AQwBBAEUARwBJAEsATQBPAFEAUwBVAFcAWQBbAF0AXwBhAGMAZQBnAGkAawBtAG8AcQBzAHUAdwB5AHsAfQA=";
+export const ALIAS_KEYS: string[] = ["adams","adams county","alamosa","alamosa county","arapahoe","arapahoe county","archuleta","archuleta county","baca","baca county","bent","bent county","boulder","boulder county","broomfield","broomfield county","chaffee","chaffee county","cheyenne","cheyenne county","clear creek","clear creek county","conejos","conejos county","costilla","costilla county","crowley","crowley county","custer","custer county","delta","delta county","denver","denver county","dolores","dolores county","douglas","douglas county","eagle","eagle county","el paso","el paso county","elbert","elbert county","fremont","fremont county","garfield","garfield county","gilpin","gilpin county","grand","grand county","gunnison","gunnison county","hinsdale","hinsdale county","huerfano","huerfano county","jackson","jackson county","jefferson","jefferson county","kiowa","kiowa county","kit carson","kit carson county","la plata","la plata county","lake","lake county","larimer","larimer county","las animas","las animas county","lincoln","lincoln county","logan","logan county","mesa","mesa county","mineral","mineral county","moffat","moffat county","montezuma","montezuma county","montrose","montrose county","morgan","morgan county","otero","otero county","ouray","ouray county","park","park county","phillips","phillips county","pitkin","pitkin county","prowers","prowers county","pueblo","pueblo county","rio blanco","rio blanco county","rio grande","rio grande county","routt","routt county","saguache","saguache county","san juan","san juan county","san miguel","san miguel county","sedgwick","sedgwick county","summit","summit county","teller","teller county","washington","washington county","weld","weld county","yuma","yuma county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5ADoAOgA7ADsAPAA8AD0APQA+AD4APwA/AA==";
+export const PRICE_BAND_TOTALS: string[] = ["1QolC2QLdQslC54KGgswC70KnQpiCwMLjgtHCygL0AqHCw8L1QreCscKjgu/CiULyQr7CsMK9Ap8CzQLawuQC0ELLAtwC5gK5QoBC4MLNgtaC8MK7QoXC6gKHgudClgLdwseC4sLCwsHC8MKugrZCtAKhwuJC0cLewuaCkgLiQs=","6As9DHwMjQw9DLELMgxIDNALsAt6DBsMpgxfDEAM4wufDCcM6AvxC9oLpgzSCz0M3AsTDNYLDAyUDEwMgwyoDFkMRAyIDKsL+AsZDJsMTgxyDNYLBQwvDLsLNgywC3AMjww2DKMMIwwfDNYLzQvsC+MLnwyhDF8MkwytC2AMoQw=","+wxVDZQNpQ1VDcQMSg1gDeMMwwySDTMNvg13DVgN9gy3DT8N+wwEDe0Mvg3lDFUN7wwrDekMJA2sDWQNmw3ADXENXA2gDb4MCw0xDbMNZg2KDekMHQ1HDc4MTg3DDIgNpw1ODbsNOw03DekM4Az/DPYMtw25DXcNqw3ADHgNuQ0=","Dg5tDqwOvQ5tDtcNYg54DvYN1g2qDksO1g6PDnAOCQ7PDlcODg4XDgAO1g74DW0OAg5DDvwNPA7EDnwOsw7YDokOdA64DtENHg5JDssOfg6iDvwNNQ5fDuENZg7WDaAOvw5mDtMOUw5PDvwN8w0SDgkOzw7RDo8Oww7TDZAO0Q4=","IQ+FD8QP1Q+FD+oOeg+QDwkP6Q7CD2MP7g+nD4gPHA/nD28PIQ8qDxMP7g8LD4UPFQ9bDw8PVA/cD5QPyw/wD6EPjA/QD+QOMQ9hD+MPlg+6Dw8PTQ93D/QOfg/pDrgP1w9+D+sPaw9nDw8PBg8lDxwP5w/pD6cP2w/mDqgP6Q8=","NBCdENwQ7RCdEP0PkhCoEBwQ/A/aEHsQBhG/EKAQLxD/EIcQNBA9ECYQBhEeEJ0QKBBzECIQbBD0EKwQ4xAIEbkQpBDoEPcPRBB5EPsQrhDSECIQZRCPEAcQlhD8D9AQ7xCWEAMRgxB/ECIQGRA4EC8Q/xABEb8Q8xD5D8AQARE=","WhLNEgwTHRPNEiMSwhLYEkISIhIKE6sSNhPvEtASVRIvE7cSWhJjEkwSNhNEEs0SThKjEkgSnBIkE9wSExM4E+kS1BIYEx0SahKpEisT3hICE0gSlRK/Ei0SxhIiEgATHxPGEjMTsxKvEkgSPxJeElUSLxMxE+8SIxMfEvASMRM=","gBT9FDwVTRX9FEkU8hQIFWgUSBQ6FdsUZhUfFQAVexRfFecUgBSJFHIUZhVqFP0UdBTTFG4UzBRUFQwVQxVoFRkVBBVIFUMUkBTZFFsVDhUyFW4UxRTvFFMU9hRIFDAVTxX2FGMV4xTfFG4UZRSEFHsUXxVhFR8VUxVFFCAVYRU=","3xl1GrQaxRp1GqgZahqAGscZpxmyGlMa3hqXGnga2hnXGl8a3xnoGdEZ3hrJGXUa0xlLGs0ZRBrMGoQauxrgGpEafBrAGqIZ7xlRGtMahhqqGs0ZPRpnGrIZbhqnGagaxxpuGtsaWxpXGs0ZxBnjGdoZ1xrZGpcayxqkGZga2Ro=","Ph/tHywgPSDtHwcf4h/4HyYfBh8qIMsfViAPIPAfOR9PINcfPh9HHzAfViAoH+0fMh/DHywfvB9EIPwfMyBYIAkg9B84IAEfTh/JH0sg/h8iICwftR/fHxEf5h8GHyAgPyDmH1Mg0x/PHywfIx9CHzkfTyBRIA8gQyADHxAgUSA=","/CndKhwrLSvdKsUp0iroKuQpxCkaK7sqRiv/KuAq9yk/K8cq/CkFKu4pRivmKd0q8CmzKuoprCo0K+wqIytIK/kq5CooK78pDCq5Kjsr7ioSK+oppSrPKs8p1irEKRArLyvWKkMrwyq/Kuop4SkAKvcpPytBK/8qMyvBKQArQSs=","ujTNNQw2HTbNNYM0wjXYNaI0gjQKNqs1NjbvNdA1tTQvNrc1ujTDNKw0NjakNM01rjSjNag0nDUkNtw1EzY4Nuk11DUYNn00yjSpNSs23jUCNqg0lTW/NY00xjWCNAA2HzbGNTM2szWvNag0nzS+NLU0LzYxNu81IzZ/NPA1MTY="];
@@ -0,0 +1,7 @@
+// DELAWARE (DE) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Kent County","New Castle County","Sussex County"];
+export const COUNTY_COLUMNS: string[] = ["mgGdAZ8B","6QHtAe8B","iwGOAZAB","igCLAIwA","tAK5ArwC","OQA6ADoA","mQCaAJsA","LQAtAC4A","FwAXABgA"];
+export const COUNTY_FIPS: string = "AQADAAUA";
+export const ALIAS_KEYS: string[] = ["kent","kent county","new castle","new castle county","sussex","sussex county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIA";
+export const PRICE_BAND_TOTALS: string[] = ["RgpcCmkK","Ywt+C4sL","gAygDK0M","nQ3CDc8N","ug7kDvEO","1w8GEBMQ","ERJKElcS","SxSOFJsU","3Bk4GkUa","bR/iH+8f","jyo2K0Mr","sTWKNpc2"];
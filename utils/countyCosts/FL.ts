@@ -0,0 +1,7 @@
+// FLORIDA (FL) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Alachua County","Baker County","Bay County","Bradford County","Brevard County","Broward County","Calhoun County","Charlotte County","Citrus County","Clay County","Collier County","Columbia County","DeSoto County","Dixie County","Duval County","Escambia County","Flagler County","Franklin County","Gadsden County","Gilchrist County","Glades County","Gulf County","Hamilton County","Hardee County","Hendry County","Hernando County","Highlands County","Hillsborough County","Holmes County","Indian River County","Jackson County","Jefferson County","Lafayette County","Lake County","Lee County","Leon County","Levy County","Liberty County","Madison County","Manatee County","Marion County","Martin County","Miami-Dade County","Monroe County","Nassau County","Okaloosa County","Okeechobee County","Orange County","Osceola County","Palm Beach County","Pasco County","Pinellas County","Polk County","Putnam County","Santa Rosa County","Sarasota County","Seminole County","St. Johns County","St. Lucie County","Sumter County","Suwannee County","Taylor County","Union County","Volusia County","Wakulla County","Walton County","Washington County"];
+export const COUNTY_COLUMNS: string[] = ["4gHYAc4B0QHjAdYB6QHaAd8B2AHsAdYB8AHNAeUBwwHxAd4B0QHhAe8B2AHTAdgB3AHFAckB1QHYAekB4QHrAfEB7AHGAckB0QHRAcQB1wHvAcsB4wHaAdIB3wHvAekB2QHLAeEBzgHHAc4B5wHMAdwB4wHVAe4B4QHuAe0B1AHWAccBxQE=","YAJVAkgCTAJiAlICagJXAl4CVAJuAlICcwJGAmUCOgJ0AlwCTAJfAnECVQJPAlQCWgI9AkICUQJVAmoCXwJtAnQCbQI9AkECSwJMAjsCUwJyAkQCYgJXAk0CXgJyAmoCVQJEAl8CSAI+AkgCZwJGAlkCYgJRAnACXwJwAm8CUAJSAj4CPQI=","VgJLAj4CQgJYAkgCYAJNAlMCSgJjAkgCaQI8AloCMAJpAlICQgJVAmcCSwJFAkoCUAIzAjgCRwJLAl8CVQJiAmoCYwI0AjgCQQJCAjICSQJnAjoCWAJNAkMCUwJnAl8CSwI7AlUCPgI1Aj4CXQI8Ak8CWAJHAmYCVQJlAmUCRgJIAjUCMwI=","tgCzAK8AsAC3ALIAuQCzALUAsgC6ALIAvACuALcAqwC8ALUAsAC2ALsAswCxALIAtACrAK0AsgCzALkAtgC6ALwAugCsAK0AsACwAKsAsgC7AK4AtwCzALAAtQC7ALkAswCuALYArwCsAK8AuACuALQAtwCyALsAtgC7ALsAsQCyAKwAqwA=","+QLqAtoC3wL7AuYCBQPtAvUC6QIJA+cCEAPYAv4CyAIRA/QC3wL3Ag4D6gLiAukC8QLMAtMC5QLqAgQD9wIIAxIDCQPNAtIC3gLfAsoC6AIPA9UC+gLtAuAC9QIPAwQD6wLWAvcC2gLOAtoCAQPXAvAC+gLlAgwD9wIMAwsD5ALnAs4CzAI=","OgA6ADkAOQA6ADkAOgA6ADoAOgA6ADkAOgA5ADoAOQA6ADoAOQA6ADoAOgA5ADoAOgA5ADkAOQA6ADoAOgA6ADoAOgA5ADkAOQA5ADkAOgA6ADkAOgA6ADkAOgA6ADoAOgA5ADoAOQA5ADkAOgA5ADoAOgA5ADoAOgA6ADoAOQA5ADkAOQA=","ygDHAMIAxADLAMYAzgDHAMoAxgDPAMYA0QDCAMwAvgDRAMkAxADKANAAxwDFAMYAyAC/AMAAxQDHAM4AygDOANEAzwC/AMAAwwDEAL4AxgDQAMEAywDHAMQAygDQAM4AxwDBAMoAwgC/AMIAzQDCAMgAywDFANAAygDQAM8AxQDGAL8AvwA=","NwA2ADUANQA3ADYAOAA2ADcANgA5ADYAOQA1ADgANAA5ADcANQA3ADkANgA2ADYANwA0ADUANgA2ADgANwA4ADkAOAA0ADQANQA1ADQANgA5ADUANwA2ADYANwA5ADgANgA1ADcANQA0ADUAOAA1ADcANwA2ADkANwA5ADkANgA2ADQANAA=","KAAnACYAJwAoACcAKQAnACgAJwApACcAKQAmACgAJgApACgAJwAoACkAJwAnACcAKAAmACYAJwAnACkAKAApACkAKQAmACYAJwAnACYAJwApACYAKAAnACcAKAApACkAJwAmACgAJgAmACYAKQAmACgAKAAnACkAKAApACkAJwAnACYAJgA="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGwAdAB8AIQAjACUAJwApACsALQAvADEAMwA1ADcAOQA7AD0APwBBAEMARQBHAEkASwBNAE8AUQBTAFUAVgBXAFkAWwBdAF8AYQBjAGUAZwBpAGsAcQBzAHUAbQBvAHcAeQB7AH0AfwCBAIMAhQA=";
+export const ALIAS_KEYS: string[] = ["alachua","alachua county","baker","baker county","bay","bay county","bradford","bradford county","brevard","brevard county","broward","broward county","calhoun","calhoun county","charlotte","charlotte county","citrus","citrus county","clay","clay county","collier","collier county","columbia","columbia county","desoto","desoto county","dixie","dixie county","duval","duval county","escambia","escambia county","flagler","flagler county","franklin","franklin county","gadsden","gadsden county","gilchrist","gilchrist county","glades","glades county","gulf","gulf county","hamilton","hamilton county","hardee","hardee county","hendry","hendry county","hernando","hernando county","highlands","highlands county","hillsborough","hillsborough county","holmes","holmes county","indian river","indian river county","jackson","jackson county","jefferson","jefferson county","lafayette","lafayette county","lake","lake county","lee","lee county","leon","leon county","levy","levy county","liberty","liberty county","madison","madison county","manatee","manatee county","marion","marion county","martin","martin county","miami dade","miami dade county","monroe","monroe county","nassau","nassau county","okaloosa","okaloosa county","okeechobee","okeechobee county","orange","orange county","osceola","osceola county","palm beach","palm beach county","pasco","pasco county","pinellas","pinellas county","polk","polk county","putnam","putnam county","saint johns","saint johns county","saint lucie","saint lucie county","santa rosa","santa rosa county","sarasota","sarasota county","seminole","seminole county","sumter","sumter county","suwannee","suwannee county","taylor","taylor county","union","union county","volusia","volusia county","wakulla","wakulla county","walton","walton county","washington","washington county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUAOQA5ADoAOgA2ADYANwA3ADgAOAA7ADsAPAA8AD0APQA+AD4APwA/AEAAQABBAEEAQgBCAA==";
+export const PRICE_BAND_TOTALS: string[] = ["kgxbDBcMKwybDEgMwgxkDIUMVgzTDEkM7QwPDKcM1QvwDH8MKwyNDOQMWww5DFYMdAziC/sLQwxbDMAMjQzNDPIM0QzmC/gLJwwrDNsLUgzmDAUMmgxkDDAMhQzmDMAMXQwHDI0MFwzqCxcMtAwNDHEMmgxDDN8MjQzeDNoMPgxJDOoL4gs=","tA19DTQNSA29DWUN5A2GDacNeA31DWYNDw4sDckN8gwSDqENSA2vDQYOfQ1WDXgNlg3/DBgNYA19DeINrw3vDRQO8w0DDRUNRA1IDfgMdA0IDiINvA2GDU0Npw0IDuINfw0kDa8NNA0HDTQN1g0qDZMNvA1gDQEOrw0ADvwNWw1mDQcN/ww=","1g6fDlEOZQ7fDoIOBg+oDskOmg4XD4MOMQ9JDusODw40D8MOZQ7RDigPnw5zDpoOuA4cDjUOfQ6fDgQP0Q4RDzYPFQ8gDjIOYQ5lDhUOlg4qDz8O3g6oDmoOyQ4qDwQPoQ5BDtEOUQ4kDlEO+A5HDrUO3g59DiMP0Q4iDx4PeA6DDiQOHA4=","+A/BD24Pgg8BEJ8PKBDKD+sPvA85EKAPUxBmDw0QLA9WEOUPgg/zD0oQwQ+QD7wP2g85D1IPmg/BDyYQ8w8zEFgQNxA9D08Pfg+CDzIPuA9MEFwPABDKD4cP6w9MECYQww9eD/MPbg9BD24PGhBkD9cPABCaD0UQ8w9EEEAQlQ+gD0EPOQ8=","GhHjEIsQnxAjEbwQShHsEA0R3hBbEb0QdRGDEC8RSRB4EQcRnxAVEWwR4xCtEN4Q/BBWEG8QtxDjEEgRFRFVEXoRWRFaEGwQmxCfEE8Q2hBuEXkQIhHsEKQQDRFuEUgR5RB7EBURixBeEIsQPBGBEPkQIhG3EGcRFRFmEWIRshC9EF4QVhA=","PBIFEqgRvBFFEtkRbBIOEi8SABJ9EtoRlxKgEVESZhGaEikSvBE3Eo4SBRLKEQASHhJzEYwR1BEFEmoSNxJ3EpwSexJ3EYkRuBG8EWwR/BGQEpYRRBIOEsERLxKQEmoSBxKYETcSqBF7EagRXhKeERsSRBLUEYkSNxKIEoQSzxHaEXsRcxE=","gBRJFOIT9hOJFBMUsBRSFHMURBTBFBQU2xTaE5UUoBPeFG0U9hN7FNIUSRQEFEQUYhStE8YTDhRJFK4UexS7FOAUvxSxE8MT8hP2E6YTQBTUFNATiBRSFPsTcxTUFK4USxTSE3sU4hO1E+ITohTYE18UiBQOFM0UexTMFMgUCRQUFLUTrRM=","xBaNFhwWMBbNFk0W9BaWFrcWiBYFF04WHxcUFtkW2hUiF7EWMBa/FhYXjRY+FogWphbnFQAWSBaNFvIWvxb/FiQXAxfrFf0VLBYwFuAVhBYYFwoWzBaWFjUWtxYYF/IWjxYMFr8WHBbvFRwW5hYSFqMWzBZIFhEXvxYQFwwXQxZOFu8V5xU=","bhw3HK0bwRt3HN4bnhxAHGEcMhyvHN8byRylG4McaxvMHFscwRtpHMAcNxzPGzIcUBx4G5Eb2Rs3HJwcaRypHM4crRx8G44bvRvBG3EbLhzCHJsbdhxAHMYbYRzCHJwcORydG2kcrRuAG60bkByjG00cdhzZG7scaRy6HLYc1BvfG4AbeBs=","GCLhIT4hUiEhIm8hSCLqIQsi3CFZInAhcyI2IS0i/CB2IgUiUiETImoi4SFgIdwh+iEJISIhaiHhIUYiEyJTIngiVyINIR8hTiFSIQIh2CFsIiwhICLqIVchCyJsIkYi4yEuIRMiPiERIT4hOiI0IfchICJqIWUiEyJkImAiZSFwIREhCSE=","bC01LWAsdCx1LZEsnC0+LV8tMC2tLZIsxy1YLIEtHizKLVktdCxnLb4tNS2CLDAtTi0rLEQsjCw1LZotZy2nLcwtqy0vLEEscCx0LCQsLC3ALU4sdC0+LXksXy3ALZotNy1QLGctYCwzLGAsji1WLEstdC2MLLktZy24LbQthyySLDMsKyw=","wDiJOII3ljfJOLM38DiSOLM4hDgBObQ3Gzl6N9U4QDceOa04lje7OBI5iTikN4Q4ojhNN2Y3rjeJOO44uzj7OCA5/zhRN2M3kjeWN0Y3gDgUOXA3yDiSOJs3szgUOe44izhyN7s4gjdVN4I34jh4N584yDiuNw05uzgMOQg5qTe0N1U3TTc="];
@@ -0,0 +1,7 @@
+// GEORGIA (GA) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Appling County","Atkinson County","Bacon County","Baker County","Baldwin County","Banks County","Barrow County","Bartow County","Ben Hill County","Berrien County","Bibb County","Bleckley County","Brantley County","Brooks County","Bryan County","Bulloch County","Burke County","Butts County","Calhoun County","Camden County","Candler County","Carroll County","Catoosa County","Charlton County","Chatham County","Chattahoochee County","Chattooga County","Cherokee County","Clarke County","Clay County","Clayton County","Clinch County","Cobb County","Coffee County","Colquitt County","Columbia County","Cook County","Coweta County","Crawford County","Crisp County","Dade County","Dawson County","DeKalb County","Decatur County","Dodge County","Dooly County","Dougherty County","Douglas County","Early County","Echols County","Effingham County","Elbert County","Emanuel County","Evans County","Fannin County","Fayette County","Floyd County","Forsyth County","Franklin County","Fulton County","Gilmer County","Glascock County","Glynn County","Gordon County","Grady County","Greene County","Gwinnett County","Habersham County","Hall County","Hancock County","Haralson County","Harris County","Hart County","Heard County","Henry County","Houston County","Irwin County","Jackson County","Jasper County","Jeff Davis County","Jefferson County","Jenkins County","Johnson County","Jones County","Lamar County","Lanier County","Laurens County","Lee County","Liberty County","Lincoln County","Long County","Lowndes County","Lumpkin County","Macon County","Madison County","Marion County","McDuffie County","McIntosh County","Meriwether County","Miller County","Mitchell County","Monroe County","Montgomery County","Morgan County","Murray County","Muscogee County","Newton County","Oconee County","Oglethorpe County","Paulding County","Peach County","Pickens County","Pierce County","Pike County","Polk County","Pulaski County","Putnam County","Quitman County","Rabun County","Randolph County","Richmond County","Rockdale County","Schley County","Screven County","Seminole County","Spalding County","Stephens County","Stewart County","Sumter County","Talbot County","Taliaferro County","Tattnall County","Taylor County","Telfair County","Terrell County","Thomas County","Tift County","Toombs County","Towns County","Treutlen County","Troup County","Turner County","Twiggs County","Union County","Upson County","Walker County","Walton County","Ware County","Warren County","Washington County","Wayne County","Webster County","Wheeler County","White County","Whitfield County","Wilcox County","Wilkes County","Wilkinson County","Worth County"];
+export const COUNTY_COLUMNS: string[] = ["rQGmAakBoQGcAZQBnQGTAaEBpAGZAaUBnQGhAa0BrgGeAZYBsQGTAbgBrAG2Aa8BnQGPAbABmwGiAaEBrgGtAbIBsgGxAaABsgGXAZ0BlwGiAawBowGXAbMBsAGyAZoBoAGzAZ4BuAGZAaUBqQG4Aa0BqQGnAaMBoAGtAaoBtAGdAbIBswGmAZsBowGvAbcBjwG3AZEBlwGsAakBrwGhAbIBrgGrAaMBmQGwAaIBkQGbAaEBpAGgAZIBkQGQAbYBlAGpAaYBmQGlAaMBkwGTAbcBrQGTAZYBogGYAaIBsgGyAawBkgGYAZkBtgGdAaABmwGrAbABqgGlAa8BpQGcAbUBsgGnAbQBtAGZAZQBkwGkAZEBqAGQAZYBuAGzAbQBjwGkAZIBrwGmAZEBnwGcAaYBoQG0AZ0BqQGhAbMB","GAIQAhMCCgIDAvkBBQL4AQoCDQL/AQ4CBQIJAhgCGgIGAvwBHQL4ASYCGAIkAhsCBQLyARwCAgIKAgkCGQIYAh8CHgIeAggCHwL9AQQC/QELAhcCCwL9ASACHAIeAgECCAIgAgUCJgL/AQ4CEwImAhgCEwIRAgsCCAIZAhUCIQIFAh8CHwIPAgICCwIbAiUC8wElAvUB/QEXAhMCGwIKAh8CGgIWAgwCAAIcAgoC9QECAgkCDQIIAvcB9QH0ASQC+gEUAg8CAAIPAgwC+AH4ASUCGQL4AfwBCwL+AQsCHwIeAhgC9gH+Af8BJAIFAggCAQIWAhwCFQIOAhsCDgIEAiICHgIRAiECIgIAAvkB+AENAvUBEgL0AfwBJgIfAiEC8wENAvYBGwIQAvUBBwIDAg8CCgIiAgQCFAIKAiAC","nQGXAZoBkgGNAYUBjgGFAZIBlQGKAZYBjgGSAZ0BnwGQAYgBoQGFAagBnQGmAaABjgGAAaEBjAGTAZIBngGdAaMBogGiAZEBowGJAY4BiQGTAZ0BlAGJAaQBoQGiAYwBkQGkAY8BqAGKAZYBmQGoAZ0BmgGYAZQBkQGeAZsBpAGOAaMBowGXAYwBlAGgAacBgQGoAYMBiAGdAZoBnwGSAaMBnwGcAZQBiwGhAZMBgwGMAZIBlQGRAYQBgwGBAaYBhgGaAZcBiwGWAZQBhAGEAacBngGEAYgBkwGKAZMBowGiAZ0BgwGJAYoBpwGOAZEBjAGcAaEBmwGWAaABlgGOAaUBogGYAaQBpQGLAYUBhAGVAYIBmQGCAYgBqAGjAaQBgQGVAYMBoAGXAYIBkAGNAZcBkgGlAY4BmgGSAaQB","mQCWAJcAlQCTAJAAkwCQAJUAlgCSAJYAkwCUAJkAmQCUAJEAmgCQAJ0AmQCcAJoAkwCOAJoAkwCVAJUAmQCZAJsAmwCaAJQAmwCRAJMAkQCVAJkAlQCRAJsAmgCbAJIAlACbAJMAnQCSAJYAlwCdAJkAlwCXAJUAlACZAJgAmwCTAJsAmwCWAJMAlQCaAJwAjgCdAI8AkQCZAJcAmgCVAJsAmQCYAJUAkgCaAJUAjwCTAJQAlgCUAI8AjwCOAJwAkACYAJYAkgCWAJUAkACQAJwAmQCQAJEAlQCRAJUAmwCbAJkAjwCRAJIAnACTAJQAkgCYAJoAmACWAJoAlgCTAJwAmwCXAJsAnACSAJAAkACWAI8AlwCPAJEAnQCbAJsAjgCWAI8AmgCXAI8AlACTAJYAlQCcAJMAmACVAJsA","sQKnAqsCnwKWAokCmAKIAp8CowKRAqUCmAKeArECswKaAo0CtwKIAsQCsQLAArUCmAKBArcClQKgAp4CswKxAroCuQK5ApwCugKPApgCjwKgArACoQKPArwCtwK5ApQCnAK8ApkCwwKSAqUCqwLEArECqwKoAqECnAKyAq0CvQKYAroCuwKmApUCoQK1AsICgQLCAoUCjgKwAqsCtQKfAroCtAKvAqICkgK3AqAChQKVAp4CowKcAocChQKDAsACigKsAqYCkgKlAqICiAKIAsICsgKIAo4CoAKQAqACugK5ArEChgKQApECwQKYApwClAKvArcCrQKlArUCpQKXAr4CuQKoAr0CvgKSAokCiAKjAoQCqgKDAo4CxAK7Ar0CggKjAoYCtQKnAoQCmwKWAqYCnwK+ApgCrAKfArwC","OwA7ADsAOgA6ADoAOgA6ADoAOwA6ADsAOgA6ADsAOwA6ADoAOwA6ADsAOwA7ADsAOgA6ADsAOgA7ADoAOwA7ADsAOwA7ADoAOwA6ADoAOgA7ADsAOwA6ADsAOwA7ADoAOgA7ADoAOwA6ADsAOwA7ADsAOwA7ADsAOgA7ADsAOwA6ADsAOwA7ADoAOwA7ADsAOgA7ADoAOgA7ADsAOwA6ADsAOwA7ADsAOgA7ADsAOgA6ADoAOwA6ADoAOgA6ADsAOgA7ADsAOgA7ADsAOgA6ADsAOwA6ADoAOwA6ADsAOwA7ADsAOgA6ADoAOwA6ADoAOgA7ADsAOwA7ADsAOwA6ADsAOwA7ADsAOwA6ADoAOgA7ADoAOwA6ADoAOwA7ADsAOgA7ADoAOwA7ADoAOgA6ADsAOgA7ADoAOwA6ADsA","qAClAKcApACiAJ4AogCeAKQApQCgAKUAogCjAKgAqQCjAJ8AqgCeAK0AqACsAKkAogCcAKkAoQCkAKQAqACoAKoAqgCqAKMAqgCgAKIAoACkAKgApACgAKsAqQCqAKEAowCrAKIArACgAKUApgCtAKgApwCmAKQAowCoAKcAqwCiAKoAqgClAKEApACpAKwAnACsAJ0AoACoAKcAqQCkAKoAqQCnAKQAoQCpAKQAnQChAKMApQCjAJ4AnQCdAKwAnwCnAKUAoQClAKQAngCeAKwAqACeAJ8ApACgAKQAqgCqAKgAngCgAKAArACiAKMAoQCnAKkApwClAKkApQCiAKsAqgCmAKsAqwChAJ4AngClAJ0ApgCdAJ8ArQCqAKsAnQClAJ4AqQCmAJ0AowChAKUApACrAKIApwCkAKsA","MgAxADEAMAAwAC8AMAAvADAAMQAvADEAMAAwADIAMgAwAC8AMgAvADMAMgAzADIAMAAuADIAMAAwADAAMgAyADIAMgAyADAAMgAvADAALwAwADEAMAAvADIAMgAyAC8AMAAyADAAMwAvADEAMQAzADIAMQAxADAAMAAyADEAMgAwADIAMgAxADAAMAAyADMALgAzAC4ALwAxADEAMgAwADIAMgAxADAALwAyADAALgAwADAAMQAwAC4ALgAuADMALwAxADEALwAxADAALwAvADMAMgAvAC8AMAAvADAAMgAyADIALgAvAC8AMwAwADAALwAxADIAMQAxADIAMQAwADMAMgAxADIAMgAvAC8ALwAxAC4AMQAuAC8AMwAyADIALgAxAC4AMgAxAC4AMAAwADEAMAAyADAAMQAwADIA","GgAaABoAGQAZABkAGQAYABkAGgAZABoAGQAZABoAGgAZABkAGgAYABsAGgAbABoAGQAYABoAGQAZABkAGgAaABoAGgAaABkAGgAZABkAGQAZABoAGQAZABoAGgAaABkAGQAaABkAGwAZABoAGgAbABoAGgAaABkAGQAaABoAGwAZABoAGgAaABkAGQAaABsAGAAbABgAGQAaABoAGgAZABoAGgAaABkAGQAaABkAGAAZABkAGgAZABgAGAAYABsAGQAaABoAGQAaABkAGAAYABsAGgAYABkAGQAZABkAGgAaABoAGAAZABkAGwAZABkAGQAaABoAGgAaABoAGgAZABsAGgAaABsAGwAZABkAGAAaABgAGgAYABkAGwAaABsAGAAaABgAGgAaABgAGQAZABoAGQAbABkAGgAZABoA"];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACsALQAvADEAMwA1ADcAOQA7AD0APwBBAEMARQBHAEkASwBNAE8AUQBTAFUAWQBXAFsAXQBfAGEAYwBlAGcAaQBrAG0AbwBxAHMAdQB3AHkAewB9AH8AgQCDAIUAhwCJAIsAjQCPAJEAkwCVAJcAmQCbAJ0AnwChAKMApQCnAKkAqwCtAK8AsQCzALUAtwC5ALsAwQDDAMUAvQC/AMcAyQDNAM8A0QDTANUA1wDZANsA3QDfAOEA4wDlAOcA6QDrAO0A7wDxAPMA9QD3APkA+wD9AP8AAQEDAQUBBwEJAQsBDQEPAREBEwEVARcBGQEbAR0BHwEhASMBJQEnASkBKwEtAS8BMQEzATUBNwE5ATsBPQE/AUEB";
+export const ALIAS_KEYS: string[] = ["appling","appling county","atkinson","atkinson county","bacon","bacon county","baker","baker county","baldwin","baldwin county","banks","banks county","barrow","barrow county","bartow","bartow county","ben hill","ben hill county","berrien","berrien county","bibb","bibb county","bleckley","bleckley county","brantley","brantley county","brooks","brooks county","bryan","bryan county","bulloch","bulloch county","burke","burke county","butts","butts county","calhoun","calhoun county","camden","camden county","candler","candler county","carroll","carroll county","catoosa","catoosa county","charlton","charlton county","chatham","chatham county","chattahoochee","chattahoochee county","chattooga","chattooga county","cherokee","cherokee county","clarke","clarke county","clay","clay county","clayton","clayton county","clinch","clinch county","cobb","cobb county","coffee","coffee county","colquitt","colquitt county","columbia","columbia county","cook","cook county","coweta","coweta county","crawford","crawford county","crisp","crisp county","dade","dade county","dawson","dawson county","decatur","decatur county","dekalb","dekalb county","dodge","dodge county","dooly","dooly county","dougherty","dougherty county","douglas","douglas county","early","early county","echols","echols county","effingham","effingham county","elbert","elbert county","emanuel","emanuel county","evans","evans county","fannin","fannin county","fayette","fayette county","floyd","floyd county","forsyth","forsyth county","franklin","franklin county","fulton","fulton county","gilmer","gilmer county","glascock","glascock county","glynn","glynn county","gordon","gordon county","grady","grady county","greene","greene county","gwinnett","gwinnett county","habersham","habersham county","hall","hall county","hancock","hancock county","haralson","haralson county","harris","harris county","hart","hart county","heard","heard county","henry","henry county","houston","houston county","irwin","irwin county","jackson","jackson county","jasper","jasper county","jeff davis","jeff davis county","jefferson","jefferson county","jenkins","jenkins county","johnson","johnson county","jones","jones county","lamar","lamar county","lanier","lanier county","laurens","laurens county","lee","lee county","liberty","liberty county","lincoln","lincoln county","long","long county","lowndes","lowndes county","lumpkin","lumpkin county","macon","macon county","madison","madison county","marion","marion county","mcduffie","mcduffie county","mcintosh","mcintosh county","meriwether","meriwether county","miller","miller county","mitchell","mitchell county","monroe","monroe county","montgomery","montgomery county","morgan","morgan county","murray","murray county","muscogee","muscogee county","newton","newton county","oconee","oconee county","oglethorpe","oglethorpe county","paulding","paulding county","peach","peach county","pickens","pickens county","pierce","pierce county","pike","pike county","polk","polk county","pulaski","pulaski county","putnam","putnam county","quitman","quitman county","rabun","rabun county","randolph","randolph county","richmond","richmond county","rockdale","rockdale county","schley","schley county","screven","screven county","seminole","seminole county","spalding","spalding county","stephens","stephens county","stewart","stewart county","sumter","sumter county","talbot","talbot county","taliaferro","taliaferro county","tattnall","tattnall county","taylor","taylor county","telfair","telfair county","terrell","terrell county","thomas","thomas county","tift","tift county","toombs","toombs county","towns","towns county","treutlen","treutlen county","troup","troup county","turner","turner county","twiggs","twiggs county","union","union county","upson","upson county","walker","walker county","walton","walton county","ware","ware county","warren","warren county","washington","washington county","wayne","wayne county","webster","webster county","wheeler","wheeler county","white","white county","whitfield","whitfield county","wilcox","wilcox county","wilkes","wilkes county","wilkinson","wilkinson county","worth","worth county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKwArACoAKgAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5ADoAOgA7ADsAPAA8AD0APQA+AD4APwA/AEAAQABBAEEAQgBCAEMAQwBEAEQARQBFAEYARgBHAEcASABIAEkASQBKAEoASwBLAEwATABNAE0ATgBOAE8ATwBQAFAAUQBRAFIAUgBTAFMAVABUAFUAVQBWAFYAVwBXAFgAWABZAFkAWgBaAFsAWwBcAFwAXQBdAF4AXgBfAF8AYABgAGEAYQBiAGIAYwBjAGQAZABlAGUAZgBmAGcAZwBoAGgAaQBpAGoAagBrAGsAbABsAG0AbQBuAG4AbwBvAHAAcABxAHEAcgByAHMAcwB0AHQAdQB1AHYAdgB3AHcAeAB4AHkAeQB6AHoAewB7AHwAfAB9AH0AfgB+AH8AfwCAAIAAgQCBAIIAggCDAIMAhACEAIUAhQCGAIYAhwCHAIgAiACJAIkAigCKAIsAiwCMAIwAjQCNAI4AjgCPAI8AkACQAJEAkQCSAJIAkwCTAJQAlACVAJUAlgCWAJcAlwCYAJgAmQCZAJoAmgCbAJsAnACcAJ0AnQCeAJ4A";
+export const PRICE_BAND_TOTALS: string[] = ["xwqhCrEKgApiCjMKaAovCoAKlgpPCpsKaAp8CscKzwpwCkEK3QovCgkLxgr9CtUKaAoUCtoKXQqICn4KzArHCuYK4wrhCncK5gpHCmcKRwqJCsMKjApHCuwK2grjClgKdwrsCmsKBwtQCpsKrwoJC8cKsQqnCowKdwrKCrgK8ApoCuYK6AqfCl0KjArVCgILFgoECyIKRQrDCrEK1AqACuYK0Aq9Co4KUwraCogKIgpdCnwKlgp3CikKIgobCv0KNwq0Cp8KUwqcCo4KLgouCgILygouCkIKiQpLCokK5grjCsYKJgpKCk8K/wpoCncKWQq9CtoKuAqbCtUKmwplCvYK4wqnCvAK9ApTCjMKLgqWCiAKrAodCkIKCQvoCvAKGAqWCiYK1QqjCiAKcwphCp8KgAr0CmcKtAqACuwK","7gvIC9gLoguEC1ULigtRC6ILvQtxC8ILigueC+4L9guSC2MLBAxRCzAM7QskDPwLigs2CwEMfwuvC6AL8wvuCw0MCgwIDJkLDQxpC4kLaQuwC+oLswtpCxMMAQwKDHoLmQsTDI0LLgxyC8IL1gswDO4L2AvOC7MLmQvxC98LFwyKCw0MDwzGC38Lswv8CykMOAsrDEQLZwvqC9gL+wuiCw0M9wvkC7ULdQsBDK8LRAt/C54LvQuZC0sLRAs9CyQMWQvbC8YLdQvDC7ULUAtQCykM8QtQC2QLsAttC7ALDQwKDO0LSAtsC3ELJgyKC5kLewvkCwEM3wvCC/wLwguHCx0MCgzOCxcMGwx1C1ULUAu9C0IL0ws/C2QLMAwPDBcMOgu9C0gL/AvKC0ILlQuDC8YLogsbDIkL2wuiCxMM","FQ3vDP8MxAymDHcMrAxzDMQM5AyTDOkMrAzADBUNHQ20DIUMKw1zDFcNFA1LDSMNrAxYDCgNoQzWDMIMGg0VDTQNMQ0vDbsMNA2LDKsMiwzXDBEN2gyLDDoNKA0xDZwMuww6Da8MVQ2UDOkM/QxXDRUN/wz1DNoMuwwYDQYNPg2sDDQNNg3tDKEM2gwjDVANWgxSDWYMiQwRDf8MIg3EDDQNHg0LDdwMlwwoDdYMZgyhDMAM5Ay7DG0MZgxfDEsNewwCDe0MlwzqDNwMcgxyDFANGA1yDIYM1wyPDNcMNA0xDRQNagyODJMMTQ2sDLsMnQwLDSgNBg3pDCMN6QypDEQNMQ31DD4NQg2XDHcMcgzkDGQM+gxhDIYMVw02DT4NXAzkDGoMIw3xDGQMtwylDO0MxAxCDasMAg3EDDoN","PA4WDiYO5g3IDZkNzg2VDeYNCw61DRAOzg3iDTwORA7WDacNUg6VDX4OOw5yDkoOzg16DU8Oww39DeQNQQ48DlsOWA5WDt0NWw6tDc0NrQ3+DTgOAQ6tDWEOTw5YDr4N3Q1hDtENfA62DRAOJA5+DjwOJg4cDgEO3Q0/Di0OZQ7ODVsOXQ4UDsMNAQ5KDncOfA15DogNqw04DiYOSQ7mDVsORQ4yDgMOuQ1PDv0NiA3DDeINCw7dDY8NiA2BDXIOnQ0pDhQOuQ0RDgMOlA2UDXcOPw6UDagN/g2xDf4NWw5YDjsOjA2wDbUNdA7ODd0Nvw0yDk8OLQ4QDkoOEA7LDWsOWA4cDmUOaQ65DZkNlA0LDoYNIQ6DDagNfg5dDmUOfg0LDowNSg4YDoYN2Q3HDRQO5g1pDs0NKQ7mDWEO","Yw89D00PCA/qDrsO8A63DggPMg/XDjcP8A4ED2MPaw/4DskOeQ+3DqUPYg+ZD3EP8A6cDnYP5Q4kDwYPaA9jD4IPfw99D/8Ogg/PDu8Ozw4lD18PKA/PDogPdg9/D+AO/w6ID/MOow/YDjcPSw+lD2MPTQ9DDygP/w5mD1QPjA/wDoIPhA87D+UOKA9xD54Png6gD6oOzQ5fD00PcA8ID4IPbA9ZDyoP2w52DyQPqg7lDgQPMg//DrEOqg6jDpkPvw5QDzsP2w44DyoPtg62Dp4PZg+2DsoOJQ/TDiUPgg9/D2IPrg7SDtcOmw/wDv8O4Q5ZD3YPVA83D3EPNw/tDpIPfw9DD4wPkA/bDrsOtg4yD6gOSA+lDsoOpQ+ED4wPoA4yD64OcQ8/D6gO+w7pDjsPCA+QD+8OUA8ID4gP","ihBkEHQQKhAMEN0PEhDZDyoQWRD5D14QEhAmEIoQkhAaEOsPoBDZD8wQiRDAEJgQEhC+D50QBxBLECgQjxCKEKkQphCkECEQqRDxDxEQ8Q9MEIYQTxDxD68QnRCmEAIQIRCvEBUQyhD6D14QchDMEIoQdBBqEE8QIRCNEHsQsxASEKkQqxBiEAcQTxCYEMUQwA/HEMwP7w+GEHQQlxAqEKkQkxCAEFEQ/Q+dEEsQzA8HECYQWRAhENMPzA/FD8AQ4Q93EGIQ/Q9fEFEQ2A/YD8UQjRDYD+wPTBD1D0wQqRCmEIkQ0A/0D/kPwhASECEQAxCAEJ0QexBeEJgQXhAPELkQphBqELMQtxD9D90P2A9ZEMoPbxDHD+wPzBCrELMQwg9ZENAPmBBmEMoPHRALEGIQKhC3EBEQdxAqEK8Q","2BKyEsISbhJQEiESVhIdEm4SpxI9EqwSVhJqEtgS4BJeEi8S7hIdEhoT1xIOE+YSVhICEusSSxKZEmwS3RLYEvcS9BLyEmUS9xI1ElUSNRKaEtQSnRI1Ev0S6xL0EkYSZRL9ElkSGBM+EqwSwBIaE9gSwhK4Ep0SZRLbEskSARNWEvcS+RKwEksSnRLmEhMTBBIVExASMxLUEsIS5RJuEvcS4RLOEp8SQRLrEpkSEBJLEmoSpxJlEhcSEBIJEg4TJRLFErASQRKtEp8SHBIcEhMT2xIcEjASmhI5EpoS9xL0EtcSFBI4Ej0SEBNWEmUSRxLOEusSyRKsEuYSrBJTEgcT9BK4EgETBRNBEiESHBKnEg4SvRILEjASGhP5EgETBhKnEhQS5hK0Eg4SYRJPErASbhIFE1USxRJuEv0S","JhUAFRAVshSUFGUUmhRhFLIU9RSBFPoUmhSuFCYVLhWiFHMUPBVhFGgVJRVcFTQVmhRGFDkVjxTnFLAUKxUmFUUVQhVAFakURRV5FJkUeRToFCIV6xR5FEsVORVCFYoUqRRLFZ0UZhWCFPoUDhVoFSYVEBUGFesUqRQpFRcVTxWaFEUVRxX+FI8U6xQ0FWEVSBRjFVQUdxQiFRAVMxWyFEUVLxUcFe0UhRQ5FecUVBSPFK4U9RSpFFsUVBRNFFwVaRQTFf4UhRT7FO0UYBRgFGEVKRVgFHQU6BR9FOgURRVCFSUVWBR8FIEUXhWaFKkUixQcFTkVFxX6FDQV+hSXFFUVQhUGFU8VUxWFFGUUYBT1FFIUCxVPFHQUaBVHFU8VShT1FFgUNBUCFVIUpRSTFP4UshRTFZkUExWyFEsV","6RrDGtMaXBo+Gg8aRBoLGlwauBorGr0aRBpYGuka8RpMGh0a/xoLGisb6BofG/caRBrwGfwaORqqGloa7hrpGggbBRsDG1MaCBsjGkMaIxqrGuUarhojGg4b/BoFGzQaUxoOG0caKRssGr0a0RorG+ka0xrJGq4aUxrsGtoaEhtEGggbChvBGjkarhr3GiQb8hkmG/4ZIRrlGtMa9hpcGggb8hrfGrAaLxr8Gqoa/hk5GlgauBpTGgUa/hn3GR8bExrWGsEaLxq+GrAaChoKGiQb7BoKGh4aqxonGqsaCBsFG+gaAhomGisaIRtEGlMaNRrfGvwa2hq9GvcavRpBGhgbBRvJGhIbFhsvGg8aChq4GvwZzhr5GR4aKxsKGxIb9Bm4GgIa9xrFGvwZTxo9GsEaXBoWG0Ma1hpcGg4b","rCCGIJYgBiDoH7kf7h+1HwYgeyDVH4Ag7h8CIKwgtCD2H8cfwiC1H+4gqyDiILog7h+aH78g4x9tIAQgsSCsIMsgyCDGIP0fyyDNH+0fzR9uIKggcSDNH9EgvyDIIN4f/R/RIPEf7CDWH4AglCDuIKwgliCMIHEg/R+vIJ0g1SDuH8sgzSCEIOMfcSC6IOcgnB/pIKgfyx+oIJYguSAGIMsgtSCiIHMg2R+/IG0gqB/jHwIgeyD9H68fqB+hH+IgvR+ZIIQg2R+BIHMgtB+0H+cgryC0H8gfbiDRH24gyyDIIKsgrB/QH9Uf5CDuH/0f3x+iIL8gnSCAILoggCDrH9sgyCCMINUg2SDZH7kftB97IKYfkSCjH8gf7iDNINUgnh97IKwfuiCIIKYf+R/nH4QgBiDZIO0fmSAGINEg","MiwMLBwsWis8Kw0rQisJK1orASwpKwYsQitWKzIsOixKKxsrSCwJK3QsMSxoLEAsQivuKkUsNyvzK1grNywyLFEsTixMLFErUSwhK0ErISv0Ky4s9yshK1csRSxOLDIrUStXLEUrciwqKwYsGix0LDIsHCwSLPcrUSs1LCMsWyxCK1EsUywKLDcr9ytALG0s8CpvLPwqHysuLBwsPyxaK1EsOywoLPkrLStFLPMr/Co3K1YrASxRKwMr/Cr1KmgsESsfLAosLSsHLPkrCCsIK20sNSwIKxwr9CslK/QrUSxOLDEsACskKykraixCK1ErMysoLEUsIywGLEAsBiw/K2EsTiwSLFssXywtKw0rCCsBLPoqFyz3KhwrdCxTLFss8ioBLAArQCwOLPoqTSs7KwosWitfLEErHyxaK1cs","uDeSN6I3rjaQNmE2ljZdNq42hzd9Now3ljaqNrg3wDeeNm82zjddNvo3tzfuN8Y3ljZCNss3izZ5N6w2vTe4N9c31DfSN6U21zd1NpU2dTZ6N7Q3fTd1Nt03yzfUN4Y2pTbdN5k2+Dd+Now3oDf6N7g3ojeYN303pTa7N6k34TeWNtc32TeQN4s2fTfGN/M3RDb1N1A2cza0N6I3xTeuNtc3wTeuN383gTbLN3k3UDaLNqo2hzelNlc2UDZJNu43ZTalN5A3gTaNN383XDZcNvM3uzdcNnA2ejd5Nno31zfUN7c3VDZ4Nn028DeWNqU2hzauN8s3qTeMN8Y3jDeTNuc31DeYN+E35TeBNmE2XDaHN042nTdLNnA2+jfZN+E3RjaHN1Q2xjeUN042oTaPNpA3rjblN5U2pTeuNt03"];
@@ -0,0 +1,7 @@
+// HAWAII (HI) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Hawaii County","Honolulu County","Kalawao County","Kauai County","Maui County"];
+export const COUNTY_COLUMNS: string[] = ["qgLFAsgCogKiAg==","ngPDA8cDkwOTAw==","VQN3A3oDSwNLAw==","JAEwATEBIQEhAQ==","MARbBF8EJAQkBA==","QwBDAEMAQwBDAA==","bQF8AX0BaQFpAQ==","UgBWAFYAUQBRAA==","PwBBAEIAPgA+AA=="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAA==";
+export const ALIAS_KEYS: string[] = ["hawaii","hawaii county","honolulu","honolulu county","kalawao","kalawao county","kauai","kauai county","maui","maui county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAA=";
+export const PRICE_BAND_TOTALS: string[] = ["PhLsEv0SDBIMEg==","jRM7FEwUWxNbEw==","3BSKFZsVqhSqFA==","KxbZFuoW+RX5FQ==","ehcoGDkYSBdIFw==","yRh3GYgZlxiXGA==","ZxsVHCYcNRs1Gw==","BR6zHsQe0x3THQ==","kCQ+JU8lXiReJA==","GyvJK9or6SrpKg==","MTjfOPA4/zf/Nw==","R0X1RQZGFUUVRQ=="];
@@ -0,0 +1,7 @@
+// IOWA (IA) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Adair County","Adams County","Allamakee County","Appanoose County","Audubon County","Benton County","Black Hawk County","Boone County","Bremer County","Buchanan County","Buena Vista County","Butler County","Calhoun County","Carroll County","Cass County","Cedar County","Cerro Gordo County","Cherokee County","Chickasaw County","Clarke County","Clay County","Clayton County","Clinton County","Crawford County","Dallas County","Davis County","Decatur County","Delaware County","Des Moines County","Dickinson County","Dubuque County","Emmet County","Fayette County","Floyd County","Franklin County","Fremont County","Greene County","Grundy County","Guthrie County","Hamilton County","Hancock County","Hardin County","Harrison County","Henry County","Howard County","Humboldt County","Ida County","Iowa County","Jackson County","Jasper County","Jefferson County","Johnson County","Jones County","Keokuk County","Kossuth County","Lee County","Linn County","Louisa County","Lucas County","Lyon County","Madison County","Mahaska County","Marion County","Marshall County","Mills County","Mitchell County","Monona County","Monroe County","Montgomery County","Muscatine County","O'Brien County","Osceola County","Page County","Palo Alto County","Plymouth County","Pocahontas County","Polk County","Pottawattamie County","Poweshiek County","Ringgold County","Sac County","Scott County","Shelby County","Sioux County","Story County","Tama County","Taylor County","Union County","Van Buren County","Wapello County","Warren County","Washington County","Wayne County","Webster County","Winnebago County","Winneshiek County","Woodbury County","Worth County","Wright County"];
+export const COUNTY_COLUMNS: string[] = ["SAFCAUMBQQFKAUYBWAFYAVQBPAE/AVEBVAFQAUQBPAFDAUMBSgFIAUgBUQFVAUQBUAE6AUABRwFVAUcBWQFFAVoBUQFMAT8BVQFNAVQBRQFJAUgBQwE7AUkBWQFQATkBTgFSAVUBTwFJAT0BSQE7AVYBTAFBAVcBOgE/AVgBOgE/AUsBUgFJATwBVAE5AUgBRwE9AUUBQAE8AVkBTQE9AVUBRwFKAUEBQAFPAVcBVgFUAUQBTAE7AUYBQwFMAT0BSgFWAU8B","lwGQAZEBjgGaAZUBqwGrAacBiQGNAaMBpgGiAZIBiAGRAZEBmgGYAZcBowGnAZMBogGGAY4BlgGoAZYBrQGUAa4BowGdAY0BqAGeAaYBkwGZAZcBkQGHAZgBrQGhAYUBnwGlAagBoQGZAYoBmQGHAakBnQGOAaoBhgGMAawBhwGMAZsBpAGZAYkBpgGFAZgBlgGKAZQBjgGIAa0BngGKAagBlgGbAY4BjgGgAaoBqQGmAZMBnAGHAZUBkgGdAYoBmgGpAaAB","PgE4ATkBNwFAATwBTQFNAUoBMwE2AUcBSQFGAToBMgE5ATkBQAE+AT4BRwFKAToBRgEwATYBPQFLAT0BTwE7AU8BRwFCATYBSwFDAUkBOwE/AT4BOQExAT8BTwFGATABRAFIAUsBRQE/ATMBPwExAUwBQgE3AUwBMAE1AU4BMQE1AUEBSAE/ATMBSQEwAT4BPQE0ATsBNgEyAU8BQwEzAUsBPQFAATcBNgFFAUwBTAFJAToBQgExATwBOQFCATMBQAFMAUUB","cgBwAHAAbwBzAHEAdwB3AHYAbgBvAHUAdgB1AHAAbgBwAHAAcwByAHIAdQB2AHEAdQBtAG8AcQB3AHIAeABxAHgAdQBzAG8AdwB0AHYAcQByAHIAcABtAHIAeAB1AG0AdAB2AHcAdQByAG4AcgBtAHcAdABvAHcAbQBvAHgAbQBvAHMAdQByAG4AdgBtAHIAcgBuAHEAbwBuAHgAdABuAHcAcgBzAG8AbwB0AHcAdwB2AHEAcwBtAHEAcABzAG4AcwB3AHQA","8QHpAekB5gH1Ae8BCQIJAgQC4AHkAQACAwL+AesB3wHpAeoB9QHyAfEBAAIFAuwB/gHcAeUB7wEFAvABCwLtAQwC/wH4AeQBBQL5AQMC7AHzAfEB6QHeAfIBDAL9AdsB+gEBAgUC/QHzAeEB8wHeAQcC+AHmAQgC3AHkAQoC3QHjAfYBAALzAeABAwLbAfIB8AHhAe0B5QHfAQwC+gHhAQYC8AH1AeYB5QH8AQgCBwIDAusB9wHdAe4B6gH4AeEB9QEHAvwB","MAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwAC8AMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAvADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAA","dwB1AHUAdAB4AHYAfQB9AHsAcwB0AHoAewB6AHUAcgB1AHUAeAB3AHcAegB8AHYAegByAHQAdgB8AHcAfQB2AH0AegB4AHQAfAB5AHsAdgB3AHcAdQByAHcAfQB6AHIAeQB7AHwAegB3AHMAdwByAHwAeQB0AHwAcgB0AH0AcgB0AHgAegB3AHMAewByAHcAdwBzAHYAdAByAH0AeQBzAHwAdwB4AHQAdAB6AHwAfAB7AHUAeAByAHYAdQB4AHMAeAB8AHkA","JQAlACUAJAAmACUAJwAnACcAJAAkACYAJwAmACUAJAAlACUAJgAlACUAJgAnACUAJgAkACQAJQAnACUAJwAlACcAJgAmACQAJwAmACcAJQAlACUAJQAkACUAJwAmACQAJgAnACcAJgAlACQAJQAkACcAJgAkACcAJAAkACcAJAAkACYAJgAlACQAJwAkACUAJQAkACUAJAAkACcAJgAkACcAJQAmACQAJAAmACcAJwAnACUAJgAkACUAJQAmACQAJgAnACYA","EQARABEAEQASABEAEgASABIAEQARABIAEgASABEAEQARABEAEgARABEAEgASABEAEgARABEAEQASABEAEgARABIAEgASABEAEgASABIAEQARABEAEQARABEAEgASABEAEgASABIAEgARABEAEQARABIAEgARABIAEQARABIAEQARABIAEgARABEAEgARABEAEQARABEAEQARABIAEgARABIAEQASABEAEQASABIAEgASABEAEgARABEAEQASABEAEgASABIA"];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBXAFkAWwBdAF8AYQBjAGUAZwBpAGsAbQBvAHEAcwB1AHcAeQB7AH0AfwCBAIMAhQCHAIkAiwCNAI8AkQCTAJUAlwCZAJsAnQCfAKEAowClAKcAqQCrAK0ArwCxALMAtQC3ALkAuwC9AL8AwQDDAMUA";
+export const ALIAS_KEYS: string[] = ["adair","adair county","adams","adams county","allamakee","allamakee county","appanoose","appanoose county","audubon","audubon county","benton","benton county","black hawk","black hawk county","boone","boone county","bremer","bremer county","buchanan","buchanan county","buena vista","buena vista county","butler","butler county","calhoun","calhoun county","carroll","carroll county","cass","cass county","cedar","cedar county","cerro gordo","cerro gordo county","cherokee","cherokee county","chickasaw","chickasaw county","clarke","clarke county","clay","clay county","clayton","clayton county","clinton","clinton county","crawford","crawford county","dallas","dallas county","davis","davis county","decatur","decatur county","delaware","delaware county","des moines","des moines county","dickinson","dickinson county","dubuque","dubuque county","emmet","emmet county","fayette","fayette county","floyd","floyd county","franklin","franklin county","fremont","fremont county","greene","greene county","grundy","grundy county","guthrie","guthrie county","hamilton","hamilton county","hancock","hancock county","hardin","hardin county","harrison","harrison county","henry","henry county","howard","howard county","humboldt","humboldt county","ida","ida county","iowa","iowa county","jackson","jackson county","jasper","jasper county","jefferson","jefferson county","johnson","johnson county","jones","jones county","keokuk","keokuk county","kossuth","kossuth county","lee","lee county","linn","linn county","louisa","louisa county","lucas","lucas county","lyon","lyon county","madison","madison county","mahaska","mahaska county","marion","marion county","marshall","marshall county","mills","mills county","mitchell","mitchell county","monona","monona county","monroe","monroe county","montgomery","montgomery county","muscatine","muscatine county","obrien","obrien county","osceola","osceola county","page","page county","palo alto","palo alto county","plymouth","plymouth county","pocahontas","pocahontas county","polk","polk county","pottawattamie","pottawattamie county","poweshiek","poweshiek county","ringgold","ringgold county","sac","sac county","scott","scott county","shelby","shelby county","sioux","sioux county","story","story county","tama","tama county","taylor","taylor county","union","union county","van buren","van buren county","wapello","wapello county","warren","warren county","washington","washington county","wayne","wayne county","webster","webster county","winnebago","winnebago county","winneshiek","winneshiek county","woodbury","woodbury county","worth","worth county","wright","wright county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5ADoAOgA7ADsAPAA8AD0APQA+AD4APwA/AEAAQABBAEEAQgBCAEMAQwBEAEQARQBFAEYARgBHAEcASABIAEkASQBKAEoASwBLAEwATABNAE0ATgBOAE8ATwBQAFAAUQBRAFIAUgBTAFMAVABUAFUAVQBWAFYAVwBXAFgAWABZAFkAWgBaAFsAWwBcAFwAXQBdAF4AXgBfAF8AYABgAGEAYQBiAGIA";
+export const PRICE_BAND_TOTALS: string[] = ["HQj+BwEI9AcsCBMIdgh2CGMI3gfuB1IIYAhNCAYI2gcBCAIILAgfCB0IUghmCAoITQjQB/EHFghpCBkIfggOCIEIUQg2CO4HaQg8CGAIDAgjCB0IAQjVByEIfwhLCMgHQAhaCGkISQgjCOEHIwjVB24IOAj0B3EI0AfsB3oI0wfrBzAIVQgjCN4HYAjIBx8IGQjiBw4I8QfaB38IPQjhB2oIGQgtCPQH8QdGCHEIbghgCAgINAjUBxIIAwg2COEHLAhuCEUI","DQnuCPEI5AgcCQMJZglmCVMJzgjeCEIJUAk9CfYIygjxCPIIHAkPCQ0JQglWCfoIPQnACOEIBglZCQkJbgn+CHEJQQkmCd4IWQksCVAJ/AgTCQ0J8QjFCBEJbwk7CbMIMAlKCVkJOQkTCdEIEwnFCF4JKAnkCGEJwAjcCGoJwwjbCCAJRQkTCc4IUAmzCA8JCQnSCP4I4QjKCG8JLQnRCFoJCQkdCeQI4Qg2CWEJXglQCfgIJAnECAIJ8wgmCdEIHAleCTUJ","/QneCeEJ1AkMCvMJVgpWCkMKvgnOCTIKQAotCuYJugnhCeIJDAr/Cf0JMgpGCuoJLQqwCdEJ9glJCvkJXgruCWEKMQoWCs4JSQocCkAK7AkDCv0J4Qm1CQEKXworCp4JIAo6CkkKKQoDCsEJAwq1CU4KGArUCVEKsAnMCVoKswnLCRAKNQoDCr4JQAqeCf8J+QnCCe4J0Qm6CV8KHQrBCUoK+QkNCtQJ0QkmClEKTgpACugJFAq0CfIJ4wkWCsEJDApOCiUK","7QrOCtEKxAr8CuMKRgtGCzMLrgq+CiILMAsdC9YKqgrRCtIK/ArvCu0KIgs2C9oKHQugCsEK5go5C+kKTgveClELIQsGC74KOQsMCzAL3ArzCu0K0QqlCvEKTwsbC4kKEAsqCzkLGQvzCrEK8wqlCj4LCAvECkELoAq8CkoLowq7CgALJQvzCq4KMAuJCu8K6QqyCt4KwQqqCk8LDQuxCjoL6Qr9CsQKwQoWC0ELPgswC9gKBAukCuIK0woGC7EK/Ao+CxUL","3Qu+C8ELtAvsC9MLNgw2DCMMnguuCxIMIAwNDMYLmgvBC8IL7AvfC90LEgwmDMoLDQyQC7EL1gspDNkLPgzOC0EMEQz2C64LKQz8CyAMzAvjC90LwQuVC+ELPwwLDHQLAAwaDCkMCQzjC6EL4wuVCy4M+Au0CzEMkAusCzoMkwurC/ALFQzjC54LIAx0C98L2QuiC84LsQuaCz8M/QuhCyoM2QvtC7QLsQsGDDEMLgwgDMgL9AuUC9ILwwv2C6EL7AsuDAUM","zQyuDLEMpAzcDMMMJg0mDRMNjgyeDAINEA39DLYMigyxDLIM3AzPDM0MAg0WDboM/QyADKEMxgwZDckMLg2+DDENAQ3mDJ4MGQ3sDBANvAzTDM0MsQyFDNEMLw37DF8M8AwKDRkN+QzTDJEM0wyFDB4N6AykDCENgAycDCoNgwybDOAMBQ3TDI4MEA1fDM8MyQySDL4MoQyKDC8N7QyRDBoNyQzdDKQMoQz2DCENHg0QDbgM5AyEDMIMswzmDJEM3AweDfUM","rQ6ODpEOhA68DqMOBg8GD/MObg5+DuIO8A7dDpYOag6RDpIOvA6vDq0O4g72DpoO3Q5gDoEOpg75DqkODg+eDhEP4Q7GDn4O+Q7MDvAOnA6zDq0OkQ5lDrEODw/bDjUO0A7qDvkO2Q6zDnEOsw5lDv4OyA6EDgEPYA58DgoPYw57DsAO5Q6zDm4O8A41Dq8OqQ5yDp4OgQ5qDg8PzQ5xDvoOqQ69DoQOgQ7WDgEP/g7wDpgOxA5kDqIOkw7GDnEOvA7+DtUO","jRBuEHEQZBCcEIMQ5hDmENMQThBeEMIQ0BC9EHYQShBxEHIQnBCPEI0QwhDWEHoQvRBAEGEQhhDZEIkQ7hB+EPEQwRCmEF4Q2RCsENAQfBCTEI0QcRBFEJEQ7xC7EAsQsBDKENkQuRCTEFEQkxBFEN4QqBBkEOEQQBBcEOoQQxBbEKAQxRCTEE4Q0BALEI8QiRBSEH4QYRBKEO8QrRBRENoQiRCdEGQQYRC2EOEQ3hDQEHgQpBBEEIIQcxCmEFEQnBDeELUQ","PRUeFSEVFBVMFTMVlhWWFYMV/hQOFXIVgBVtFSYV+hQhFSIVTBU/FT0VchWGFSoVbRXwFBEVNhWJFTkVnhUuFaEVcRVWFQ4ViRVcFYAVLBVDFT0VIRX1FEEVnxVrFaIUYBV6FYkVaRVDFQEVQxX1FI4VWBUUFZEV8BQMFZoV8xQLFVAVdRVDFf4UgBWiFD8VORUCFS4VERX6FJ8VXRUBFYoVORVNFRQVERVmFZEVjhWAFSgVVBX0FDIVIxVWFQEVTBWOFWUV","7RnOGdEZxBn8GeMZRhpGGjMarhm+GSIaMBodGtYZqhnRGdIZ/BnvGe0ZIho2GtoZHRqgGcEZ5hk5GukZThreGVEaIRoGGr4ZORoMGjAa3BnzGe0Z0RmlGfEZTxobGjkZEBoqGjkaGRrzGbEZ8xmlGT4aCBrEGUEaoBm8GUoaoxm7GQAaJRrzGa4ZMBo5Ge8Z6RmyGd4ZwRmqGU8aDRqxGToa6Rn9GcQZwRkWGkEaPhowGtgZBBqkGeIZ0xkGGrEZ/Bk+GhUa","TSMuIzEjJCNcI0MjpiOmI5MjDiMeI4IjkCN9IzYjCiMxIzIjXCNPI00jgiOWIzojfSMAIyEjRiOZI0kjriM+I7EjgSNmIx4jmSNsI5AjPCNTI00jMSMFI1EjryN7I2cicCOKI5kjeSNTIxEjUyMFI54jaCMkI6EjACMcI6ojAyMbI2AjhSNTIw4jkCNnIk8jSSMSIz4jISMKI68jbSMRI5ojSSNdIyQjISN2I6EjniOQIzgjZCMEI0IjMyNmIxEjXCOeI3Uj","rSyOLJEshCy8LKMsBi0GLfMsbix+LOIs8CzdLJYsaiyRLJIsvCyvLK0s4iz2LJos3SxgLIEspiz5LKksDi2eLBEt4SzGLH4s+SzMLPAsnCyzLK0skSxlLLEsDy3bLJUr0CzqLPks2SyzLHEssyxlLP4syCyELAEtYCx8LAotYyx7LMAs5SyzLG4s8CyVK68sqSxyLJ4sgSxqLA8tzSxxLPosqSy9LIQsgSzWLAEt/izwLJgsxCxkLKIskyzGLHEsvCz+LNUs"];
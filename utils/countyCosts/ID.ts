@@ -0,0 +1,7 @@
+// IDAHO (ID) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Ada County","Adams County","Bannock County","Bear Lake County","Benewah County","Bingham County","Blaine County","Boise County","Bonner County","Bonneville County","Boundary County","Butte County","Camas County","Canyon County","Caribou County","Cassia County","Clark County","Clearwater County","Custer County","Elmore County","Franklin County","Fremont County","Gem County","Gooding County","Idaho County","Jefferson County","Jerome County","Kootenai County","Latah County","Lemhi County","Lewis County","Lincoln County","Madison County","Minidoka County","Nez Perce County","Oneida County","Owyhee County","Payette County","Power County","Shoshone County","Teton County","Twin Falls County","Valley County","Washington County"];
+export const COUNTY_COLUMNS: string[] = ["ZgFgAWEBYQFqAWYBaAFhAWUBZgFoAW0BWAFbAXcBXAFnAWABagFxAWoBXAFhAWoBcQF0AV8BbAF4AW0BVwFlAVcBZQFuAWsBcAFtAV4BVgFqAV8BcwFXAQ==","tQGuAbABrwG6AbUBuAGwAbQBtgG4Ab8BpQGpAcoBqgG3Aa4BuwHDAbsBqgGwAbsBwwHHAa0BvQHLAb8BowG0AaMBtAG/AbwBwgG/AawBogG7Aa0BxQGkAQ==","tQGuAbABrwG6AbUBuAGwAbQBtgG4Ab8BpQGpAcoBqgG3Aa4BuwHDAbsBqgGwAbsBwwHHAa0BvQHLAb8BowG0AaMBtAG/AbwBwgG/AawBogG7Aa0BxQGkAQ==","cgBwAHAAcABzAHIAcwBwAHIAcgBzAHQAbgBvAHcAbwByAHAAcwB1AHMAbwBxAHMAdgB3AHAAdAB4AHQAbQByAG0AcgB0AHQAdQB0AG8AbQBzAHAAdgBtAA==","pgGfAaEBoAGrAaYBqQGhAaYBpwGpAa8BlwGaAbsBmwGoAaABrAG0AawBmwGhAawBtAG3AZ4BrgG8Aa8BlQGmAZUBpgGwAa0BswGvAZ0BkwGsAZ4BtgGVAQ==","MQAxADEAMQAxADEAMQAxADEAMQAxADEAMQAxADEAMQAxADEAMQAxADEAMQAxADEAMQAxADEAMQAxADEAMAAxADAAMQAxADEAMQAxADEAMAAxADEAMQAxAA==","mgCXAJgAmACbAJoAmwCYAJkAmgCbAJ0AlACVAKEAlgCaAJcAnACfAJwAlgCYAJwAnwCgAJcAnQChAJ0AkwCZAJMAmQCdAJwAngCdAJYAkwCcAJcAnwCUAA==","KQApACkAKQAqACkAKgApACkAKQAqACoAKAAoACsAKAApACkAKgArACoAKAApACoAKwArACgAKgArACoAKAApACgAKQAqACoAKwAqACgAJwAqACgAKwAoAA==","FQAVABUAFQAWABUAFgAVABUAFQAWABYAFQAVABYAFQAVABUAFgAWABYAFQAVABYAFgAWABUAFgAWABYAFAAVABQAFQAWABYAFgAWABUAFAAWABUAFgAVAA=="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBXAA==";
+export const ALIAS_KEYS: string[] = ["ada","ada county","adams","adams county","bannock","bannock county","bear lake","bear lake county","benewah","benewah county","bingham","bingham county","blaine","blaine county","boise","boise county","bonner","bonner county","bonneville","bonneville county","boundary","boundary county","butte","butte county","camas","camas county","canyon","canyon county","caribou","caribou county","cassia","cassia county","clark","clark county","clearwater","clearwater county","custer","custer county","elmore","elmore county","franklin","franklin county","fremont","fremont county","gem","gem county","gooding","gooding county","idaho","idaho county","jefferson","jefferson county","jerome","jerome county","kootenai","kootenai county","latah","latah county","lemhi","lemhi county","lewis","lewis county","lincoln","lincoln county","madison","madison county","minidoka","minidoka county","nez perce","nez perce county","oneida","oneida county","owyhee","owyhee county","payette","payette county","power","power county","shoshone","shoshone county","teton","teton county","twin falls","twin falls county","valley","valley county","washington","washington county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwA=";
+export const PRICE_BAND_TOTALS: string[] = ["tQiVCJ0ImgjMCLUIxAidCLEIuAjECOAIbQh9CBQJggi8CJYI0Aj1CNAIggieCNAI9ggGCZAI2ggZCeAIXgixCF4IsQjiCNUI8AjgCIoIWAjQCJAI/ghnCA==","qgmKCZIJjwnBCaoJuQmSCaYJrQm5CdUJYglyCQkKdwmxCYsJxQnqCcUJdwmTCcUJ6wn7CYUJzwkOCtUJTgmmCU4JpgnXCcoJ5QnVCX8JSAnFCYUJ8wlcCQ==","nwp/CocKhAq2Cp8KrgqHCpsKogquCsoKVwpnCv4KbAqmCoAKugrfCroKbAqICroK4ArwCnoKxAoDC8oKPgqbCj4KmwrMCr8K2grKCnQKOAq6CnoK6ApRCg==","lAt0C3wLeQurC5QLowt8C5ALlwujC78LTAtcC/MLYQubC3ULrwvUC68LYQt9C68L1QvlC28LuQv4C78LLguQCy4LkAvBC7QLzwu/C2kLKAuvC28L3QtGCw==","iQxpDHEMbgygDIkMmAxxDIUMjAyYDLQMQQxRDOgMVgyQDGoMpAzJDKQMVgxyDKQMygzaDGQMrgztDLQMHgyFDB4MhQy2DKkMxAy0DF4MGAykDGQM0gw7DA==","fg1eDWYNYw2VDX4NjQ1mDXoNgQ2NDakNNg1GDd0NSw2FDV8NmQ2+DZkNSw1nDZkNvw3PDVkNow3iDakNDg16DQ4Neg2rDZ4NuQ2pDVMNCA2ZDVkNxw0wDQ==","aA9ID1APTQ9/D2gPdw9QD2QPaw93D5MPIA8wD8cPNQ9vD0kPgw+oD4MPNQ9RD4MPqQ+5D0MPjQ/MD5MP7g5kD+4OZA+VD4gPow+TDz0P6A6DD0MPsQ8aDw==","UhEyEToRNxFpEVIRYRE6EU4RVRFhEX0RChEaEbERHxFZETMRbRGSEW0RHxE7EW0RkxGjES0RdxG2EX0RzhBOEc4QThF/EXIRjRF9EScRyBBtES0RmxEEEQ==","Gxb7FQMWABYyFhsWKhYDFhcWHhYqFkYW0xXjFXoW6BUiFvwVNhZbFjYW6BUEFjYWXBZsFvYVQBZ/FkYWfhUXFn4VFxZIFjsWVhZGFvAVeBU2FvYVZBbNFQ==","5BrEGswayRr7GuQa8xrMGuAa5xrzGg8bnBqsGkMbsRrrGsUa/xokG/8asRrNGv8aJRs1G78aCRtIGw8bLhrgGi4a4BoRGwQbHxsPG7kaKBr/Gr8aLRuWGg==","diRWJF4kWySNJHYkhSReJHIkeSSFJKEkLiQ+JNUkQyR9JFckkSS2JJEkQyRfJJEktyTHJFEkmyTaJKEkjiNyJI4jciSjJJYksSShJEskiCORJFEkvyQoJA==","CC7oLfAt7S0fLgguFy7wLQQuCy4XLjMuwC3QLWcu1S0PLuktIy5ILiMu1S3xLSMuSS5ZLuMtLS5sLjMu7iwELu4sBC41LiguQy4zLt0t6CwjLuMtUS66LQ=="];
@@ -0,0 +1,7 @@
+// ILLINOIS (IL) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Adams County","Alexander County","Bond County","Boone County","Brown County","Bureau County","Calhoun County","Carroll County","Cass County","Champaign County","Christian County","Clark County","Clay County","Clinton County","Coles County","Cook County","Crawford County","Cumberland County","De Witt County","DeKalb County","Douglas County","DuPage County","Edgar County","Edwards County","Effingham County","Fayette County","Ford County","Franklin County","Fulton County","Gallatin County","Greene County","Grundy County","Hamilton County","Hancock County","Hardin County","Henderson County","Henry County","Iroquois County","Jackson County","Jasper County","Jefferson County","Jersey County","Jo Daviess County","Johnson County","Kane County","Kankakee County","Kendall County","Knox County","LaSalle County","Lake County","Lawrence County","Lee County","Livingston County","Logan County","Macon County","Macoupin County","Madison County","Marion County","Marshall County","Mason County","Massac County","McDonough County","McHenry County","McLean County","Menard County","Mercer County","Monroe County","Montgomery County","Morgan County","Moultrie County","Ogle County","Peoria County","Perry County","Piatt County","Pike County","Pope County","Pulaski County","Putnam County","Randolph County","Richland County","Rock Island County","Saline County","Sangamon County","Schuyler County","Scott County","Shelby County","St. Clair County","Stark County","Stephenson County","Tazewell County","Union County","Vermilion County","Wabash County","Warren County","Washington County","Wayne County","White County","Whiteside County","Will County","Williamson County","Winnebago County","Woodford County"];
+export const COUNTY_COLUMNS: string[] = ["bgGDAYEBhwF0AXYBggF+AXABbwGJAXYBdAGDAWwBhAFxAYkBfwF2AW4BZAGBAYABcQGJAYcBegF2AWcBhAF6AXEBdgF1AYABZgF4AXsBgQGEAW4BeQF9AYcBagFmAYABZwGEAW4BZgFnAYcBZgFmAWUBhwFlAWgBeAGIAXIBfQF7AYABdgFoAWgBggFwAWsBeAGFAX4BfwFsAW0BcwF4AX8BhgFtAXMBdAF4AYABegFpAXUBhQFkAYUBeQFmAXIBdQGEAYEBaQF6AXwB","xgHgAd4B5AHOAdAB3wHaAcgBxwHnAdABzgHgAcMB4QHJAecB2wHQAcYBuQHdAd0BygHnAeQB1AHQAb0B4QHVAcoB0AHOAdwBvAHSAdcB3QHhAcYB1AHZAeQBwQG9Ad0BvQHhAcUBvAG9AeQBvAG8AbsB5QG7Ab4B0wHmAcsB2AHWAd0B0AG+Ab4B3gHJAcIB0wHjAdoB2wHDAcQBzAHSAdsB5AHFAcwBzQHSAd0B1AHAAc8B4wG6AeIB1AG8AcsBzgHiAd4BvwHUAdcB","ZAF5AXcBfAFqAWwBeAF0AWYBZQF+AWwBagF5AWIBeQFnAX4BdQFsAWQBWgF2AXYBZwF+AXwBbwFsAV4BeQFwAWcBbAFrAXUBXAFuAXEBdgF5AWQBbwFzAXwBYAFdAXYBXgF6AWQBXAFeAXwBXAFcAVsBfQFcAV4BbgF+AWgBcwFxAXYBbAFeAV4BdwFmAWEBbgF7AXQBdQFiAWMBaQFuAXUBewFjAWkBagFuAXYBbwFfAWsBewFbAXoBbwFcAWgBawF6AXcBXwFvAXIB","iACQAI8AkgCLAIsAkACOAIkAiQCSAIsAiwCQAIgAkACJAJIAjwCLAIgAhQCPAI8AigCSAJIAjQCLAIYAkACNAIkAiwCLAI8AhQCMAI0AjwCQAIgAjACOAJIAhwCFAI8AhgCRAIgAhQCGAJIAhQCFAIUAkgCFAIYAjACSAIoAjgCNAI8AiwCGAIYAkACJAIcAjACRAI4AjwCIAIgAigCMAI8AkQCIAIoAigCMAI8AjQCGAIsAkQCFAJEAjACFAIoAiwCRAI8AhgCNAI0A","lAK5ArUCwAKeAqECtwKxApYClQLEAqECngK5ApACugKYAsQCsQKhApQCgQK1ArQCmQLEAsACqAKhAocCugKpApgCoQKfArMChQKlAqsCtQK6ApQCpwKvAsACjAKFArQChwK7ApIChQKHAsAChQKFAoMCwAKDAogCpgLCApsCrgKqArQCogKIAogCtwKXAo4CpgK9ArECsgKQApECnAKlArECvgKSApwCnQKlArQCqAKKAqACvQKBArwCpwKEApsCnwK7ArUCigKoAqwC","NwA4ADgAOAA4ADgAOAA4ADcANwA4ADgAOAA4ADcAOAA3ADgAOAA4ADcANwA4ADgAOAA4ADgAOAA4ADcAOAA4ADgAOAA4ADgANwA4ADgAOAA4ADcAOAA4ADgANwA3ADgANwA4ADcANwA3ADgANwA3ADcAOAA3ADcAOAA4ADgAOAA4ADgAOAA3ADcAOAA3ADcAOAA4ADgAOAA3ADcAOAA4ADgAOAA3ADgAOAA4ADgAOAA3ADgAOAA3ADgAOAA3ADgAOAA4ADgANwA4ADgA","oQCqAKkArACkAKQAqgCoAKIAoQCtAKQApACqAKAAqgCiAK0AqACkAKEAnACpAKkAogCtAKwApgCkAJ4AqgCmAKIApACkAKgAnQClAKcAqQCqAKEApgCnAKwAnwCdAKkAngCqAKEAnQCeAKwAnQCdAJ0ArACdAJ4ApQCsAKMApwCmAKkApACeAJ4AqQCiAJ8ApQCrAKgAqACgAKAAowClAKgAqwCgAKMAowClAKkApgCfAKQAqwCcAKsApgCdAKMApACrAKkAngCmAKcA","LwAyADIAMwAwADAAMgAyADAAMAAzADAAMAAyAC8AMgAwADMAMgAwAC8ALgAyADIAMAAzADMAMQAwAC4AMgAxADAAMAAwADIALgAxADEAMgAyAC8AMQAxADMALwAuADIALgAyAC8ALgAuADMALgAuAC4AMwAuAC8AMQAzADAAMQAxADIAMAAvAC8AMgAwAC8AMQAyADIAMgAvAC8AMAAxADIAMwAvADAAMAAxADIAMQAvADAAMgAuADIAMQAuADAAMAAyADIALwAxADEA","FwAYABgAGQAXABcAGAAYABcAFwAZABcAFwAYABcAGAAXABkAGAAXABcAFgAYABgAFwAZABkAGAAXABcAGAAYABcAFwAXABgAFgAYABgAGAAYABcAGAAYABkAFwAWABgAFwAYABcAFgAXABkAFgAWABYAGQAWABcAGAAZABcAGAAYABgAFwAXABcAGAAXABcAGAAYABgAGAAXABcAFwAYABgAGAAXABcAFwAYABgAGAAXABcAGAAWABgAGAAWABcAFwAYABgAFwAYABgA"];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJwAlACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBXAFkAWwBdAF8AYwBhAGUAZwBpAGsAcwB1AHcAeQB7AH0AfwBtAG8AcQCBAIMAhQCHAIkAiwCNAI8AkQCTAJUAlwCZAJsAnQCfAKEApQCnAKkAqwCtAKMArwCxALMAtQC3ALkAuwC9AL8AwQDDAMUAxwDJAMsA";
+export const ALIAS_KEYS: string[] = ["adams","adams county","alexander","alexander county","bond","bond county","boone","boone county","brown","brown county","bureau","bureau county","calhoun","calhoun county","carroll","carroll county","cass","cass county","champaign","champaign county","christian","christian county","clark","clark county","clay","clay county","clinton","clinton county","coles","coles county","cook","cook county","crawford","crawford county","cumberland","cumberland county","de witt","de witt county","dekalb","dekalb county","douglas","douglas county","dupage","dupage county","edgar","edgar county","edwards","edwards county","effingham","effingham county","fayette","fayette county","ford","ford county","franklin","franklin county","fulton","fulton county","gallatin","gallatin county","greene","greene county","grundy","grundy county","hamilton","hamilton county","hancock","hancock county","hardin","hardin county","henderson","henderson county","henry","henry county","iroquois","iroquois county","jackson","jackson county","jasper","jasper county","jefferson","jefferson county","jersey","jersey county","jo daviess","jo daviess county","johnson","johnson county","kane","kane county","kankakee","kankakee county","kendall","kendall county","knox","knox county","lake","lake county","lasalle","lasalle county","lawrence","lawrence county","lee","lee county","livingston","livingston county","logan","logan county","macon","macon county","macoupin","macoupin county","madison","madison county","marion","marion county","marshall","marshall county","mason","mason county","massac","massac county","mcdonough","mcdonough county","mchenry","mchenry county","mclean","mclean county","menard","menard county","mercer","mercer county","monroe","monroe county","montgomery","montgomery county","morgan","morgan county","moultrie","moultrie county","ogle","ogle county","peoria","peoria county","perry","perry county","piatt","piatt county","pike","pike county","pope","pope county","pulaski","pulaski county","putnam","putnam county","randolph","randolph county","richland","richland county","rock island","rock island county","saint clair","saint clair county","saline","saline county","sangamon","sangamon county","schuyler","schuyler county","scott","scott county","shelby","shelby county","stark","stark county","stephenson","stephenson county","tazewell","tazewell county","union","union county","vermilion","vermilion county","wabash","wabash county","warren","warren county","washington","washington county","wayne","wayne county","white","white county","whiteside","whiteside county","will","will county","williamson","williamson county","winnebago","winnebago county","woodford","woodford county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMQAxADAAMAAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5ADoAOgA7ADsAPAA8AD0APQA+AD4APwA/AEAAQABBAEEAQgBCAEMAQwBEAEQARQBFAEYARgBHAEcASABIAEkASQBKAEoASwBLAEwATABNAE0ATgBOAE8ATwBQAFAAVgBWAFEAUQBSAFIAUwBTAFQAVABVAFUAVwBXAFgAWABZAFkAWgBaAFsAWwBcAFwAXQBdAF4AXgBfAF8AYABgAGEAYQBiAGIAYwBjAGQAZABlAGUA";
+export const PRICE_BAND_TOTALS: string[] = ["rgkxCiUKSQrYCeEJLAoVCrkJtAlVCuEJ2AkxCqIJNAq+CVUKGQrhCa4JcAkjCiEKxglVCkkK+QnhCYUJNAr8CcQJ4QnbCR0KfAnvCQMKIwo0Cq4J9gkOCkkKlgl+CSEKhQk3CqsJfAmFCUkKfAl8CXcJSwp4CYkJ8QlQCswJDAoACiEK4gmJCYkJKQq7CZsJ8Qk+ChUKGgqiCaYJ0AnvCRkKQgqoCdAJ1AnvCSEK+QmQCd0JPgpyCTsK9gl7CcwJ2wk5CiUKjgn5CQYK","wQpJCz0LYQvwCvkKRAstC8wKxwptC/kK8ApJC7UKTAvRCm0LMQv5CsEKgwo7CzkL3gptC2ELEQv5CpgKTAsUC9wK+QrzCjULjwoHCxsLOwtMC8EKDgsmC2ELqQqRCjkLmApPC74KjwqYCmELjwqPCooKYwuLCpwKCQtoC+QKJAsYCzkL+gqcCpwKQQvOCq4KCQtWCy0LMgu1CrkK6AoHCzELWgu7CugK7AoHCzkLEQujCvUKVguFClMLDguOCuQK8wpRCz0LoQoRCx4L","1AthDFUMeQwIDBEMXAxFDN8L2guFDBEMCAxhDMgLZAzkC4UMSQwRDNQLlgtTDFEM9guFDHkMKQwRDKsLZAwsDPQLEQwLDE0MogsfDDMMUwxkDNQLJgw+DHkMvAukC1EMqwtnDNELogurC3kMoguiC50LewyeC68LIQyADPwLPAwwDFEMEgyvC68LWQzhC8ELIQxuDEUMSgzIC8wLAAwfDEkMcgzOCwAMBAwfDFEMKQy2Cw0MbgyYC2sMJgyhC/wLCwxpDFUMtAspDDYM","5wx5DW0NkQ0gDSkNdA1dDfIM7QydDSkNIA15DdsMfA33DJ0NYQ0pDecMqQxrDWkNDg2dDZENQQ0pDb4MfA1EDQwNKQ0jDWUNtQw3DUsNaw18DecMPg1WDZENzwy3DGkNvgx/DeQMtQy+DJENtQy1DLAMkw2xDMIMOQ2YDRQNVA1IDWkNKg3CDMIMcQ30DNQMOQ2GDV0NYg3bDN8MGA03DWENig3hDBgNHA03DWkNQQ3JDCUNhg2rDIMNPg20DBQNIw2BDW0NxwxBDU4N","+g2RDoUOqQ44DkEOjA51DgUOAA61DkEOOA6RDu4NlA4KDrUOeQ5BDvoNvA2DDoEOJg61DqkOWQ5BDtENlA5cDiQOQQ47Dn0OyA1PDmMOgw6UDvoNVg5uDqkO4g3KDYEO0Q2XDvcNyA3RDakOyA3IDcMNqw7EDdUNUQ6wDiwObA5gDoEOQg7VDdUNiQ4HDucNUQ6eDnUOeg7uDfINMA5PDnkOog70DTAONA5PDoEOWQ7cDT0Ong6+DZsOVg7HDSwOOw6ZDoUO2g1ZDmYO","DQ+pD50PwQ9QD1kPpA+NDxgPEw/ND1kPUA+pDwEPrA8dD80PkQ9ZDw0Pzw6bD5kPPg/ND8EPcQ9ZD+QOrA90DzwPWQ9TD5UP2w5nD3sPmw+sDw0Pbg+GD8EP9Q7dDpkP5A6vDwoP2w7kDsEP2w7bDtYOww/XDugOaQ/ID0QPhA94D5kPWg/oDugOoQ8aD/oOaQ+2D40Pkg8BDwUPSA9nD5EPug8HD0gPTA9nD5kPcQ/vDlUPtg/RDrMPbg/aDkQPUw+xD50P7Q5xD34P","MxHZEc0R8RGAEYkR1BG9ET4RORH9EYkRgBHZEScR3BFDEf0RwRGJETMR9RDLEckRbhH9EfERoRGJEQoR3BGkEWwRiRGDEcURARGXEasRyxHcETMRnhG2EfERGxEDEckRChHfETARAREKEfERAREBEfwQ8xH9EA4RmRH4EXQRtBGoEckRihEOEQ4R0RFAESARmRHmEb0RwhEnESsReBGXEcER6hEtEXgRfBGXEckRoREVEYUR5hH3EOMRnhEAEXQRgxHhEc0RExGhEa4R","WRMJFP0TIRSwE7kTBBTtE2QTXxMtFLkTsBMJFE0TDBRpEy0U8RO5E1kTGxP7E/kTnhMtFCEU0RO5EzATDBTUE5wTuROzE/UTJxPHE9sT+xMMFFkTzhPmEyEUQRMpE/kTMBMPFFYTJxMwEyEUJxMnEyITIxQjEzQTyRMoFKQT5BPYE/kTuhM0EzQTARRmE0YTyRMWFO0T8hNNE1ETqBPHE/ETGhRTE6gTrBPHE/kT0RM7E7UTFhQdExMUzhMmE6QTsxMRFP0TORPRE94T","uBiBGXUZmRkoGTEZfBllGcMYvhilGTEZKBmBGawYhBnIGKUZaRkxGbgYehhzGXEZFhmlGZkZSRkxGY8YhBlMGRQZMRkrGW0Zhhg/GVMZcxmEGbgYRhleGZkZoBiIGHEZjxiHGbUYhhiPGJkZhhiGGIEYmxmCGJMYQRmgGRwZXBlQGXEZMhmTGJMYeRnFGKUYQRmOGWUZahmsGLAYIBk/GWkZkhmyGCAZJBk/GXEZSRmaGC0Zjhl8GIsZRhmFGBwZKxmJGXUZmBhJGVYZ","Fx75Hu0eER+gHqke9B7dHiIeHR4dH6keoB75Hgse/B4nHh0f4R6pHhce2R3rHukejh4dHxEfwR6pHu4d/B7EHoweqR6jHuUe5R23Hsse6x78Hhcevh7WHhEf/x3nHeke7h3/HhQe5R3uHREf5R3lHeAdEx/hHfIduR4YH5Qe1B7IHukeqh7yHfId8R4kHgQeuR4GH90e4h4LHg8emB63HuEeCh8RHpgenB63HukewR75HaUeBh/bHQMfvh7kHZQeox4BH+0e9x3BHs4e","1SjpKd0pASqQKZkp5CnNKeAo2ygNKpkpkCnpKcko7CnlKA0q0SmZKdUolyjbKdkpfikNKgEqsSmZKawo7Cm0KXwpmSmTKdUpoyinKbsp2ynsKdUorinGKQEqvSilKNkprCjvKdIooyisKAEqoyijKJ4oAyqfKLAoqSkIKoQpxCm4KdkpmimwKLAo4SniKMIoqSn2Kc0p0inJKM0oiCmnKdEp+inPKIgpjCmnKdkpsSm3KJUp9imZKPMprimiKIQpkynxKd0ptSixKb4p","kzPZNM008TSANIk01DS9NJ4zmTP9NIk0gDTZNIcz3DSjM/00wTSJNJMzVTPLNMk0bjT9NPE0oTSJNGoz3DSkNGw0iTSDNMU0YTOXNKs0yzTcNJMznjS2NPE0ezNjM8k0ajPfNJAzYTNqM/E0YTNhM1wz8zRdM24zmTT4NHQ0tDSoNMk0ijRuM24z0TSgM4AzmTTmNL00wjSHM4szeDSXNME06jSNM3g0fDSXNMk0oTR1M4U05jRXM+M0njRgM3Q0gzThNM00czOhNK40"];
@@ -0,0 +1,7 @@
+// INDIANA (IN) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Adams County","Allen County","Bartholomew County","Benton County","Blackford County","Boone County","Brown County","Carroll County","Cass County","Clark County","Clay County","Clinton County","Crawford County","Daviess County","DeKalb County","Dearborn County","Decatur County","Delaware County","Dubois County","Elkhart County","Fayette County","Floyd County","Fountain County","Franklin County","Fulton County","Gibson County","Grant County","Greene County","Hamilton County","Hancock County","Harrison County","Hendricks County","Henry County","Howard County","Huntington County","Jackson County","Jasper County","Jay County","Jefferson County","Jennings County","Johnson County","Knox County","Kosciusko County","LaGrange County","LaPorte County","Lake County","Lawrence County","Madison County","Marion County","Marshall County","Martin County","Miami County","Monroe County","Montgomery County","Morgan County","Newton County","Noble County","Ohio County","Orange County","Owen County","Parke County","Perry County","Pike County","Porter County","Posey County","Pulaski County","Putnam County","Randolph County","Ripley County","Rush County","Scott County","Shelby County","Spencer County","St. Joseph County","Starke County","Steuben County","Sullivan County","Switzerland County","Tippecanoe County","Tipton County","Union County","Vanderburgh County","Vermillion County","Vigo County","Wabash County","Warren County","Warrick County","Washington County","Wayne County","Wells County","White County","Whitley County"];
+export const COUNTY_COLUMNS: string[] = ["YAFkAXcBZAFkAXcBZQFvAWEBZwFlAXQBYgF4AWcBZQFdAWQBbQFdAXkBbwFdAWoBZwFjAXYBdAFiAWcBYAFkAVgBZgFyAWwBcQFpAXQBeQFuAXEBXgFpAWoBdAFfAVcBdwFXAVwBagFnAVkBWQFZAXkBZAFyAV0BcQFpAW8BVwFaAV0BXgFkAWoBdAFlAWkBZQFmAWcBaQFmAVsBcAFyAXYBZwFuAXMBdQFqAWYBVwFkAXcBZgFWAQ==","rgGzAcsBswGzAcoBtQHBAbABtwG1AcYBsAHLAbcBtQGrAbQBvgGqAc0BwQGqAbsBtwGyAcoBxwGxAbcBrgG0AaQBtgHFAb0BwwG5AccBzQG/AcMBrAG5AboBxwGtAaMBywGjAakBuwG3AaYBpgGmAc0BswHFAasBwwG6AcEBpAGnAasBrAG0AboBxgG0AbkBtQG2AbcBuQG2AakBwgHFAckBtwG/AcYByAG7AbUBpAGzAcsBtQGiAQ==","VgFaAW0BWgFaAW0BWwFlAVcBXQFbAWkBWAFtAV0BWwFTAVoBYgFTAW8BZQFTAWABXQFZAWwBagFYAV0BVgFaAU4BXAFoAWIBZwFfAWoBbwFkAWcBVAFfAWABagFVAU0BbQFNAVIBYAFdAVABUAFQAW8BWgFoAVMBZwFfAWUBTgFRAVQBVAFaAWABaQFbAV8BWwFcAV0BXwFcAVIBZgFoAWsBXQFjAWkBawFgAVwBTgFaAW0BXAFMAQ==","fwCAAIcAgACAAIcAgQCEAH8AgQCBAIYAfwCHAIEAgQB+AIAAgwB+AIgAhAB+AIMAgQCAAIcAhgCAAIEAfwCAAHwAgQCFAIMAhQCCAIYAiACEAIUAfgCCAIIAhgB+AHsAhwB8AH0AgwCBAHwAfAB8AIgAgACFAH4AhQCCAIQAfAB9AH4AfgCAAIIAhgCAAIIAgQCBAIEAggCBAH0AhQCFAIcAgQCEAIYAhgCCAIEAfACAAIcAgQB7AA==","GQIfAj4CIAIgAj0CIgIxAhwCJAIiAjgCHQI+AiQCIgIWAiECLQIVAkACMgIVAioCJAIfAjwCOQIdAiQCGgIhAg0CJAI2Ai0CNAIoAjkCQAIvAjQCFwIoAikCOQIYAgwCPgIMAhMCKgIlAhACEAIQAkACIAI2AhYCNAIoAjECDQIRAhYCFwIhAikCOAIhAicCIgIkAiUCJwIjAhMCMwI2AjsCJAIvAjcCOgIpAiMCDQIfAj4CIwILAg==","NQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA0ADUANQA0ADUANQA0ADUANQA1ADUANQA1ADUANQA1ADQANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADQANQA0ADQANQA1ADQANAA0ADUANQA1ADQANQA1ADUANAA0ADQANQA1ADUANQA1ADUANQA1ADUANQA1ADQANQA1ADUANQA1ADUANQA1ADUANAA1ADUANQA0AA==","fwCAAIcAgACAAIcAgQCEAH8AgQCBAIYAfwCHAIEAgQB+AIAAgwB+AIgAhAB+AIMAgQCAAIcAhgCAAIEAfwCAAHwAgQCFAIMAhQCCAIYAiACEAIUAfgCCAIIAhgB+AHsAhwB8AH0AgwCBAHwAfAB8AIgAgACFAH4AhQCCAIQAfAB9AH4AfgCAAIIAhgCAAIIAgQCBAIEAggCBAH0AhQCFAIcAgQCEAIYAhgCCAIEAfACAAIcAgQB7AA==","KQApACsAKQApACsAKQAqACkAKQApACsAKQArACkAKQAoACkAKgAoACwAKgAoACoAKQApACsAKwApACkAKQApACgAKQArACoAKwAqACsALAAqACsAKAAqACoAKwAoACgAKwAoACgAKgApACgAKAAoACwAKQArACgAKwAqACoAKAAoACgAKAApACoAKwApACoAKQApACkAKgApACgAKwArACsAKQAqACsAKwAqACkAKAApACsAKQAnAA==","FQAVABYAFQAVABYAFQAWABUAFQAVABYAFQAWABUAFQAVABUAFgAVABcAFgAVABYAFQAVABYAFgAVABUAFQAVABUAFQAWABYAFgAWABYAFwAWABYAFQAWABYAFgAVABQAFgAUABUAFgAVABUAFQAVABcAFQAWABUAFgAWABYAFQAVABUAFQAVABYAFgAVABYAFQAVABUAFgAVABUAFgAWABYAFQAWABYAFgAWABUAFQAVABYAFQAUAA=="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbACEAHQAfACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBXAFsAWQBdAF8AYQBjAGUAZwBpAGsAbQBvAHEAcwB1AHcAeQB7AH0AfwCBAIMAhQCHAIkAiwCPAJEAkwCNAJUAlwCZAJsAnQCfAKEAowClAKcAqQCrAK0ArwCxALMAtQC3AA==";
+export const ALIAS_KEYS: string[] = ["adams","adams county","allen","allen county","bartholomew","bartholomew county","benton","benton county","blackford","blackford county","boone","boone county","brown","brown county","carroll","carroll county","cass","cass county","clark","clark county","clay","clay county","clinton","clinton county","crawford","crawford county","daviess","daviess county","dearborn","dearborn county","decatur","decatur county","dekalb","dekalb county","delaware","delaware county","dubois","dubois county","elkhart","elkhart county","fayette","fayette county","floyd","floyd county","fountain","fountain county","franklin","franklin county","fulton","fulton county","gibson","gibson county","grant","grant county","greene","greene county","hamilton","hamilton county","hancock","hancock county","harrison","harrison county","hendricks","hendricks county","henry","henry county","howard","howard county","huntington","huntington county","jackson","jackson county","jasper","jasper county","jay","jay county","jefferson","jefferson county","jennings","jennings county","johnson","johnson county","knox","knox county","kosciusko","kosciusko county","lagrange","lagrange county","lake","lake county","laporte","laporte county","lawrence","lawrence county","madison","madison county","marion","marion county","marshall","marshall county","martin","martin county","miami","miami county","monroe","monroe county","montgomery","montgomery county","morgan","morgan county","newton","newton county","noble","noble county","ohio","ohio county","orange","orange county","owen","owen county","parke","parke county","perry","perry county","pike","pike county","porter","porter county","posey","posey county","pulaski","pulaski county","putnam","putnam county","randolph","randolph county","ripley","ripley county","rush","rush county","saint joseph","saint joseph county","scott","scott county","shelby","shelby county","spencer","spencer county","starke","starke county","steuben","steuben county","sullivan","sullivan county","switzerland","switzerland county","tippecanoe","tippecanoe county","tipton","tipton county","union","union county","vanderburgh","vanderburgh county","vermillion","vermillion county","vigo","vigo county","wabash","wabash county","warren","warren county","warrick","warrick county","washington","washington county","wayne","wayne county","wells","wells county","white","white county","whitley","whitley county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAPAA8AEAAQAA4ADgARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAtAC0ALAAsAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5ADoAOgA7ADsAPAA8AD0APQA+AD4APwA/AEAAQABBAEEAQgBCAEMAQwBEAEQARQBFAEkASQBGAEYARwBHAEgASABKAEoASwBLAEwATABNAE0ATgBOAE8ATwBQAFAAUQBRAFIAUgBTAFMAVABUAFUAVQBWAFYAVwBXAFgAWABZAFkAWgBaAFsAWwA=";
+export const PRICE_BAND_TOTALS: string[] = ["wgjXCEUJ2AjYCEMJ4AgXCckI6AjgCDEJzAhGCegI4AiuCNoICQmsCFEJGAmsCP4I6AjUCEAJNAnPCOgIwwjaCJAI5QgpCQcJIwn2CDQJUQkRCSMJtwj2CPoINAm7CIkIRQmLCKUI/gjpCJgImAiYCFEJ2AgpCa4IIwn3CBcJjwieCK8ItwjaCPoIMQncCPUI4AjlCOkI9QjkCKQIHwkpCT0J6AgQCS8JOAn7COMIjwjXCEUJ4wiECA==","ywngCU4K4QnhCUwK6QkgCtIJ8QnpCToK1QlPCvEJ6QmyCeMJEgqwCVoKIQqwCQcK8QndCUkKPQrYCfEJzAnjCZQJ7gkyChAKLAr/CT0KWgoaCiwKwAn/CQMKPQrECY0JTgqPCakJBwryCZwJnAmcCVoK4QkyCrIJLAoACiAKkwmiCbMJwAnjCQMKOgrlCf4J6QnuCfIJ/gntCagJKAoyCkYK8QkZCjgKQQoECuwJkwngCU4K7AmICQ==","1ArpClcL6grqClUL8gopC9sK+gryCkML3gpYC/oK8gq2CuwKGwu0CmMLKgu0ChAL+grmClILRgvhCvoK1QrsCpgK9wo7CxkLNQsIC0YLYwsjCzULyQoICwwLRgvNCpEKVwuTCq0KEAv7CqAKoAqgCmML6go7C7YKNQsJCykLlwqmCrcKyQrsCgwLQwvuCgcL8gr3CvsKBwv2CqwKMQs7C08L+goiC0ELSgsNC/UKlwrpClcL9QqMCg==","3QvyC2AM8wvzC14M+wsyDOQLAwz7C0wM5wthDAMM+wu6C/ULJAy4C2wMMwy4CxkMAwzvC1sMTwzqCwMM3gv1C5wLAAxEDCIMPgwRDE8MbAwsDD4M0gsRDBUMTwzWC5ULYAyXC7ELGQwEDKQLpAukC2wM8wtEDLoLPgwSDDIMmwuqC7sL0gv1CxUMTAz3CxAM+wsADAQMEAz/C7ALOgxEDFgMAwwrDEoMUwwWDP4LmwvyC2AM/guQCw==","5gz7DGkN/Az8DGcNBA07De0MDA0EDVUN8AxqDQwNBA2+DP4MLQ28DHUNPA28DCINDA34DGQNWA3zDAwN5wz+DKAMCQ1NDSsNRw0aDVgNdQ01DUcN2wwaDR4NWA3fDJkMaQ2bDLUMIg0NDagMqAyoDHUN/AxNDb4MRw0bDTsNnwyuDL8M2wz+DB4NVQ0ADRkNBA0JDQ0NGQ0IDbQMQw1NDWENDA00DVMNXA0fDQcNnwz7DGkNBw2UDA==","7w0EDnIOBQ4FDnAODQ5EDvYNFQ4NDl4O+Q1zDhUODQ7CDQcONg7ADX4ORQ7ADSsOFQ4BDm0OYQ78DRUO8A0HDqQNEg5WDjQOUA4jDmEOfg4+DlAO5A0jDicOYQ7oDZ0Ncg6fDbkNKw4WDqwNrA2sDX4OBQ5WDsINUA4kDkQOow2yDcMN5A0HDicOXg4JDiIODQ4SDhYOIg4RDrgNTA5WDmoOFQ49DlwOZQ4oDhAOow0EDnIOEA6YDQ==","ARAWEIQQFxAXEIIQHxBWEAgQJxAfEHAQCxCFECcQHxDKDxkQSBDID5AQVxDIDz0QJxATEH8QcxAOECcQAhAZEKwPJBBoEEYQYhA1EHMQkBBQEGIQ9g81EDkQcxD6D6UPhBCnD8EPPRAoELQPtA+0D5AQFxBoEMoPYhA2EFYQqw+6D8sP9g8ZEDkQcBAbEDQQHxAkECgQNBAjEMAPXhBoEHwQJxBPEG4QdxA6ECIQqw8WEIQQIhCgDw==","ExIoEpYSKRIpEpQSMRJoEhoSORIxEoISHRKXEjkSMRLSESsSWhLQEaISaRLQEU8SORIlEpEShRIgEjkSFBIrErQRNhJ6ElgSdBJHEoUSohJiEnQSCBJHEksShRIMEq0RlhKvEckRTxI6ErwRvBG8EaISKRJ6EtIRdBJIEmgSsxHCEdMRCBIrEksSghItEkYSMRI2EjoSRhI1EsgRcBJ6Eo4SORJhEoASiRJMEjQSsxEoEpYSNBKoEQ==","QBdVF8MXVhdWF8EXXheVF0cXZhdeF68XShfEF2YXXhfmFlgXhxfkFs8XlhfkFnwXZhdSF74XshdNF2YXQRdYF8gWYxenF4UXoRd0F7IXzxePF6EXNRd0F3gXshc5F8EWwxfDFt0WfBdnF9AW0BbQFs8XVhenF+YWoRd1F5UXxxbWFucWNRdYF3gXrxdaF3MXXhdjF2cXcxdiF9wWnRenF7sXZheOF60Xthd5F2EXxxZVF8MXYRe8Fg==","bRyCHPAcgxyDHO4cixzCHHQckxyLHNwcdxzxHJMcixz6G4UctBz4G/wcwxz4G6kckxx/HOsc3xx6HJMcbhyFHNwbkBzUHLIczhyhHN8c/By8HM4cYhyhHKUc3xxmHNUb8BzXG/EbqRyUHOQb5BvkG/wcgxzUHPobzhyiHMIc2xvqG/sbYhyFHKUc3ByHHKAcixyQHJQcoByPHPAbyhzUHOgckxy7HNoc4xymHI4c2xuCHPAcjhzQGw==","xybcJkon3SbdJkgn5SYcJ84m7SblJjYn0SZLJ+0m5SYiJt8mDicgJlYnHScgJgMn7SbZJkUnOSfUJu0myCbfJgQm6iYuJwwnKCf7JjknVicWJygnvCb7Jv8mOSfAJv0lSif/JRkmAyfuJgwmDCYMJlYn3SYuJyImKCf8JhwnAyYSJiMmvCbfJv8mNifhJvom5SbqJu4m+ibpJhgmJCcuJ0In7SYVJzQnPScAJ+gmAybcJkon6Cb4JQ==","ITE2MaQxNzE3MaIxPzF2MSgxRzE/MZAxKzGlMUcxPzFKMDkxaDFIMLAxdzFIMF0xRzEzMZ8xkzEuMUcxIjE5MSwwRDGIMWYxgjFVMZMxsDFwMYIxFjFVMVkxkzEaMSUwpDEnMEEwXTFIMTQwNDA0MLAxNzGIMUowgjFWMXYxKzA6MEswFjE5MVkxkDE7MVQxPzFEMUgxVDFDMUAwfjGIMZwxRzFvMY4xlzFaMUIxKzA2MaQxQjEgMA=="];
@@ -0,0 +1,7 @@
+// KANSAS (KS) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Allen County","Anderson County","Atchison County","Barber County","Barton County","Bourbon County","Brown County","Butler County","Chase County","Chautauqua County","Cherokee County","Cheyenne County","Clark County","Clay County","Cloud County","Coffey County","Comanche County","Cowley County","Crawford County","Decatur County","Dickinson County","Doniphan County","Douglas County","Edwards County","Elk County","Ellis County","Ellsworth County","Finney County","Ford County","Franklin County","Geary County","Gove County","Graham County","Grant County","Gray County","Greeley County","Greenwood County","Hamilton County","Harper County","Harvey County","Haskell County","Hodgeman County","Jackson County","Jefferson County","Jewell County","Johnson County","Kearny County","Kingman County","Kiowa County","Labette County","Lane County","Leavenworth County","Lincoln County","Linn County","Logan County","Lyon County","Marion County","Marshall County","McPherson County","Meade County","Miami County","Mitchell County","Montgomery County","Morris County","Morton County","Nemaha County","Neosho County","Ness County","Norton County","Osage County","Osborne County","Ottawa County","Pawnee County","Phillips County","Pottawatomie County","Pratt County","Rawlins County","Reno County","Republic County","Rice County","Riley County","Rooks County","Rush County","Russell County","Saline County","Scott County","Sedgwick County","Seward County","Shawnee County","Sheridan County","Sherman County","Smith County","Stafford County","Stanton County","Stevens County","Sumner County","Thomas County","Trego County","Wabaunsee County","Wallace County","Washington County","Wichita County","Wilson County","Woodson County","Wyandotte County"];
+export const COUNTY_COLUMNS: string[] = ["cgF3AWUBhgFuAW4BdAGAAW4BfQFvAWYBdgF0AXwBdQFoAYMBcQFsAXQBawFuAYABgwFwAXEBZQGHAXoBdwGJAYgBhgFrAWoBgwFxAXcBbwFuAW8BewGEAXwBfQF4AWcBiQF5AW4BiAF0AYUBhwGGAYcBZQGJAYQBegF4AWgBeAFxAYkBbwFoAWYBbAF3AW4BegGFAWsBZQF1AWgBhgFpAXUBeAGDAW0BhgF0AYgBiQFsAXIBewGFAYQBbAF9AXQBaAF1AYIBaQFmAXcBdwFnAXAB","ywHRAbsB5AHGAcUBzgHcAcYB2AHHAbwB0AHOAdcBzwG+AeAByQHDAc0BwgHGAd0B4AHJAckBuwHkAdQB0QHnAeYB5AHDAcEB3wHKAdEBxwHFAccB1wHhAdcB2QHTAb0B5wHUAcUB5gHNAeMB5AHjAeUBuwHnAeEB1AHSAb4B0gHKAecByAG/AbwBwwHRAcYB1AHjAcIBugHPAb4B5AG/Ac8B0gHgAcUB5AHNAeYB5wHDAcoB1wHjAeIBwwHYAc0BvgHPAd8BwAG8AdEB0QG9AcgB","aAFtAVsBfAFkAWQBagF1AWQBcgFlAVwBbAFqAXIBawFeAXkBZwFiAWoBYQFkAXYBeQFmAWcBXAF8AW8BbQF+AX4BewFiAWABeAFnAW0BZQFkAWUBcQF5AXIBcwFuAV4BfgFvAWQBfQFqAXsBfAF7AX0BXAF+AXkBbwFuAV4BbgFnAX4BZgFfAVwBYgFtAWQBbwF7AWEBWwFrAV4BewFfAWsBbgF5AWMBewFqAX0BfgFiAWgBcQF7AXoBYgFyAWoBXgFrAXgBXwFcAW0BbQFdAWYB","igCMAIUAkQCIAIgAiwCPAIgAjgCJAIUAiwCLAI0AiwCGAJAAiQCHAIoAhwCIAI8AkACJAIkAhQCSAI0AjACSAJIAkQCHAIcAkACJAIwAiQCIAIkAjQCQAI4AjgCMAIYAkgCMAIgAkgCLAJEAkgCRAJIAhQCSAJAAjQCMAIYAjACJAJIAiQCGAIUAhwCMAIgAjQCRAIcAhQCLAIYAkQCGAIsAjACQAIgAkQCKAJIAkgCIAIoAjQCRAJEAiACOAIoAhgCLAJAAhgCFAIwAjACGAIkA","agJxAlMCiwJjAmICbQKAAmICewJkAlUCbwJtAnkCbwJYAoUCZwJeAmwCXQJjAoEChgJmAmcCVAKLAnYCcQKPAo4CigJeAlsChQJnAnICYwJiAmMCeQKGAnoCfAJ0AlcCjwJ1AmICjQJsAokCiwKKAowCVAKPAoYCdgJzAlgCcwJnAo8CZQJZAlQCXgJxAmICdgKJAl0CUwJuAlgCigJZAm4CcwKGAmECigJsAo0CjwJfAmgCeQKJAogCXwJ7AmwCWAJuAoQCWgJUAnECcgJWAmUC","NQA1ADQANQA1ADUANQA1ADUANQA1ADQANQA1ADUANQA0ADUANQA0ADUANAA1ADUANQA1ADUANAA1ADUANQA1ADUANQA0ADQANQA1ADUANQA1ADUANQA1ADUANQA1ADQANQA1ADUANQA1ADUANQA1ADUANAA1ADUANQA1ADQANQA1ADUANQA0ADQANAA1ADUANQA1ADQANAA1ADQANQA0ADUANQA1ADUANQA1ADUANQA0ADUANQA1ADUANAA1ADUANAA1ADUANAA0ADUANQA0ADUA","mQCbAJMAoQCXAJcAmgCeAJcAnQCXAJQAmgCaAJ0AmgCUAKAAmACWAJkAlgCXAJ8AoACYAJgAkwChAJwAmwCiAKIAoQCWAJUAnwCYAJsAlwCXAJcAnQCgAJ0AnQCbAJQAogCcAJcAogCZAKEAoQChAKEAkwCiAKAAnACbAJQAmwCYAKIAmACVAJQAlgCbAJcAnAChAJYAkwCaAJQAoQCVAJoAmwCgAJcAoQCZAKIAogCWAJgAnQChAKAAlgCdAJkAlACaAJ8AlQCUAJsAmwCUAJgA","LQAuACsALwAsACwALQAvACwALgAtACsALQAtAC4ALQAsAC8ALQAsAC0ALAAsAC8ALwAtAC0AKwAvAC4ALgAwADAALwAsACwALwAtAC4ALQAsAC0ALgAvAC4ALgAuACwAMAAuACwAMAAtAC8ALwAvADAAKwAwAC8ALgAuACwALgAtADAALQAsACsALAAuACwALgAvACwAKwAtACwALwAsAC0ALgAvACwALwAtADAAMAAsAC0ALgAvAC8ALAAuAC0ALAAtAC8ALAArAC4ALgAsAC0A","FwAYABYAGQAXABcAFwAYABcAGAAXABYAFwAXABgAFwAXABgAFwAXABcAFwAXABgAGAAXABcAFgAZABgAGAAZABkAGAAXABcAGAAXABgAFwAXABcAGAAYABgAGAAYABcAGQAYABcAGQAXABgAGQAYABkAFgAZABgAGAAYABcAGAAXABkAFwAXABYAFwAYABcAGAAYABcAFgAXABcAGAAXABcAGAAYABcAGAAXABkAGQAXABcAGAAYABgAFwAYABcAFwAXABgAFwAWABgAGAAWABcA"];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBXAFkAWwBdAF8AYQBjAGUAZwBpAGsAbQBvAHMAdQBxAHcAeQB7AH0AfwCBAIMAhQCHAIkAiwCNAI8AkQCTAJUAlwCZAJsAnQCfAKEAowClAKcAqQCrAK0ArwCxALMAtQC3ALkAuwC9AL8AwQDDAMUAxwDJAMsAzQDPANEA";
+export const ALIAS_KEYS: string[] = ["allen","allen county","anderson","anderson county","atchison","atchison county","barber","barber county","barton","barton county","bourbon","bourbon county","brown","brown county","butler","butler county","chase","chase county","chautauqua","chautauqua county","cherokee","cherokee county","cheyenne","cheyenne county","clark","clark county","clay","clay county","cloud","cloud county","coffey","coffey county","comanche","comanche county","cowley","cowley county","crawford","crawford county","decatur","decatur county","dickinson","dickinson county","doniphan","doniphan county","douglas","douglas county","edwards","edwards county","elk","elk county","ellis","ellis county","ellsworth","ellsworth county","finney","finney county","ford","ford county","franklin","franklin county","geary","geary county","gove","gove county","graham","graham county","grant","grant county","gray","gray county","greeley","greeley county","greenwood","greenwood county","hamilton","hamilton county","harper","harper county","harvey","harvey county","haskell","haskell county","hodgeman","hodgeman county","jackson","jackson county","jefferson","jefferson county","jewell","jewell county","johnson","johnson county","kearny","kearny county","kingman","kingman county","kiowa","kiowa county","labette","labette county","lane","lane county","leavenworth","leavenworth county","lincoln","lincoln county","linn","linn county","logan","logan county","lyon","lyon county","marion","marion county","marshall","marshall county","mcpherson","mcpherson county","meade","meade county","miami","miami county","mitchell","mitchell county","montgomery","montgomery county","morris","morris county","morton","morton county","nemaha","nemaha county","neosho","neosho county","ness","ness county","norton","norton county","osage","osage county","osborne","osborne county","ottawa","ottawa county","pawnee","pawnee county","phillips","phillips county","pottawatomie","pottawatomie county","pratt","pratt county","rawlins","rawlins county","reno","reno county","republic","republic county","rice","rice county","riley","riley county","rooks","rooks county","rush","rush county","russell","russell county","saline","saline county","scott","scott county","sedgwick","sedgwick county","seward","seward county","shawnee","shawnee county","sheridan","sheridan county","sherman","sherman county","smith","smith county","stafford","stafford county","stanton","stanton county","stevens","stevens county","sumner","sumner county","thomas","thomas county","trego","trego county","wabaunsee","wabaunsee county","wallace","wallace county","washington","washington county","wichita","wichita county","wilson","wilson county","woodson","woodson county","wyandotte","wyandotte county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5ADoAOgA7ADsAPAA8AD0APQA+AD4APwA/AEAAQABBAEEAQgBCAEMAQwBEAEQARQBFAEYARgBHAEcASABIAEkASQBKAEoASwBLAEwATABNAE0ATgBOAE8ATwBQAFAAUQBRAFIAUgBTAFMAVABUAFUAVQBWAFYAVwBXAFgAWABZAFkAWgBaAFsAWwBcAFwAXQBdAF4AXgBfAF8AYABgAGEAYQBiAGIAYwBjAGQAZABlAGUAZgBmAGcAZwBoAGgA";
+export const PRICE_BAND_TOTALS: string[] = ["fwmcCSsJ9AlmCWQJiwnOCWUJvAlsCTEJkwmLCbcJkAk9CeEJdglTCYcJTwlmCdIJ4glzCXYJLQn2CasJnAkDCgAK8QlSCUkJ3gl3CZ0JawlkCWsJtQnkCbkJvwmjCToJAwqoCWQJ/gmICe4J9gnwCfoJLQkDCuQJqwmhCT0JoQl3CQMKcAlBCTAJUwmcCWUJqwnuCU8JKgmPCT0J8QlCCY8JoQniCWEJ8QmHCf4JAwpVCXsJtQnuCekJVQm8CYcJPQmPCdwJRAkwCZwJnQk3CXEJ","iAqlCi8K/QpvCm0KlArXCm4KxQp1CjUKnAqUCsAKmQpBCuoKfwpXCpAKUwpvCtsK6wp8Cn8KMQr/CrQKpQoMCwkL+gpWCk0K5wqACqYKdAptCnQKvgrtCsIKyAqsCj4KDAuxCm0KBwuRCvcK/wr5CgMLMQoMC+0KtAqqCkEKqgqACgwLeQpFCjQKVwqlCm4KtAr3ClMKLgqYCkEK+gpGCpgKqgrrCmoK+gqQCgcLDAtZCoQKvgr3CvIKWQrFCpAKQQqYCuUKSAo0CqUKpgo7CnoK","kQuuCzMLBgx4C3YLnQvgC3cLzgt+CzkLpQudC8kLogtFC/MLiAtbC5kLVwt4C+QL9AuFC4gLNQsIDL0LrgsVDBIMAwxaC1EL8AuJC68LfQt2C30Lxwv2C8sL0Qu1C0ILFQy6C3YLEAyaCwAMCAwCDAwMNQsVDPYLvQuzC0ULswuJCxUMggtJCzgLWwuuC3cLvQsADFcLMguhC0ULAwxKC6ELswv0C3MLAwyZCxAMFQxdC40LxwsADPsLXQvOC5kLRQuhC+4LTAs4C64Lrws/C4ML","mgy3DDcMDw2BDH8MpgzpDIAM1wyHDD0MrgymDNIMqwxJDPwMkQxfDKIMWwyBDO0M/QyODJEMOQwRDcYMtwweDRsNDA1eDFUM+QySDLgMhgx/DIYM0Az/DNQM2gy+DEYMHg3DDH8MGQ2jDAkNEQ0LDRUNOQweDf8Mxgy8DEkMvAySDB4NiwxNDDwMXwy3DIAMxgwJDVsMNgyqDEkMDA1ODKoMvAz9DHwMDA2iDBkNHg1hDJYM0AwJDQQNYQzXDKIMSQyqDPcMUAw8DLcMuAxDDIwM","ow3ADTsNGA6KDYgNrw3yDYkN4A2QDUENtw2vDdsNtA1NDQUOmg1jDasNXw2KDfYNBg6XDZoNPQ0aDs8NwA0nDiQOFQ5iDVkNAg6bDcENjw2IDY8N2Q0IDt0N4w3HDUoNJw7MDYgNIg6sDRIOGg4UDh4OPQ0nDggOzw3FDU0NxQ2bDScOlA1RDUANYw3ADYkNzw0SDl8NOg2zDU0NFQ5SDbMNxQ0GDoUNFQ6rDSIOJw5lDZ8N2Q0SDg0OZQ3gDasNTQ2zDQAOVA1ADcANwQ1HDZUN","rA7JDj8OIQ+TDpEOuA77DpIO6Q6ZDkUOwA64DuQOvQ5RDg4Pow5nDrQOYw6TDv8ODw+gDqMOQQ4jD9gOyQ4wDy0PHg9mDl0OCw+kDsoOmA6RDpgO4g4RD+YO7A7QDk4OMA/VDpEOKw+1DhsPIw8dDycPQQ4wDxEP2A7ODlEOzg6kDjAPnQ5VDkQOZw7JDpIO2A4bD2MOPg68DlEOHg9WDrwOzg4PD44OHg+0DisPMA9pDqgO4g4bDxYPaQ7pDrQOUQ68DgkPWA5EDskOyg5LDp4O","vhDbEEcQMxGlEKMQyhANEaQQ+xCrEE0Q0hDKEPYQzxBZECARtRBvEMYQaxClEBERIRGyELUQSRA1EeoQ2xBCET8RMBFuEGUQHRG2ENwQqhCjEKoQ9BAjEfgQ/hDiEFYQQhHnEKMQPRHHEC0RNREvETkRSRBCESMR6hDgEFkQ4BC2EEIRrxBdEEwQbxDbEKQQ6hAtEWsQRhDOEFkQMBFeEM4Q4BAhEaAQMBHGED0RQhFxELoQ9BAtESgRcRD7EMYQWRDOEBsRYBBMENsQ3BBTELAQ","0BLtEk8SRRO3ErUS3BIfE7YSDRO9ElUS5BLcEggT4RJhEjITxxJ3EtgScxK3EiMTMxPEEscSURJHE/wS7RJUE1ETQhN2Em0SLxPIEu4SvBK1ErwSBhM1EwoTEBP0El4SVBP5ErUSTxPZEj8TRxNBE0sTURJUEzUT/BLyEmES8hLIElQTwRJlElQSdxLtErYS/BI/E3MSThLgEmESQhNmEuAS8hIzE7ISQhPYEk8TVBN5EswSBhM/EzoTeRINE9gSYRLgEi0TaBJUEu0S7hJbEsIS","/RcaGGMXchjkF+IXCRhMGOMXOhjqF2kXERgJGDUYDhh1F18Y9BeLFwUYhxfkF1AYYBjxF/QXZRd0GCkYGhiBGH4YbxiKF4EXXBj1FxsY6RfiF+kXMxhiGDcYPRghGHIXgRgmGOIXfBgGGGwYdBhuGHgYZReBGGIYKRgfGHUXHxj1F4EY7hd5F2gXixcaGOMXKRhsGIcXYhcNGHUXbxh6Fw0YHxhgGN8XbxgFGHwYgRiNF/kXMxhsGGcYjRc6GAUYdRcNGFoYfBdoFxoYGxhvF+8X","Kh1HHXccnx0RHQ8dNh15HRAdZx0XHX0cPh02HWIdOx2JHIwdIR2fHDIdmxwRHX0djR0eHSEdeRyhHVYdRx2uHasdnB2eHJUciR0iHUgdFh0PHRYdYB2PHWQdah1OHYYcrh1THQ8dqR0zHZkdoR2bHaUdeRyuHY8dVh1MHYkcTB0iHa4dGx2NHHwcnxxHHRAdVh2ZHZscdhw6HYkcnB2OHDodTB2NHQwdnB0yHakdrh2hHCYdYB2ZHZQdoRxnHTIdiRw6HYcdkBx8HEcdSB2DHBwd","hCehJ58m+SdrJ2knkCfTJ2onwSdxJ6UmmCeQJ7wnlSexJuYneyfHJownwyZrJ9cn5yd4J3snoSb7J7AnoScIKAUo9ifGJr0m4yd8J6IncCdpJ3AnuifpJ74nxCeoJ64mCCitJ2knAyiNJ/Mn+yf1J/8noSYIKOknsCemJ7Empid8JwgodSe1JqQmxyahJ2onsCfzJ8MmniaUJ7Em9ie2JpQnpifnJ2Yn9ieMJwMoCCjJJoAnuifzJ+4nySbBJ4wnsSaUJ+EnuCakJqEnoierJnYn","3jH7MccwUzLFMcMx6jEtMsQxGzLLMc0w8jHqMRYy7zHZMEAy1THvMOYx6zDFMTEyQTLSMdUxyTBVMgoy+zFiMl8yUDLuMOUwPTLWMfwxyjHDMcoxFDJDMhgyHjICMtYwYjIHMsMxXTLnMU0yVTJPMlkyyTBiMkMyCjIAMtkwADLWMWIyzzHdMMww7zD7McQxCjJNMuswxjDuMdkwUDLeMO4xADJBMsAxUDLmMV0yYjLxMNoxFDJNMkgy8TAbMuYx2TDuMTsy4DDMMPsx/DHTMNAx"];
@@ -0,0 +1,7 @@
+// KENTUCKY (KY) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Adair County","Allen County","Anderson County","Ballard County","Barren County","Bath County","Bell County","Boone County","Bourbon County","Boyd County","Boyle County","Bracken County","Breathitt County","Breckinridge County","Bullitt County","Butler County","Caldwell County","Calloway County","Campbell County","Carlisle County","Carroll County","Carter County","Casey County","Christian County","Clark County","Clay County","Clinton County","Crittenden County","Cumberland County","Daviess County","Edmonson County","Elliott County","Estill County","Fayette County","Fleming County","Floyd County","Franklin County","Fulton County","Gallatin County","Garrard County","Grant County","Graves County","Grayson County","Green County","Greenup County","Hancock County","Hardin County","Harlan County","Harrison County","Hart County","Henderson County","Henry County","Hickman County","Hopkins County","Jackson County","Jefferson County","Jessamine County","Johnson County","Kenton County","Knott County","Knox County","Larue County","Laurel County","Lawrence County","Lee County","Leslie County","Letcher County","Lewis County","Lincoln County","Livingston County","Logan County","Lyon County","Madison County","Magoffin County","Marion County","Marshall County","Martin County","Mason County","McCracken County","McCreary County","McLean County","Meade County","Menifee County","Mercer County","Metcalfe County","Monroe County","Montgomery County","Morgan County","Muhlenberg County","Nelson County","Nicholas County","Ohio County","Oldham County","Owen County","Owsley County","Pendleton County","Perry County","Pike County","Powell County","Pulaski County","Robertson County","Rockcastle County","Rowan County","Russell County","Scott County","Shelby County","Simpson County","Spencer County","Taylor County","Todd County","Trigg County","Trimble County","Union County","Warren County","Washington County","Wayne County","Webster County","Whitley County","Wolfe County","Woodford County"];
+export const COUNTY_COLUMNS: string[] = ["ZQFkAWgBawFvAWQBcAF3AV8BbwFvAW8BdAFdAWYBcAFXAV4BZQFeAW8BcgFpAXkBZwFlAXQBagF5AXgBdAFcAVoBeQFzAW8BagFnAVkBaAF2AVcBagFlAXQBZwFmAW4BYAFWAXABWAF2AXIBbAF0AWcBbgFXAV8BcQF4AVkBXwFYAWwBVwFXAWUBWQF3AXYBVwFzAXcBVwFcAVkBVwFdAW4BdAFyAXEBaAFnAVkBWQFZAW4BYAFkAWABXQF1AWMBaQFvAXIBXQFzAVgBYAFfAWUBaQFxAWUBdgFzAVYBXAF2AWoBVwFkAWEBVgFmAW0B","tQGzAbgBuwHBAbMBwgHKAa0BwQHAAcABxwGrAbUBwgGjAawBtAGsAcEBxAG5Ac0BtwG1AcYBugHNAcsBxwGpAacBzQHFAcEBuwG3AaUBuAHKAaMBugG1AccBtwG1Ab8BrgGiAcIBpAHKAcQBvQHHAbcBvwGjAa0BwwHLAaYBrQGkAb0BowGjAbQBpQHKAckBowHGAcsBowGpAaYBowGrAb8BxwHFAcMBuAG3AaYBpgGmAcABrwGzAa8BqwHIAbIBugHBAcQBqwHGAaQBrgGtAbQBuQHDAbUByQHFAaIBqQHJAbsBpAGzAa8BogG1Ab4B","WwFaAV4BYQFlAVoBZgFtAVUBZQFlAWUBagFTAVwBZgFNAVQBWwFUAWUBaAFfAW8BXQFbAWkBYAFvAW0BagFSAVABbwFoAWUBYAFdAU8BXgFsAU0BYAFbAWoBXQFcAWQBVgFMAWYBTgFsAWgBYgFqAV0BZAFNAVUBZwFtAVABVQFOAWIBTQFNAVsBTwFtAWwBTQFpAW0BTQFSAVABTQFUAWMBagFoAWcBXgFdAVABUAFQAWQBVwFaAVcBUwFrAVkBXwFlAWcBVAFpAU4BVgFVAVsBXwFnAVsBbAFoAU0BUgFrAWABTgFaAVcBTAFcAWIB","gQCAAIIAgwCEAIAAhQCHAH4AhACEAIQAhgB+AIEAhQB8AH4AgAB+AIQAhQCCAIgAgQCBAIYAggCIAIcAhgB9AH0AiACGAIQAgwCBAHwAggCHAHsAggCBAIYAgQCBAIQAfwB7AIUAfACHAIUAgwCGAIEAhAB8AH8AhQCHAHwAfgB8AIMAfAB7AIEAfACHAIcAewCGAIcAfAB9AHwAewB+AIQAhgCFAIUAggCBAHwAfAB8AIQAfwCAAH8AfgCGAIAAggCEAIUAfgCGAHwAfwB+AIAAggCFAIEAhwCGAHsAfQCHAIIAfACAAH8AewCBAIMA","IgIfAiYCKgIyAiACMwI9AhgCMgIxAjECOQIWAiMCMwIMAhcCIQIXAjECNQIoAkACJAIiAjgCKQJAAj4COQITAhECQAI3AjICKgIkAg8CJgI8AgwCKQIiAjkCJAIjAi8CGgILAjMCDQI8AjUCLQI5AiUCLwIMAhkCNAI+AhACGAINAi0CDAIMAiICDwI9AjwCDAI3Aj4CDAITAhACDAIWAi8COQI2AjQCJwIlAhACEAIQAjACGwIgAhsCFgI6Ah4CKAIxAjUCFgI3Ag0CGQIYAiECJwI0AiICPAI3AgsCFAI7AikCDQIfAhsCCwIjAi0C","NQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA0ADUANQA0ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA0ADQANQA1ADUANQA1ADQANQA1ADQANQA1ADUANQA1ADUANQA0ADUANAA1ADUANQA1ADUANQA0ADUANQA1ADQANQA0ADUANAA0ADUANAA1ADUANAA1ADUANAA0ADQANAA0ADUANQA1ADUANQA1ADQANAA0ADUANQA1ADUANAA1ADUANQA1ADUANAA1ADQANQA1ADUANQA1ADUANQA1ADQANAA1ADUANAA1ADUANAA1ADUA","gQCAAIIAgwCEAIAAhQCHAH4AhACEAIQAhgB+AIEAhQB8AH4AgAB+AIQAhQCCAIgAgQCBAIYAggCIAIcAhgB9AH0AiACGAIQAgwCBAHwAggCHAHsAggCBAIYAgQCBAIQAfwB7AIUAfACHAIUAgwCGAIEAhAB8AH8AhQCHAHwAfgB8AIMAfAB7AIEAfACHAIcAewCGAIcAfAB9AHwAewB+AIQAhgCFAIUAggCBAHwAfAB8AIQAfwCAAH8AfgCGAIAAggCEAIUAfgCGAHwAfwB+AIAAggCFAIEAhwCGAHsAfQCHAIIAfACAAH8AewCBAIMA","KQApACoAKgAqACkAKwArACgAKgAqACoAKwAoACkAKwAoACgAKQAoACoAKwAqACwAKQApACsAKgAsACsAKwAoACgALAArACoAKgApACgAKgArACgAKgApACsAKQApACoAKQAnACsAKAArACsAKgArACkAKgAoACkAKwArACgAKAAoACoAKAAoACkAKAArACsAKAArACsAKAAoACgAKAAoACoAKwArACsAKgApACgAKAAoACoAKQApACkAKAArACkAKgAqACsAKAArACgAKQAoACkAKgArACkAKwArACcAKAArACoAKAApACkAJwApACoA","FQAVABYAFgAWABUAFgAWABUAFgAWABYAFgAVABUAFgAUABUAFQAVABYAFgAWABcAFQAVABYAFgAXABYAFgAVABUAFwAWABYAFgAVABUAFgAWABQAFgAVABYAFQAVABYAFQAUABYAFQAWABYAFgAWABUAFgAUABUAFgAWABUAFQAVABYAFAAUABUAFQAWABYAFAAWABYAFAAVABUAFAAVABYAFgAWABYAFgAVABUAFQAVABYAFQAVABUAFQAWABUAFgAWABYAFQAWABUAFQAVABUAFgAWABUAFgAWABQAFQAWABYAFQAVABUAFAAVABYA"];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBXAFkAWwBdAF8AYQBjAGUAZwBpAGsAbQBvAHEAcwB1AHcAeQB7AH0AfwCBAIMAhQCHAIkAiwCNAI8AlwCZAJsAnQCfAKEAkQCTAJUAowClAKcAqQCrAK0ArwCxALMAtQC3ALkAuwC9AL8AwQDDAMUAxwDJAMsAzQDPANEA0wDVANcA2QDbAN0A3wDhAOMA5QDnAOkA6wDtAO8A";
+export const ALIAS_KEYS: string[] = ["adair","adair county","allen","allen county","anderson","anderson county","ballard","ballard county","barren","barren county","bath","bath county","bell","bell county","boone","boone county","bourbon","bourbon county","boyd","boyd county","boyle","boyle county","bracken","bracken county","breathitt","breathitt county","breckinridge","breckinridge county","bullitt","bullitt county","butler","butler county","caldwell","caldwell county","calloway","calloway county","campbell","campbell county","carlisle","carlisle county","carroll","carroll county","carter","carter county","casey","casey county","christian","christian county","clark","clark county","clay","clay county","clinton","clinton county","crittenden","crittenden county","cumberland","cumberland county","daviess","daviess county","edmonson","edmonson county","elliott","elliott county","estill","estill county","fayette","fayette county","fleming","fleming county","floyd","floyd county","franklin","franklin county","fulton","fulton county","gallatin","gallatin county","garrard","garrard county","grant","grant county","graves","graves county","grayson","grayson county","green","green county","greenup","greenup county","hancock","hancock county","hardin","hardin county","harlan","harlan county","harrison","harrison county","hart","hart county","henderson","henderson county","henry","henry county","hickman","hickman county","hopkins","hopkins county","jackson","jackson county","jefferson","jefferson county","jessamine","jessamine county","johnson","johnson county","kenton","kenton county","knott","knott county","knox","knox county","larue","larue county","laurel","laurel county","lawrence","lawrence county","lee","lee county","leslie","leslie county","letcher","letcher county","lewis","lewis county","lincoln","lincoln county","livingston","livingston county","logan","logan county","lyon","lyon county","madison","madison county","magoffin","magoffin county","marion","marion county","marshall","marshall county","martin","martin county","mason","mason county","mccracken","mccracken county","mccreary","mccreary county","mclean","mclean county","meade","meade county","menifee","menifee county","mercer","mercer county","metcalfe","metcalfe county","monroe","monroe county","montgomery","montgomery county","morgan","morgan county","muhlenberg","muhlenberg county","nelson","nelson county","nicholas","nicholas county","ohio","ohio county","oldham","oldham county","owen","owen county","owsley","owsley county","pendleton","pendleton county","perry","perry county","pike","pike county","powell","powell county","pulaski","pulaski county","robertson","robertson county","rockcastle","rockcastle county","rowan","rowan county","russell","russell county","scott","scott county","shelby","shelby county","simpson","simpson county","spencer","spencer county","taylor","taylor county","todd","todd county","trigg","trigg county","trimble","trimble county","union","union county","warren","warren county","washington","washington county","wayne","wayne county","webster","webster county","whitley","whitley county","wolfe","wolfe county","woodford","woodford county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5ADoAOgA7ADsAPAA8AD0APQA+AD4APwA/AEAAQABBAEEAQgBCAEMAQwBEAEQARQBFAEYARgBHAEcASABIAEkASQBKAEoASwBLAEwATABNAE0ATgBOAE8ATwBQAFAAUQBRAFIAUgBTAFMAVABUAFUAVQBWAFYAVwBXAFgAWABZAFkAWgBaAFsAWwBcAFwAXQBdAF4AXgBfAF8AYABgAGEAYQBiAGIAYwBjAGQAZABlAGUAZgBmAGcAZwBoAGgAaQBpAGoAagBrAGsAbABsAG0AbQBuAG4AbwBvAHAAcABxAHEAcgByAHMAcwB0AHQAdQB1AHYAdgB3AHcA";
+export const PRICE_BAND_TOTALS: string[] = ["4AjXCPEIAAkYCdgIHwlDCbsIGAkWCRYJNAmuCOMIHwmLCLcI3Ai3CBcJJwn2CFEJ6AjgCDEJ+ghRCUYJNAmlCJ0IUQktCRgJ/gjoCJUI8QhACYkI+gjgCDQJ6AjjCBEJwwiECB8JkAhACScJBwk0CekIEQmLCL8IIwlGCZgIuwiQCAcJiwiJCN8IlQhDCT8JiQgvCUUJiwilCJgIiQivCBAJNAkpCSMJ8gjpCJgImAiYCBMJxgjYCMYIrgg4CdMI9wgXCSYJrwgvCZAIwgi7CNwI9QgjCeAIPwktCYUIpgg9CfsIjwjXCMcIhAjjCAkJ","6QngCfoJCQohCuEJKApMCsQJIQofCh8KPQqyCewJKAqPCcAJ5QnACSAKMAr/CVoK8QnpCToKAwpaCk8KPQqpCaEJWgo2CiEKBwrxCZkJ+glJCo0JAwrpCT0K8QnsCRoKzAmICSgKlAlJCjAKEAo9CvIJGgqPCcgJLApPCpwJxAmUCRAKjwmNCegJmQlMCkgKjQk4Ck4KjwmpCZwJjQmzCRkKPQoyCiwK+wnyCZwJnAmcCRwKzwnhCc8JsglBCtwJAAogCi8Kswk4CpQJywnECeUJ/gksCukJSAo2CokJqglGCgQKkwngCdAJiAnsCRIK","8grpCgMLEgsqC+oKMQtVC80KKgsoCygLRgu2CvUKMQuTCskK7grJCikLOQsIC2ML+gryCkMLDAtjC1gLRgutCqUKYws/CyoLEAv6Cp0KAwtSC5EKDAvyCkYL+gr1CiML1QqMCjELmApSCzkLGQtGC/sKIwuTCtEKNQtYC6AKzQqYChkLkwqRCvEKnQpVC1ELkQpBC1cLkwqtCqAKkQq3CiILRgs7CzULBAv7CqAKoAqgCiUL2ArqCtgKtgpKC+UKCQspCzgLtwpBC5gK1ArNCu4KBws1C/IKUQs/C40KrgpPCw0LlwrpCtkKjAr1ChsL","+wvyCwwMGwwzDPMLOgxeDNYLMwwxDDEMTwy6C/4LOgyXC9IL9wvSCzIMQgwRDGwMAwz7C0wMFQxsDGEMTwyxC6kLbAxIDDMMGQwDDKELDAxbDJULFQz7C08MAwz+CywM3guQCzoMnAtbDEIMIgxPDAQMLAyXC9oLPgxhDKQL1gucCyIMlwuVC/oLoQteDFoMlQtKDGAMlwuxC6QLlQu7CysMTwxEDD4MDQwEDKQLpAukCy4M4QvzC+ELugtTDO4LEgwyDEEMuwtKDJwL3QvWC/cLEAw+DPsLWgxIDJELsgtYDBYMmwvyC+ILkAv+CyQM","BA37DBUNJA08DfwMQw1nDd8MPA06DToNWA2+DAcNQw2bDNsMAA3bDDsNSw0aDXUNDA0EDVUNHg11DWoNWA21DK0MdQ1RDTwNIg0MDaUMFQ1kDZkMHg0EDVgNDA0HDTUN5wyUDEMNoAxkDUsNKw1YDQ0NNQ2bDOMMRw1qDagM3wygDCsNmwyZDAMNpQxnDWMNmQxTDWkNmwy1DKgMmQy/DDQNWA1NDUcNFg0NDagMqAyoDDcN6gz8DOoMvgxcDfcMGw07DUoNvwxTDaAM5gzfDAANGQ1HDQQNYw1RDZUMtgxhDR8Nnwz7DOsMlAwHDS0N","DQ4EDh4OLQ5FDgUOTA5wDugNRQ5DDkMOYQ7CDRAOTA6fDeQNCQ7kDUQOVA4jDn4OFQ4NDl4OJw5+DnMOYQ65DbENfg5aDkUOKw4VDqkNHg5tDp0NJw4NDmEOFQ4QDj4O8A2YDUwOpA1tDlQONA5hDhYOPg6fDewNUA5zDqwN6A2kDTQOnw2dDQwOqQ1wDmwOnQ1cDnIOnw25DawNnQ3DDT0OYQ5WDlAOHw4WDqwNrA2sDUAO8w0FDvMNwg1lDgAOJA5EDlMOww1cDqQN7w3oDQkOIg5QDg0ObA5aDpkNug1qDigOow0EDvQNmA0QDjYO","HxAWEDAQPxBXEBcQXhCCEPoPVxBVEFUQcxDKDyIQXhCnD/YPGxD2D1YQZhA1EJAQJxAfEHAQORCQEIUQcxDBD7kPkBBsEFcQPRAnELEPMBB/EKUPORAfEHMQJxAiEFAQAhCgD14QrA9/EGYQRhBzECgQUBCnD/4PYhCFELQP+g+sD0YQpw+lDx4QsQ+CEH4QpQ9uEIQQpw/BD7QPpQ/LD08QcxBoEGIQMRAoELQPtA+0D1IQBRAXEAUQyg93EBIQNhBWEGUQyw9uEKwPARD6DxsQNBBiEB8QfhBsEKEPwg98EDoQqw8WEAYQoA8iEEgQ","MRIoEkISURJpEikScBKUEgwSaRJnEmcShRLSETQScBKvEQgSLRIIEmgSeBJHEqISORIxEoISSxKiEpcShRLJEcERohJ+EmkSTxI5ErkRQhKREq0RSxIxEoUSORI0EmISFBKoEXAStBGREngSWBKFEjoSYhKvERASdBKXErwRDBK0EVgSrxGtETASuRGUEpASrRGAEpYSrxHJEbwRrRHTEWEShRJ6EnQSQxI6ErwRvBG8EWQSFxIpEhcS0hGJEiQSSBJoEncS0xGAErQRExIMEi0SRhJ0EjESkBJ+EqkRyhGOEkwSsxEoEhgSqBE0EloS","XhdVF28XfheWF1YXnRfBFzkXlheUF5QXshfmFmEXnRfDFjUXWhc1F5UXpRd0F88XZhdeF68XeBfPF8QXshfdFtUWzxerF5YXfBdmF80Wbxe+F8EWeBdeF7IXZhdhF48XQRe8Fp0XyBa+F6UXhReyF2cXjxfDFj0XoRfEF9AWORfIFoUXwxbBFl0XzRbBF70XwRatF8MXwxbdFtAWwRbnFo4XshenF6EXcBdnF9AW0BbQFpEXRBdWF0QX5ha2F1EXdReVF6QX5xatF8gWQBc5F1oXcxehF14XvRerF70W3ha7F3kXxxZVF0UXvBZhF4cX","ixyCHJwcqxzDHIMcyhzuHGYcwxzBHMEc3xz6G44cyhzXG2IchxxiHMIc0hyhHPwckxyLHNwcpRz8HPEc3xzxG+kb/BzYHMMcqRyTHOEbnBzrHNUbpRyLHN8ckxyOHLwcbhzQG8oc3BvrHNIcshzfHJQcvBzXG2oczhzxHOQbZhzcG7Ic1xvVG4oc4RvuHOoc1RvaHPAc1xvxG+Qb1Rv7G7sc3xzUHM4cnRyUHOQb5BvkG74ccRyDHHEc+hvjHH4cohzCHNEc+xvaHNwbbRxmHIccoBzOHIsc6hzYHNEb8hvoHKYc2xuCHHIc0BuOHLQc","5SbcJvYmBScdJ90mJCdIJ8AmHScbJxsnOSciJugmJCf/Jbwm4Sa8JhwnLCf7JlYn7SblJjYn/yZWJ0snOScZJhEmVicyJx0nAyftJgkm9iZFJ/0l/yblJjkn7SboJhYnyCb4JSQnBCZFJywnDCc5J+4mFif/JcQmKCdLJwwmwCYEJgwn/yX9JeQmCSZIJ0Qn/SU0J0on/yUZJgwm/SUjJhUnOScuJygn9ybuJgwmDCYMJhgnyybdJssmIiY9J9gm/CYcJysnIyY0JwQmxybAJuEm+iYoJ+UmRCcyJ/klGiZCJwAnAybcJswm+CXoJg4n","PzE2MVAxXzF3MTcxfjGiMRoxdzF1MXUxkzFKMEIxfjEnMBYxOzEWMXYxhjFVMbAxRzE/MZAxWTGwMaUxkzFBMDkwsDGMMXcxXTFHMTEwUDGfMSUwWTE/MZMxRzFCMXAxIjEgMH4xLDCfMYYxZjGTMUgxcDEnMB4xgjGlMTQwGjEsMGYxJzAlMD4xMTCiMZ4xJTCOMaQxJzBBMDQwJTBLMG8xkzGIMYIxUTFIMTQwNDA0MHIxJTE3MSUxSjCXMTIxVjF2MYUxSzCOMSwwITEaMTsxVDGCMT8xnjGMMSEwQjCcMVoxKzA2MSYxIDBCMWgx"];
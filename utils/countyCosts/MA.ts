@@ -0,0 +1,7 @@
+// MASSACHUSETTS (MA) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Barnstable County","Berkshire County","Bristol County","Dukes County","Essex County","Franklin County","Hampden County","Hampshire County","Middlesex County","Nantucket County","Norfolk County","Plymouth County","Suffolk County","Worcester County"];
+export const COUNTY_COLUMNS: string[] = ["IQL5ARUCJQIYAhECHgIgAgQCEAIBAgUCFALzAQ==","bwJBAmICdAJlAlwCawJuAk0CXAJLAk8CYAI7Ag==","BwLhAfwBCwL/AfgBBAIHAusB9wHpAe0B+wHcAQ==","zwDAAMsA0QDMAMkAzgDPAMQAyQDDAMUAygC+AA==","DwTCA/gDFwT+A/ADCQQOBNcD7gPTA9oD9gO4Aw==","RABDAEMARABEAEMARABEAEMAQwBDAEMAQwBDAA==","zwDAAMsA0QDMAMkAzgDPAMQAyQDDAMUAygC+AA==","MwAwADIANAAzADIAMwAzADEAMgAwADEAMgAvAA==","HQAaABwAHQAcABwAHAAdABsAHAAbABsAHAAaAA=="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAA==";
+export const ALIAS_KEYS: string[] = ["barnstable","barnstable county","berkshire","berkshire county","bristol","bristol county","dukes","dukes county","essex","essex county","franklin","franklin county","hampden","hampden county","hampshire","hampshire county","middlesex","middlesex county","nantucket","nantucket county","norfolk","norfolk county","plymouth","plymouth county","suffolk","suffolk county","worcester","worcester county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQA=";
+export const PRICE_BAND_TOTALS: string[] = ["6A32DJ4NAg61DYQN1Q3lDTYNgA0oDUANlg3WDA==","PA9FDu0OVg8JD9MOKQ85D4UOzw53Do8O5Q4lDg==","kBCUDzwQqhBdECIQfRCNENQPHhDGD94PNBB0Dw==","5BHjEIsR/hGxEXER0RHhESMRbREVES0RgxHDEA==","OBMyEtoSUhMFE8ASJRM1E3ISvBJkEnwS0hISEg==","jBSBEykUphRZFA8UeRSJFMETCxSzE8sTIRRhEw==","NBcfFscWThcBF60WIRcxF18WqRZRFmkWvxb/FQ==","3Bm9GGUZ9hmpGUsZyRnZGf0YRxnvGAcZXRmdGA==","gCBIH/AfmiBNINYfbSB9IIgf0h96H5If6B8oHw==","JCfTJXsmPifxJmEmESchJxMmXSYFJh0mcyazJQ==","bDTpMpEzhjQ5NHczWTRpNCkzczMbMzMziTPJMg==","tEH/P6dAzkGBQY1AoUGxQT9AiUAxQElAn0DfPw=="];
@@ -0,0 +1,7 @@
+// MARYLAND (MD) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Allegany County","Anne Arundel County","Baltimore County","Calvert County","Caroline County","Carroll County","Cecil County","Charles County","Dorchester County","Frederick County","Garrett County","Harford County","Howard County","Kent County","Montgomery County","Prince George's County","Queen Anne's County","Somerset County","St. Mary's County","Talbot County","Washington County","Wicomico County","Worcester County"];
+export const COUNTY_COLUMNS: string[] = ["6AHkAdEBwwHMAeQBzwHRAdMB8gHZAcMB2QHVAcgB7QHnAdcB2AHrAcUBxQHEAQ==","RAJAAikCGQIjAkACJgIpAiwCUAIzAhgCMwIuAh4CSwJEAjACMQJIAhsCGwIZAg==","3gHaAccBugHCAdoBxQHHAcoB5wHPAbkBzwHLAb4B4wHdAc0BzgHgAbwBvAG6AQ==","qQCoAKEAnACfAKgAoAChAKIArQCkAJwApACjAJ4AqwCpAKMApACqAJ0AnQCdAA==","NgMwAw8D+AIHAzADDAMPAxQDRwMdA/gCHQMXAwADPwM1AxkDGwM7A/wC/AL5Ag==","PwA/AD4APgA+AD8APgA+AD4APwA+AD4APgA+AD4APwA/AD4APgA/AD4APgA+AA==","uQC3ALAAqwCuALcArwCwALEAvACzAKsAswCyAKwAuwC4ALIAsgC6AKsAqwCrAA==","MgAyAC8ALgAvADIALwAvADAAMwAwAC4AMAAwAC8AMgAyADAAMAAyAC4ALgAuAA==","GgAaABkAGAAZABoAGQAZABkAGwAZABgAGQAZABgAGwAaABkAGQAaABgAGAAYAA=="];
+export const COUNTY_FIPS: string = "AQADAAUACQALAA0ADwARABMAFQAXABkAGwAdAB8AIQAjACcAJQApACsALQAvAA==";
+export const ALIAS_KEYS: string[] = ["allegany","allegany county","anne arundel","anne arundel county","baltimore","baltimore county","calvert","calvert county","caroline","caroline county","carroll","carroll county","cecil","cecil county","charles","charles county","dorchester","dorchester county","frederick","frederick county","garrett","garrett county","harford","harford county","howard","howard county","kent","kent county","montgomery","montgomery county","prince georges","prince georges county","queen annes","queen annes county","saint marys","saint marys county","somerset","somerset county","talbot","talbot county","washington","washington county","wicomico","wicomico county","worcester","worcester county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAASABIAEQARABMAEwAUABQAFQAVABYAFgA=";
+export const PRICE_BAND_TOTALS: string[] = ["KQwUDJ8LUQuDCxQMkwufC68LYgzOC08Lzgu5C2sLSAwlDMELxws5DFwLXAtUCw==","ZA1PDdUMhwy5DE8NyQzVDOUMnQ0EDYUMBA3vDKEMgw1gDfcM/Qx0DZIMkgyKDA==","nw6KDgsOvQ3vDYoO/w0LDhsO2A46DrsNOg4lDtcNvg6bDi0OMw6vDsgNyA3ADQ==","2g/FD0EP8w4lD8UPNQ9BD1EPExBwD/EOcA9bDw0P+Q/WD2MPaQ/qD/4O/g72Dg==","FREAEXcQKRBbEAARaxB3EIcQThGmECcQphCREEMQNBEREZkQnxAlETQQNBAsEA==","UBI7Eq0RXxGRETsSoRGtEb0RiRLcEV0R3BHHEXkRbxJMEs8R1RFgEmoRahFiEQ==","xhSxFBkUyxP9E7EUDRQZFCkU/xRIFMkTSBQzFOUT5RTCFDsUQRTWFNYT1hPOEw==","PBcnF4UWNxZpFicXeRaFFpUWdRe0FjUWtBafFlEWWxc4F6cWrRZMF0IWQhY6Fg==","Yx1OHZMcRRx3HE4dhxyTHKMcnB3CHEMcwhytHF8cgh1fHbUcuxxzHVAcUBxIHA==","iiN1I6EiUyKFInUjlSKhIrEiwyPQIlEi0CK7Im0iqSOGI8MiySKaI14iXiJWIg==","2C/DL70uby6hLsMvsS69Ls0uETDsLm0u7C7XLoku9y/UL98u5S7oL3ouei5yLg==","JjwRPNk6izq9OhE8zTrZOuk6XzwIO4k6CDvzOqU6RTwiPPs6ATs2PJY6ljqOOg=="];
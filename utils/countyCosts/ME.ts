@@ -0,0 +1,7 @@
+// MAINE (ME) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Androscoggin County","Aroostook County","Cumberland County","Franklin County","Hancock County","Kennebec County","Knox County","Lincoln County","Oxford County","Penobscot County","Piscataquis County","Sagadahoc County","Somerset County","Waldo County","Washington County","York County"];
+export const COUNTY_COLUMNS: string[] = ["qgGrAb0BrAGoAbQBtAGmAb0BuQGoAZkBpQG2AZUBowE=","9gH3AQwC+AHzAQECAQLwAQwCBwLzAeEB8AEEAt0B7QE=","eAF5AYkBegF2AYEBgAF0AYkBhQF2AWkBdAGDAWYBcQE=","jACMAJIAjQCLAI8AjwCLAJIAkQCLAIYAigCQAIUAigA=","CgMMAywDDQMFAxsDGwMBAywDJAMGA+oCAAMfA+QC/AI=","OgA6ADoAOgA6ADoAOgA6ADoAOgA6ADkAOgA6ADkAOQA=","kQCSAJgAkgCQAJQAlACPAJcAlgCQAIsAjwCVAIoAjgA=","KgAqACwAKgApACsAKwApACwAKwApACgAKQArACgAKQA=","FgAWABcAFgAVABYAFgAVABcAFgAVABUAFQAWABUAFQA="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwA=";
+export const ALIAS_KEYS: string[] = ["androscoggin","androscoggin county","aroostook","aroostook county","cumberland","cumberland county","franklin","franklin county","hancock","hancock county","kennebec","kennebec county","knox","knox county","lincoln","lincoln county","oxford","oxford county","penobscot","penobscot county","piscataquis","piscataquis county","sagadahoc","sagadahoc county","somerset","somerset county","waldo","waldo county","washington","washington county","york","york county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPAA==";
+export const PRICE_BAND_TOTALS: string[] = ["oQqnCg0LrAqRCtcK1gqFCgwL8wqSCjgKggrkCiUKcAo=","wwvJCy8MzguzC/kL+AunCy4MFQy0C1ULpAsGDEILjQs=","5QzrDFEN8AzVDBsNGg3JDFANNw3WDHIMxgwoDV8Mqgw=","Bw4NDnMOEg73DT0OPA7rDXIOWQ74DY8N6A1KDnwNxw0=","KQ8vD5UPNA8ZD18PXg8ND5QPew8aD6wOCg9sD5kO5A4=","SxBRELcQVhA7EIEQgBAvELYQnRA8EMkPLBCOELYPARA=","jxKVEvsSmhJ/EsUSxBJzEvoS4RKAEgMScBLSEvAROxI=","0xTZFD8V3hTDFAkVCBW3FD4VJRXEFD0UtBQWFSoUdRQ=","fRqDGukaiBptGrMashphGugazxpuGs4ZXhrAGrsZBho=","JyAtIJMgMiAXIF0gXCALIJIgeSAYIF8fCCBqIEwflx8=","eyuBK+crhitrK7ErsCtfK+YrzStsK4EqXCu+K24quSo=","zzbVNjs32ja/NgU3BDezNjo3ITfANqM1sDYSN5A12zU="];
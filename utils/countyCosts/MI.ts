@@ -0,0 +1,7 @@
+// MICHIGAN (MI) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Alcona County","Alger County","Allegan County","Alpena County","Antrim County","Arenac County","Baraga County","Barry County","Bay County","Benzie County","Berrien County","Branch County","Calhoun County","Cass County","Charlevoix County","Cheboygan County","Chippewa County","Clare County","Clinton County","Crawford County","Delta County","Dickinson County","Eaton County","Emmet County","Genesee County","Gladwin County","Gogebic County","Grand Traverse County","Gratiot County","Hillsdale County","Houghton County","Huron County","Ingham County","Ionia County","Iosco County","Iron County","Isabella County","Jackson County","Kalamazoo County","Kalkaska County","Kent County","Keweenaw County","Lake County","Lapeer County","Leelanau County","Lenawee County","Livingston County","Luce County","Mackinac County","Macomb County","Manistee County","Marquette County","Mason County","Mecosta County","Menominee County","Midland County","Missaukee County","Monroe County","Montcalm County","Montmorency County","Muskegon County","Newaygo County","Oakland County","Oceana County","Ogemaw County","Ontonagon County","Osceola County","Oscoda County","Otsego County","Ottawa County","Presque Isle County","Roscommon County","Saginaw County","Sanilac County","Schoolcraft County","Shiawassee County","St. Clair County","St. Joseph County","Tuscola County","Van Buren County","Washtenaw County","Wayne County","Wexford County"];
+export const COUNTY_COLUMNS: string[] = ["iQF5AWkBcQFnAW8BdQF/AW0BaAF3AXkBggFwAWYBhgFoAWsBgwFxAW4BdAGGAXEBdwGHAW4BcwFwAXEBiQF4AXsBbAFzAYEBaAF7AX0BbAFyAYcBhAF3AXABfAFnAYYBdAF6AXQBZQFoAYcBbAGHAYIBdgF1AXcBfgFmAYYBbgFsAW4BdQFoAYcBbgFrAXcBcAGJAYYBdgGAAXUBaAGCAXUBcgGGAQ==","5wHUAcABygG9AcgBzwHbAcQBvwHRAdMB3wHIAbwB4wG/AcMB4AHJAcUBzQHkAcoB0QHlAcUBzAHJAckB5wHSAdYBwwHMAd0BvwHXAdkBxAHLAeUB4QHRAcgB1wG9AeMBzgHVAc0BuwG+AeUBxAHlAd8B0AHOAdEB2gG8AeQBxgHDAcYBzwG+AeUBxgHDAdEByQHnAeQB0AHdAc8BvgHfAc8BywHkAQ==","fgFvAWABZwFdAWYBawF1AWMBXwFtAW8BeAFmAVwBewFfAWIBeQFnAWQBagF7AWcBbQF9AWQBaQFmAWcBfgFuAXEBYgFpAXYBXwFxAXMBYwFoAX0BegFtAWYBcgFeAXsBagFwAWoBWwFeAX0BYwF9AXgBbAFrAW0BdAFcAXwBZAFiAWQBawFeAX0BZAFiAW0BZgF+AXsBbAF2AWsBXgF4AWsBaAF7AQ==","kgCMAIcAiQCGAIkAiwCPAIgAhgCMAIwAkACJAIUAkQCGAIcAkACJAIgAigCRAIoAjACSAIgAigCJAIkAkgCMAI0AiACKAI8AhgCNAI4AiACKAJIAkQCMAIkAjQCGAJEAiwCNAIsAhQCGAJIAiACSAJAAiwCLAIwAjgCFAJEAiACHAIgAiwCGAJIAiACHAIwAiQCSAJEAiwCPAIsAhgCQAIsAigCRAA==","jwJ1AlsCZwJWAmUCbwJ/AmACWQJxAnQChAJlAlUCigJZAl4ChgJnAmICbAKKAmgCcQKNAmICagJmAmcCjwJyAngCXwJrAoECWQJ5AnwCYAJqAowChwJyAmUCeQJXAooCbQJ3AmwCUwJYAowCYAKMAoQCcAJtAnECfQJUAosCYwJeAmMCbgJYAo0CYgJeAnICZgKPAooCcAKBAm8CWAKEAm4CagKKAg==","NQA1ADQANQA0ADUANQA1ADUANAA1ADUANQA1ADQANQA0ADQANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANAA1ADUANAA1ADUANQA1ADUANQA1ADUANQA0ADUANQA1ADUANAA0ADUANQA1ADUANQA1ADUANQA0ADUANQA0ADUANQA0ADUANQA0ADUANQA1ADUANQA1ADUANAA1ADUANQA1AA==","ogCcAJUAmACUAJgAmgCeAJYAlQCbAJsAnwCYAJQAoQCVAJYAoACYAJcAmQChAJgAmwChAJcAmQCYAJgAogCbAJwAlgCZAJ8AlQCdAJ0AlgCZAKEAoACbAJgAnQCUAKEAmgCcAJkAkwCUAKEAlgChAJ8AmgCaAJsAngCUAKEAlwCWAJcAmgCUAKEAlwCWAJsAmACiAKEAmgCfAJoAlACfAJoAmQChAA==","MAAuACwALQAsAC0ALQAvACwALAAuAC4ALwAtACsALwAsACwALwAtACwALQAvAC0ALgAwACwALQAtAC0AMAAuAC4ALAAtAC8ALAAuAC4ALAAtADAALwAuAC0ALgAsAC8ALQAuAC0AKwAsADAALAAwAC8ALQAtAC4ALgArAC8ALAAsACwALQAsADAALAAsAC4ALQAwAC8ALQAvAC0ALAAvAC0ALQAvAA==","GQAYABcAFwAWABcAFwAYABcAFwAYABgAGAAXABYAGAAXABcAGAAXABcAFwAYABcAGAAZABcAFwAXABcAGQAYABgAFwAXABgAFwAYABgAFwAXABkAGAAYABcAGAAXABgAFwAYABcAFgAXABkAFwAZABgAFwAXABgAGAAWABkAFwAXABcAFwAXABkAFwAXABgAFwAZABgAFwAYABcAFwAYABcAFwAYAA=="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBXAFkAWwBdAF8AYQBjAGUAZwBpAGsAbQBvAHEAcwB1AHcAeQB7AH0AfwCBAIMAhQCHAIkAiwCNAI8AkQCXAJkAmwCTAJUAnQCfAKEAowClAA==";
+export const ALIAS_KEYS: string[] = ["alcona","alcona county","alger","alger county","allegan","allegan county","alpena","alpena county","antrim","antrim county","arenac","arenac county","baraga","baraga county","barry","barry county","bay","bay county","benzie","benzie county","berrien","berrien county","branch","branch county","calhoun","calhoun county","cass","cass county","charlevoix","charlevoix county","cheboygan","cheboygan county","chippewa","chippewa county","clare","clare county","clinton","clinton county","crawford","crawford county","delta","delta county","dickinson","dickinson county","eaton","eaton county","emmet","emmet county","genesee","genesee county","gladwin","gladwin county","gogebic","gogebic county","grand traverse","grand traverse county","gratiot","gratiot county","hillsdale","hillsdale county","houghton","houghton county","huron","huron county","ingham","ingham county","ionia","ionia county","iosco","iosco county","iron","iron county","isabella","isabella county","jackson","jackson county","kalamazoo","kalamazoo county","kalkaska","kalkaska county","kent","kent county","keweenaw","keweenaw county","lake","lake county","lapeer","lapeer county","leelanau","leelanau county","lenawee","lenawee county","livingston","livingston county","luce","luce county","mackinac","mackinac county","macomb","macomb county","manistee","manistee county","marquette","marquette county","mason","mason county","mecosta","mecosta county","menominee","menominee county","midland","midland county","missaukee","missaukee county","monroe","monroe county","montcalm","montcalm county","montmorency","montmorency county","muskegon","muskegon county","newaygo","newaygo county","oakland","oakland county","oceana","oceana county","ogemaw","ogemaw county","ontonagon","ontonagon county","osceola","osceola county","oscoda","oscoda county","otsego","otsego county","ottawa","ottawa county","presque isle","presque isle county","roscommon","roscommon county","saginaw","saginaw county","saint clair","saint clair county","saint joseph","saint joseph county","sanilac","sanilac county","schoolcraft","schoolcraft county","shiawassee","shiawassee county","tuscola","tuscola county","van buren","van buren county","washtenaw","washtenaw county","wayne","wayne county","wexford","wexford county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5ADoAOgA7ADsAPAA8AD0APQA+AD4APwA/AEAAQABBAEEAQgBCAEMAQwBEAEQARQBFAEYARgBHAEcASABIAEwATABNAE0ASQBJAEoASgBLAEsATgBOAE8ATwBQAFAAUQBRAFIAUgA=";
+export const PRICE_BAND_TOTALS: string[] = ["AwqoCUcJdwk3CXAJkAnLCV4JQQmcCaUJ3AlxCTEJ8AlBCVIJ4gl2CWQJhwnxCXkJnAn7CWQJgglzCXYJAwqgCbIJVQmDCdMJQQm1Cb8JXQl/CfoJ5wmdCXEJtwk6CfAJiwmuCYgJKwk9CfoJXQn6CdwJlAmNCZwJxAkwCfQJZglTCWYJjwk9CfsJZQlSCZ0JcwkDCvEJlAnSCZAJPQncCY8JfwnxCQ==","DAuxCksKgAo7CnkKmQrUCmcKRQqlCq4K5Qp6CjUK+QpFClYK6wp/Cm0KkAr6CoIKpQoEC20Kiwp8Cn8KDAupCrsKWQqMCtwKRQq+CsgKZgqICgML8AqmCnoKwAo+CvkKlAq3CpEKLwpBCgMLZgoDC+UKnQqWCqUKzQo0Cv0KbwpXCm8KmApBCgQLbgpWCqYKfAoMC/oKnQrbCpkKQQrlCpgKiAr6Cg==","FQy6C08LiQs/C4ILogvdC3ALSQuuC7cL7guDCzkLAgxJC1oL9AuIC3YLmQsDDIsLrgsNDHYLlAuFC4gLFQyyC8QLXQuVC+ULSQvHC9ELbwuRCwwM+QuvC4MLyQtCCwIMnQvAC5oLMwtFCwwMbwsMDO4LpgufC64L1gs4CwYMeAtbC3gLoQtFCw0MdwtaC68LhQsVDAMMpgvkC6ILRQvuC6ELkQsDDA==","Hg3DDFMMkgxDDIsMqwzmDHkMTQy3DMAM9wyMDD0MCw1NDF4M/QyRDH8MogwMDZQMtwwWDX8MnQyODJEMHg27DM0MYQyeDO4MTQzQDNoMeAyaDBUNAg24DIwM0gxGDAsNpgzJDKMMNwxJDBUNeAwVDfcMrwyoDLcM3ww8DA8NgQxfDIEMqgxJDBYNgAxeDLgMjgweDQwNrwztDKsMSQz3DKoMmgwMDQ==","Jw7MDVcNmw1HDZQNtA3vDYINUQ3ADckNAA6VDUENFA5RDWINBg6aDYgNqw0VDp0NwA0fDogNpg2XDZoNJw7EDdYNZQ2nDfcNUQ3ZDeMNgQ2jDR4OCw7BDZUN2w1KDRQOrw3SDawNOw1NDR4OgQ0eDgAOuA2xDcAN6A1ADRgOig1jDYoNsw1NDR8OiQ1iDcENlw0nDhUOuA32DbQNTQ0ADrMNow0VDg==","MA/VDlsOpA5LDp0OvQ74DosOVQ7JDtIOCQ+eDkUOHQ9VDmYODw+jDpEOtA4eD6YOyQ4oD5EOrw6gDqMOMA/NDt8OaQ6wDgAPVQ7iDuwOig6sDicPFA/KDp4O5A5ODh0PuA7bDrUOPw5RDicPig4nDwkPwQ66DskO8Q5EDiEPkw5nDpMOvA5RDigPkg5mDsoOoA4wDx4PwQ7/Dr0OUQ4JD7wOrA4eDw==","QhHnEGMQthBTEK8QzxAKEZ0QXRDbEOQQGxGwEE0QLxFdEG4QIRG1EKMQxhAwEbgQ2xA6EaMQwRCyELUQQhHfEPEQcRDCEBIRXRD0EP4QnBC+EDkRJhHcELAQ9hBWEC8RyhDtEMcQRxBZEDkRnBA5ERsR0xDMENsQAxFMEDMRpRBvEKUQzhBZEDoRpBBuENwQshBCETAR0xAREc8QWRAbEc4QvhAwEQ==","VBP5EmsSyBJbEsES4RIcE68SZRLtEvYSLRPCElUSQRNlEnYSMxPHErUS2BJCE8oS7RJME7US0xLEEscSVBPxEgMTeRLUEiQTZRIGExATrhLQEksTOBPuEsISCBNeEkET3BL/EtkSTxJhEksTrhJLEy0T5RLeEu0SFRNUEkUTtxJ3ErcS4BJhEkwTthJ2Eu4SxBJUE0IT5RIjE+ESYRItE+AS0BJCEw==","gRgmGH8X9RdvF+4XDhhJGNwXeRcaGCMYWhjvF2kXbhh5F4oXYBj0F+IXBRhvGPcXGhh5GOIXABjxF/QXgRgeGDAYjRcBGFEYeRczGD0Y2xf9F3gYZRgbGO8XNRhyF24YCRgsGAYYYxd1F3gY2xd4GFoYEhgLGBoYQhhoF3IY5BeLF+QXDRh1F3kY4xeKFxsY8ReBGG8YEhhQGA4YdRdaGA0Y/RdvGA==","rh1THZMcIh2DHBsdOx12HQkdjRxHHVAdhx0cHX0cmx2NHJ4cjR0hHQ8dMh2cHSQdRx2mHQ8dLR0eHSEdrh1LHV0doRwuHX4djRxgHWodCB0qHaUdkh1IHRwdYh2GHJsdNh1ZHTMddxyJHKUdCB2lHYcdPx04HUcdbx18HJ8dER2fHBEdOh2JHKYdEB2eHEgdHh2uHZwdPx19HTsdiRyHHTodKh2cHQ==","CCitJ7smfCerJnUnlSfQJ2MntSahJ6on4Sd2J6Um9Se1JsYm5yd7J2knjCf2J34noScAKGknhyd4J3snCCilJ7cnySaIJ9gntSa6J8QnYieEJ/8n7CeiJ3YnvCeuJvUnkCezJ40nnyaxJv8nYif/J+EnmSeSJ6EnySekJvknayfHJmsnlCexJgAoaifGJqIneCcIKPYnmSfXJ5UnsSbhJ5QnhCf2Jw==","YjIHMuMw1jHTMM8x7zEqMr0x3TD7MQQyOzLQMc0wTzLdMO4wQTLVMcMx5jFQMtgx+zFaMsMx4THSMdUxYjL/MREy8TDiMTIy3TAUMh4yvDHeMVkyRjL8MdAxFjLWME8y6jENMucxxzDZMFkyvDFZMjsy8zHsMfsxIzLMMFMyxTHvMMUx7jHZMFoyxDHuMPwx0jFiMlAy8zExMu8x2TA7Mu4x3jFQMg=="];
@@ -0,0 +1,7 @@
+// MINNESOTA (MN) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Aitkin County","Anoka County","Becker County","Beltrami County","Benton County","Big Stone County","Blue Earth County","Brown County","Carlton County","Carver County","Cass County","Chippewa County","Chisago County","Clay County","Clearwater County","Cook County","Cottonwood County","Crow Wing County","Dakota County","Dodge County","Douglas County","Faribault County","Fillmore County","Freeborn County","Goodhue County","Grant County","Hennepin County","Houston County","Hubbard County","Isanti County","Itasca County","Jackson County","Kanabec County","Kandiyohi County","Kittson County","Koochiching County","Lac qui Parle County","Lake County","Lake of the Woods County","Le Sueur County","Lincoln County","Lyon County","Mahnomen County","Marshall County","Martin County","McLeod County","Meeker County","Mille Lacs County","Morrison County","Mower County","Murray County","Nicollet County","Nobles County","Norman County","Olmsted County","Otter Tail County","Pennington County","Pine County","Pipestone County","Polk County","Pope County","Ramsey County","Red Lake County","Redwood County","Renville County","Rice County","Rock County","Roseau County","Scott County","Sherburne County","Sibley County","St. Louis County","Stearns County","Steele County","Stevens County","Swift County","Todd County","Traverse County","Wabasha County","Wadena County","Waseca County","Washington County","Watonwan County","Wilkin County","Winona County","Wright County","Yellow Medicine County"];
+export const COUNTY_COLUMNS: string[] = ["jAGUAZgBjgGCAYYBlwGDAYABkQF+AXcBhwGDAX0BkwGNAXIBfgGUAX0BeQGXAZcBhgGVAY0BegGUAXgBlQGLAZEBggGSAYsBcgGUAZABfgGDAZUBlwF0AXkBhgF5AX0BlgGPAZcBfwGNAZABgAF5AXIBjwGGAXUBjgF5AZgBjAF9AXcBlwGKAYIBjgF2AYABkQGUAYwBkwGSAZABdwGGAY0BdAF8AZMBfgGMAYgB","8QH7AQEC9AHlAeoB/wHnAeMB+AHhAdcB6wHnAd8B+wHzAdEB4AH8Ad8B2gH/AQAC6gH+AfMB2wH7AdgB/QHwAfgB5QH5AfEB0QH7AfcB4AHmAf0BAALTAdkB6gHaAd4B/wH1AQAC4QHzAfYB4gHaAdEB9QHqAdUB9QHaAQEC8gHfAdcB/wHvAeYB9AHWAeIB+AH7AfEB+gH5AfcB2AHqAfIB0wHeAfoB4AHxAewB","ggGJAY0BhAF4AXwBjAF5AXcBhwF1AW0BfQF5AXQBiQGDAWkBdAGKAXMBcAGMAY0BfAGLAYMBcAGJAW4BigGAAYcBeAGIAYEBaQGJAYYBdAF5AYsBjQFqAW8BfAFwAXMBjAGFAY0BdQGDAYUBdgFvAWkBhQF8AWwBhAFwAY4BggFzAW0BjAGAAXgBhAFsAXYBhwGJAYIBiAGHAYYBbgF8AYIBagFyAYgBdAGCAX4B","jgCRAJIAjwCKAIwAkgCLAIoAkACJAIYAjACLAIkAkACOAIUAiQCRAIgAhwCSAJIAjACRAI4AhwCRAIcAkQCNAJAAigCQAI4AhQCRAI8AiQCLAJEAkgCFAIcAjACHAIgAkgCPAJIAiQCOAI8AiQCHAIUAjwCMAIYAjwCHAJIAjgCIAIYAkgCNAIoAjwCGAIkAkACRAI4AkACQAI8AhgCMAI4AhQCIAJAAiQCOAIwA","rQK7AsICsQKcAqMCwAKeApoCtgKWAokCpQKeApQCugKwAoEClQK8ApQCjgLAAsICpAK+ArACjgK7AosCvQKrArYCnAK4Aq0CgQK7ArUClgKeAr4CwgKDAowCowKOApMCwAKzAsIClwKwArQCmAKNAoECswKjAoYCsgKOAsMCrgKUAooCwAKqAp0CsQKIApgCtgK7Aq0CuQK3ArUCigKjAq8ChAKSArkClgKtAqcC","OAA4ADgAOAA4ADgAOAA4ADgAOAA3ADcAOAA4ADcAOAA4ADcANwA4ADcANwA4ADgAOAA4ADgANwA4ADcAOAA4ADgAOAA4ADgANwA4ADgANwA4ADgAOAA3ADcAOAA3ADcAOAA4ADgANwA4ADgAOAA3ADcAOAA4ADcAOAA3ADgAOAA3ADcAOAA4ADgAOAA3ADgAOAA4ADgAOAA4ADgANwA4ADgANwA3ADgANwA4ADgA","pwCqAKwAqACjAKUArACkAKIAqQCiAJ4ApQCkAKEAqgCoAJwAoQCrAKEAnwCsAKwApQCrAKgAoACqAJ8AqwCnAKkAowCqAKcAnACqAKkAoQCjAKsArACdAJ8ApQCfAKEArACoAKwAogCoAKkAogCfAJwAqAClAJ4AqACfAKwApwChAJ4ArACmAKMAqACeAKIAqQCqAKcAqgCqAKkAnwClAKcAnQChAKoAoQCnAKUA","MQAyADMAMgAwADEAMwAwADAAMgAwAC8AMQAwAC8AMgAxAC4AMAAyAC8ALwAzADMAMQAzADEALwAyAC8AMgAxADIAMAAyADEALgAyADIAMAAwADIAMwAuAC8AMQAvAC8AMwAyADMAMAAxADIAMAAvAC4AMgAxAC4AMgAvADMAMQAvAC8AMwAxADAAMgAvADAAMgAyADEAMgAyADIALwAxADEALgAvADIAMAAxADEA","GQAZABoAGQAYABkAGgAYABgAGQAYABgAGQAYABgAGQAZABcAGAAZABgAGAAaABoAGQAaABkAGAAZABgAGQAZABkAGAAZABkAFwAZABkAGAAYABoAGgAXABgAGQAYABgAGgAZABoAGAAZABkAGAAYABcAGQAZABcAGQAYABoAGQAYABgAGgAZABgAGQAYABgAGQAZABkAGQAZABkAGAAZABkAFwAYABkAGAAZABkA"];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVwBZAFsAVQBdAF8AYQBjAGUAZwBpAGsAbQBvAHEAcwB1AHcAeQB7AH0AfwCBAIMAhQCHAIsAjQCPAIkAkQCTAJUAlwCZAJsAnQCfAKEAowClAKcAqQCrAK0A";
+export const ALIAS_KEYS: string[] = ["aitkin","aitkin county","anoka","anoka county","becker","becker county","beltrami","beltrami county","benton","benton county","big stone","big stone county","blue earth","blue earth county","brown","brown county","carlton","carlton county","carver","carver county","cass","cass county","chippewa","chippewa county","chisago","chisago county","clay","clay county","clearwater","clearwater county","cook","cook county","cottonwood","cottonwood county","crow wing","crow wing county","dakota","dakota county","dodge","dodge county","douglas","douglas county","faribault","faribault county","fillmore","fillmore county","freeborn","freeborn county","goodhue","goodhue county","grant","grant county","hennepin","hennepin county","houston","houston county","hubbard","hubbard county","isanti","isanti county","itasca","itasca county","jackson","jackson county","kanabec","kanabec county","kandiyohi","kandiyohi county","kittson","kittson county","koochiching","koochiching county","lac qui parle","lac qui parle county","lake","lake county","lake of the woods","lake of the woods county","le sueur","le sueur county","lincoln","lincoln county","lyon","lyon county","mahnomen","mahnomen county","marshall","marshall county","martin","martin county","mcleod","mcleod county","meeker","meeker county","mille lacs","mille lacs county","morrison","morrison county","mower","mower county","murray","murray county","nicollet","nicollet county","nobles","nobles county","norman","norman county","olmsted","olmsted county","otter tail","otter tail county","pennington","pennington county","pine","pine county","pipestone","pipestone county","polk","polk county","pope","pope county","ramsey","ramsey county","red lake","red lake county","redwood","redwood county","renville","renville county","rice","rice county","rock","rock county","roseau","roseau county","saint louis","saint louis county","scott","scott county","sherburne","sherburne county","sibley","sibley county","stearns","stearns county","steele","steele county","stevens","stevens county","swift","swift county","todd","todd county","traverse","traverse county","wabasha","wabasha county","wadena","wadena county","waseca","waseca county","washington","washington county","watonwan","watonwan county","wilkin","wilkin county","winona","winona county","wright","wright county","yellow medicine","yellow medicine county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5ADoAOgA7ADsAPAA8AD0APQA+AD4APwA/AEAAQABBAEEAQgBCAEMAQwBHAEcARABEAEUARQBGAEYASABIAEkASQBKAEoASwBLAEwATABNAE0ATgBOAE8ATwBQAFAAUQBRAFIAUgBTAFMAVABUAFUAVQBWAFYA";
+export const PRICE_BAND_TOTALS: string[] = ["QwpxCosKUQoICiIKhQoQCgAKYgrwCcIJJwoQCugJbgpLCqYJ7Al1CuYJ0QmFCokKIwp9CksK1AlxCskJeAo8CmIKCApoCkEKpglxCl0K7QkOCnsKiQquCc0JIgrRCeQJhApWCokK8glLCloK+wnPCaYJVgoiCrgJUwrRCY0KRQrmCcMJhQo4CgoKUQq+CfsJYgpxCkMKawpmCl0KxgkiCkcKrwnhCWsK7QlDCiwK","WwuJC6MLaQsgCzoLnQsoCxgLegsDC9UKPwsoC/sKhgtjC7kK/wqNC/kK5AqdC6ELOwuVC2ML5wqJC9wKkAtUC3oLIAuAC1kLuQqJC3ULAAsmC5MLoQvBCuAKOgvkCvcKnAtuC6ELBQtjC3ILEwviCrkKbgs6C8sKawvkCqULXQv5CtYKnQtQCyILaQvRChMLeguJC1sLgwt+C3UL2Qo6C18Lwgr0CoMLAAtbC0QL","cwyhDLsMgQw4DFIMtQxADDAMkgwWDOgLVwxADA4Mngx7DMwLEgylDAwM9wu1DLkMUwytDHsM+guhDO8LqAxsDJIMOAyYDHEMzAuhDI0MEww+DKsMuQzUC/MLUgz3CwoMtAyGDLkMGAx7DIoMKwz1C8wLhgxSDN4Lgwz3C70MdQwMDOkLtQxoDDoMgQzkCysMkgyhDHMMmwyWDI0M7AtSDHcM1QsHDJsMEwxzDFwM","iw25DdMNmQ1QDWoNzQ1YDUgNqg0pDfsMbw1YDSENtg2TDd8MJQ29DR8NCg3NDdENaw3FDZMNDQ25DQINwA2EDaoNUA2wDYkN3wy5DaUNJg1WDcMN0Q3nDAYNag0KDR0NzA2eDdENKw2TDaINQw0IDd8Mng1qDfEMmw0KDdUNjQ0fDfwMzQ2ADVINmQ33DEMNqg25DYsNsw2uDaUN/wxqDY8N6AwaDbMNJg2LDXQN","ow7RDusOsQ5oDoIO5Q5wDmAOwg48Dg4Ohw5wDjQOzg6rDvINOA7VDjIOHQ7lDukOgw7dDqsOIA7RDhUO2A6cDsIOaA7IDqEO8g3RDr0OOQ5uDtsO6Q76DRkOgg4dDjAO5A62DukOPg6rDroOWw4bDvINtg6CDgQOsw4dDu0OpQ4yDg8O5Q6YDmoOsQ4KDlsOwg7RDqMOyw7GDr0OEg6CDqcO+w0tDssOOQ6jDowO","uw/pDwMQyQ+AD5oP/Q+ID3gP2g9PDyEPnw+ID0cP5g/DDwUPSw/tD0UPMA/9DwEQmw/1D8MPMw/pDygP8A+0D9oPgA/gD7kPBQ/pD9UPTA+GD/MPARANDywPmg8wD0MP/A/ODwEQUQ/DD9IPcw8uDwUPzg+aDxcPyw8wDwUQvQ9FDyIP/Q+wD4IPyQ8dD3MP2g/pD7sP4w/eD9UPJQ+aD78PDg9AD+MPTA+7D6QP","6xEZEjMS+RGwEcoRLRK4EagRChJ1EUcRzxG4EW0RFhLzESsRcREdEmsRVhEtEjESyxElEvMRWREZEk4RIBLkEQoSsBEQEukRKxEZEgUSchG2ESMSMRIzEVIRyhFWEWkRLBL+ETESdxHzEQISoxFUESsR/hHKET0R+xFWETUS7RFrEUgRLRLgEbIR+RFDEaMRChIZEusRExIOEgUSSxHKEe8RNBFmERMSchHrEdQR","GxRJFGMUKRTgE/oTXRToE9gTOhSbE20T/xPoE5MTRhQjFFETlxNNFJETfBNdFGEU+xNVFCMUfxNJFHQTUBQUFDoU4BNAFBkUURNJFDUUmBPmE1MUYRRZE3gT+hN8E48TXBQuFGEUnRMjFDIU0xN6E1ETLhT6E2MTKxR8E2UUHRSRE24TXRQQFOITKRRpE9MTOhRJFBsUQxQ+FDUUcRP6Ex8UWhOME0MUmBMbFAQU","kxnBGdsZoRlYGXIZ1RlgGVAZshn6GMwYdxlgGfIYvhmbGbAY9hjFGfAY2xjVGdkZcxnNGZsZ3hjBGdMYyBmMGbIZWBm4GZEZsBjBGa0Z9xheGcsZ2Rm4GNcYchnbGO4Y1BmmGdkZ/BibGaoZSxnZGLAYphlyGcIYoxnbGN0ZlRnwGM0Y1RmIGVoZoRnIGEsZshnBGZMZuxm2Ga0Z0BhyGZcZuRjrGLsZ9xiTGXwZ","Cx85H1MfGR/QHuoeTR/YHsgeKh9ZHise7x7YHlEeNh8THw8eVR49H08eOh5NH1Ef6x5FHxMfPR45HzIeQB8EHyof0B4wHwkfDx45HyUfVh7WHkMfUR8XHjYe6h46Hk0eTB8eH1EfWx4THyIfwx44Hg8eHh/qHiEeGx86HlUfDR9PHiweTR8AH9IeGR8nHsMeKh85HwsfMx8uHyUfLx7qHg8fGB5KHjMfVh4LH/Qe","+ykpKkMqCSrAKdopPSrIKbgpGioXKeko3ynIKQ8pJioDKs0oEyktKg0p+Cg9KkEq2yk1KgMq+ygpKvAoMCr0KRoqwCkgKvkpzSgpKhUqFCnGKTMqQSrVKPQo2in4KAspPCoOKkEqGSkDKhIqsyn2KM0oDiraKd8oCyr4KEUq/SkNKeooPSrwKcIpCSrlKLMpGiopKvspIyoeKhUq7SjaKf8p1igIKSMqFCn7KeQp","6zQZNTM1+TSwNMo0LTW4NKg0CjXVM6czzzS4NM0zFjXzNIsz0TMdNcsztjMtNTE1yzQlNfM0uTMZNa4zIDXkNAo1sDQQNek0izMZNQU10jO2NCM1MTWTM7IzyjS2M8kzLDX+NDE11zPzNAI1ozS0M4sz/jTKNJ0z+zS2MzU17TTLM6gzLTXgNLI0+TSjM6M0CjUZNes0EzUONQU1qzPKNO80lDPGMxM10jPrNNQ0"];
@@ -0,0 +1,7 @@
+// MISSOURI (MO) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Adair County","Andrew County","Atchison County","Audrain County","Barry County","Barton County","Bates County","Benton County","Bollinger County","Boone County","Buchanan County","Butler County","Caldwell County","Callaway County","Camden County","Cape Girardeau County","Carroll County","Carter County","Cass County","Cedar County","Chariton County","Christian County","Clark County","Clay County","Clinton County","Cole County","Cooper County","Crawford County","Dade County","Dallas County","Daviess County","DeKalb County","Dent County","Douglas County","Dunklin County","Franklin County","Gasconade County","Gentry County","Greene County","Grundy County","Harrison County","Henry County","Hickory County","Holt County","Howard County","Howell County","Iron County","Jackson County","Jasper County","Jefferson County","Johnson County","Knox County","Laclede County","Lafayette County","Lawrence County","Lewis County","Lincoln County","Linn County","Livingston County","Macon County","Madison County","Maries County","Marion County","McDonald County","Mercer County","Miller County","Mississippi County","Moniteau County","Monroe County","Montgomery County","Morgan County","New Madrid County","Newton County","Nodaway County","Oregon County","Osage County","Ozark County","Pemiscot County","Perry County","Pettis County","Phelps County","Pike County","Platte County","Polk County","Pulaski County","Putnam County","Ralls County","Randolph County","Ray County","Reynolds County","Ripley County","Saline County","Schuyler County","Scotland County","Scott County","Shannon County","Shelby County","St. Charles County","St. Clair County","St. Francois County","St. Louis County","Ste. Genevieve County","Stoddard County","Stone County","Sullivan County","Taney County","Texas County","Vernon County","Warren County","Washington County","Wayne County","Webster County","Worth County","Wright County"];
+export const COUNTY_COLUMNS: string[] = ["ZQFpAVcBagFwAWABZAFkAW4BdwFZAXABVwFzAVkBZgFvAXIBYQFYAW4BeQFnAWUBdAF0AXMBYgFmAW8BeAFnAVkBYAF2AWoBeAFuAXQBawFgAVgBVgF2AWYBWAFxAWwBcQF0AW4BcQFWAXkBXwFXAWUBdgFZAVgBVwFdAXcBZwFxAV8BYwFbAWcBWQFZAXkBWQF2AWIBXQFmAVcBaQFqAXgBbwFnAVgBXQFeAW0BZAFZAXYBagF2AWQBYwFlAVYBaQFmAXEBaAFiAXEBcAFzAWYBawFiAXABagFXAWQBYQF1AW0B","tQG6AaMBuwHCAa4BswGzAb8BygGmAcIBowHFAaYBtgHBAcQBsAGlAb8BzQG3AbUBxgHHAcYBsAG2AcABywG3AaYBrgHJAbsBywG/AccBvAGuAaQBogHJAbYBpQHDAb0BwwHHAb8BwwGiAc0BrQGjAbQByQGlAaQBowGrAcsBtwHDAa0BsgGoAbcBpgGmAc0BpgHJAbABqwG2AaMBugG7AcwBwQG3AaUBqwGsAb4BtAGmAcoBugHKAbQBsgG0AaIBuQG1AcMBuAGxAcMBwgHGAbYBvAGwAcIBuwGkAbMBrwHIAb8B","WwFfAU0BYAFmAVYBWgFaAWMBbQFQAWYBTQFoAVABXAFlAWgBVwFPAWMBbwFdAVsBaQFqAWkBWAFcAWUBbQFdAVABVgFsAWABbQFkAWoBYQFWAU4BTAFsAVwBTgFnAWIBZwFqAWQBZwFNAW4BVQFNAVsBawFPAU4BTQFTAW0BXQFnAVUBWQFRAV0BUAFQAW4BUAFrAVgBUwFcAU0BXwFgAW4BZQFdAU8BVAFUAWMBWgFQAWwBYAFsAVoBWQFbAUwBXwFcAWcBXgFYAWcBZgFpAVwBYQFYAWYBYAFOAVoBVwFrAWMB","gQCCAHsAgwCEAH8AgACAAIQAhwB8AIUAfACGAHwAgQCEAIUAfwB8AIQAiACBAIEAhgCGAIYAfwCBAIQAhwCBAHwAfwCHAIMAhwCEAIYAgwB/AHwAewCHAIEAfACFAIMAhQCGAIQAhQB7AIgAfgB7AIEAhwB8AHwAewB+AIcAgQCFAH4AgAB9AIEAfAB8AIgAfACHAH8AfgCBAHwAggCDAIgAhACBAHwAfgB+AIMAgAB8AIcAggCHAIAAgACAAHsAggCBAIUAggCAAIUAhQCGAIEAgwB/AIUAggB8AIAAfwCGAIQA","IgIoAgwCKgIyAhkCHwIgAi8CPQIQAjMCDAI3AhACIwIxAjUCHAIOAi8CQAIkAiICOAI5AjgCHQIkAjECPgIkAhACGQI8AioCPgIvAjkCKwIaAg0CCgI8AiQCDgI0Ai0CNAI5Ai8CNAILAkACGAIMAiICOwIPAg0CDAIWAj4CJAI0AhgCHwISAiUCEAIQAkACEAI7Ah0CFgIkAgwCKAIqAj8CMQIkAg4CFgIXAi4CIQIQAjwCKQI8AiECHwIhAgsCJwIjAjQCJgIdAjQCMwI4AiMCKwIdAjMCKQINAh8CGwI6Ai4C","NQA1ADQANQA1ADUANQA1ADUANQA0ADUANAA1ADQANQA1ADUANQA0ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADQANQA1ADUANQA1ADUANQA1ADQANAA1ADUANAA1ADUANQA1ADUANQA0ADUANQA0ADUANQA0ADQANAA0ADUANQA1ADUANQA0ADUANAA0ADUANAA1ADUANAA1ADQANQA1ADUANQA1ADQANAA1ADUANQA0ADUANQA1ADUANQA1ADQANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA0ADUANQA1ADUA","gQCCAHsAgwCEAH8AgACAAIQAhwB8AIUAfACGAHwAgQCEAIUAfwB8AIQAiACBAIEAhgCGAIYAfwCBAIQAhwCBAHwAfwCHAIMAhwCEAIYAgwB/AHwAewCHAIEAfACFAIMAhQCGAIQAhQB7AIgAfgB7AIEAhwB8AHwAewB+AIcAgQCFAH4AgAB9AIEAfAB8AIgAfACHAH8AfgCBAHwAggCDAIgAhACBAHwAfgB+AIMAgAB8AIcAggCHAIAAgACAAHsAggCBAIUAggCAAIUAhQCGAIEAgwB/AIUAggB8AIAAfwCGAIQA","KQAqACgAKgAqACkAKQApACoAKwAoACsAKAArACgAKQAqACsAKQAoACoALAApACkAKwArACsAKQApACoAKwApACgAKQArACoAKwAqACsAKgApACgAJwArACkAKAArACoAKwArACoAKwAnACwAKAAoACkAKwAoACgAKAAoACsAKQArACgAKQAoACkAKAAoACwAKAArACkAKAApACgAKgAqACsAKgApACgAKAAoACoAKQAoACsAKgArACkAKQApACcAKgApACsAKgApACsAKwArACkAKgApACsAKgAoACkAKQArACoA","FQAWABQAFgAWABUAFQAVABYAFgAVABYAFAAWABUAFQAWABYAFQAVABYAFwAVABUAFgAWABYAFQAVABYAFgAVABUAFQAWABYAFgAWABYAFgAVABUAFAAWABUAFQAWABYAFgAWABYAFgAUABcAFQAUABUAFgAVABUAFAAVABYAFQAWABUAFQAVABUAFQAVABcAFQAWABUAFQAVABQAFgAWABcAFgAVABUAFQAVABYAFQAVABYAFgAWABUAFQAVABQAFgAVABYAFgAVABYAFgAWABUAFgAVABYAFgAVABUAFQAWABYA"];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBXAFkAWwBdAF8AYQBjAGUAZwBpAGsAbQBvAHEAcwB1AHkAewB9AH8AdwCBAIMAhQCHAIkAiwCNAI8AkQCTAJUAlwCZAJsAnQCfAKEAowClAKcAqQCrAK0ArwCxALMAtQDDAMUAxwDJAMsAzQC3ALkAuwC9ALoAzwDRANMA1QDXANkA2wDdAN8A4QDjAOUA";
+export const ALIAS_KEYS: string[] = ["adair","adair county","andrew","andrew county","atchison","atchison county","audrain","audrain county","barry","barry county","barton","barton county","bates","bates county","benton","benton county","bollinger","bollinger county","boone","boone county","buchanan","buchanan county","butler","butler county","caldwell","caldwell county","callaway","callaway county","camden","camden county","cape girardeau","cape girardeau county","carroll","carroll county","carter","carter county","cass","cass county","cedar","cedar county","chariton","chariton county","christian","christian county","clark","clark county","clay","clay county","clinton","clinton county","cole","cole county","cooper","cooper county","crawford","crawford county","dade","dade county","dallas","dallas county","daviess","daviess county","dekalb","dekalb county","dent","dent county","douglas","douglas county","dunklin","dunklin county","franklin","franklin county","gasconade","gasconade county","gentry","gentry county","greene","greene county","grundy","grundy county","harrison","harrison county","henry","henry county","hickory","hickory county","holt","holt county","howard","howard county","howell","howell county","iron","iron county","jackson","jackson county","jasper","jasper county","jefferson","jefferson county","johnson","johnson county","knox","knox county","laclede","laclede county","lafayette","lafayette county","lawrence","lawrence county","lewis","lewis county","lincoln","lincoln county","linn","linn county","livingston","livingston county","macon","macon county","madison","madison county","maries","maries county","marion","marion county","mcdonald","mcdonald county","mercer","mercer county","miller","miller county","mississippi","mississippi county","moniteau","moniteau county","monroe","monroe county","montgomery","montgomery county","morgan","morgan county","new madrid","new madrid county","newton","newton county","nodaway","nodaway county","oregon","oregon county","osage","osage county","ozark","ozark county","pemiscot","pemiscot county","perry","perry county","pettis","pettis county","phelps","phelps county","pike","pike county","platte","platte county","polk","polk county","pulaski","pulaski county","putnam","putnam county","ralls","ralls county","randolph","randolph county","ray","ray county","reynolds","reynolds county","ripley","ripley county","saint charles","saint charles county","saint clair","saint clair county","saint francois","saint francois county","saint louis","saint louis county","sainte genevieve","sainte genevieve county","saline","saline county","schuyler","schuyler county","scotland","scotland county","scott","scott county","shannon","shannon county","shelby","shelby county","stoddard","stoddard county","stone","stone county","sullivan","sullivan county","taney","taney county","texas","texas county","vernon","vernon county","warren","warren county","washington","washington county","wayne","wayne county","webster","webster county","worth","worth county","wright","wright county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5ADoAOgA7ADsAPAA8AD0APQA+AD4APwA/AEAAQABBAEEAQgBCAEMAQwBEAEQARQBFAEYARgBHAEcASABIAEkASQBKAEoASwBLAEwATABNAE0ATgBOAE8ATwBQAFAAUQBRAFIAUgBTAFMAVABUAFUAVQBWAFYAVwBXAFgAWABZAFkAWgBaAGEAYQBiAGIAYwBjAGQAZABlAGUAWwBbAFwAXABdAF0AXgBeAF8AXwBgAGAAZgBmAGcAZwBoAGgAaQBpAGoAagBrAGsAbABsAG0AbQBuAG4AbwBvAHAAcABxAHEA";
+export const PRICE_BAND_TOTALS: string[] = ["4Aj3CIkI/ggbCcII1wjYCBAJQwmYCB8JiwgtCZgI5AgXCScJyQiTCBAJUQnoCOAIMQk0CTAJzAjlCBYJRgnoCJgIwgg/Cf4IRgkRCTQJAgnDCJAIgwg/CeUIkggjCQcJIwk0CREJIwmFCFAJuwiJCN8IPQmVCJAIiQiuCEUJ6AgjCbsI1AihCOkImAiYCFAJmAg9CcwIrgjlCIsI9wj+CEwJFwnoCJMIrwi3CAsJ2giYCEAJ+ghACdoI1AjcCIQI9QjjCCMJ8QjPCCMJHwkwCeQIAgnMCB8J+wiPCNcIxwg4CQ4J","6QkACo0JBwokCssJ4AnhCRkKTAqcCSgKjwk2CpwJ7QkgCjAK0gmXCRkKWgrxCekJOgo9CjkK1QnuCR8KTwrxCZwJywlICgcKTwoaCj0KCwrMCZQJhwlICu4JlgksChAKLAo9ChoKLAqJCVkKxAmNCegJRgqZCZQJjQmyCU4K8QksCsQJ3QmlCfIJnAmcCVkKnAlGCtUJsgnuCY8JAAoHClUKIArxCZcJswnACRQK4wmcCUkKAwpJCuMJ3QnlCYgJ/gnsCSwK+gnYCSwKKAo5Cu0JCwrVCSgKBAqTCeAJ0AlBChcK","8goJC5EKEAstC9QK6QrqCiILVQugCjELkwo/C6AK9gopCzkL2wqbCiILYwv6CvIKQwtGC0IL3gr3CigLWAv6CqAK1ApRCxALWAsjC0YLFAvVCpgKiwpRC/cKmgo1CxkLNQtGCyMLNQuNCmILzQqRCvEKTwudCpgKkQq2ClcL+go1C80K5gqpCvsKoAqgCmILoApPC94Ktgr3CpMKCQsQC14LKQv6CpsKtwrJCh0L7AqgClILDAtSC+wK5gruCowKBwv1CjULAwvhCjULMQtCC/YKFAveCjELDQuXCukK2QpKCyAL","+wsSDJULGQw2DN0L8gvzCysMXgykCzoMlwtIDKQL/wsyDEIM5AufCysMbAwDDPsLTAxPDEsM5wsADDEMYQwDDKQL3QtaDBkMYQwsDE8MHQzeC5wLjwtaDAAMngs+DCIMPgxPDCwMPgyRC2sM1guVC/oLWAyhC5wLlQu6C2AMAww+DNYL7wutCwQMpAukC2sMpAtYDOcLugsADJcLEgwZDGcMMgwDDJ8LuwvSCyYM9QukC1sMFQxbDPUL7wv3C5ALEAz+Cz4MDAzqCz4MOgxLDP8LHQznCzoMFgybC/IL4gtTDCkM","BA0bDZkMIg0/DeYM+wz8DDQNZw2oDEMNmwxRDagMCA07DUsN7QyjDDQNdQ0MDQQNVQ1YDVQN8AwJDToNag0MDagM5gxjDSINag01DVgNJg3nDKAMkwxjDQkNogxHDSsNRw1YDTUNRw2VDHQN3wyZDAMNYQ2lDKAMmQy+DGkNDA1HDd8M+AyxDA0NqAyoDHQNqAxhDfAMvgwJDZsMGw0iDXANOw0MDaMMvwzbDC8N/gyoDGQNHg1kDf4M+AwADZQMGQ0HDUcNFQ3zDEcNQw1UDQgNJg3wDEMNHw2fDPsM6wxcDTIN","DQ4kDp0NKw5IDu8NBA4FDj0OcA6sDUwOnw1aDqwNEQ5EDlQO9g2nDT0Ofg4VDg0OXg5hDl0O+Q0SDkMOcw4VDqwN7w1sDisOcw4+DmEOLw7wDaQNlw1sDhIOpg1QDjQOUA5hDj4OUA6ZDX0O6A2dDQwOag6pDaQNnQ3CDXIOFQ5QDugNAQ61DRYOrA2sDX0OrA1qDvkNwg0SDp8NJA4rDnkORA4VDqcNww3kDTgOBw6sDW0OJw5tDgcOAQ4JDpgNIg4QDlAOHg78DVAOTA5dDhEOLw75DUwOKA6jDQQO9A1lDjsO","HxA2EKUPPRBaEAEQFhAXEE8QghC0D14Qpw9sELQPIxBWEGYQCBCvD08QkBAnEB8QcBBzEG8QCxAkEFUQhRAnELQPARB+ED0QhRBQEHMQQRACEKwPnw9+ECQQrg9iEEYQYhBzEFAQYhChD48Q+g+lDx4QfBCxD6wPpQ/KD4QQJxBiEPoPExC9DygQtA+0D48QtA98EAsQyg8kEKcPNhA9EIsQVhAnEK8Pyw/2D0oQGRC0D38QORB/EBkQExAbEKAPNBAiEGIQMBAOEGIQXhBvECMQQRALEF4QOhCrDxYQBhB3EE0Q","MRJIEq0RTxJsEhMSKBIpEmESlBK8EXASrxF+ErwRNRJoEngSGhK3EWESohI5EjESghKFEoESHRI2EmcSlxI5ErwRExKQEk8SlxJiEoUSUxIUErQRpxGQEjYSthF0ElgSdBKFEmISdBKpEaESDBKtETASjhK5EbQRrRHSEZYSORJ0EgwSJRLFEToSvBG8EaESvBGOEh0S0hE2Eq8RSBJPEp0SaBI5ErcR0xEIElwSKxK8EZESSxKREisSJRItEqgRRhI0EnQSQhIgEnQScBKBEjUSUxIdEnASTBKzESgSGBKJEl8S","Xhd1F8EWfBeZF0AXVRdWF44XwRfQFp0XwxarF9AWYheVF6UXRxfLFo4XzxdmF14XrxeyF64XShdjF5QXxBdmF9AWQBe9F3wXxBePF7IXgBdBF8gWuxa9F2MXyhahF4UXoReyF48XoRe9Fs4XORfBFl0XuxfNFsgWwRbmFsMXZhehFzkXUhfZFmcX0BbQFs4X0Ba7F0oX5hZjF8MWdRd8F8oXlRdmF8sW5xY1F4kXWBfQFr4XeBe+F1gXUhdaF7wWcxdhF6EXbxdNF6EXnReuF2IXgBdKF50XeRfHFlUXRRe2F4wX","ixyiHNUbqRzGHG0cghyDHLsc7hzkG8oc1xvYHOQbjxzCHNIcdBzfG7sc/ByTHIsc3BzfHNscdxyQHMEc8RyTHOQbbRzqHKkc8Ry8HN8crRxuHNwbzxvqHJAc3hvOHLIczhzfHLwczhzRG/scZhzVG4oc6BzhG9wb1Rv6G/AckxzOHGYcfxztG5Qc5BvkG/sc5BvoHHcc+huQHNcbohypHPccwhyTHN8b+xtiHLYchRzkG+scpRzrHIUcfxyHHNAboByOHM4cnBx6HM4cyhzbHI8crRx3HMocphzbG4IcchzjHLkc","5Sb8Jv0lAycgJ8cm3CbdJhUnSCcMJiQn/yUyJwwm6SYcJywnziYHJhUnViftJuUmNic5JzUn0SbqJhsnSyftJgwmxyZEJwMnSycWJzknByfIJgQm9yVEJ+omBiYoJwwnKCc5JxYnKCf5JVUnwCb9JeQmQicJJgQm/SUiJkon7SYoJ8Am2SYVJu4mDCYMJlUnDCZCJ9EmIibqJv8l/CYDJ1EnHCftJgcmIya8JhAn3yYMJkUn/yZFJ98m2SbhJvgl+iboJign9ibUJignJCc1J+kmByfRJiQnACcDJtwmzCY9JxMn","PzFWMSUwXTF6MSExNjE3MW8xojE0MH4xJzCMMTQwQzF2MYYxKDEvMG8xsDFHMT8xkDGTMY8xKzFEMXUxpTFHMTQwITGeMV0xpTFwMZMxYTEiMSwwHzCeMUQxLjCCMWYxgjGTMXAxgjEhMK8xGjElMD4xnDExMCwwJTBKMKQxRzGCMRoxMzE9MEgxNDA0MK8xNDCcMSsxSjBEMScwVjFdMasxdjFHMS8wSzAWMWoxOTE0MJ8xWTGfMTkxMzE7MSAwVDFCMYIxUDEuMYIxfjGPMUMxYTErMX4xWjErMDYxJjGXMW0x"];
@@ -0,0 +1,7 @@
+// MISSISSIPPI (MS) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Adams County","Alcorn County","Amite County","Attala County","Benton County","Bolivar County","Calhoun County","Carroll County","Chickasaw County","Choctaw County","Claiborne County","Clarke County","Clay County","Coahoma County","Copiah County","Covington County","DeSoto County","Forrest County","Franklin County","George County","Greene County","Grenada County","Hancock County","Harrison County","Hinds County","Holmes County","Humphreys County","Issaquena County","Itawamba County","Jackson County","Jasper County","Jefferson County","Jefferson Davis County","Jones County","Kemper County","Lafayette County","Lamar County","Lauderdale County","Lawrence County","Leake County","Lee County","Leflore County","Lincoln County","Lowndes County","Madison County","Marion County","Marshall County","Monroe County","Montgomery County","Neshoba County","Newton County","Noxubee County","Oktibbeha County","Panola County","Pearl River County","Perry County","Pike County","Pontotoc County","Prentiss County","Quitman County","Rankin County","Scott County","Sharkey County","Simpson County","Smith County","Stone County","Sunflower County","Tallahatchie County","Tate County","Tippah County","Tishomingo County","Tunica County","Union County","Walthall County","Warren County","Washington County","Wayne County","Webster County","Wilkinson County","Winston County","Yalobusha County","Yazoo County"];
+export const COUNTY_COLUMNS: string[] = ["QgE/AT0BSAFGAUUBVAFQAUoBQQFCAUgBSAE/AU4BRgFZAVgBTAFSAVUBRQFJAUMBWgFIAU8BPQFYAU4BUgFVAVkBSQFQAVkBQgFNAUIBSAE7AU4BRwFHAToBWAE6AUkBPAFMATwBWgFaAUIBSQFLAVABUwFDAVgBPwFHAVIBUgFWAVQBUQFBAUgBWAFBAUsBVgFUAUwBOwFGAUMBSAFZAUoBRAE=","kAGMAYoBlwGVAZQBpgGiAZoBjwGQAZgBlwGNAaABlQGsAasBnQGkAagBlAGZAZEBrgGXAaABigGrAZ8BpQGoAa0BmQGhAa0BkAGeAZABlwGHAZ8BlwGWAYYBrAGHAZkBiQGdAYkBrgGuAZABmQGcAaIBpgGRAawBjQGWAaUBpAGpAacBowGPAZcBrAGPAZsBqQGmAZwBhwGVAZIBlwGsAZoBkwE=","OAE1ATMBPgE8ATsBSQFGAUABNwE4AT4BPgE2AUQBPAFOAU0BQgFIAUsBOwE/ATkBTwE+AUUBMwFNAUQBSAFLAU8BPwFGAU8BOAFDATgBPgExAUQBPQE9ATABTgExAT8BMwFCATMBTwFPATgBPwFBAUYBSQE5AU4BNgE9AUgBSAFMAUoBRwE4AT4BTgE4AUEBTAFJAUIBMQE8ATkBPgFOAUABOgE=","cABvAG4AcgBxAHEAdgB1AHMAcABwAHIAcgBvAHQAcQB4AHcAcwB1AHcAcQByAHAAeAByAHQAbgB3AHQAdgB3AHgAcgB1AHgAcAB0AHAAcgBtAHQAcgBxAG0AeABtAHIAbgB0AG4AeAB4AHAAcgBzAHUAdgBwAHgAbwByAHYAdQB3AHYAdQBwAHIAeABwAHMAdwB2AHMAbQBxAHAAcgB4AHMAcQA=","6QHjAeEB8QHvAe0BAwL+AfUB5wHoAfIB8QHkAfsB7gELAgkC+AEAAgUC7QHzAekBDALxAfwB4AEJAvoBAQIFAgwC8wH9AQwC6AH6AegB8QHeAfoB8AHvAdwBCgLdAfMB4AH4AeABDAIMAugB8wH2Af4BAwLpAQoC5AHwAQECAQIHAgQC/wHnAfEBCgLnAfYBBwIDAvcB3QHuAeoB8QELAvUB6wE=","MAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAA=","dQB0AHMAdwB2AHYAewB6AHgAdAB1AHcAdwB0AHkAdgB9AH0AeAB6AHwAdgB3AHUAfQB3AHoAcwB9AHkAewB8AH0AdwB6AH0AdQB5AHUAdwByAHkAdwB2AHIAfQByAHcAcwB5AHMAfQB9AHUAdwB4AHoAewB1AH0AdAB3AHsAewB8AHsAegB1AHcAfQB1AHgAfAB7AHgAcgB2AHUAdwB9AHgAdQA=","JQAkACQAJQAlACUAJwAmACYAJQAlACUAJQAkACYAJQAnACcAJgAmACcAJQAlACUAJwAlACYAJAAnACYAJwAnACcAJQAmACcAJQAmACUAJQAkACYAJQAlACQAJwAkACUAJAAmACQAJwAnACUAJQAmACYAJwAlACcAJAAlACcAJgAnACcAJgAlACUAJwAlACYAJwAnACYAJAAlACUAJQAnACYAJQA=","EQARABEAEQARABEAEgASABIAEQARABEAEQARABIAEQASABIAEgASABIAEQARABEAEgARABIAEQASABIAEgASABIAEQASABIAEQASABEAEQARABIAEQARABEAEgARABEAEQASABEAEgASABEAEQASABIAEgARABIAEQARABIAEgASABIAEgARABEAEgARABIAEgASABIAEQARABEAEQASABIAEQA="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBXAFkAWwBdAF8AYQBjAGUAZwBpAGsAbQBvAHEAcwB1AHcAeQB7AH0AfwCBAIMAhQCHAIkAiwCNAI8AkQCTAJUAlwCZAJsAnQCfAKEAowA=";
+export const ALIAS_KEYS: string[] = ["adams","adams county","alcorn","alcorn county","amite","amite county","attala","attala county","benton","benton county","bolivar","bolivar county","calhoun","calhoun county","carroll","carroll county","chickasaw","chickasaw county","choctaw","choctaw county","claiborne","claiborne county","clarke","clarke county","clay","clay county","coahoma","coahoma county","copiah","copiah county","covington","covington county","desoto","desoto county","forrest","forrest county","franklin","franklin county","george","george county","greene","greene county","grenada","grenada county","hancock","hancock county","harrison","harrison county","hinds","hinds county","holmes","holmes county","humphreys","humphreys county","issaquena","issaquena county","itawamba","itawamba county","jackson","jackson county","jasper","jasper county","jefferson","jefferson county","jefferson davis","jefferson davis county","jones","jones county","kemper","kemper county","lafayette","lafayette county","lamar","lamar county","lauderdale","lauderdale county","lawrence","lawrence county","leake","leake county","lee","lee county","leflore","leflore county","lincoln","lincoln county","lowndes","lowndes county","madison","madison county","marion","marion county","marshall","marshall county","monroe","monroe county","montgomery","montgomery county","neshoba","neshoba county","newton","newton county","noxubee","noxubee county","oktibbeha","oktibbeha county","panola","panola county","pearl river","pearl river county","perry","perry county","pike","pike county","pontotoc","pontotoc county","prentiss","prentiss county","quitman","quitman county","rankin","rankin county","scott","scott county","sharkey","sharkey county","simpson","simpson county","smith","smith county","stone","stone county","sunflower","sunflower county","tallahatchie","tallahatchie county","tate","tate county","tippah","tippah county","tishomingo","tishomingo county","tunica","tunica county","union","union county","walthall","walthall county","warren","warren county","washington","washington county","wayne","wayne county","webster","webster county","wilkinson","wilkinson county","winston","winston county","yalobusha","yalobusha county","yazoo","yazoo county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5ADoAOgA7ADsAPAA8AD0APQA+AD4APwA/AEAAQABBAEEAQgBCAEMAQwBEAEQARQBFAEYARgBHAEcASABIAEkASQBKAEoASwBLAEwATABNAE0ATgBOAE8ATwBQAFAAUQBRAA==";
+export const PRICE_BAND_TOTALS: string[] = ["/gfrB+EHHQgTCA4IYAhNCCwI+Af9Bx8IHQjuB0IIEgh8CHYINghVCGkIDggjCAEIgQgdCEYI4Ad2CEAIWghpCH8IIwhLCH8I/Qc9CP0HHQjVB0AIGggWCNAHegjTByMI3gc4CN4HgQiBCP0HIwgxCE0IXwgBCHoI7gcZCFoIVwhuCGMIUQj6Bx0Iegj6BzAIbghgCDQI1AcSCAMIHQh8CCwICAg=","7gjbCNEIDQkDCf4IUAk9CRwJ6AjtCA8JDQneCDIJAglsCWYJJglFCVkJ/ggTCfEIcQkNCTYJ0AhmCTAJSglZCW8JEwk7CW8J7QgtCe0IDQnFCDAJCgkGCcAIagnDCBMJzggoCc4IcQlxCe0IEwkhCT0JTwnxCGoJ3ggJCUoJRwleCVMJQQnqCA0JagnqCCAJXglQCSQJxAgCCfMIDQlsCRwJ+Ag=","3gnLCcEJ/QnzCe4JQAotCgwK2AndCf8J/QnOCSIK8glcClYKFgo1CkkK7gkDCuEJYQr9CSYKwAlWCiAKOgpJCl8KAworCl8K3QkdCt0J/Qm1CSAK+gn2CbAJWgqzCQMKvgkYCr4JYQphCt0JAwoRCi0KPwrhCVoKzgn5CToKNwpOCkMKMQraCf0JWgraCRAKTgpAChQKtAnyCeMJ/QlcCgwK6Ak=","zgq7CrEK7QrjCt4KMAsdC/wKyArNCu8K7Qq+ChIL4gpMC0YLBgslCzkL3grzCtEKUQvtChYLsApGCxALKgs5C08L8wobC08LzQoNC80K7QqlChAL6grmCqAKSgujCvMKrgoIC64KUQtRC80K8woBCx0LLwvRCkoLvgrpCioLJws+CzMLIQvKCu0KSgvKCgALPgswCwQLpAriCtMK7QpMC/wK2Ao=","vgurC6EL3QvTC84LIAwNDOwLuAu9C98L3QuuCwIM0gs8DDYM9gsVDCkMzgvjC8ELQQzdCwYMoAs2DAAMGgwpDD8M4wsLDD8MvQv9C70L3QuVCwAM2gvWC5ALOgyTC+MLngv4C54LQQxBDL0L4wvxCw0MHwzBCzoMrgvZCxoMFwwuDCMMEQy6C90LOgy6C/ALLgwgDPQLlAvSC8ML3Qs8DOwLyAs=","rgybDJEMzQzDDL4MEA39DNwMqAytDM8MzQyeDPIMwgwsDSYN5gwFDRkNvgzTDLEMMQ3NDPYMkAwmDfAMCg0ZDS8N0wz7DC8NrQztDK0MzQyFDPAMygzGDIAMKg2DDNMMjgzoDI4MMQ0xDa0M0wzhDP0MDw2xDCoNngzJDAoNBw0eDRMNAQ2qDM0MKg2qDOAMHg0QDeQMhAzCDLMMzQwsDdwMuAw=","jg57DnEOrQ6jDp4O8A7dDrwOiA6NDq8OrQ5+DtIOog4MDwYPxg7lDvkOng6zDpEOEQ+tDtYOcA4GD9AO6g75Dg8Psw7bDg8PjQ7NDo0OrQ5lDtAOqg6mDmAOCg9jDrMObg7IDm4OEQ8RD40Osw7BDt0O7w6RDgoPfg6pDuoO5w7+DvMO4Q6KDq0OCg+KDsAO/g7wDsQOZA6iDpMOrQ4MD7wOmA4=","bhBbEFEQjRCDEH4Q0BC9EJwQaBBtEI8QjRBeELIQghDsEOYQphDFENkQfhCTEHEQ8RCNELYQUBDmELAQyhDZEO8QkxC7EO8QbRCtEG0QjRBFELAQihCGEEAQ6hBDEJMQThCoEE4Q8RDxEG0QkxChEL0QzxBxEOoQXhCJEMoQxxDeENMQwRBqEI0Q6hBqEKAQ3hDQEKQQRBCCEHMQjRDsEJwQeBA=","HhULFQEVPRUzFS4VgBVtFUwVGBUdFT8VPRUOFWIVMhWcFZYVVhV1FYkVLhVDFSEVoRU9FWYVABWWFWAVehWJFZ8VQxVrFZ8VHRVdFR0VPRX1FGAVOhU2FfAUmhXzFEMV/hRYFf4UoRWhFR0VQxVRFW0VfxUhFZoVDhU5FXoVdxWOFYMVcRUaFT0VmhUaFVAVjhWAFVQV9BQyFSMVPRWcFUwVKBU=","zhm7GbEZ7RnjGd4ZMBodGvwZyBnNGe8Z7Rm+GRIa4hlMGkYaBholGjka3hnzGdEZURrtGRYasBlGGhAaKho5Gk8a8xkbGk8azRkNGs0Z7RmlGRAa6hnmGaAZShqjGfMZrhkIGq4ZURpRGs0Z8xkBGh0aLxrRGUoavhnpGSoaJxo+GjMaIRrKGe0ZShrKGQAaPhowGgQapBniGdMZ7RlMGvwZ2Bk=","LiMbIxEjTSNDIz4jkCN9I1wjKCMtI08jTSMeI3IjQiOsI6YjZiOFI5kjPiNTIzEjsSNNI3YjECOmI3AjiiOZI68jUyN7I68jLSNtIy0jTSMFI3AjSiNGIwAjqiMDI1MjDiNoIw4jsSOxIy0jUyNhI30jjyMxI6ojHiNJI4ojhyOeI5MjgSMqI00jqiMqI2AjniOQI2QjBCNCIzMjTSOsI1wjOCM=","jix7LHEsrSyjLJ4s8CzdLLwsiCyNLK8srSx+LNIsoiwMLQYtxizlLPksniyzLJEsES2tLNYscCwGLdAs6iz5LA8tsyzbLA8tjSzNLI0srSxlLNAsqiymLGAsCi1jLLMsbizILG4sES0RLY0ssyzBLN0s7yyRLAotfiypLOos5yz+LPMs4SyKLK0sCi2KLMAs/izwLMQsZCyiLJMsrSwMLbwsmCw="];
@@ -0,0 +1,7 @@
+// MONTANA (MT) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Beaverhead County","Big Horn County","Blaine County","Broadwater County","Carbon County","Carter County","Cascade County","Chouteau County","Custer County","Daniels County","Dawson County","Deer Lodge County","Fallon County","Fergus County","Flathead County","Gallatin County","Garfield County","Glacier County","Golden Valley County","Granite County","Hill County","Jefferson County","Judith Basin County","Lake County","Lewis and Clark County","Liberty County","Lincoln County","Madison County","McCone County","Meagher County","Mineral County","Missoula County","Musselshell County","Park County","Petroleum County","Phillips County","Pondera County","Powder River County","Powell County","Prairie County","Ravalli County","Richland County","Roosevelt County","Rosebud County","Sanders County","Sheridan County","Silver Bow County","Stillwater County","Sweet Grass County","Teton County","Toole County","Treasure County","Valley County","Wheatland County","Wibaux County","Yellowstone County"];
+export const COUNTY_COLUMNS: string[] = ["dwFqAWgBdQF2AXIBYAFrAWoBZgFvAVgBVwFlAWkBWQFqAVYBawF2AXYBdAFwAXQBdgFgAWUBVwFoAWABcgFlAWABcQF3AXYBcAFwAXIBawFXAWkBdgFsAVgBYwFoAWIBagFqAXIBdwFzAXMBWQFwAQ==","ywG7AbgByAHJAcQBrgG7AbsBtQHAAaUBpAG1AbkBpQG7AaIBuwHKAcoBxwHCAccBygGvAbQBowG4Aa8BxAG1Aa4BwwHLAckBwgHCAcQBvAGjAbkByQG9AaUBsgG4AbEBuwG7AcQBygHFAcYBpgHCAQ==","ywG7AbgByAHJAcQBrgG7AbsBtQHAAaUBpAG1AbkBpQG7AaIBuwHKAcoBxwHCAccBygGvAbQBowG4Aa8BxAG1Aa4BwwHLAckBwgHCAcQBvAGjAbkByQG9AaUBsgG4AbEBuwG7AcQBygHFAcYBpgHCAQ==","aABkAGQAZwBnAGYAYQBkAGQAYwBmAF8AXwBjAGQAXwBkAF8AZABoAGgAZwBmAGcAaABiAGMAXwBkAGIAZgBjAGEAZgBoAGcAZgBmAGYAZQBfAGQAaABlAF8AYgBkAGIAZABkAGYAaABnAGcAYABmAA==","uwGrAakBuQG5AbUBnwGsAawBpgGxAZYBlQGmAaoBlwGrAZMBrAG6AboBtwGzAbgBugGgAaYBlQGpAaABtAGmAZ8BtAG7AbkBsgGzAbQBrQGVAaoBugGuAZcBowGpAaIBrAGsAbQBugG2AbYBmAGzAQ==","MQAxADEAMQAxADEAMQAxADEAMQAxADEAMQAxADEAMQAxADAAMQAxADEAMQAxADEAMQAxADEAMAAxADEAMQAxADEAMQAxADEAMQAxADEAMQAwADEAMQAxADEAMQAxADEAMQAxADEAMQAxADEAMQAxAA==","oQCcAJsAoAChAJ8AlwCcAJwAmgCeAJQAlACaAJsAlACcAJMAnAChAKEAoACeAKAAoQCXAJkAkwCbAJcAnwCaAJcAnwChAKEAngCeAJ8AnACTAJsAoQCdAJQAmACbAJgAnACcAJ8AoQCfAJ8AlACeAA==","KwAqACoAKwArACsAKQAqACoAKQAqACgAKAApACoAKAAqACcAKgArACsAKwArACsAKwApACkAKAAqACkAKwApACkAKwArACsAKgArACsAKgAoACoAKwAqACgAKQAqACkAKgAqACsAKwArACsAKAArAA==","FgAWABYAFgAWABYAFQAWABYAFQAWABUAFQAVABYAFQAWABQAFgAWABYAFgAWABYAFgAVABUAFAAWABUAFgAVABUAFgAWABYAFgAWABYAFgAUABYAFgAWABUAFQAWABUAFgAWABYAFgAWABYAFQAWAA=="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUAOQA3ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBXAFkAWwBdAF8AYQBjAGUAZwBpAGsAbQBvAA==";
+export const ALIAS_KEYS: string[] = ["beaverhead","beaverhead county","big horn","big horn county","blaine","blaine county","broadwater","broadwater county","carbon","carbon county","carter","carter county","cascade","cascade county","chouteau","chouteau county","custer","custer county","daniels","daniels county","dawson","dawson county","deer lodge","deer lodge county","fallon","fallon county","fergus","fergus county","flathead","flathead county","gallatin","gallatin county","garfield","garfield county","glacier","glacier county","golden valley","golden valley county","granite","granite county","hill","hill county","jefferson","jefferson county","judith basin","judith basin county","lake","lake county","lewis and clark","lewis and clark county","liberty","liberty county","lincoln","lincoln county","madison","madison county","mccone","mccone county","meagher","meagher county","mineral","mineral county","missoula","missoula county","musselshell","musselshell county","park","park county","petroleum","petroleum county","phillips","phillips county","pondera","pondera county","powder river","powder river county","powell","powell county","prairie","prairie county","ravalli","ravalli county","richland","richland county","roosevelt","roosevelt county","rosebud","rosebud county","sanders","sanders county","sheridan","sheridan county","silver bow","silver bow county","stillwater","stillwater county","sweet grass","sweet grass county","teton","teton county","toole","toole county","treasure","treasure county","valley","valley county","wheatland","wheatland county","wibaux","wibaux county","yellowstone","yellowstone county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADcANwA=";
+export const PRICE_BAND_TOTALS: string[] = ["BwnACLUI+wj/COoIhgjCCMEIpgjZCF0IWQilCLkIXwjACEoIwggDCQMJ9gjhCPcIAwmKCKIIUAi1CIoI6QilCIYI5ggHCf8I3wjhCOkIxghQCLkIAQnLCF4Ilwi1CJMIwQjBCOkIBAnvCPEIYwjhCA==","/Am1CaoJ8An0Cd8Jewm3CbYJmwnOCVIJTgmaCa4JVAm1CToJtwn4CfgJ6wnWCewJ+Al/CZcJQAmqCX8J3gmaCXsJ2wn8CfQJ1AnWCd4JuwlACa4J9gnACVMJjAmqCYgJtgm2Cd4J+QnkCeYJWAnWCQ==","8QqqCp8K5QrpCtQKcAqsCqsKkArDCkcKQwqPCqMKSQqqCioKrArtCu0K4ArLCuEK7Qp0CowKMAqfCnQK0wqPCnAK0ArxCukKyQrLCtMKsAowCqMK6wq1CkgKgQqfCn0KqwqrCtMK7grZCtsKTQrLCg==","5gufC5QL2gveC8kLZQuhC6ALhQu4CzwLOAuEC5gLPgufCxoLoQviC+IL1QvAC9YL4gtpC4ELIAuUC2kLyAuEC2ULxQvmC94LvgvAC8gLpQsgC5gL4AuqCz0LdguUC3ILoAugC8gL4wvOC9ALQgvACw==","2wyUDIkMzwzTDL4MWgyWDJUMegytDDEMLQx5DI0MMwyUDAoMlgzXDNcMygy1DMsM1wxeDHYMEAyJDF4MvQx5DFoMugzbDNMMswy1DL0MmgwQDI0M1QyfDDIMawyJDGcMlQyVDL0M2AzDDMUMNwy1DA==","0A2JDX4NxA3IDbMNTw2LDYoNbw2iDSYNIg1uDYINKA2JDfoMiw3MDcwNvw2qDcANzA1TDWsNAA1+DVMNsg1uDU8Nrw3QDcgNqA2qDbINjw0ADYINyg2UDScNYA1+DVwNig2KDbINzQ24DboNLA2qDQ==","ug9zD2gPrg+yD50POQ91D3QPWQ+MDxAPDA9YD2wPEg9zD9oOdQ+2D7YPqQ+UD6oPtg89D1UP4A5oDz0PnA9YDzkPmQ+6D7IPkg+UD5wPeQ/gDmwPtA9+DxEPSg9oD0YPdA90D5wPtw+iD6QPFg+UDw==","pBFdEVIRmBGcEYcRIxFfEV4RQxF2EfoQ9hBCEVYR/BBdEboQXxGgEaARkxF+EZQRoBEnET8RwBBSEScRhhFCESMRgxGkEZwRfBF+EYYRYxHAEFYRnhFoEfsQNBFSETARXhFeEYYRoRGMEY4RABF+EQ==","bRYmFhsWYRZlFlAW7BUoFicWDBY/FsMVvxULFh8WxRUmFmoVKBZpFmkWXBZHFl0WaRbwFQgWcBUbFvAVTxYLFuwVTBZtFmUWRRZHFk8WLBZwFR8WZxYxFsQV/RUbFvkVJxYnFk8WahZVFlcWyRVHFg==","NhvvGuQaKhsuGxkbtRrxGvAa1RoIG4waiBrUGugajhrvGhoa8RoyGzIbJRsQGyYbMhu5GtEaIBrkGrkaGBvUGrUaFRs2Gy4bDhsQGxgb9RogGugaMBv6Go0axhrkGsIa8BrwGhgbMxseGyAbkhoQGw==","yCSBJHYkvCTAJKskRySDJIIkZySaJB4kGiRmJHokICSBJHojgyTEJMQktySiJLgkxCRLJGMkgCN2JEskqiRmJEckpyTIJMAkoCSiJKokhySAI3okwiSMJB8kWCR2JFQkgiSCJKokxSSwJLIkJCSiJA==","Wi4TLgguTi5SLj0u2S0VLhQu+S0sLrAtrC34LQwusi0TLtosFS5WLlYuSS40LkouVi7dLfUt4CwILt0tPC74LdktOS5aLlIuMi40LjwuGS7gLAwuVC4eLrEt6i0ILuYtFC4ULjwuVy5CLkQuti00Lg=="];
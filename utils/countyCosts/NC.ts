@@ -0,0 +1,7 @@
+// NORTH CAROLINA (NC) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Alamance County","Alexander County","Alleghany County","Anson County","Ashe County","Avery County","Beaufort County","Bertie County","Bladen County","Brunswick County","Buncombe County","Burke County","Cabarrus County","Caldwell County","Camden County","Carteret County","Caswell County","Catawba County","Chatham County","Cherokee County","Chowan County","Clay County","Cleveland County","Columbus County","Craven County","Cumberland County","Currituck County","Dare County","Davidson County","Davie County","Duplin County","Durham County","Edgecombe County","Forsyth County","Franklin County","Gaston County","Gates County","Graham County","Granville County","Greene County","Guilford County","Halifax County","Harnett County","Haywood County","Henderson County","Hertford County","Hoke County","Hyde County","Iredell County","Jackson County","Johnston County","Jones County","Lee County","Lenoir County","Lincoln County","Macon County","Madison County","Martin County","McDowell County","Mecklenburg County","Mitchell County","Montgomery County","Moore County","Nash County","New Hanover County","Northampton County","Onslow County","Orange County","Pamlico County","Pasquotank County","Pender County","Perquimans County","Person County","Pitt County","Polk County","Randolph County","Richmond County","Robeson County","Rockingham County","Rowan County","Rutherford County","Sampson County","Scotland County","Stanly County","Stokes County","Surry County","Swain County","Transylvania County","Tyrrell County","Union County","Vance County","Wake County","Warren County","Washington County","Watauga County","Wayne County","Wilkes County","Wilson County","Yadkin County","Yancey County"];
+export const COUNTY_COLUMNS: string[] = ["nQGYAYMBnAGHAZ4BdwGFAX0BlAGFAYYBmwF4AXsBfAGaAZYBhQGDAYABiAGFAZQBkgGeAY4BdwGHAYcBhQGUAZMBkAGOAZgBlAGdAX8BmAGQAY4BnQF/AZQBfgGZAXsBmQGQAXsBigF5AYYBiAF5AXgBfQGdAX8BjAF7AX8BggGMAZ0BiAGWAYABngGBAX8BhAGKAXoBhwGCAZQBjgGCAZQBhgGGAYgBmgGWAX4BfQGWAZoBjQF6AY0BeQF3AYYBkAGLAXcBigE=","AQL6AeEBAALmAQIC0QHiAdgB9QHiAeQB/gHTAdYB1wH9AfgB4gHgAd0B5wHiAfUB8wECAu0B0QHmAeUB4wH1AfQB8AHtAfsB9QEBAtsB+wHwAe4BAALbAfUB2gH7AdcB/AHwAdYB6QHUAeQB5gHUAdIB2QEBAtwB6wHWAdwB3wHsAQEC5wH4Ad0BAgLeAdsB4QHpAdUB5QHfAfUB7gHfAfYB5AHkAecB/QH3AdoB2QH4Af0B7AHUAe0B0wHRAeQB8AHqAdEB6QE=","kwGNAXoBkgF9AZMBbgF7AXMBiQF7AXwBkQFvAXEBcgGQAYwBewF5AXYBfgF7AYkBiAGTAYQBbgF9AX0BewGJAYkBhgGEAY4BigGTAXUBjgGGAYQBkgF1AYoBdAGOAXIBjwGGAXEBgAFwAXwBfgFwAW4BdAGTAXYBggFxAXYBeAGCAZMBfgGMAXYBkwF4AXUBegGAAXABfQF4AYoBhAF4AYoBfAF8AX4BkAGLAXQBdAGMAZABgwFwAYMBbwFuAXwBhgGBAW4BgAE=","kgCQAIkAkgCKAJIAhQCJAIcAjwCJAIoAkQCFAIYAhgCRAJAAiQCJAIgAiwCJAI8AjgCSAI0AhQCKAIoAigCPAI8AjQCNAJAAjwCSAIcAkACNAI0AkgCHAI8AhwCRAIYAkQCNAIYAiwCFAIoAiwCFAIUAhwCSAIgAjACGAIgAiQCMAJIAiwCQAIgAkgCIAIcAiQCLAIYAigCJAI8AjQCIAI8AigCKAIsAkQCPAIcAhwCQAJEAjACFAIwAhQCFAIoAjQCMAIUAiwA=","jwKFAmUCjQJsAo8CUgJnAlsCfwJnAmkCiwJUAlgCWQKJAoMCZwJkAmACbQJnAn8CfQKPAnYCUgJsAmoCaAJ/An4CeQJ2AoYCgAKOAl4ChgJ5AncCjQJeAoACXQKHAlkCiAJ5AlgCcAJVAmoCbAJVAlMCXAKOAl8CcwJYAl8CYwJ0Ao8CbQKDAmACjwJiAl4CZgJvAlYCawJjAoACdgJjAoACagJpAm0CigKCAl0CXAKDAokCdAJWAnUCVAJSAmoCeQJyAlICcAI=","OgA6ADkAOgA6ADoAOQA5ADkAOgA5ADkAOgA5ADkAOQA6ADoAOQA5ADkAOgA5ADoAOgA6ADoAOQA6ADkAOQA6ADoAOgA6ADoAOgA6ADkAOgA6ADoAOgA5ADoAOQA6ADkAOgA6ADkAOgA5ADkAOgA5ADkAOQA6ADkAOgA5ADkAOQA6ADoAOgA6ADkAOgA5ADkAOQA6ADkAOQA5ADoAOgA5ADoAOQA5ADoAOgA6ADkAOQA6ADoAOgA5ADoAOQA5ADkAOgA6ADkAOgA=","ogCgAJgAoQCZAKIAkwCYAJUAngCYAJkAoQCTAJQAlQChAJ8AmACXAJYAmgCYAJ4AngCiAJwAkwCZAJkAmACeAJ4AnQCcAKAAngCiAJYAoACdAJwAogCWAJ4AlgCgAJUAoACdAJQAmgCUAJkAmQCUAJMAlQCiAJYAmwCUAJYAlwCbAKIAmgCfAJYAogCXAJYAmACaAJQAmQCXAJ4AnACXAJ4AmQCZAJoAoQCfAJYAlQCfAKEAmwCUAJwAlACTAJkAnQCbAJMAmgA=","MAAvAC0AMAAtADAAKwAtACwALwAtAC0ALwArACwALAAvAC8ALQAtACwALQAtAC8ALgAwAC4AKwAtAC0ALQAvAC8ALgAuAC8ALwAwACwALwAuAC4AMAAsAC8ALAAvACwALwAuACwALQArAC0ALQArACsALAAwACwALgAsACwALQAuADAALQAvACwAMAAsACwALQAtACwALQAtAC8ALgAsAC8ALQAtAC0ALwAvACwALAAvAC8ALgAsAC4AKwArAC0ALgAuACsALQA=","GQAYABcAGQAXABkAFgAXABcAGAAXABcAGQAWABcAFwAYABgAFwAXABcAFwAXABgAGAAZABgAFgAXABcAFwAYABgAGAAYABgAGAAZABcAGAAYABgAGQAXABgAFwAYABcAGAAYABcAFwAWABcAFwAWABYAFwAZABcAGAAXABcAFwAYABkAFwAYABcAGQAXABcAFwAXABYAFwAXABgAGAAXABgAFwAXABcAGAAYABcAFwAYABgAGAAWABgAFgAWABcAGAAYABYAFwA="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBXAFkAWwBdAF8AYQBjAGUAZwBpAGsAbQBxAHMAdQBvAHcAeQB7AH0AfwCBAIMAhQCHAIkAiwCNAI8AkQCTAJUAlwCZAJsAnQCfAKEAowClAKcAqQCrAK0ArwCxALMAtQC3ALkAuwC9AL8AwQDDAMUAxwA=";
+export const ALIAS_KEYS: string[] = ["alamance","alamance county","alexander","alexander county","alleghany","alleghany county","anson","anson county","ashe","ashe county","avery","avery county","beaufort","beaufort county","bertie","bertie county","bladen","bladen county","brunswick","brunswick county","buncombe","buncombe county","burke","burke county","cabarrus","cabarrus county","caldwell","caldwell county","camden","camden county","carteret","carteret county","caswell","caswell county","catawba","catawba county","chatham","chatham county","cherokee","cherokee county","chowan","chowan county","clay","clay county","cleveland","cleveland county","columbus","columbus county","craven","craven county","cumberland","cumberland county","currituck","currituck county","dare","dare county","davidson","davidson county","davie","davie county","duplin","duplin county","durham","durham county","edgecombe","edgecombe county","forsyth","forsyth county","franklin","franklin county","gaston","gaston county","gates","gates county","graham","graham county","granville","granville county","greene","greene county","guilford","guilford county","halifax","halifax county","harnett","harnett county","haywood","haywood county","henderson","henderson county","hertford","hertford county","hoke","hoke county","hyde","hyde county","iredell","iredell county","jackson","jackson county","johnston","johnston county","jones","jones county","lee","lee county","lenoir","lenoir county","lincoln","lincoln county","macon","macon county","madison","madison county","martin","martin county","mcdowell","mcdowell county","mecklenburg","mecklenburg county","mitchell","mitchell county","montgomery","montgomery county","moore","moore county","nash","nash county","new hanover","new hanover county","northampton","northampton county","onslow","onslow county","orange","orange county","pamlico","pamlico county","pasquotank","pasquotank county","pender","pender county","perquimans","perquimans county","person","person county","pitt","pitt county","polk","polk county","randolph","randolph county","richmond","richmond county","robeson","robeson county","rockingham","rockingham county","rowan","rowan county","rutherford","rutherford county","sampson","sampson county","scotland","scotland county","stanly","stanly county","stokes","stokes county","surry","surry county","swain","swain county","transylvania","transylvania county","tyrrell","tyrrell county","union","union county","vance","vance county","wake","wake county","warren","warren county","washington","washington county","watauga","watauga county","wayne","wayne county","wilkes","wilkes county","wilson","wilson county","yadkin","yadkin county","yancey","yancey county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5ADoAOgA7ADsAPAA8AD0APQA+AD4APwA/AEAAQABBAEEAQgBCAEMAQwBEAEQARQBFAEYARgBHAEcASABIAEkASQBKAEoASwBLAEwATABNAE0ATgBOAE8ATwBQAFAAUQBRAFIAUgBTAFMAVABUAFUAVQBWAFYAVwBXAFgAWABZAFkAWgBaAFsAWwBcAFwAXQBdAF4AXgBfAF8AYABgAGEAYQBiAGIAYwBjAA==";
+export const PRICE_BAND_TOTALS: string[] = ["Xwo9CsUJWQrfCWEKfgnLCZ8JJwrLCdMJUQqECZQJmQlLCjUKywnBCbEJ5QnLCScKHgphCgYKfgnfCdcJzgknCiQKEQoGCkAKKQpeCqoJQAoRCggKWwqqCSkKpglDCpgJRgoRCpQJ7gmJCdQJ4gmJCYEJogleCq4J+wmUCa4JvQn9CV8K5Qk1CrEJYQq4CaoJxwntCY4J2Am9CSkKBwq7CSoK1AnTCeUJTAoxCqYJogk1CksK/wmMCQIKhgl+CdQJEQr3CX4J7gk=","gQtfC+IKewsBC4MLmwroCrwKSQvoCvAKcwuhCrEKtgptC1cL6AreCs4KBwvoCkkLQAuDCygLmwoBC/QK6wpJC0YLMwsoC2ILSwuAC8cKYgszCyoLfQvHCksLwwplC7UKaAszC7EKEAumCvEKBAumCp4KvwqAC8sKHQuxCssK2gofC4ELBwtXC84KgwvVCscK5AoPC6sK9QraCksLKQvYCkwL8QrwCgcLbgtTC8MKvwpXC20LIQupCiQLowqbCvEKMwsZC5sKEAs=","owyBDP8LnQwjDKUMuAsFDNkLawwFDA0MlQy+C84L0wuPDHkMBQz7C+sLKQwFDGsMYgylDEoMuAsjDBEMCAxrDGgMVQxKDIQMbQyiDOQLhAxVDEwMnwzkC20M4AuHDNILigxVDM4LMgzDCw4MJgzDC7sL3AuiDOgLPwzOC+gL9wtBDKMMKQx5DOsLpQzyC+QLAQwxDMgLEgz3C20MSwz1C24MDgwNDCkMkAx1DOAL3At5DI8MQwzGC0YMwAu4Cw4MVQw7DLgLMgw=","xQ2jDRwNvw1FDccN1QwiDfYMjQ0iDSoNtw3bDOsM8AyxDZsNIg0YDQgNSw0iDY0NhA3HDWwN1QxFDS4NJQ2NDYoNdw1sDaYNjw3EDQENpg13DW4NwQ0BDY8N/QypDe8MrA13DesMVA3gDCsNSA3gDNgM+QzEDQUNYQ3rDAUNFA1jDcUNSw2bDQgNxw0PDQENHg1TDeUMLw0UDY8NbQ0SDZANKw0qDUsNsg2XDf0M+QybDbENZQ3jDGgN3QzVDCsNdw1dDdUMVA0=","5w7FDjkO4Q5nDukO8g0/DhMOrw4/DkcO2Q74DQgODQ7TDr0OPw41DiUObQ4/Dq8Opg7pDo4O8g1nDksOQg6vDqwOmQ6ODsgOsQ7mDh4OyA6ZDpAO4w4eDrEOGg7LDgwOzg6ZDggOdg79DUgOag79DfUNFg7mDiIOgw4IDiIOMQ6FDucObQ69DiUO6Q4sDh4OOw51DgIOTA4xDrEOjw4vDrIOSA5HDm0O1A65DhoOFg69DtMOhw4ADooO+g3yDUgOmQ5/DvINdg4=","CRDnD1YPAxCJDwsQDw9cDzAP0Q9cD2QP+w8VDyUPKg/1D98PXA9SD0IPjw9cD9EPyA8LELAPDw+JD2gPXw/RD84Puw+wD+oP0w8IEDsP6g+7D7IPBRA7D9MPNw/tDykP8A+7DyUPmA8aD2UPjA8aDxIPMw8IED8PpQ8lDz8PTg+nDwkQjw/fD0IPCxBJDzsPWA+XDx8PaQ9OD9MPsQ9MD9QPZQ9kD48P9g/bDzcPMw/fD/UPqQ8dD6wPFw8PD2UPuw+hDw8PmA8=","TRIrEpARRxLNEU8SSRGWEWoRFRKWEZ4RPxJPEV8RZBE5EiMSlhGMEXwR0xGWERUSDBJPEvQRSRHNEaIRmREVEhIS/xH0ES4SFxJMEnURLhL/EfYRSRJ1ERcScRExEmMRNBL/EV8R3BFUEZ8R0BFUEUwRbRFMEnkR6RFfEXkRiBHrEU0S0xEjEnwRTxKDEXURkhHbEVkRoxGIERcS9RGGERgSnxGeEdMROhIfEnERbREjEjkS7RFXEfARURFJEZ8R/xHlEUkR3BE=","kRRvFMoTixQRFJMUgxPQE6QTWRTQE9gTgxSJE5kTnhN9FGcU0BPGE7YTFxTQE1kUUBSTFDgUgxMRFNwT0xNZFFYUQxQ4FHIUWxSQFK8TchRDFDoUjRSvE1sUqxN1FJ0TeBRDFJkTIBSOE9kTFBSOE4YTpxOQFLMTLRSZE7MTwhMvFJEUFxRnFLYTkxS9E68TzBMfFJMT3RPCE1sUORTAE1wU2RPYExcUfhRjFKsTpxNnFH0UMRSREzQUixODE9kTQxQpFIMTIBQ=","OxoZGlsZNRq7GT0aFBlhGTUZAxphGWkZLRoaGSoZLxknGhEaYRlXGUcZwRlhGQMa+hk9GuIZFBm7GW0ZZBkDGgAa7RniGRwaBRo6GkAZHBrtGeQZNxpAGQUaPBkfGi4ZIhrtGSoZyhkfGWoZvhkfGRcZOBk6GkQZ1xkqGUQZUxnZGTsawRkRGkcZPRpOGUAZXRnJGSQZbhlTGQUa4xlRGQYaahlpGcEZKBoNGjwZOBkRGica2xkiGd4ZHBkUGWoZ7RnTGRQZyhk=","5R/DH+we3x9lH+cfpR7yHsYerR/yHvoe1x+rHrsewB7RH7sf8h7oHtgeax/yHq0fpB/nH4wfpR5lH/4e9R6tH6oflx+MH8Yfrx/kH9Eexh+XH44f4R/RHq8fzR7JH78ezB+XH7sedB+wHvseaB+wHqgeyR7kH9UegR+7HtUe5B6DH+Ufax+7H9ge5x/fHtEe7h5zH7Ue/x7kHq8fjR/iHrAf+x76Hmsf0h+3H80eyR67H9EfhR+zHogfrR6lHvselx99H6UedB8=","OSsXKw4qMyu5KjsrxykUKugpASsUKhwqKyvNKd0p4iklKw8rFCoKKvopvyoUKgEr+Co7K+Aqxym5KiAqFyoBK/4q6yrgKhorAys4K/MpGivrKuIqNSvzKQMr7ykdK+EpICvrKt0pyCrSKR0qvCrSKcop6yk4K/cp1SrdKfcpBirXKjkrvyoPK/opOysBKvMpECrHKtcpISoGKgMr4SoEKgQrHSocKr8qJisLK+8p6ykPKyUr2SrVKdwqzynHKR0q6yrRKscpyCo=","jTZrNjA1hzYNNo826TQ2NQo1VTY2NT41fzbvNP80BDV5NmM2NjUsNRw1EzY2NVU2TDaPNjQ26TQNNkI1OTVVNlI2PzY0Nm42VzaMNhU1bjY/NjY2iTYVNVc2ETVxNgM1dDY/Nv80HDb0ND81EDb0NOw0DTWMNhk1KTb/NBk1KDUrNo02EzZjNhw1jzYjNRU1MjUbNvk0QzUoNVc2NTYmNVg2PzU+NRM2ejZfNhE1DTVjNnk2LTb3NDA28TTpND81PzYlNuk0HDY="];
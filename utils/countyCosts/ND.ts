@@ -0,0 +1,7 @@
+// NORTH DAKOTA (ND) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Adams County","Barnes County","Benson County","Billings County","Bottineau County","Bowman County","Burke County","Burleigh County","Cass County","Cavalier County","Dickey County","Divide County","Dunn County","Eddy County","Emmons County","Foster County","Golden Valley County","Grand Forks County","Grant County","Griggs County","Hettinger County","Kidder County","LaMoure County","Logan County","McHenry County","McIntosh County","McKenzie County","McLean County","Mercer County","Morton County","Mountrail County","Nelson County","Oliver County","Pembina County","Pierce County","Ramsey County","Ransom County","Renville County","Richland County","Rolette County","Sargent County","Sheridan County","Sioux County","Slope County","Stark County","Steele County","Stutsman County","Towner County","Traill County","Walsh County","Ward County","Wells County","Williams County"];
+export const COUNTY_COLUMNS: string[] = ["IAEsASEBMwEaASoBIwEvASEBGAEZARsBKgEuASIBGwEpATABMwE0ARwBMgEwATMBIwErATMBLAEuASIBJQEsATUBLwExAR0BNQEgASgBKQEiASMBHwEyASkBMQExATUBLAEnASkBMwEfAQ==","bgF+AW8BhgFmAXsBcgGBAXABZQFmAWgBewGAAXEBaAF6AYMBhgGIAWkBhQGCAYcBcgF8AYcBfQGAAXEBdQF+AYkBgQGDAWsBiQFuAXgBeQFxAXIBbAGGAXoBhAGEAYkBfQF3AXoBhwFtAQ==","GwEnARwBLgEVASUBHgEqARwBFAEUARYBJQEoAR0BFgEkASsBLQEvARcBLQEqAS4BHgEmAS4BJgEpAR0BIAEnATABKgErARkBLwEbASMBJAEdAR4BGgEtASQBLAEsAS8BJgEiASQBLgEaAQ==","YQBlAGIAaABfAGUAYgBmAGIAXwBfAGAAZQBmAGIAYABkAGcAaABoAGAAZwBnAGgAYgBlAGgAZQBmAGIAYwBlAGgAZgBnAGAAaABhAGQAZABiAGIAYQBoAGQAZwBnAGgAZQBkAGQAaABhAA==","nwGxAaABugGWAa4BowG1AaEBlAGVAZgBrgGzAaMBmAGsAbYBugG8AZkBuQG2AbsBpAGuAbsBsAG0AaIBpwGxAb0BtQG3AZsBvQGfAaoBqwGjAaMBnQG6AawBuAG3Ab0BsAGpAawBuwGeAQ==","KwArACsALAArACsAKwArACsAKwArACsAKwArACsAKwArACsALAAsACsALAArACwAKwArACwAKwArACsAKwArACwAKwAsACsALAArACsAKwArACsAKwAsACsALAAsACwAKwArACsALAArAA==","ZgBqAGcAbQBkAGoAZwBsAGcAYwBkAGQAagBrAGcAZABpAGwAbQBtAGUAbQBsAG0AZwBqAG0AagBrAGcAaABqAG4AbABsAGUAbgBmAGkAaQBnAGcAZgBtAGkAbABsAG4AagBpAGkAbQBmAA==","IwAkACMAJQAiACQAIwAlACMAIgAiACIAJAAkACMAIgAkACUAJQAlACIAJQAlACUAIwAkACUAJAAkACMAIwAkACUAJQAlACIAJQAjACQAJAAjACMAIwAlACQAJQAlACUAJAAkACQAJQAjAA==","DgAPAA4ADwAOAA8ADgAPAA4ADgAOAA4ADwAPAA4ADgAPAA8ADwAPAA4ADwAPAA8ADgAPAA8ADwAPAA4ADgAPAA8ADwAPAA4ADwAOAA8ADwAOAA4ADgAPAA8ADwAPAA8ADwAPAA8ADwAOAA=="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBXAFkAWwBdAF8AYQBjAGUAZwBpAA==";
+export const ALIAS_KEYS: string[] = ["adams","adams county","barnes","barnes county","benson","benson county","billings","billings county","bottineau","bottineau county","bowman","bowman county","burke","burke county","burleigh","burleigh county","cass","cass county","cavalier","cavalier county","dickey","dickey county","divide","divide county","dunn","dunn county","eddy","eddy county","emmons","emmons county","foster","foster county","golden valley","golden valley county","grand forks","grand forks county","grant","grant county","griggs","griggs county","hettinger","hettinger county","kidder","kidder county","lamoure","lamoure county","logan","logan county","mchenry","mchenry county","mcintosh","mcintosh county","mckenzie","mckenzie county","mclean","mclean county","mercer","mercer county","morton","morton county","mountrail","mountrail county","nelson","nelson county","oliver","oliver county","pembina","pembina county","pierce","pierce county","ramsey","ramsey county","ransom","ransom county","renville","renville county","richland","richland county","rolette","rolette county","sargent","sargent county","sheridan","sheridan county","sioux","sioux county","slope","slope county","stark","stark county","steele","steele county","stutsman","stutsman county","towner","towner county","traill","traill county","walsh","walsh county","ward","ward county","wells","wells county","williams","williams county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA=";
+export const PRICE_BAND_TOTALS: string[] = ["FwdbBx0Hhgf1BlEHJwdsBx8H7gbyBvwGUQdkByQH/AZKB3IHhQeMBwEHgQdwB4gHKAdUB4gHWAdmByMHNAdbB5EHbAd5BwgHkAcXB0QHSAckBycHEQeEB0oHfAd7B5AHWAdAB0oHiAcTBw==","7gcyCPQHYgjMBygI/gdDCPYHxQfJB9MHKAg7CPsH0wchCEkIYQhoCNgHXQhHCGQI/wcrCGQILwg9CPoHCwgyCG0IQwhVCN8HbAjuBxsIHwj7B/4H6AdgCCEIWAhXCGwILwgXCCEIZAjqBw==","xQgJCcsIPgmjCP8I1QgaCc0InAigCKoI/wgSCdIIqgj4CCAJPQlECa8IOQkeCUAJ1ggCCUAJBgkUCdEI4ggJCUkJGgkxCbYISAnFCPII9gjSCNUIvwg8CfgINAkzCUgJBgnuCPgIQAnBCA==","nAngCaIJGgp6CdYJrAnxCaQJcwl3CYEJ1gnpCakJgQnPCfcJGQogCoYJFQr1CRwKrQnZCRwK3QnrCagJuQngCSUK8QkNCo0JJAqcCckJzQmpCawJlgkYCs8JEAoPCiQK3QnFCc8JHAqYCQ==","cwq3CnkK9gpRCq0KgwrICnsKSgpOClgKrQrACoAKWAqmCs4K9Qr8Cl0K8QrMCvgKhAqwCvgKtArCCn8KkAq3CgELyArpCmQKAAtzCqAKpAqACoMKbQr0CqYK7ArrCgALtAqcCqYK+ApvCg==","SguOC1AL0gsoC4QLWgufC1ILIQslCy8LhAuXC1cLLwt9C6UL0QvYCzQLzQujC9QLWwuHC9QLiwuZC1YLZwuOC90LnwvFCzsL3AtKC3cLewtXC1oLRAvQC30LyAvHC9wLiwtzC30L1AtGCw==","+Aw8Df4Mig3WDDINCA1NDQANzwzTDN0MMg1FDQUN3QwrDVMNiQ2QDeIMhQ1RDYwNCQ01DYwNOQ1HDQQNFQ08DZUNTQ19DekMlA34DCUNKQ0FDQgN8gyIDSsNgA1/DZQNOQ0hDSsNjA30DA==","pg7qDqwOQg+EDuAOtg77Dq4OfQ6BDosO4A7zDrMOiw7ZDgEPQQ9ID5AOPQ//DkQPtw7jDkQP5w71DrIOww7qDk0P+w41D5cOTA+mDtMO1w6zDrYOoA5AD9kOOA83D0wP5w7PDtkORA+iDg==","2RIdE98SjhO3EhMT6RIuE+ESsBK0Er4SExMmE+YSvhIMEzQTjROUE8MSiRMyE5AT6hIWE5ATGhMoE+US9hIdE5kTLhOBE8oSmBPZEgYTChPmEukS0xKMEwwThBODE5gTGhMCEwwTkBPVEg==","DBdQFxIX2hfqFkYXHBdhFxQX4xbnFvEWRhdZFxkX8RY/F2cX2RfgF/YW1RdlF9wXHRdJF9wXTRdbFxgXKRdQF+UXYRfNF/0W5BcMFzkXPRcZFxwXBhfYFz8X0BfPF+QXTRc1Fz8X3BcIFw==","ch+2H3gfciBQH6wfgh/HH3ofSR9NH1cfrB+/H38fVx+lH80fcSB4IFwfbSDLH3Qggx+vH3Qgsx/BH34fjx+2H30gxx9lIGMffCByH58fox9/H4IfbB9wIKUfaCBnIHwgsx+bH6UfdCBuHw==","2CccKN4nCim2JxIo6CctKOAnryezJ70nEiglKOUnvScLKDMoCSkQKcInBSkxKAwp6ScVKAwpGSgnKOQn9SccKBUpLSj9KMknFCnYJwUoCSjlJ+gn0icIKQsoACn/KBQpGSgBKAsoDCnUJw=="];
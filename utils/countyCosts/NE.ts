@@ -0,0 +1,7 @@
+// NEBRASKA (NE) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Adams County","Antelope County","Arthur County","Banner County","Blaine County","Boone County","Box Butte County","Boyd County","Brown County","Buffalo County","Burt County","Butler County","Cass County","Cedar County","Chase County","Cherry County","Cheyenne County","Clay County","Colfax County","Cuming County","Custer County","Dakota County","Dawes County","Dawson County","Deuel County","Dixon County","Dodge County","Douglas County","Dundy County","Fillmore County","Franklin County","Frontier County","Furnas County","Gage County","Garden County","Garfield County","Gosper County","Grant County","Greeley County","Hall County","Hamilton County","Harlan County","Hayes County","Hitchcock County","Holt County","Hooker County","Howard County","Jefferson County","Johnson County","Kearney County","Keith County","Keya Paha County","Kimball County","Knox County","Lancaster County","Lincoln County","Logan County","Loup County","Madison County","McPherson County","Merrick County","Morrill County","Nance County","Nemaha County","Nuckolls County","Otoe County","Pawnee County","Perkins County","Phelps County","Pierce County","Platte County","Polk County","Red Willow County","Richardson County","Rock County","Saline County","Sarpy County","Saunders County","Scotts Bluff County","Seward County","Sheridan County","Sherman County","Sioux County","Stanton County","Thayer County","Thomas County","Thurston County","Valley County","Washington County","Wayne County","Webster County","Wheeler County","York County"];
+export const COUNTY_COLUMNS: string[] = ["NAEyATMBLwE7AUgBLgFBATkBPwE3AUIBNQEtATMBPAEtATkBMgFHAT0BNAE2AUEBNQE/AUYBNAEtAUgBPQE/ATYBLAFJAT0BLAFHATABNAE2AUABPgE/AUcBQQE6AUYBQAE6ATsBMgE9AUMBMwE4AUgBRQEsAUoBRQEyASsBSgFKAUkBPQEsAUkBRQE6AS0BMAEvAUgBRwFBAUABOgFKATYBPwEyATIBNwEuAUgBRAEsATcBNQE8ATYB","ggGAAYEBewGLAZsBewGTAYgBkAGGAZQBgwF6AYEBjAF5AYgBgAGaAY4BgwGFAZIBgwGQAZoBggF6AZwBjgGQAYUBeAGdAY0BeAGbAX0BgwGFAZIBjwGQAZoBkgGJAZgBkgGKAYwBgAGOAZUBgQGIAZsBmAF4AZ0BlwF/AXgBnQGeAZ0BjgF4AZ0BmAGKAXoBfQF9AZwBmwGTAZEBigGdAYUBkAGAAX8BhgF7AZwBlwF5AYYBgwGMAYUB","LwEtAS4BKgE2AUMBKQE8ATQBOgEyAT0BMAEoAS4BNwEoATQBLQFCATgBLwExATwBMAE6AUEBLwEoAUMBOAE6ATEBJwFEATgBJwFCASsBLwExATsBOQE6AUIBPAE1AUABOwE1ATYBLQE4AT4BLgEzAUMBQAEnAUQBPwEtAScBRAFFAUQBOAEnAUQBQAE1ASgBKwErAUMBQgE8ATsBNQFEATEBOgEtAS0BMgEpAUMBPwEoATIBMAE3ATEB","cABwAHAAbgBzAHcAbgB1AHIAdABxAHUAcABuAHAAcwBtAHIAcAB3AHMAcABxAHUAcAB0AHcAcABuAHgAcwB0AHEAbQB4AHMAbQB3AG8AcABxAHUAdAB0AHcAdQByAHcAdQByAHMAbwB0AHUAcAByAHcAdgBtAHgAdgBvAG0AeAB4AHgAcwBtAHgAdgByAG4AbwBuAHgAdwB1AHQAcgB4AHEAdABvAG8AcQBuAHgAdgBtAHEAcABzAHEA","6QHnAegB4QH1AQkC4AH/AfEB+wHuAQAC6wHfAegB9gHeAfEB5wEIAvgB6gHtAf4B6gH7AQcC6QHeAQoC+AH6AewB3AELAvcB3AEIAuMB6gHsAf0B+QH7AQgC/gHyAQUC/QHzAfUB5gH4AQEC5wHwAQkCBQLcAQwCBALmAdwBDAIMAgsC+AHdAQsCBQLzAd8B4wHiAQoCCAL/AfwB8wEMAu0B+gHmAeYB7gHgAQoCAwLdAe4B6gH2Ae0B","MAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAA","dQB0AHUAcwB4AH0AcwB6AHcAeQB2AHoAdQByAHUAeAByAHcAdAB8AHgAdQB2AHoAdQB5AHwAdQByAH0AeAB5AHYAcgB9AHgAcgB8AHMAdQB2AHoAeQB5AHwAegB3AHwAegB3AHgAdAB5AHsAdQB3AH0AfAByAH0AewB0AHIAfQB9AH0AeAByAH0AfAB3AHIAdABzAH0AfAB6AHoAdwB9AHYAeQB0AHQAdgBzAH0AewByAHYAdQB4AHYA","JQAlACUAJAAmACcAJAAmACUAJgAlACYAJQAkACUAJgAkACUAJQAnACYAJQAlACYAJQAmACcAJQAkACcAJgAmACUAJAAnACYAJAAnACQAJQAlACYAJgAmACcAJgAlACcAJgAlACYAJAAmACYAJQAlACcAJwAkACcAJwAkACQAJwAnACcAJgAkACcAJwAlACQAJAAkACcAJwAmACYAJQAnACUAJgAkACQAJQAkACcAJwAkACUAJQAmACUA","EQARABEAEQASABIAEQASABEAEgARABIAEQARABEAEgARABEAEQASABIAEQARABIAEQASABIAEQARABIAEgASABEAEQASABIAEQASABEAEQARABIAEgASABIAEgARABIAEgARABIAEQASABIAEQARABIAEgARABIAEgARABEAEgASABIAEgARABIAEgARABEAEQARABIAEgASABIAEQASABEAEgARABEAEQARABIAEgARABEAEQASABEA"];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBXAFkAWwBdAF8AYQBjAGUAZwBpAGsAbQBvAHEAcwB3AHUAeQB7AH0AfwCBAIMAhQCHAIkAiwCNAI8AkQCTAJUAlwCZAJsAnQCfAKEAowClAKcAqQCrAK0ArwCxALMAtQC3ALkA";
+export const ALIAS_KEYS: string[] = ["adams","adams county","antelope","antelope county","arthur","arthur county","banner","banner county","blaine","blaine county","boone","boone county","box butte","box butte county","boyd","boyd county","brown","brown county","buffalo","buffalo county","burt","burt county","butler","butler county","cass","cass county","cedar","cedar county","chase","chase county","cherry","cherry county","cheyenne","cheyenne county","clay","clay county","colfax","colfax county","cuming","cuming county","custer","custer county","dakota","dakota county","dawes","dawes county","dawson","dawson county","deuel","deuel county","dixon","dixon county","dodge","dodge county","douglas","douglas county","dundy","dundy county","fillmore","fillmore county","franklin","franklin county","frontier","frontier county","furnas","furnas county","gage","gage county","garden","garden county","garfield","garfield county","gosper","gosper county","grant","grant county","greeley","greeley county","hall","hall county","hamilton","hamilton county","harlan","harlan county","hayes","hayes county","hitchcock","hitchcock county","holt","holt county","hooker","hooker county","howard","howard county","jefferson","jefferson county","johnson","johnson county","kearney","kearney county","keith","keith county","keya paha","keya paha county","kimball","kimball county","knox","knox county","lancaster","lancaster county","lincoln","lincoln county","logan","logan county","loup","loup county","madison","madison county","mcpherson","mcpherson county","merrick","merrick county","morrill","morrill county","nance","nance county","nemaha","nemaha county","nuckolls","nuckolls county","otoe","otoe county","pawnee","pawnee county","perkins","perkins county","phelps","phelps county","pierce","pierce county","platte","platte county","polk","polk county","red willow","red willow county","richardson","richardson county","rock","rock county","saline","saline county","sarpy","sarpy county","saunders","saunders county","scotts bluff","scotts bluff county","seward","seward county","sheridan","sheridan county","sherman","sherman county","sioux","sioux county","stanton","stanton county","thayer","thayer county","thomas","thomas county","thurston","thurston county","valley","valley county","washington","washington county","wayne","wayne county","webster","webster county","wheeler","wheeler county","york","york county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5ADoAOgA7ADsAPAA8AD0APQA+AD4APwA/AEAAQABBAEEAQgBCAEMAQwBEAEQARQBFAEYARgBHAEcASABIAEkASQBKAEoASwBLAEwATABNAE0ATgBOAE8ATwBQAFAAUQBRAFIAUgBTAFMAVABUAFUAVQBWAFYAVwBXAFgAWABZAFkAWgBaAFsAWwBcAFwA";
+export const PRICE_BAND_TOTALS: string[] = ["2QfQB9UHuwcECEwIuAcmCPUHGQjqByoI3gezB9UHCAiwB/UH0AdHCA4I2wfmByQI3QcZCEQI2QeyB08IDggYCOUHqwdTCAwIqwdICMIH2wflByEIFAgZCEcIJAj5Bz8IIQj7BwUIzQcQCC8I1AfyB0wIPQirB1UIOQjMB6oHVQhXCFMIDgisB1MIPQj7B7MHwwe/B08ISAgmCB4I+wdVCOYHGAjNB8wH6ge4B08INwiuB+oH3QcICOYH","yQjACMUIqwj0CDwJqAgWCeUICQnaCBoJzgijCMUI+AigCOUIwAg3Cf4IywjWCBQJzQgJCTQJyQiiCD8J/ggICdUImwhDCfwImwg4CbIIywjVCBEJBAkJCTcJFAnpCC8JEQnrCPUIvQgACR8JxAjiCDwJLQmbCEUJKQm8CJoIRQlHCUMJ/gicCEMJLQnrCKMIswivCD8JOAkWCQ4J6whFCdYICAm9CLwI2gioCD8JJwmeCNoIzQj4CNYI","uQmwCbUJmwnkCSwKmAkGCtUJ+QnKCQoKvgmTCbUJ6AmQCdUJsAknCu4JuwnGCQQKvQn5CSQKuQmSCS8K7gn4CcUJiwkzCuwJiwkoCqIJuwnFCQEK9An5CScKBArZCR8KAQrbCeUJrQnwCQ8KtAnSCSwKHQqLCTUKGQqsCYoJNQo3CjMK7gmMCTMKHQrbCZMJowmfCS8KKAoGCv4J2wk1CsYJ+AmtCawJygmYCS8KFwqOCcoJvQnoCcYJ","qQqgCqUKiwrUChwLiAr2CsUK6Qq6CvoKrgqDCqUK2AqACsUKoAoXC94Kqwq2CvQKrQrpChQLqQqCCh8L3groCrUKewojC9wKewoYC5IKqwq1CvEK5ArpChcL9ArJCg8L8QrLCtUKnQrgCv8KpArCChwLDQt7CiULCQucCnoKJQsnCyML3gp8CiMLDQvLCoMKkwqPCh8LGAv2Cu4KywolC7YK6AqdCpwKugqICh8LBwt+CroKrQrYCrYK","mQuQC5ULewvECwwMeAvmC7UL2QuqC+oLngtzC5ULyAtwC7ULkAsHDM4LmwumC+QLnQvZCwQMmQtyCw8MzgvYC6ULawsTDMwLawsIDIILmwulC+EL1AvZCwcM5Au5C/8L4Qu7C8ULjQvQC+8LlAuyCwwM/QtrCxUM+QuMC2oLFQwXDBMMzgtsCxMM/Qu7C3MLgwt/Cw8MCAzmC94LuwsVDKYL2AuNC4wLqgt4Cw8M9wtuC6oLnQvIC6YL","iQyADIUMawy0DPwMaAzWDKUMyQyaDNoMjgxjDIUMuAxgDKUMgAz3DL4MiwyWDNQMjQzJDPQMiQxiDP8MvgzIDJUMWwwDDbwMWwz4DHIMiwyVDNEMxAzJDPcM1AypDO8M0QyrDLUMfQzADN8MhAyiDPwM7QxbDAUN6Qx8DFoMBQ0HDQMNvgxcDAMN7QyrDGMMcwxvDP8M+AzWDM4MqwwFDZYMyAx9DHwMmgxoDP8M5wxeDJoMjQy4DJYM","aQ5gDmUOSw6UDtwOSA62DoUOqQ56DroObg5DDmUOmA5ADoUOYA7XDp4Oaw52DrQObQ6pDtQOaQ5CDt8Ong6oDnUOOw7jDpwOOw7YDlIOaw51DrEOpA6pDtcOtA6JDs8OsQ6LDpUOXQ6gDr8OZA6CDtwOzQ47DuUOyQ5cDjoO5Q7nDuMOng48DuMOzQ6LDkMOUw5PDt8O2A62Dq4Oiw7lDnYOqA5dDlwOeg5IDt8Oxw4+DnoObQ6YDnYO","SRBAEEUQKxB0ELwQKBCWEGUQiRBaEJoQThAjEEUQeBAgEGUQQBC3EH4QSxBWEJQQTRCJELQQSRAiEL8QfhCIEFUQGxDDEHwQGxC4EDIQSxBVEJEQhBCJELcQlBBpEK8QkRBrEHUQPRCAEJ8QRBBiELwQrRAbEMUQqRA8EBoQxRDHEMMQfhAcEMMQrRBrECMQMxAvEL8QuBCWEI4QaxDFEFYQiBA9EDwQWhAoEL8QpxAeEFoQTRB4EFYQ","+RTwFPUU2xQkFWwV2BRGFRUVORUKFUoV/hTTFPUUKBXQFBUV8BRnFS4V+xQGFUQV/RQ5FWQV+RTSFG8VLhU4FQUVyxRzFSwVyxRoFeIU+xQFFUEVNBU5FWcVRBUZFV8VQRUbFSUV7RQwFU8V9BQSFWwVXRXLFHUVWRXsFMoUdRV3FXMVLhXMFHMVXRUbFdMU4xTfFG8VaBVGFT4VGxV1FQYVOBXtFOwUChXYFG8VVxXOFAoV/RQoFQYV","qRmgGaUZixnUGRwaiBn2GcUZ6Rm6GfoZrhmDGaUZ2BmAGcUZoBkXGt4Zqxm2GfQZrRnpGRQaqRmCGR8a3hnoGbUZexkjGtwZexkYGpIZqxm1GfEZ5BnpGRca9BnJGQ8a8RnLGdUZnRngGf8ZpBnCGRwaDRp7GSUaCRqcGXoZJRonGiMa3hl8GSMaDRrLGYMZkxmPGR8aGBr2Ge4ZyxklGrYZ6BmdGZwZuhmIGR8aBxp+GboZrRnYGbYZ","CSMAIwUj6yI0I3wj6CJWIyUjSSMaI1ojDiPjIgUjOCPgIiUjACN3Iz4jCyMWI1QjDSNJI3QjCSPiIn8jPiNIIxUj2yKDIzwj2yJ4I/IiCyMVI1EjRCNJI3cjVCMpI28jUSMrIzUj/SJAI18jBCMiI3wjbSPbIoUjaSP8ItoihSOHI4MjPiPcIoMjbSMrI+Mi8yLvIn8jeCNWI04jKyOFIxYjSCP9IvwiGiPoIn8jZyPeIhojDSM4IxYj","aSxgLGUsSyyULNwsSCy2LIUsqSx6LLosbixDLGUsmCxALIUsYCzXLJ4sayx2LLQsbSypLNQsaSxCLN8sniyoLHUsOyzjLJwsOyzYLFIsayx1LLEspCypLNcstCyJLM8ssSyLLJUsXSygLL8sZCyCLNwszSw7LOUsySxcLDos5SznLOMsniw8LOMszSyLLEMsUyxPLN8s2Cy2LK4siyzlLHYsqCxdLFwseixILN8sxyw+LHosbSyYLHYs"];
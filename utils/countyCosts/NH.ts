@@ -0,0 +1,7 @@
+// NEW HAMPSHIRE (NH) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Belknap County","Carroll County","Cheshire County","Coos County","Grafton County","Hillsborough County","Merrimack County","Rockingham County","Strafford County","Sullivan County"];
+export const COUNTY_COLUMNS: string[] = ["1QHLAboBvQHPAb0BsgHGAcIBwAE=","LgIiAg4CEQInAhECBAIbAhcCFAI=","xgG8AawBrgHAAa4BpAG2AbMBsQE=","pwCjAJ0AngCkAJ4AmgChAKAAnwA=","kQN9A10DYgOGA2EDTQNyA2sDZwM=","PwA/AD4APgA/AD4APgA/AD4APgA=","rACoAKIAowCqAKMAnwCmAKUApAA=","MAAuAC0ALQAvAC0ALAAuAC4ALQA=","GQAYABcAFwAYABcAFwAYABgAFwA="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwA=";
+export const ALIAS_KEYS: string[] = ["belknap","belknap county","carroll","carroll county","cheshire","cheshire county","coos","coos county","grafton","grafton county","hillsborough","hillsborough county","merrimack","merrimack county","rockingham","rockingham county","strafford","strafford county","sullivan","sullivan county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAA==";
+export const PRICE_BAND_TOTALS: string[] = ["MQzyC4oLmQsMDJgLWQvRC7gLqQs=","bA0tDcAMzwxHDc4MjwwMDe4M3ww=","pw5oDvYNBQ6CDgQOxQ1HDiQOFQ4=","4g+jDywPOw+9DzoP+w6CD1oPSw8=","HRHeEGIQcRD4EHAQMRC9EJAQgRA=","WBIZEpgRpxEzEqYRZxH4EcYRtxE=","zhSPFAQUExSpFBIU0xNuFDIUIxQ=","RBcFF3AWfxYfF34WPxbkFp4WjxY=","ax0sHX4cjRxGHYwcTRwLHawcnRw=","kiNTI4wimyJtI5oiWyIyI7oiqyI=","4C+hL6guty67L7Yudy6AL9Yuxy4=","LjzvO8Q60zoJPNI6kzrOO/I64zo="];
@@ -0,0 +1,7 @@
+// NEW JERSEY (NJ) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Atlantic County","Bergen County","Burlington County","Camden County","Cape May County","Cumberland County","Essex County","Gloucester County","Hudson County","Hunterdon County","Mercer County","Middlesex County","Monmouth County","Morris County","Ocean County","Passaic County","Salem County","Somerset County","Sussex County","Union County","Warren County"];
+export const COUNTY_COLUMNS: string[] = ["BgL2ARsC+AH1ASYCGAL7ASYCFAIaAgQCIAIPAiACFQL6AQgCDQIhAhAC","WgJIAnICSgJHAn8CbwJNAn8CawJxAlcCeAJkAnkCbAJMAl0CYgJ5AmYC","HwIOAjQCEAINAkACMgITAkACLgI0AhwCOgIoAjoCLwISAiECJgI7AikC","sQCsALgArACsALwAtwCuALwAtgC4ALAAugC0ALoAtwCtALIAtAC7ALUA","DQTtAzYE8QPrA00EMQT3A0wEKQQ1BAgEQAQeBEEEKwT0AxEEGwRCBCEE","PgA+AD8APgA+AD8APwA+AD8APwA/AD4APwA+AD8APwA+AD4APgA/AD4A","4wDcAOwA3QDbAPEA6wDeAPEA6QDrAOIA7gDmAO4A6QDdAOQA5gDuAOcA","NgA0ADgANAA0ADkAOAA1ADkANwA4ADYAOQA3ADkANwA1ADYANwA5ADcA","HgAdAB8AHQAdACAAHwAdACAAHwAfAB4AIAAfACAAHwAdAB4AHwAgAB8A"];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkA";
+export const ALIAS_KEYS: string[] = ["atlantic","atlantic county","bergen","bergen county","burlington","burlington county","camden","camden county","cape may","cape may county","cumberland","cumberland county","essex","essex county","gloucester","gloucester county","hudson","hudson county","hunterdon","hunterdon county","mercer","mercer county","middlesex","middlesex county","monmouth","monmouth county","morris","morris county","ocean","ocean county","passaic","passaic county","salem","salem county","somerset","somerset county","sussex","sussex county","union","union county","warren","warren county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQA";
+export const PRICE_BAND_TOTALS: string[] = ["qg1IDS0OUw1CDXMOHg5mDXIOBg4pDpsNTg7fDVAODA5eDbcN1g1UDugN","4A5+DmgPiQ54Dq4PWQ+cDq0PQQ9kD9EOiQ8VD4sPRw+UDu0ODA+PDx4P","FhC0D6MQvw+uD+kQlBDSD+gQfBCfEAcQxBBLEMYQghDKDyMQQhDKEFQQ","TBHqEN4R9RDkECQSzxEIESMStxHaET0R/xGBEQESvREAEVkReBEFEooR","ghIgEhkTKxIaEl8TChM+El4T8hIVE3MSOhO3EjwT+BI2Eo8SrhJAE8AS","uBNWE1QUYRNQE5oURRR0E5kULRRQFKkTdRTtE3cUMxRsE8UT5BN7FPYT","JBbCFcoWzRW8FRAXuxbgFQ8XoxbGFhUW6xZZFu0WqRbYFTEWUBbxFmIW","kBguGEAZORgoGIYZMRlMGIUZGRk8GYEYYRnFGGMZHxlEGJ0YvBhnGc4Y","nh48HmcfRx42Hq0fWB9aHqwfQB9jH48eiB/THoofRh9SHqseyh6OH9we","rCRKJI4lVSREJNQlfyVoJNMlZyWKJZ0kryXhJLElbSVgJLkk2CS1Jeok","yDBmMNwxcTBgMCIyzTGEMCEytTHYMbkw/TH9MP8xuzF8MNUw9DADMgYx","5DyCPCo+jTx8PHA+Gz6gPG8+Az4mPtU8Sz4ZPU0+CT6YPPE8ED1RPiI9"];
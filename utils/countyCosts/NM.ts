@@ -0,0 +1,7 @@
+// NEW MEXICO (NM) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Bernalillo County","Catron County","Chaves County","Cibola County","Colfax County","Curry County","De Baca County","Do\u00f1a Ana County","Eddy County","Grant County","Guadalupe County","Harding County","Hidalgo County","Lea County","Lincoln County","Los Alamos County","Luna County","McKinley County","Mora County","Otero County","Quay County","Rio Arriba County","Roosevelt County","San Juan County","San Miguel County","Sandoval County","Santa Fe County","Sierra County","Socorro County","Taos County","Torrance County","Union County","Valencia County"];
+export const COUNTY_COLUMNS: string[] = ["hwFsAYkBdAFtAXgBegF9AYABhgGIAYUBggFpAXQBhQF4AWcBeQF4AWYBhAGGAW4BhwGBAWgBbAF2AWwBbwGFAWQB","5QHDAecBzQHEAdIB1AHYAdwB5AHmAeMB3gHAAc0B4wHSAb0B1AHSAbwB4QHjAcUB5QHdAb4BwwHQAcMBxwHjAbkB","5QHDAecBzQHEAdIB1AHYAdwB5AHmAeMB3gHAAc0B4wHSAb0B1AHSAbwB4QHjAcUB5QHdAb4BwwHQAcMBxwHjAbkB","hwB+AIgAgAB+AIIAgwCEAIUAhwCIAIcAhQB9AIEAhwCCAHwAggCCAHwAhgCHAH4AhwCFAHwAfgCBAH4AfwCHAHsA","vAGdAb0BpQGdAaoBrAGvAbMBugG8AbkBtQGZAaYBuQGqAZcBqwGqAZUBuAG6AZ4BvAG0AZgBnAGoAZ0BoAG5AZMB","NQA0ADUANQA1ADUANQA1ADUANQA1ADUANQA0ADUANQA1ADQANQA1ADQANQA1ADUANQA1ADQANAA1ADQANQA1ADQA","rACgAKwAowCgAKUApgCnAKgAqwCsAKsAqQCfAKMAqwClAJ4ApgClAJ0AqgCrAKEArACpAJ4AoACkAKAAoQCrAJwA","MAAsADAALQAsAC4ALgAuAC8ALwAwAC8ALwAsAC0ALwAuACwALgAuACsALwAvACwAMAAvACwALAAtACwALQAvACsA","GQAXABkAFwAXABgAGAAYABgAGAAZABgAGAAXABcAGAAYABYAGAAYABYAGAAYABcAGQAYABcAFwAXABcAFwAYABYA"];
+export const COUNTY_FIPS: string = "AQADAAUABgAHAAkACwANAA8AEQATABUAFwAZABsAHAAdAB8AIQAjACUAJwApAC0ALwArADEAMwA1ADcAOQA7AD0A";
+export const ALIAS_KEYS: string[] = ["bernalillo","bernalillo county","catron","catron county","chaves","chaves county","cibola","cibola county","colfax","colfax county","curry","curry county","de baca","de baca county","dona ana","dona ana county","eddy","eddy county","grant","grant county","guadalupe","guadalupe county","harding","harding county","hidalgo","hidalgo county","lea","lea county","lincoln","lincoln county","los alamos","los alamos county","luna","luna county","mckinley","mckinley county","mora","mora county","otero","otero county","quay","quay county","rio arriba","rio arriba county","roosevelt","roosevelt county","san juan","san juan county","san miguel","san miguel county","sandoval","sandoval county","santa fe","santa fe county","sierra","sierra county","socorro","socorro county","taos","taos county","torrance","torrance county","union","union county","valencia","valencia county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAA";
+export const PRICE_BAND_TOTALS: string[] = ["kgn0CJoJIwn8CDwJRglWCWgJigmWCYYJcQnlCCUJhgk8CdgIQwk8CdEIfgmICQEJkgltCd0I8wgwCfQICgmGCcUI","mwr4CaMKLAoFCkUKTwpfCnEKkwqfCo8KegrpCS4KjwpFCtwJTApFCtUJhwqRCgoKmwp2CuEJ9wk5CvgJEwqPCskJ","pAv8CqwLNQsOC04LWAtoC3oLnAuoC5gLgwvtCjcLmAtOC+AKVQtOC9kKkAuaCxMLpAt/C+UK+wpCC/wKHAuYC80K","rQwADLUMPgwXDFcMYQxxDIMMpQyxDKEMjAzxC0AMoQxXDOQLXgxXDN0LmQyjDBwMrQyIDOkL/wtLDAAMJQyhDNEL","tg0EDb4NRw0gDWANag16DYwNrg26DaoNlQ31DEkNqg1gDegMZw1gDeEMog2sDSUNtg2RDe0MAw1UDQQNLg2qDdUM","vw4IDscOUA4pDmkOcw6DDpUOtw7DDrMOng75DVIOsw5pDuwNcA5pDuUNqw61Di4Ovw6aDvENBw5dDggONw6zDtkN","0RAQENkQYhA7EHsQhRCVEKcQyRDVEMUQsBABEGQQxRB7EPQPghB7EO0PvRDHEEAQ0RCsEPkPDxBvEBAQSRDFEOEP","4xIYEusSdBJNEo0SlxKnErkS2xLnEtcSwhIJEnYS1xKNEvwRlBKNEvURzxLZElIS4xK+EgESFxKBEhgSWxLXEukR","EBgsFxgYoRd6F7oXxBfUF+YXCBgUGAQY7xcdF6MXBBi6FxAXwRe6FwkX/BcGGH8XEBjrFxUXKxeuFywXiBcEGP0W","PR1AHEUdzhynHOcc8RwBHRMdNR1BHTEdHB0xHNAcMR3nHCQc7hznHB0cKR0zHawcPR0YHSkcPxzbHEActRwxHREc","lydoJp8nKCcBJ0EnSydbJ20njyebJ4sndidZJioniydBJ0wmSCdBJ0UmgyeNJwYnlydyJ1EmZyY1J2gmDyeLJzkm","8TGQMPkxgjFbMZsxpTG1Mccx6TH1MeUx0DGBMIQx5TGbMXQwojGbMW0w3THnMWAx8THMMXkwjzCPMZAwaTHlMWEw"];
@@ -0,0 +1,7 @@
+// NEVADA (NV) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Churchill County","Clark County","Douglas County","Elko County","Esmeralda County","Eureka County","Humboldt County","Lander County","Lincoln County","Lyon County","Mineral County","Nye County","Pershing County","Storey County","Washoe County","White Pine County"];
+export const COUNTY_COLUMNS: string[] = ["ogGeAZUBrQGRAa0BsgGnAZwBrwGqAaMBjAGtAaEBqwE=","+AHzAekBBQLjAQUCDAL+AfABCAICAvoB3QEGAvcBAwI=","AgL8AfIBDwLtAQ8CFgIIAvoBEgIMAgQC5wEQAgECDQI=","dAByAHAAdwBvAHcAeAB1AHIAdwB2AHQAbQB3AHMAdgA=","rAGoAZ8BtwGaAbcBvQGxAaYBugG0Aa4BlQG4AasBtgE=","NQA1ADUANQA0ADUANQA1ADUANQA1ADUANAA1ADUANQA=","tQCzALAAugCuALoAvAC3ALIAuwC5ALYAqwC6ALUAuQA=","MQAwAC8AMgAvADIAMwAyADAAMgAyADEALgAyADEAMgA=","FgAVABUAFgAVABYAFwAWABUAFgAWABYAFQAWABYAFgA="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGwAdAB8AIQA=";
+export const ALIAS_KEYS: string[] = ["churchill","churchill county","clark","clark county","douglas","douglas county","elko","elko county","esmeralda","esmeralda county","eureka","eureka county","humboldt","humboldt county","lander","lander county","lincoln","lincoln county","lyon","lyon county","mineral","mineral county","nye","nye county","pershing","pershing county","storey","storey county","washoe","washoe county","white pine","white pine county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPAA==";
+export const PRICE_BAND_TOTALS: string[] = ["wQmoCXwJ+glgCfoJGArbCZ4JBgrsCckJRAn9CbwJ8Qk=","ygqxCoUKAwtkCgMLIQvkCqcKDwv1CtIKSAoGC8UK+go=","0wu6C44LDAxoCwwMKgztC7ALGAz+C9sLTAsPDM4LAww=","3AzDDJcMFQ1sDBUNMw32DLkMIQ0HDeQMUAwYDdcMDA0=","5Q3MDaANHg5wDR4OPA7/DcINKg4QDu0NVA0hDuANFQ4=","7g7VDqkOJw90DicPRQ8ID8sOMw8ZD/YOWA4qD+kOHg8=","ABHnELsQORF8EDkRVxEaEd0QRRErEQgRYBA8EfsQMBE=","EhP5Es0SSxOEEksTaRMsE+8SVxM9ExoTaBJOEw0TQhM=","PxgmGPoXeBiYF3gYlhhZGBwYhBhqGEcYfBd7GDoYbxg=","bB1THScdpR2sHKUdwx2GHUkdsR2XHXQdkByoHWcdnB0=","xietJ4En/yfUJv8nHSjgJ6MnCyjxJ84nuCYCKMEn9ic=","IDIHMtsxWTL8MFkydzI6Mv0xZTJLMigy4DBcMhsyUDI="];
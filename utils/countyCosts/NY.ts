@@ -0,0 +1,7 @@
+// NEW YORK (NY) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Albany County","Allegany County","Bronx County","Broome County","Cattaraugus County","Cayuga County","Chautauqua County","Chemung County","Chenango County","Clinton County","Columbia County","Cortland County","Delaware County","Dutchess County","Erie County","Essex County","Franklin County","Fulton County","Genesee County","Greene County","Hamilton County","Herkimer County","Jefferson County","Kings County","Lewis County","Livingston County","Madison County","Monroe County","Montgomery County","Nassau County","New York County","Niagara County","Oneida County","Onondaga County","Ontario County","Orange County","Orleans County","Oswego County","Otsego County","Putnam County","Queens County","Rensselaer County","Richmond County","Rockland County","Saratoga County","Schenectady County","Schoharie County","Schuyler County","Seneca County","St. Lawrence County","Steuben County","Suffolk County","Sullivan County","Tioga County","Tompkins County","Ulster County","Warren County","Washington County","Wayne County","Westchester County","Wyoming County","Yates County"];
+export const COUNTY_COLUMNS: string[] = ["XgKCAmYCcQJeAm8CewJqAnQChgJrAnYCawJyAnECfgJ2Am8CcQKGAmcCXgKGAnACUwJXAlMCcAJYAmUCbgKGAncCfAJiAoMCbAKLAo0CYAKNAlECYwKFAn0CiwJYAmsCcQJvAnICegJuAn8CZQJYAnUCVAJqAo0CVwKKAg==","1wIDA+EC7gLXAusC+gLlAvECBwPnAvQC5wLvAu4C/gL0AuwC7gIIA+IC2AIIA+0CygLPAsoC7QLQAuAC6wIHA/YC+wLcAgQD6AIOAw8D2gIPA8gC3gIGA/0CDQPQAucC7gLsAvAC+QLrAv8C3wLQAvMCzALlAg8DzwIMAw==","vwLpAsgC1QK/AtIC4ALNAtgC7QLOAtsCzgLWAtUC5ALaAtMC1QLuAsoCvwLuAtQCsgK3ArIC1AK4AscC0gLtAtwC4gLDAuoCzwL0AvUCwgL1ArACxQLsAuMC8wK4As4C1QLTAtcC3wLSAuUCxwK4AtoCtALNAvUCtwLyAg==","wgDNAMQAyADCAMcAywDFAMgAzgDGAMkAxgDIAMgAzADJAMcAyADOAMUAwgDOAMcAvgC/AL4AxwDAAMQAxwDOAMoAywDDAM4AxgDQANEAwgDRAL4AwwDOAMwA0ADAAMYAyADHAMgAygDHAMwAxADAAMkAvwDFANEAvwDQAA==","jATRBJsEsASMBKwEwwSiBLUE2ASlBLoEpQSyBLEEygS5BK0EsATaBJ4EjQTaBK4EdwR+BHcErgSABJoEqwTYBL0ExQSTBNQEpwTjBOYEkATmBHQElgTXBMgE4gSABKUEsAStBLMEwQSrBMsEmQSBBLgEegSiBOYEfgThBA==","QwBEAEMAQwBDAEMAQwBDAEMARABDAEMAQwBDAEMARABDAEMAQwBEAEMAQwBEAEMAQwBDAEMAQwBDAEMAQwBEAEMAQwBDAEQAQwBEAEQAQwBEAEIAQwBEAEMARABDAEMAQwBDAEMAQwBDAEQAQwBDAEMAQwBDAEQAQwBEAA==","CgEaAQ4BEwEKARIBFwEPARQBHAEQARUBEAETARMBGQEVARIBEwEcAQ4BCwEcARIBBgEHAQYBEgEIAQ4BEQEcARYBFwEMARsBEQEeAR8BCwEfAQUBDQEcARgBHgEIARABEwESARMBFwERARkBDQEIARQBBgEPAR8BBwEeAQ==","PAA/ADwAPgA8AD0APgA9AD4AQAA9AD4APQA+AD4APwA+AD0APgBAAD0APABAAD0AOwA7ADsAPQA7ADwAPQBAAD4APwA8AD8APQBAAEAAPABAADoAPABAAD8AQAA7AD0APgA9AD4APgA9AD8APAA7AD4AOwA9AEAAOwBAAA==","IQAjACIAIwAhACIAIwAiACMAJAAiACMAIgAjACMAIwAjACIAIwAkACIAIQAkACIAIQAhACEAIgAhACIAIgAkACMAIwAiACQAIgAkACQAIgAkACEAIgAkACMAJAAhACIAIwAiACMAIwAiACMAIgAhACMAIQAiACQAIQAkAA=="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBXAFsAXQBfAGEAYwBZAGUAZwBpAGsAbQBvAHEAcwB1AHcAeQB7AA==";
+export const ALIAS_KEYS: string[] = ["albany","albany county","allegany","allegany county","bronx","bronx county","broome","broome county","cattaraugus","cattaraugus county","cayuga","cayuga county","chautauqua","chautauqua county","chemung","chemung county","chenango","chenango county","clinton","clinton county","columbia","columbia county","cortland","cortland county","delaware","delaware county","dutchess","dutchess county","erie","erie county","essex","essex county","franklin","franklin county","fulton","fulton county","genesee","genesee county","greene","greene county","hamilton","hamilton county","herkimer","herkimer county","jefferson","jefferson county","kings","kings county","lewis","lewis county","livingston","livingston county","madison","madison county","monroe","monroe county","montgomery","montgomery county","nassau","nassau county","new york","new york county","niagara","niagara county","oneida","oneida county","onondaga","onondaga county","ontario","ontario county","orange","orange county","orleans","orleans county","oswego","oswego county","otsego","otsego county","putnam","putnam county","queens","queens county","rensselaer","rensselaer county","richmond","richmond county","rockland","rockland county","saint lawrence","saint lawrence county","saratoga","saratoga county","schenectady","schenectady county","schoharie","schoharie county","schuyler","schuyler county","seneca","seneca county","steuben","steuben county","suffolk","suffolk county","sullivan","sullivan county","tioga","tioga county","tompkins","tompkins county","ulster","ulster county","warren","warren county","washington","washington county","wayne","wayne county","westchester","westchester county","wyoming","wyoming county","yates","yates county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAxADEALAAsAC0ALQAuAC4ALwAvADAAMAAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5ADoAOgA7ADsAPAA8AD0APQA=";
+export const PRICE_BAND_TOTALS: string[] = ["+A/cECkQbxD4D18QqhBAEH4Q9BBJEI0QSRB0EHAQxRCLEGIQbxD4EDIQ+w/4EGYQtQ/MD7UPZhDTDyUQXBD0EJYQsRAQEOUQTxAWER8RBhAfEaUPGRDwELoQExHTD0kQbxBiEHcQpBBcEMkQIhDUD4cQvg9AEB8RzA8PEQ==","RxEwEngRvhFHEa4R+RGPEc0RSBKYEdwRmBHDEb8RGRLaEbERvhFMEoERShFMErURBBEbEQQRtREiEXQRqxFIEuURABJfETkSnhFqEnMSVRFzEu8QaBFEEgkSZxIiEZgRvhGxEcYR8xGrER0ScREjEdYRDRGPEXMSGxFjEg==","lhKEE8cSDROWEv0SSBPeEhwTnBPnEisT5xISEw4TbRMpEwATDROgE9ASmRKgEwQTUxJqElMSBBNxEsMS+hKcEzQTTxOuEo0T7RK+E8cTpBLHEzkStxKYE1gTuxNxEucSDRMAExUTQhP6EnETwBJyEiUTXBLeEscTahK3Ew==","5RPYFBYUXBTlE0wUlxQtFGsU8BQ2FHoUNhRhFF0UwRR4FE8UXBT0FB8U6BP0FFMUohO5E6ITUxTAExIUSRTwFIMUnhT9E+EUPBQSFRsV8xMbFYMTBhTsFKcUDxXAEzYUXBRPFGQUkRRJFMUUDxTBE3QUqxMtFBsVuRMLFQ==","NBUsFmUVqxU0FZsV5hV8FboVRBaFFckVhRWwFawVFRbHFZ4VqxVIFm4VNxVIFqIV8RQIFfEUohUPFWEVmBVEFtIV7RVMFTUWixVmFm8WQhVvFs0UVRVAFvYVYxYPFYUVqxWeFbMV4BWYFRkWXhUQFcMV+hR8FW8WCBVfFg==","gxaAF7QW+haDFuoWNRfLFgkXmBfUFhgX1Bb/FvsWaRcWF+0W+hacF70WhhacF/EWQBZXFkAW8RZeFrAW5xaYFyEXPBebFokX2ha6F8MXkRbDFxcWpBaUF0UXtxdeFtQW+hbtFgIXLxfnFm0XrRZfFhIXSRbLFsMXVxazFw==","IRkoGlIZmBkhGYgZ0xlpGacZQBpyGbYZchmdGZkZERq0GYsZmBlEGlsZJBlEGo8Z3hj1GN4Yjxn8GE4ZhRlAGr8Z2hk5GTEaeBliGmsaLxlrGqsYQhk8GuMZXxr8GHIZmBmLGaAZzRmFGRUaSxn9GLAZ5xhpGWsa9RhbGg==","vxvQHPAbNhy/GyYccRwHHEUc6BwQHFQcEBw7HDccuRxSHCkcNhzsHPkbwhvsHC0cfBuTG3wbLRyaG+wbIxzoHF0ceBzXG9kcFhwKHRMdzRsTHT8b4BvkHIEcBx2aGxAcNhwpHD4caxwjHL0c6RubG04chRsHHBMdkxsDHQ==","SiJ0I3siwSJKIrEi/CKSItAijCObIt8imyLGIsIiXSPdIrQiwSKQI4QiTSKQI7giByIeIgciuCIlInciriKMI+giAyNiIn0joSKuI7cjWCK3I7EhayKIIwwjqyMlIpsiwSK0Iski9iKuImEjdCImItkiECKSIrcjHiKnIw==","1SgYKgYpTCnVKDwphykdKVspMComKWopJilRKU0pASpoKT8pTCk0Kg8p2Cg0KkMpkiipKJIoQymwKAIpOSkwKnMpjintKCEqLClSKlsq4yhbKiMo9igsKpcpTyqwKCYpTCk/KVQpgSk5KQUq/yixKGQpmygdKVsqqShLKg==","6zVgNxw2YjbrNVI2nTYzNnE2eDc8NoA2PDZnNmM2STd+NlU2YjZ8NyU27jV8N1k2qDW/Nag1WTbGNRg2TzZ4N4k2pDYDNmk3QjaaN6M3+TWjNwc1DDZ0N602lzfGNTw2YjZVNmo2lzZPNk03FTbHNXo2sTUzNqM3vzWTNw==","AUOoRDJDeEMBQ2hDs0NJQ4dDwERSQ5ZDUkN9Q3lDkUSUQ2tDeEPERDtDBEPERG9DvkLVQr5Cb0PcQi5DZUPARJ9DukMZQ7FEWEPiROtED0PrROtBIkO8RMND30TcQlJDeENrQ4BDrUNlQ5VEK0PdQpBDx0JJQ+tE1ULbRA=="];
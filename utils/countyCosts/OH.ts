@@ -0,0 +1,7 @@
+// OHIO (OH) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Adams County","Allen County","Ashland County","Ashtabula County","Athens County","Auglaize County","Belmont County","Brown County","Butler County","Carroll County","Champaign County","Clark County","Clermont County","Clinton County","Columbiana County","Coshocton County","Crawford County","Cuyahoga County","Darke County","Defiance County","Delaware County","Erie County","Fairfield County","Fayette County","Franklin County","Fulton County","Gallia County","Geauga County","Greene County","Guernsey County","Hamilton County","Hancock County","Hardin County","Harrison County","Henry County","Highland County","Hocking County","Holmes County","Huron County","Jackson County","Jefferson County","Knox County","Lake County","Lawrence County","Licking County","Logan County","Lorain County","Lucas County","Madison County","Mahoning County","Marion County","Medina County","Meigs County","Mercer County","Miami County","Monroe County","Montgomery County","Morgan County","Morrow County","Muskingum County","Noble County","Ottawa County","Paulding County","Perry County","Pickaway County","Pike County","Portage County","Preble County","Putnam County","Richland County","Ross County","Sandusky County","Scioto County","Seneca County","Shelby County","Stark County","Summit County","Trumbull County","Tuscarawas County","Union County","Van Wert County","Vinton County","Warren County","Washington County","Wayne County","Williams County","Wood County","Wyandot County"];
+export const COUNTY_COLUMNS: string[] = ["bgFyAYMBagGCAYkBhwF0AYABfgFvAXYBgwGDAYkBawFxAXgBdAF2AXMBdwF5AYkBegF2AWoBdwGEAXABcQF2AXUBbwFmAYcBfQF1AXgBewGEAYABhAFuAXABhwGFAWwBZQF6AYcBZwFwAYABegF2AWgBaAFmAYgBiQFuAWwBeAFrAX4BhgF2AW0BeAF9AXoBdAF3AXgBegF+AYABewGFAWUBggF5AWYBcgFtAW4BggE=","xgHLAd8BwQHfAecB5AHOAdwB2gHHAdAB4AHgAecBwwHJAdIBzQHQAcwB0QHUAecB1AHQAcEB0QHhAckBygHQAc4BxwG8AeUB2AHOAdIB1wHhAd0B4QHFAcgB5AHiAcQBuwHVAeUBvQHJAd0B1AHQAb4BvgG8AeYB5wHGAcQB0wHCAdoB5AHQAcQB0gHYAdUBzgHRAdIB1AHaAd0B1gHjAbsB3wHUAbwBywHFAcUB3wE=","ZAFoAXgBYAF4AX4BfAFqAXUBdAFlAWwBeQF5AX4BYgFnAW4BagFsAWkBbQFvAX4BbwFsAWABbQF5AWYBZwFsAWsBZQFcAX0BcgFrAW4BcQF5AXYBegFkAWYBfAF6AWMBWwFwAX0BXgFmAXYBbwFsAV4BXgFcAX4BfgFkAWMBbgFhAXQBfAFsAWMBbgFzAXABagFtAW4BbwF0AXYBcQF7AVwBeAFvAVwBaAFjAWQBeAE=","iACKAJAAhwCQAJIAkgCLAI8AjgCJAIsAkACQAJIAhwCJAIwAigCLAIoAjACMAJIAjQCLAIcAjACQAIkAiQCLAIsAiQCFAJIAjgCLAIwAjQCQAI8AkQCIAIkAkgCRAIgAhQCNAJIAhgCJAI8AjQCLAIYAhgCFAJIAkgCIAIgAjACHAI4AkQCLAIgAjACOAI0AiwCMAIwAjQCOAI8AjQCRAIUAkACMAIUAigCIAIgAkAA=","YwJqAoUCXAKEAo8CiwJtAoACfgJkAm8ChgKGAo8CXgJnAnMCbAJwAmsCcQJ1Ao8CdgJvAlwCcQKGAmYCZwJvAm0CYwJVAowCewJtAnICeQKGAoEChwJiAmUCiwKIAmACUwJ2AowCVwJmAoECdgJwAlgCWAJVAo4CjwJiAmACdAJdAn4CiwJvAmACcwJ7AncCbQJxAnICdgJ9AoECeAKJAlQChAJ1AlQCagJhAmIChAI=","NQA1ADUANAA1ADUANQA1ADUANQA1ADUANQA1ADUANAA1ADUANQA1ADUANQA1ADUANQA1ADQANQA1ADUANQA1ADUANQA0ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANAA1ADUANAA1ADUANQA1ADQANAA0ADUANQA1ADUANQA0ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADQANQA1ADQANQA1ADUANQA=","lwCZAJ8AlQCfAKIAoQCaAJ4AngCXAJoAoACgAKIAlgCYAJsAmQCaAJkAmwCcAKIAnACaAJUAmwCgAJgAmACaAJoAlwCUAKEAnQCaAJsAnQCgAJ8AoACXAJgAoQCgAJYAkwCcAKEAlACYAJ8AnACaAJQAlACUAKIAogCXAJYAmwCWAJ4AoQCaAJYAmwCdAJwAmgCbAJsAnACeAJ8AnAChAJMAnwCcAJQAmQCXAJcAnwA=","LAAtAC8ALAAvADAALwAtAC8ALgAtAC0ALwAvADAALAAtAC4ALQAtAC0ALgAuADAALgAtACwALgAvAC0ALQAtAC0ALQArADAALgAtAC4ALgAvAC8ALwAsAC0ALwAvACwAKwAuADAALAAtAC8ALgAtACwALAArADAAMAAsACwALgAsAC4ALwAtACwALgAuAC4ALQAuAC4ALgAuAC8ALgAvACsALwAuACsALQAsACwALwA=","FwAXABgAFwAYABkAGQAXABgAGAAXABcAGAAYABkAFwAXABgAFwAXABcAGAAYABkAGAAXABcAGAAYABcAFwAXABcAFwAWABkAGAAXABgAGAAYABgAGAAXABcAGQAYABcAFgAYABkAFwAXABgAGAAXABcAFwAWABkAGQAXABcAGAAXABgAGQAXABcAGAAYABgAFwAYABgAGAAYABgAGAAYABYAGAAYABYAFwAXABcAGAA="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBXAFkAWwBdAF8AYQBjAGUAZwBpAGsAbQBvAHEAcwB1AHcAeQB7AH0AfwCBAIMAhQCHAIkAiwCNAI8AkQCTAJUAlwCZAJsAnQCfAKEAowClAKcAqQCrAK0ArwA=";
+export const ALIAS_KEYS: string[] = ["adams","adams county","allen","allen county","ashland","ashland county","ashtabula","ashtabula county","athens","athens county","auglaize","auglaize county","belmont","belmont county","brown","brown county","butler","butler county","carroll","carroll county","champaign","champaign county","clark","clark county","clermont","clermont county","clinton","clinton county","columbiana","columbiana county","coshocton","coshocton county","crawford","crawford county","cuyahoga","cuyahoga county","darke","darke county","defiance","defiance county","delaware","delaware county","erie","erie county","fairfield","fairfield county","fayette","fayette county","franklin","franklin county","fulton","fulton county","gallia","gallia county","geauga","geauga county","greene","greene county","guernsey","guernsey county","hamilton","hamilton county","hancock","hancock county","hardin","hardin county","harrison","harrison county","henry","henry county","highland","highland county","hocking","hocking county","holmes","holmes county","huron","huron county","jackson","jackson county","jefferson","jefferson county","knox","knox county","lake","lake county","lawrence","lawrence county","licking","licking county","logan","logan county","lorain","lorain county","lucas","lucas county","madison","madison county","mahoning","mahoning county","marion","marion county","medina","medina county","meigs","meigs county","mercer","mercer county","miami","miami county","monroe","monroe county","montgomery","montgomery county","morgan","morgan county","morrow","morrow county","muskingum","muskingum county","noble","noble county","ottawa","ottawa county","paulding","paulding county","perry","perry county","pickaway","pickaway county","pike","pike county","portage","portage county","preble","preble county","putnam","putnam county","richland","richland county","ross","ross county","sandusky","sandusky county","scioto","scioto county","seneca","seneca county","shelby","shelby county","stark","stark county","summit","summit county","trumbull","trumbull county","tuscarawas","tuscarawas county","union","union county","van wert","van wert county","vinton","vinton county","warren","warren county","washington","washington county","wayne","wayne county","williams","williams county","wood","wood county","wyandot","wyandot county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5ADoAOgA7ADsAPAA8AD0APQA+AD4APwA/AEAAQABBAEEAQgBCAEMAQwBEAEQARQBFAEYARgBHAEcASABIAEkASQBKAEoASwBLAEwATABNAE0ATgBOAE8ATwBQAFAAUQBRAFIAUgBTAFMAVABUAFUAVQBWAFYAVwBXAA==";
+export const PRICE_BAND_TOTALS: string[] = ["Zgl/Cd4JSgncCQMK9gmLCc4JxQlsCZMJ4gniCQMKUgl2CaEJhwmUCYMJnAmoCQMKqwmTCUoJnAnkCXMJdwmTCY0JawkxCfoJvAmNCaAJtQnkCdIJ5wlkCXEJ9gnqCV0JKwmtCfoJOglzCdIJqwmUCT0JPQkxCQAKAwplCV0JowlPCcUJ9AmTCV4JoQm9Ca4JiwmcCaAJqwnECdIJsgnuCS0J3AmoCTAJfwlhCWQJ3Ak=","bwqICucKTgrlCgwL/wqUCtcKzgp1CpwK6wrrCgwLVgp/CqoKkAqdCowKpQqxCgwLtAqcCk4KpQrtCnwKgAqcCpYKdAo1CgMLxQqWCqkKvgrtCtsK8AptCnoK/wrzCmYKLwq2CgMLPgp8CtsKtAqdCkEKQQo1CgkLDAtuCmYKrApTCs4K/QqcCmcKqgrGCrcKlAqlCqkKtArNCtsKuwr3CjEK5QqxCjQKiApqCm0K5Qo=","eAuRC/ALUgvuCxUMCAydC+AL1wt+C6UL9Av0CxUMWguIC7MLmQumC5ULrgu6CxUMvQulC1ILrgv2C4ULiQulC58LfQs5CwwMzgufC7ILxwv2C+QL+Qt2C4MLCAz8C28LMwu/CwwMQguFC+QLvQumC0ULRQs5CxIMFQx3C28LtQtXC9cLBgylC3ALswvPC8ALnQuuC7ILvQvWC+QLxAsADDUL7gu6CzgLkQtzC3YL7gs=","gQyaDPkMVgz3DB4NEQ2mDOkM4AyHDK4M/Qz9DB4NXgyRDLwMogyvDJ4MtwzDDB4NxgyuDFYMtwz/DI4MkgyuDKgMhgw9DBUN1wyoDLsM0Az/DO0MAg1/DIwMEQ0FDXgMNwzIDBUNRgyODO0MxgyvDEkMSQw9DBsNHg2ADHgMvgxbDOAMDw2uDHkMvAzYDMkMpgy3DLsMxgzfDO0MzQwJDTkM9wzDDDwMmgx8DH8M9ww=","ig2jDQIOWg0ADicOGg6vDfIN6Q2QDbcNBg4GDicOYg2aDcUNqw24DacNwA3MDScOzw23DVoNwA0IDpcNmw23DbENjw1BDR4O4A2xDcQN2Q0IDvYNCw6IDZUNGg4ODoENOw3RDR4OSg2XDfYNzw24DU0NTQ1BDSQOJw6JDYENxw1fDekNGA63DYINxQ3hDdINrw3ADcQNzw3oDfYN1g0SDj0NAA7MDUANow2FDYgNAA4=","kw6sDgsPXg4JDzAPIw+4DvsO8g6ZDsAODw8PDzAPZg6jDs4OtA7BDrAOyQ7VDjAP2A7ADl4OyQ4RD6AOpA7ADroOmA5FDicP6Q66Ds0O4g4RD/8OFA+RDp4OIw8XD4oOPw7aDicPTg6gDv8O2A7BDlEOUQ5FDi0PMA+SDooO0A5jDvIOIQ/ADosOzg7qDtsOuA7JDs0O2A7xDv8O3w4bD0EOCQ/VDkQOrA6ODpEOCQ8=","pRC+EB0RZhAbEUIRNRHKEA0RBBGrENIQIREhEUIRbhC1EOAQxhDTEMIQ2xDnEEIR6hDSEGYQ2xAjEbIQthDSEMwQqhBNEDkR+xDMEN8Q9BAjERERJhGjELAQNREpEZwQRxDsEDkRVhCyEBER6hDTEFkQWRBNED8RQhGkEJwQ4hBrEAQRMxHSEJ0Q4BD8EO0QyhDbEN8Q6hADERER8RAtEUkQGxHnEEwQvhCgEKMQGxE=","txLQEi8TbhItE1QTRxPcEh8TFhO9EuQSMxMzE1QTdhLHEvIS2BLlEtQS7RL5ElQT/BLkEm4S7RI1E8QSyBLkEt4SvBJVEksTDRPeEvESBhM1EyMTOBO1EsISRxM7E64STxL+EksTXhLEEiMT/BLlEmESYRJVElETVBO2Eq4S9BJzEhYTRRPkEq8S8hIOE/8S3BLtEvES/BIVEyMTAxM/E1ESLRP5ElQS0BKyErUSLRM=","5Bf9F1wYghdaGIEYdBgJGEwYQxjqFxEYYBhgGIEYihf0Fx8YBRgSGAEYGhgmGIEYKRgRGIIXGhhiGPEX9RcRGAsY6RdpF3gYOhgLGB4YMxhiGFAYZRjiF+8XdBhoGNsXYxcrGHgYchfxF1AYKRgSGHUXdRdpF34YgRjjF9sXIRiHF0MYchgRGNwXHxg7GCwYCRgaGB4YKRhCGFAYMBhsGGUXWhgmGGgX/RffF+IXWhg=","ER0qHYkdlhyHHa4doR02HXkdcB0XHT4djR2NHa4dnhwhHUwdMh0/HS4dRx1THa4dVh0+HZYcRx2PHR4dIh0+HTgdFh19HKUdZx04HUsdYB2PHX0dkh0PHRwdoR2VHQgddxxYHaUdhhweHX0dVh0/HYkciRx9HKsdrh0QHQgdTh2bHHAdnx0+HQkdTB1oHVkdNh1HHUsdVh1vHX0dXR2ZHXkchx1THXwcKh0MHQ8dhx0=","ayeEJ+MnvibhJwgo+yeQJ9MnyidxJ5gn5yfnJwgoxiZ7J6YnjCeZJ4gnoSetJwgosCeYJ74moSfpJ3gnfCeYJ5IncCelJv8nwSeSJ6UnuifpJ9cn7CdpJ3Yn+yfvJ2InnyayJ/8nriZ4J9cnsCeZJ7EmsSalJgUoCChqJ2InqCfDJson+SeYJ2MnpifCJ7MnkCehJ6UnsCfJJ9cntyfzJ6Em4SetJ6QmhCdmJ2kn4Sc=","xTHeMT0y5jA7MmIyVTLqMS0yJDLLMfIxQTJBMmIy7jDVMQAy5jHzMeIx+zEHMmIyCjLyMeYw+zFDMtIx1jHyMewxyjHNMFkyGzLsMf8xFDJDMjEyRjLDMdAxVTJJMrwxxzAMMlky1jDSMTEyCjLzMdkw2TDNMF8yYjLEMbwxAjLrMCQyUzLyMb0xADIcMg0y6jH7Mf8xCjIjMjEyETJNMskwOzIHMsww3jHAMcMxOzI="];
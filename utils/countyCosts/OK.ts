@@ -0,0 +1,7 @@
+// OKLAHOMA (OK) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Adair County","Alfalfa County","Atoka County","Beaver County","Beckham County","Blaine County","Bryan County","Caddo County","Canadian County","Carter County","Cherokee County","Choctaw County","Cimarron County","Cleveland County","Coal County","Comanche County","Cotton County","Craig County","Creek County","Custer County","Delaware County","Dewey County","Ellis County","Garfield County","Garvin County","Grady County","Grant County","Greer County","Harmon County","Harper County","Haskell County","Hughes County","Jackson County","Jefferson County","Johnston County","Kay County","Kingfisher County","Kiowa County","Latimer County","Le Flore County","Lincoln County","Logan County","Love County","Major County","Marshall County","Mayes County","McClain County","McCurtain County","McIntosh County","Murray County","Muskogee County","Noble County","Nowata County","Okfuskee County","Oklahoma County","Okmulgee County","Osage County","Ottawa County","Pawnee County","Payne County","Pittsburg County","Pontotoc County","Pottawatomie County","Pushmataha County","Roger Mills County","Rogers County","Seminole County","Sequoyah County","Stephens County","Texas County","Tillman County","Tulsa County","Wagoner County","Washington County","Washita County","Woods County","Woodward County"];
+export const COUNTY_COLUMNS: string[] = ["SAE7AUoBRwFPAUoBUQFEAVoBUwFDAUEBWQFFAVABPAFUAUABOwFMAUcBTwFEAUwBVAFFAVcBOwFEAUoBQgFYAU4BVQE8ATkBTgFaAUcBOQFHAVgBTQE/AToBUwFPAVkBTgFZAUMBWgFYAUoBTAE+AUABQgFMAUkBTwFTAT8BVQFFAUIBSgE6AUoBRAFVAUABVwE7AVEBUAE/AQ==","lwGIAZsBlwGgAZoBowGTAa4BpQGRAY8BrQGTAaIBiQGnAY4BhwGdAZYBoAGTAZwBpgGTAaoBhwGSAZoBkAGsAZ8BqAGJAYUBoAGuAZcBhQGXAasBngGMAYcBpgGhAawBnwGsAZEBrgGsAZsBnAGMAY4BkAGdAZgBoQGmAYwBqAGUAZABmwGGAZsBkwGnAY0BqgGHAaMBoQGMAQ==","PgEyAUABPQFFAUABRwE6AU8BSQE5ATcBTwE7AUYBMwFKATYBMQFCAT0BRQE6AUIBSQE7AU0BMQE6AUABOAFOAUQBSwEzATABRAFPAT0BMAE9AU0BQwE1ATEBSQFFAU4BRAFOATkBTwFOAUABQgE1ATYBOAFCAT8BRQFJATUBSwE7ATgBQAEwAUABOgFKATYBTAExAUcBRgE1AQ==","cgBuAHMAcgB0AHMAdQBxAHgAdgBwAHAAeABxAHUAbgB2AG8AbQBzAHEAdABxAHMAdgBxAHcAbQBwAHMAcAB4AHQAdwBuAG0AdAB4AHIAbQByAHcAdABvAG0AdgB1AHgAdAB4AHAAeAB4AHMAcwBvAG8AcABzAHIAdQB2AG8AdwBxAHAAcwBtAHMAcQB2AG8AdwBtAHUAdQBvAA==","8QHeAfUB8AH8AfUB/wHrAQwCAgLqAecBDALsAf4B4AEEAuUB3gH4Ae8B/AHrAfcBAwLsAQgC3QHrAfUB6AEKAvoBBQLgAdsB+wEMAvAB2wHwAQkC+gHkAd0BAwL9AQsC+wELAuoBDAIKAvUB9wHjAeUB6AH4AfIB/QEDAuQBBQLtAegB9QHcAfUB7AEFAuUBCALdAf8B/QHkAQ==","MAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwAC8AMAAwADAALwAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwADAAMAAwAA==","dwByAHgAdwB5AHgAegB1AH0AewB1AHQAfQB2AHoAcwB7AHQAcgB4AHYAeQB1AHgAewB2AHwAcgB1AHgAdQB9AHkAfABzAHIAeQB9AHcAcgB3AH0AeQB0AHIAewB6AH0AeQB9AHUAfQB9AHgAeABzAHQAdQB4AHcAegB7AHQAfAB2AHUAeAByAHgAdgB8AHQAfAByAHoAegB0AA==","JQAkACYAJQAmACYAJgAlACcAJwAlACUAJwAlACYAJAAnACQAJAAmACUAJgAlACYAJwAlACcAJAAlACYAJQAnACYAJwAkACQAJgAnACUAJAAlACcAJgAkACQAJwAmACcAJgAnACUAJwAnACYAJgAkACQAJQAmACUAJgAnACQAJwAlACUAJgAkACYAJQAnACQAJwAkACYAJgAkAA==","EQARABIAEQASABIAEgARABIAEgARABEAEgARABIAEQASABEAEQASABEAEgARABIAEgARABIAEQARABIAEQASABIAEgARABEAEgASABEAEQARABIAEgARABEAEgASABIAEgASABEAEgASABIAEgARABEAEQASABEAEgASABEAEgARABEAEgARABIAEQASABEAEgARABIAEgARAA=="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBdAF8AYQBXAFkAWwBjAGUAZwBpAGsAbQBvAHEAcwB1AHcAeQB7AH0AfwCBAIMAhQCHAIkAiwCNAI8AkQCTAJUAlwCZAA==";
+export const ALIAS_KEYS: string[] = ["adair","adair county","alfalfa","alfalfa county","atoka","atoka county","beaver","beaver county","beckham","beckham county","blaine","blaine county","bryan","bryan county","caddo","caddo county","canadian","canadian county","carter","carter county","cherokee","cherokee county","choctaw","choctaw county","cimarron","cimarron county","cleveland","cleveland county","coal","coal county","comanche","comanche county","cotton","cotton county","craig","craig county","creek","creek county","custer","custer county","delaware","delaware county","dewey","dewey county","ellis","ellis county","garfield","garfield county","garvin","garvin county","grady","grady county","grant","grant county","greer","greer county","harmon","harmon county","harper","harper county","haskell","haskell county","hughes","hughes county","jackson","jackson county","jefferson","jefferson county","johnston","johnston county","kay","kay county","kingfisher","kingfisher county","kiowa","kiowa county","latimer","latimer county","le flore","le flore county","lincoln","lincoln county","logan","logan county","love","love county","major","major county","marshall","marshall county","mayes","mayes county","mcclain","mcclain county","mccurtain","mccurtain county","mcintosh","mcintosh county","murray","murray county","muskogee","muskogee county","noble","noble county","nowata","nowata county","okfuskee","okfuskee county","oklahoma","oklahoma county","okmulgee","okmulgee county","osage","osage county","ottawa","ottawa county","pawnee","pawnee county","payne","payne county","pittsburg","pittsburg county","pontotoc","pontotoc county","pottawatomie","pottawatomie county","pushmataha","pushmataha county","roger mills","roger mills county","rogers","rogers county","seminole","seminole county","sequoyah","sequoyah county","stephens","stephens county","texas","texas county","tillman","tillman county","tulsa","tulsa county","wagoner","wagoner county","washington","washington county","washita","washita county","woods","woods county","woodward","woodward county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5ADoAOgA7ADsAPAA8AD0APQA+AD4APwA/AEAAQABBAEEAQgBCAEMAQwBEAEQARQBFAEYARgBHAEcASABIAEkASQBKAEoASwBLAEwATAA=";
+export const PRICE_BAND_TOTALS: string[] = ["HQjYBy0IGghFCCwIUQgICIEIXQgCCPgHfwgMCE0I3gdjCPEH1Qc2CBYIRQgICDQIYAgMCHII1AcGCCwI/Qd6CEAIaQjeB8gHQgiBCBoIyAcaCHYIPQjsB9MHXwhJCHwIQQh8CAIIgQh6CC0INAjpB/EH/Qc2CCEISQhfCOwHaQgOCP0HLQjQBy0ICghmCPAHcQjUB1EISwjsBw==","DQnICB0JCgk1CRwJQQn4CHEJTQnyCOgIbwn8CD0JzghTCeEIxQgmCQYJNQn4CCQJUAn8CGIJxAj2CBwJ7QhqCTAJWQnOCLMIMglxCQoJswgKCWYJLQncCMMITwk5CWwJMQlsCfIIcQlqCR0JJAnZCOEI7QgmCREJOQlPCdwIWQn+CO0IHQnACB0J+ghWCeAIYQnECEEJOwncCA==","/Qm4CQ0K+gklCgwKMQroCWEKPQriCdgJXwrsCS0KvglDCtEJtQkWCvYJJQroCRQKQArsCVIKtAnmCQwK3QlaCiAKSQq+CZ4JIgphCvoJngn6CVYKHQrMCbMJPwopClwKIQpcCuIJYQpaCg0KFArJCdEJ3QkWCgEKKQo/CswJSQruCd0JDQqwCQ0K6glGCtAJUQq0CTEKKwrMCQ==","7QqoCv0K6goVC/wKIQvYClELLQvSCsgKTwvcCh0LrgozC8EKpQoGC+YKFQvYCgQLMAvcCkILpArWCvwKzQpKCxALOQuuCokKEgtRC+oKiQrqCkYLDQu8CqMKLwsZC0wLEQtMC9IKUQtKC/0KBAu5CsEKzQoGC/EKGQsvC7wKOQveCs0K/QqgCv0K2go2C8AKQQukCiELGwu8Cg==","3QuYC+0L2gsFDOwLEQzIC0EMHQzCC7gLPwzMCw0MngsjDLELlQv2C9YLBQzIC/QLIAzMCzIMlAvGC+wLvQs6DAAMKQyeC3QLAgxBDNoLdAvaCzYM/QusC5MLHwwJDDwMAQw8DMILQQw6DO0L9AupC7ELvQv2C+ELCQwfDKwLKQzOC70L7QuQC+0LygsmDLALMQyUCxEMCwysCw==","zQyIDN0Mygz1DNwMAQ24DDENDQ2yDKgMLw28DP0MjgwTDaEMhQzmDMYM9Qy4DOQMEA28DCINhAy2DNwMrQwqDfAMGQ2ODF8M8gwxDcoMXwzKDCYN7QycDIMMDw35DCwN8QwsDbIMMQ0qDd0M5AyZDKEMrQzmDNEM+QwPDZwMGQ2+DK0M3QyADN0MugwWDaAMIQ2EDAEN+wycDA==","rQ5oDr0Oqg7VDrwO4Q6YDhEP7Q6SDogODw+cDt0Obg7zDoEOZQ7GDqYO1Q6YDsQO8A6cDgIPZA6WDrwOjQ4KD9AO+Q5uDjUO0g4RD6oONQ6qDgYPzQ58DmMO7w7ZDgwP0Q4MD5IOEQ8KD70OxA55DoEOjQ7GDrEO2Q7vDnwO+Q6eDo0OvQ5gDr0Omg72DoAOAQ9kDuEO2w58Dg==","jRBIEJ0QihC1EJwQwRB4EPEQzRByEGgQ7xB8EL0QThDTEGEQRRCmEIYQtRB4EKQQ0BB8EOIQRBB2EJwQbRDqELAQ2RBOEAsQshDxEIoQCxCKEOYQrRBcEEMQzxC5EOwQsRDsEHIQ8RDqEJ0QpBBZEGEQbRCmEJEQuRDPEFwQ2RB+EG0QnRBAEJ0QehDWEGAQ4RBEEMEQuxBcEA==","PRX4FE0VOhVlFUwVcRUoFaEVfRUiFRgVnxUsFW0V/hSDFREV9RRWFTYVZRUoFVQVgBUsFZIV9BQmFUwVHRWaFWAViRX+FKIUYhWhFToVohQ6FZYVXRUMFfMUfxVpFZwVYRWcFSIVoRWaFU0VVBUJFREVHRVWFUEVaRV/FQwViRUuFR0VTRXwFE0VKhWGFRAVkRX0FHEVaxUMFQ==","7RmoGf0Z6hkVGvwZIRrYGVEaLRrSGcgZTxrcGR0arhkzGsEZpRkGGuYZFRrYGQQaMBrcGUIapBnWGfwZzRlKGhAaORquGTkZEhpRGuoZORnqGUYaDRq8GaMZLxoZGkwaERpMGtIZURpKGv0ZBBq5GcEZzRkGGvEZGRovGrwZORreGc0Z/RmgGf0Z2hk2GsAZQRqkGSEaGxq8GQ==","TSMII10jSiN1I1wjgSM4I7EjjSMyIygjryM8I30jDiOTIyEjBSNmI0YjdSM4I2QjkCM8I6IjBCM2I1wjLSOqI3AjmSMOI2ciciOxI0ojZyJKI6YjbSMcIwMjjyN5I6wjcSOsIzIjsSOqI10jZCMZIyEjLSNmI1EjeSOPIxwjmSM+Iy0jXSMAI10jOiOWIyAjoSMEI4EjeyMcIw==","rSxoLL0sqizVLLws4SyYLBEt7SySLIgsDy2cLN0sbizzLIEsZSzGLKYs1SyYLMQs8CycLAItZCyWLLwsjSwKLdAs+SxuLJUr0iwRLaoslSuqLAYtzSx8LGMs7yzZLAwt0SwMLZIsES0KLb0sxCx5LIEsjSzGLLEs2SzvLHws+SyeLI0svSxgLL0smiz2LIAsAS1kLOEs2yx8LA=="];
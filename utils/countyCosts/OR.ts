@@ -0,0 +1,7 @@
+// OREGON (OR) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Baker County","Benton County","Clackamas County","Clatsop County","Columbia County","Coos County","Crook County","Curry County","Deschutes County","Douglas County","Gilliam County","Grant County","Harney County","Hood River County","Jackson County","Jefferson County","Josephine County","Klamath County","Lake County","Lane County","Lincoln County","Linn County","Malheur County","Marion County","Morrow County","Multnomah County","Polk County","Sherman County","Tillamook County","Umatilla County","Union County","Wallowa County","Wasco County","Washington County","Wheeler County","Yamhill County"];
+export const COUNTY_COLUMNS: string[] = ["vwG9AdABrgG9Ab0BwAHDAdMBuAHTAdQBtgHOAccB0QG9AcsB0gG3Ab4B0wGzAdUBrgHTAa8BxwGtAdIB0wHJAcEBrQHEAcMB","LQIqAkECFwIqAioCLQIyAkUCIwJFAkYCIgI/AjcCQwIpAjsCRAIiAiwCRQIdAkgCFwJFAhgCNwIWAkQCRQI5Ai4CFgIyAjEC","+wH4AQ4C6AH5AfgB+wEAAhEC8gERAhIC8QEMAgQCDwL4AQgCEALxAfoBEQLtARQC5wERAugBBALnARACEQIGAvwB5wEAAv8B","lQCUAJoAjwCUAJQAlQCWAJsAkgCbAJwAkgCaAJcAmwCUAJkAmwCSAJQAmwCRAJwAjwCbAI8AlwCPAJsAmwCYAJUAjwCWAJYA","IwIgAjcCDgIhAiACIwIoAjoCGQI7AjwCGAI1Ai0COQIfAjECOQIYAiICOwITAj4CDQI6Ag4CLQINAjkCOwIvAiQCDQIoAicC","OAA4ADgANwA4ADgAOAA4ADgANwA4ADgANwA4ADgAOAA4ADgAOAA3ADgAOAA3ADgANwA4ADcAOAA3ADgAOAA4ADgANwA4ADgA","vQC8AMQAtQC8ALwAvQC+AMUAuQDFAMUAuQDDAMAAxAC7AMEAxAC5ALwAxQC3AMYAtQDFALYAwAC1AMQAxQDBAL0AtQC+AL4A","MgAyADQAMAAyADIAMgAzADQAMQA0ADUAMQA0ADMANAAyADQANAAxADIANAAxADUAMAA0ADAAMwAwADQANAAzADIAMAAzADMA","GwAbABwAGgAbABsAGwAcAB0AGwAdAB0AGwAcABwAHAAbABwAHQAbABsAHQAbAB0AGgAdABoAHAAaAB0AHQAcABsAGgAcABwA"];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcA";
+export const ALIAS_KEYS: string[] = ["baker","baker county","benton","benton county","clackamas","clackamas county","clatsop","clatsop county","columbia","columbia county","coos","coos county","crook","crook county","curry","curry county","deschutes","deschutes county","douglas","douglas county","gilliam","gilliam county","grant","grant county","harney","harney county","hood river","hood river county","jackson","jackson county","jefferson","jefferson county","josephine","josephine county","klamath","klamath county","lake","lake county","lane","lane county","lincoln","lincoln county","linn","linn county","malheur","malheur county","marion","marion county","morrow","morrow county","multnomah","multnomah county","polk","polk county","sherman","sherman county","tillamook","tillamook county","umatilla","umatilla county","union","union county","wallowa","wallowa county","wasco","wasco county","washington","washington county","wheeler","wheeler county","yamhill","yamhill county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMA";
+export const PRICE_BAND_TOTALS: string[] = ["wQq0ChwLXAq2CrQKwgrYCiwLkAotCzMLiwoTC+0KIwuxCgELJwuMCrsKLQt3CjsLWgosC18K7QpYCicLLQv3CsYKWArZCtUK","2QvMCzQMbwvOC8wL2gvwC0QMowtFDEsMngsrDAUMOwzJCxkMPwyfC9MLRQyKC1MMbQtEDHILBQxrCz8MRQwPDN4LawvxC+0L","8QzkDEwNggzmDOQM8gwIDVwNtgxdDWMNsQxDDR0NUw3hDDENVw2yDOsMXQ2dDGsNgAxcDYUMHQ1+DFcNXQ0nDfYMfgwJDQUN","CQ78DWQOlQ3+DfwNCg4gDnQOyQ11DnsOxA1bDjUOaw75DUkObw7FDQMOdQ6wDYMOkw10DpgNNQ6RDW8OdQ4/Dg4OkQ0hDh0O","IQ8UD3wPqA4WDxQPIg84D4wP3A6ND5MP1w5zD00Pgw8RD2EPhw/YDhsPjQ/DDpsPpg6MD6sOTQ+kDocPjQ9XDyYPpA45DzUP","ORAsEJQQuw8uECwQOhBQEKQQ7w+lEKsQ6g+LEGUQmxApEHkQnxDrDzMQpRDWD7MQuQ+kEL4PZRC3D58QpRBvED4Qtw9REE0Q","aRJcEsQS4RFeElwSahKAEtQSFRLVEtsSEBK7EpUSyxJZEqkSzxIREmMS1RL8EeMS3xHUEuQRlRLdEc8S1RKfEm4S3RGBEn0S","mRSMFPQUBxSOFIwUmhSwFAQVOxQFFQsVNhTrFMUU+xSJFNkU/xQ3FJMUBRUiFBMVBRQEFQoUxRQDFP8UBRXPFJ4UAxSxFK0U","ERoEGmwaZhkGGgQaEhooGnwamhl9GoMalRljGj0acxoBGlEadxqWGQsafRqBGYsaZBl8GmkZPRpiGXcafRpHGhYaYhkpGiUa","iR98H+QfxR5+H3wfih+gH/Qf+R71H/sf9B7bH7Uf6x95H8kf7x/1HoMf9R/gHgMgwx70H8getR/BHu8f9R+/H44fwR6hH50f","eSpsKtQqgyluKmwqeiqQKuQqtynlKusqsinLKqUq2yppKrkq3yqzKXMq5SqeKfMqgSnkKoYppSp/Kd8q5SqvKn4qfymRKo0q","aTVcNcQ1QTReNVw1ajWANdQ1dTTVNds1cDS7NZU1yzVZNak1zzVxNGM11TVcNOM1PzTUNUQ0lTU9NM811TWfNW41PTSBNX01"];
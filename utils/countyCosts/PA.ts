@@ -0,0 +1,7 @@
+// PENNSYLVANIA (PA) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Adams County","Allegheny County","Armstrong County","Beaver County","Bedford County","Berks County","Blair County","Bradford County","Bucks County","Butler County","Cambria County","Cameron County","Carbon County","Centre County","Chester County","Clarion County","Clearfield County","Clinton County","Columbia County","Crawford County","Cumberland County","Dauphin County","Delaware County","Elk County","Erie County","Fayette County","Forest County","Franklin County","Fulton County","Greene County","Huntingdon County","Indiana County","Jefferson County","Juniata County","Lackawanna County","Lancaster County","Lawrence County","Lebanon County","Lehigh County","Luzerne County","Lycoming County","McKean County","Mercer County","Mifflin County","Monroe County","Montgomery County","Montour County","Northampton County","Northumberland County","Perry County","Philadelphia County","Pike County","Potter County","Schuylkill County","Snyder County","Somerset County","Sullivan County","Susquehanna County","Tioga County","Union County","Venango County","Warren County","Washington County","Wayne County","Westmoreland County","Wyoming County","York County"];
+export const COUNTY_COLUMNS: string[] = ["rgHGAawBtAGyAcsBzAGvAaQBwgGlAcsByQHGAcwBogG9AcYBtAGwAc0BogG0AcYBuAHNAcwBuwG3AccBqQG0AccBuwHMAa0BrQGmAboBwgHLAbABwwHKAbcBpgG/Ac0BpwG6AcUBwQGiAccBqwG0AbYBxQHCAckBugG7AaQBswGrAaUBsQE=","AQIeAv4BCQIGAiQCJQICAvUBGQL2ASQCIQIdAiUC8wETAh4CCAIEAiYC8wEIAh4CDQImAiUCEQILAh8C/AEIAh8CEAIlAv8BAAL4ARACGQIkAgQCGgIiAgwC+AEVAiYC+QEPAh0CGALyAR8C/gEIAgoCHAIZAiECDwIQAvUBBwL9AfcBBQI=","nwG3AZ0BpgGjAbsBvAGgAZYBswGXAbsBuQG2AbwBlAGuAbcBpQGiAb0BlAGlAbcBqQG9AbwBrAGoAbcBmwGlAbcBqwG8AZ4BngGYAasBsgG8AaIBtAG6AagBmAGwAb0BmQGrAbYBsQGTAbcBnQGlAacBtQGyAbkBqwGrAZUBpAGcAZcBowE=","kgCbAJEAlACUAJwAnQCTAI8AmQCPAJwAmwCaAJ0AjgCXAJsAlACTAJ0AjgCUAJsAlgCdAJ0AlwCVAJsAkQCUAJsAlwCdAJIAkgCQAJYAmQCcAJMAmQCcAJUAkACYAJ0AkACWAJoAmQCOAJsAkQCUAJUAmgCZAJsAlgCXAI8AlACRAI8AkwA=","3QIHA9kC6ALlAg8DEQPfAs0CAAPOAg8DCwMGAxEDygL3AgcD5wLiAhIDygLnAgcD7gISAxED9ALsAggD1gLoAggD8wIRA9sC3ALQAvIC/wIPA+ICAQMMA+0C0AL6AhID0gLxAgUD/QLIAggD2QLoAusCBAP/AgsD8QLzAswC5QLYAs8C4wI=","PAA9ADwAPAA8AD0APQA8ADwAPQA8AD0APQA9AD0APAA9AD0APAA8AD0APAA8AD0APAA9AD0APQA8AD0APAA8AD0APQA9ADwAPAA8AD0APQA9ADwAPQA9ADwAPAA9AD0APAA9AD0APQA8AD0APAA8ADwAPQA9AD0APQA9ADwAPAA8ADwAPAA=","oQCqAKAAowCjAKwArAChAJ0AqACeAKwAqwCqAKwAnQCnAKoAowCiAK0AnQCjAKoApQCtAKwApgCkAKoAnwCjAKoApgCsAKAAoQCeAKUAqACsAKIAqQCrAKQAngCnAKwAngClAKoAqACcAKoAoACjAKQAqQCoAKsApQCmAJ0AowCgAJ4AogA=","LwAyAC8AMAAwADMAMwAwAC4AMgAuADMAMgAyADMALgAxADIAMAAwADMALgAwADIAMQAzADMAMQAwADIALwAwADIAMQAzAC8ALwAvADEAMgAzADAAMgAzADAALwAxADMALwAxADIAMgAuADIALwAwADAAMgAyADIAMQAxAC4AMAAvAC4AMAA=","GQAaABkAGQAZABsAGwAZABgAGgAYABsAGwAaABsAGAAaABoAGQAZABsAGAAZABoAGgAbABsAGgAZABoAGQAZABoAGgAbABkAGQAYABoAGgAbABkAGgAbABkAGAAaABsAGQAaABoAGgAYABoAGQAZABkAGgAaABsAGgAaABgAGQAZABgAGQA="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBXAFkAWwBdAF8AYQBjAGUAZwBpAGsAbQBvAHEAcwB1AHcAeQB7AH0AfwCBAIMAhQA=";
+export const ALIAS_KEYS: string[] = ["adams","adams county","allegheny","allegheny county","armstrong","armstrong county","beaver","beaver county","bedford","bedford county","berks","berks county","blair","blair county","bradford","bradford county","bucks","bucks county","butler","butler county","cambria","cambria county","cameron","cameron county","carbon","carbon county","centre","centre county","chester","chester county","clarion","clarion county","clearfield","clearfield county","clinton","clinton county","columbia","columbia county","crawford","crawford county","cumberland","cumberland county","dauphin","dauphin county","delaware","delaware county","elk","elk county","erie","erie county","fayette","fayette county","forest","forest county","franklin","franklin county","fulton","fulton county","greene","greene county","huntingdon","huntingdon county","indiana","indiana county","jefferson","jefferson county","juniata","juniata county","lackawanna","lackawanna county","lancaster","lancaster county","lawrence","lawrence county","lebanon","lebanon county","lehigh","lehigh county","luzerne","luzerne county","lycoming","lycoming county","mckean","mckean county","mercer","mercer county","mifflin","mifflin county","monroe","monroe county","montgomery","montgomery county","montour","montour county","northampton","northampton county","northumberland","northumberland county","perry","perry county","philadelphia","philadelphia county","pike","pike county","potter","potter county","schuylkill","schuylkill county","snyder","snyder county","somerset","somerset county","sullivan","sullivan county","susquehanna","susquehanna county","tioga","tioga county","union","union county","venango","venango county","warren","warren county","washington","washington county","wayne","wayne county","westmoreland","westmoreland county","wyoming","wyoming county","york","york county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5ADoAOgA7ADsAPAA8AD0APQA+AD4APwA/AEAAQABBAEEAQgBCAA==";
+export const PRICE_BAND_TOTALS: string[] = ["0gpkC8UK9wrsCoALhgvZCpoKTAufCoALcgtgC4YLkAovC2QL9AriCosLkAr0CmQLDguLC4YLJQsEC2cLugr1CmcLIguGC8sKzgqnCh4LSguBC+IKUQt4CwYLpwo5C4oLrQocC14LRQuLCmcLxAr1CgALWgtKC3ILHAsiC5gK7wrBCqEK5go=","/guVDPELIwwYDLEMtwwFDMYLfQzLC7EMowyRDLcMvAtgDJUMIAwODLwMvAsgDJUMOgy8DLcMVgwwDJgM5gshDJgMUwy3DPcL+gvTC08MewyyDA4MggypDDIM0wtqDLsM2QtNDI8Mdgy3C5gM8AshDCwMiwx7DKMMTQxTDMQLGwztC80LEgw=","Kg3GDR0NTw1EDeIN6A0xDfIMrg33DOIN1A3CDegN6AyRDcYNTA06De0N6AxMDcYNZg3tDegNhw1cDckNEg1NDckNhA3oDSMNJg3/DIANrA3jDToNsw3aDV4N/wybDewNBQ1+DcANpw3jDMkNHA1NDVgNvA2sDdQNfg2EDfAMRw0ZDfkMPg0=","Vg73DkkOew5wDhMPGQ9dDh4O3w4jDhMPBQ/zDhkPFA7CDvcOeA5mDh4PFA54DvcOkg4eDxkPuA6IDvoOPg55DvoOtQ4ZD08OUg4rDrEO3Q4UD2YO5A4LD4oOKw7MDh0PMQ6vDvEO2A4PDvoOSA55DoQO7Q7dDgUPrw61DhwOcw5FDiUOag4=","gg8oEHUPpw+cD0QQShCJD0oPEBBPD0QQNhAkEEoQQA/zDygQpA+SD08QQA+kDygQvg9PEEoQ6Q+0DysQag+lDysQ5g9KEHsPfg9XD+IPDhBFEJIPFRA8ELYPVw/9D04QXQ/gDyIQCRA7DysQdA+lD7APHhAOEDYQ4A/mD0gPnw9xD1EPlg8=","rhBZEaEQ0xDIEHURexG1EHYQQRF7EHURZxFVEXsRbBAkEVkR0BC+EIARbBDQEFkR6hCAEXsRGhHgEFwRlhDREFwRFxF7EacQqhCDEBMRPxF2Eb4QRhFtEeIQgxAuEX8RiRAREVMROhFnEFwRoBDRENwQTxE/EWcREREXEXQQyxCdEH0QwhA=","BhO7E/kSKxMgE9cT3RMNE84SoxPTEtcTyRO3E90TxBKGE7sTKBMWE+ITxBIoE7sTQhPiE90TfBM4E74T7hIpE74TeRPdE/8SAhPbEnUToRPYExYTqBPPEzoT2xKQE+ET4RJzE7UTnBO/Er4T+BIpEzQTsROhE8kTcxN5E8wSIxP1EtUSGhM=","XhUdFlEVgxV4FTkWPxZlFSYVBRYrFTkWKxYZFj8WHBXoFR0WgBVuFUQWHBWAFR0WmhVEFj8W3hWQFSAWRhWBFSAW2xU/FlcVWhUzFdcVAxY6Fm4VChYxFpIVMxXyFUMWORXVFRcW/hUXFSAWUBWBFYwVExYDFisW1RXbFSQVexVNFS0VchU=","OhsSHC0bXxtUGy4cNBxBGwIb+hsHGy4cIBwOHDQc+BrdGxIcXBtKGzkc+BpcGxIcdhs5HDQc0xtsGxUcIhtdGxUc0Bs0HDMbNhsPG8wb+BsvHEob/xsmHG4bDxvnGzgcFRvKGwwc8xvzGhUcLBtdG2gbCBz4GyAcyhvQGwAbVxspGwkbThs=","FiEHIgkhOyEwISMiKSIdId4g7yHjICMiFSIDIiki1CDSIQciOCEmIS4i1CA4IQciUiEuIikiyCFIIQoi/iA5IQoixSEpIg8hEiHrIMEh7SEkIiYh9CEbIkoh6yDcIS0i8SC/IQEi6CHPIAoiCCE5IUQh/SHtIRUivyHFIdwgMyEFIeUgKiE=","zizxLcEs8yzoLA0uEy7VLJYs2S2bLA0u/y3tLRMujCy8LfEt8CzeLBgujCzwLPEtCi0YLhMusi0ALfQttizxLPQtry0TLscsyiyjLKst1y0OLt4s3i0FLgItoyzGLRcuqSypLest0i2HLPQtwCzxLPws5y3XLf8tqS2vLZQs6yy9LJ0s4iw=","hjjbOXk4qzigOPc5/TmNOE44wzlTOPc56TnXOf05RDimOds5qDiWOAI6RDioONs5wjgCOv05nDm4ON45bjipON45mTn9OX84gjhbOJU5wTn4OZY4yDnvObo4WziwOQE6YTiTOdU5vDk/ON45eDipOLQ40TnBOek5kzmZOUw4ozh1OFU4mjg="];
@@ -0,0 +1,7 @@
+// RHODE ISLAND (RI) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Bristol County","Kent County","Newport County","Providence County","Washington County"];
+export const COUNTY_COLUMNS: string[] = ["4wHVAe0BygHFAQ==","PgIuAksCIQIbAg==","2AHLAeMBwAG8AQ==","twCyALsArQCrAA==","rAOSA8EDfANzAw==","PwA+AD8APgA+AA==","sQCtALUAqACnAA==","LgAtAC8ALAArAA==","GQAYABkAGAAXAA=="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAA==";
+export const ALIAS_KEYS: string[] = ["bristol","bristol county","kent","kent county","newport","newport county","providence","providence county","washington","washington county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAA=";
+export const PRICE_BAND_TOTALS: string[] = ["jww6DM8M9gvZCw==","yg1wDQoOLA0PDQ==","BQ+mDkUPYg5FDg==","QBDcD4AQmA97Dw==","exESEbsRzhCxEA==","thJIEvYSBBLnEQ==","LBW0FGwVcBRTFA==","ohcgF+IX3Ba/Fg==","yR0uHQke6hzNHA==","8CM8IzAk+CLbIg==","PjBYL34wFC/3Lg==","jDx0O8w8MDsTOw=="];
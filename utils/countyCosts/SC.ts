@@ -0,0 +1,7 @@
+// SOUTH CAROLINA (SC) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Abbeville County","Aiken County","Allendale County","Anderson County","Bamberg County","Barnwell County","Beaufort County","Berkeley County","Calhoun County","Charleston County","Cherokee County","Chester County","Chesterfield County","Clarendon County","Colleton County","Darlington County","Dillon County","Dorchester County","Edgefield County","Fairfield County","Florence County","Georgetown County","Greenville County","Greenwood County","Hampton County","Horry County","Jasper County","Kershaw County","Lancaster County","Laurens County","Lee County","Lexington County","Marion County","Marlboro County","McCormick County","Newberry County","Oconee County","Orangeburg County","Pickens County","Richland County","Saluda County","Spartanburg County","Sumter County","Union County","Williamsburg County","York County"];
+export const COUNTY_COLUMNS: string[] = ["cgGWAZgBhgGJAYoBcgGHAZIBjAF+AZgBfgGOAYIBdAGUAYABjgGIAXYBiwF5AZIBiQFyAZABfwF8AYQBdAF8AZcBcgGEAXMBeQGUAZMBhwF2AXUBlQGVAXQBgAE=","yAH0AfYB4AHkAeUByAHhAe4B6AHWAfYB1wHqAdwByQHxAdgB6gHjAcwB5wHQAe8B4wHIAewB1wHUAd4BygHUAfUByAHdAckB0QHyAfAB4QHMAcsB8wHyAcoB2QE=","aQGLAY0BfAF/AYABaQF9AYcBggF0AY0BdQGDAXgBagGKAXYBgwF+AWwBgQFvAYgBfwFpAYYBdQFyAXoBawFyAYwBaQF6AWoBcAGKAYkBfQFsAWsBiwGKAWsBdgE=","gACMAI0AhwCIAIgAgACHAIsAiQCEAI0AhACJAIUAgACLAIQAiQCHAIEAiQCCAIsAiACAAIoAhACDAIYAgQCDAIwAgACGAIAAggCMAIsAhwCBAIEAjACMAIEAhQA=","OgJxAnQCWAJdAl8COgJZAmoCYgJMAnQCTQJkAlMCPAJuAk8CZAJcAj8CYAJEAmsCXAI6AmgCTQJJAlUCPQJJAnICOgJVAjsCRQJuAm0CWgJAAj4CcAJvAj0CTwI=","NwA4ADgAOAA4ADgANwA4ADgAOAA3ADgANwA4ADgANwA4ADgAOAA4ADcAOAA3ADgAOAA3ADgANwA3ADgANwA3ADgANwA4ADcANwA4ADgAOAA3ADcAOAA4ADcAOAA=","jgCcAJ0AlgCXAJcAjgCWAJoAmACTAJ0AkwCZAJQAjwCbAJMAmQCXAI8AmACRAJoAlwCOAJoAkwCSAJUAjwCSAJwAjgCVAI4AkQCbAJsAlgCQAI8AnACbAI8AkwA=","KQAtAC4ALAAsACwAKQAsAC0ALAArAC4AKwAsACsAKQAtACsALAAsACoALAAqAC0ALAApAC0AKwAqACsAKgAqAC0AKQArACkAKgAtAC0ALAAqACoALQAtACoAKwA=","FAAWABcAFgAWABYAFAAWABYAFgAVABcAFQAWABUAFAAWABUAFgAWABUAFgAVABYAFgAUABYAFQAVABUAFQAVABYAFAAVABQAFQAWABYAFgAVABUAFgAWABUAFQA="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEMARQBBAEcASQBLAE0ATwBRAFMAVQBXAFkAWwA=";
+export const ALIAS_KEYS: string[] = ["abbeville","abbeville county","aiken","aiken county","allendale","allendale county","anderson","anderson county","bamberg","bamberg county","barnwell","barnwell county","beaufort","beaufort county","berkeley","berkeley county","calhoun","calhoun county","charleston","charleston county","cherokee","cherokee county","chester","chester county","chesterfield","chesterfield county","clarendon","clarendon county","colleton","colleton county","darlington","darlington county","dillon","dillon county","dorchester","dorchester county","edgefield","edgefield county","fairfield","fairfield county","florence","florence county","georgetown","georgetown county","greenville","greenville county","greenwood","greenwood county","hampton","hampton county","horry","horry county","jasper","jasper county","kershaw","kershaw county","lancaster","lancaster county","laurens","laurens county","lee","lee county","lexington","lexington county","marion","marion county","marlboro","marlboro county","mccormick","mccormick county","newberry","newberry county","oconee","oconee county","orangeburg","orangeburg county","pickens","pickens county","richland","richland county","saluda","saluda county","spartanburg","spartanburg county","sumter","sumter county","union","union county","williamsburg","williamsburg county","york","york county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAA==";
+export const PRICE_BAND_TOTALS: string[] = ["OwkJChYKsQnCCccJOwm1CfEJ0wl+CRYKgQnbCZoJQgn+CYwJ2wm9CU8JzglhCfQJwAk7CekJgglyCaQJSAlyCQ0KOwmjCT8JZAkACvoJtglRCUsJBgoCCkgJjgk=","TgohCy4LyQraCt8KTgrNCgkL6wqRCi4LlArzCrIKVQoWC6QK8wrVCmIK5gp0CgwL2ApOCgELlQqFCrwKWwqFCiULTgq7ClIKdwoYCxILzgpkCl4KHgsaC1sKpgo=","YQs5DEYM4QvyC/cLYQvlCyEMAwykC0YMpwsLDMoLaAsuDLwLCwztC3UL/guHCyQM8AthCxkMqAuYC9QLbguYCz0MYQvTC2ULigswDCoM5gt3C3ELNgwyDG4Lvgs=","dAxRDV4N+QwKDQ8NdAz9DDkNGw23DF4NugwjDeIMewxGDdQMIw0FDYgMFg2aDDwNCA10DDENuwyrDOwMgQyrDFUNdAzrDHgMnQxIDUIN/gyKDIQMTg1KDYEM1gw=","hw1pDnYOEQ4iDicOhw0VDlEOMw7KDXYOzQ07DvoNjg1eDuwNOw4dDpsNLg6tDVQOIA6HDUkOzg2+DQQOlA2+DW0Ohw0DDosNsA1gDloOFg6dDZcNZg5iDpQN7g0=","mg6BD44PKQ86Dz8Pmg4tD2kPSw/dDo4P4A5TDxIPoQ52DwQPUw81D64ORg/ADmwPOA+aDmEP4Q7RDhwPpw7RDoUPmg4bD54Oww54D3IPLg+wDqoOfg96D6cOBg8=","wBCxEb4RWRFqEW8RwBBdEZkRexEDEb4RBhGDEUIRxxCmETQRgxFlEdQQdhHmEJwRaBHAEJERBxH3EEwRzRD3ELURwBBLEcQQ6RCoEaIRXhHWENAQrhGqEc0QNhE=","5hLhE+4TiROaE58T5hKNE8kTqxMpE+4TLBOzE3IT7RLWE2QTsxOVE/oSphMME8wTmBPmEsETLRMdE3wT8xIdE+UT5hJ7E+oSDxPYE9ITjhP8EvYS3hPaE/MSZhM=","RRhZGWYZARkSGRcZRRgFGUEZIxmIGGYZixgrGeoYTBhOGdwYKxkNGVkYHhlrGEQZEBlFGDkZjBh8GPQYUhh8GF0ZRRjzGEkYbhhQGUoZBhlbGFUYVhlSGVIY3hg=","pB3RHt4eeR6KHo8epB19Hrkemx7nHd4e6h2jHmIeqx3GHlQeox6FHrgdlh7KHbweiB6kHbEe6x3bHWwesR3bHdUepB1rHqgdzR3IHsIefh66HbQdzh7KHrEdVh4=","YijBKc4paSl6KX8pYihtKakpiymlKM4pqCiTKVIpaSi2KUQpkyl1KXYohimIKKwpeCliKKEpqSiZKFwpbyiZKMUpYihbKWYoiyi4KbIpbil4KHIovim6KW8oRik=","IDOxNL40WTRqNG80IDNdNJk0ezRjM740ZjODNEI0JzOmNDQ0gzRlNDQzdjRGM5w0aDQgM5E0ZzNXM0w0LTNXM7U0IDNLNCQzSTOoNKI0XjQ2MzAzrjSqNC0zNjQ="];
@@ -0,0 +1,7 @@
+// SOUTH DAKOTA (SD) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Aurora County","Beadle County","Bennett County","Bon Homme County","Brookings County","Brown County","Brule County","Buffalo County","Butte County","Campbell County","Charles Mix County","Clark County","Clay County","Codington County","Corson County","Custer County","Davison County","Day County","Deuel County","Dewey County","Douglas County","Edmunds County","Fall River County","Faulk County","Grant County","Gregory County","Haakon County","Hamlin County","Hand County","Hanson County","Harding County","Hughes County","Hutchinson County","Hyde County","Jackson County","Jerauld County","Jones County","Kingsbury County","Lake County","Lawrence County","Lincoln County","Lyman County","Marshall County","McCook County","McPherson County","Meade County","Mellette County","Miner County","Minnehaha County","Moody County","Oglala Lakota County","Pennington County","Perkins County","Potter County","Roberts County","Sanborn County","Spink County","Stanley County","Sully County","Todd County","Tripp County","Turner County","Union County","Walworth County","Yankton County","Ziebach County"];
+export const COUNTY_COLUMNS: string[] = ["MQE6AScBPAEqAS8BOAE1ATUBLgEsATABLwE/ASMBMwE3AToBKwE1ASoBNQEjATYBPQEpASUBOQE5ASsBPAE+AS4BJQE0ATEBMAEiATsBKQEuATcBIgE3AT8BOwEyATcBMwEmATQBIgEiASEBPwEvATEBNgE8AToBMwE/ATwBJQEtAT4B","ggGNAXUBjwF4AX4BiQGGAYcBfQF7AYABfgGTAW8BhAGJAYwBeQGHAXgBhgFvAYcBkAF3AXIBjAGLAXkBkAGSAX0BcgGGAYIBgAFvAY4BdwF+AYkBbwGJAZMBjgGCAYkBhAFzAYQBbgFvAW0BkwF/AYEBhwGPAYwBhAGTAZABcgF9AZEB","LAE1ASIBNwElASoBMgEwATABKQEnASsBKgE6AR4BLgEyATUBJgEwASUBMAEeATEBOAEkASABNAE0ASYBNwE5ASkBIAEvASwBKwEeATYBJAEpATIBHgEyAToBNgEtATIBLgEhAS8BHQEeAR0BOgEqASwBMQE3ATUBLgE6ATcBIAEpATgB","bABvAGgAbwBpAGsAbgBtAG0AawBqAGsAawBxAGcAbABuAG8AaQBtAGkAbQBnAG0AcABpAGgAbwBuAGkAcABwAGsAZwBtAGwAawBnAG8AaQBrAG4AZwBuAHEAbwBsAG4AbABoAG0AZgBnAGYAcQBrAGwAbQBvAG8AbABxAHAAZwBqAHAA","wwHQAbQB0gG4Ab8BzAHIAckBvgG7AcEBvwHXAa0BxQHLAc8BuQHJAbgByAGtAckB1AG2AbEBzwHOAbkB0wHWAb0BsAHHAcMBwQGtAdIBtwG+AcsBrQHLAdcB0QHEAcsBxgGyAcYBqwGtAasB1wHAAcIBygHSAc8BxQHYAdMBsAG9AdUB","LgAuAC4ALgAuAC4ALgAuAC4ALgAuAC4ALgAvAC4ALgAuAC4ALgAuAC4ALgAuAC4ALgAuAC4ALgAuAC4ALgAvAC4ALgAuAC4ALgAuAC4ALgAuAC4ALgAuAC8ALgAuAC4ALgAuAC4ALgAuAC4ALwAuAC4ALgAuAC4ALgAvAC4ALgAuAC4A","cABzAGwAdABtAG8AcgBxAHEAbwBuAG8AbwB1AGoAcAByAHMAbQBxAG0AcQBqAHEAdABtAGsAcwBzAG0AdAB1AG4AawBxAHAAbwBqAHQAbQBvAHIAagByAHUAcwBwAHIAcQBsAHEAagBqAGoAdQBvAHAAcgB0AHMAcAB1AHQAawBuAHQA","JgAnACQAJwAlACUAJgAmACYAJQAlACUAJQAnACQAJgAmACcAJQAmACUAJgAkACYAJwAlACQAJwAnACUAJwAnACUAJAAmACYAJQAkACcAJQAlACYAJAAmACcAJwAmACYAJgAkACYAJAAkACQAJwAlACYAJgAnACcAJgAnACcAJAAlACcA","EAAQAA8AEAAPAA8AEAAQABAADwAPAA8ADwAQAA8AEAAQABAADwAQAA8AEAAPABAAEAAPAA8AEAAQAA8AEAAQAA8ADwAQABAADwAPABAADwAPABAADwAQABAAEAAQABAAEAAPABAADwAPAA8AEAAPABAAEAAQABAAEAAQABAADwAPABAA"];
+export const COUNTY_FIPS: string = "AwAFAAcACQALAA0ADwARABMAFQAXABkAGwAdAB8AIQAjACUAJwApACsALQAvADEAMwA1ADcAOQA7AD0APwBBAEMARQBHAEkASwBNAE8AUQBTAFUAWwBXAFkAXQBfAGEAYwBlAGYAZwBpAGsAbQBvAHMAdQB3AHkAewB9AH8AgQCHAIkA";
+export const ALIAS_KEYS: string[] = ["aurora","aurora county","beadle","beadle county","bennett","bennett county","bon homme","bon homme county","brookings","brookings county","brown","brown county","brule","brule county","buffalo","buffalo county","butte","butte county","campbell","campbell county","charles mix","charles mix county","clark","clark county","clay","clay county","codington","codington county","corson","corson county","custer","custer county","davison","davison county","day","day county","deuel","deuel county","dewey","dewey county","douglas","douglas county","edmunds","edmunds county","fall river","fall river county","faulk","faulk county","grant","grant county","gregory","gregory county","haakon","haakon county","hamlin","hamlin county","hand","hand county","hanson","hanson county","harding","harding county","hughes","hughes county","hutchinson","hutchinson county","hyde","hyde county","jackson","jackson county","jerauld","jerauld county","jones","jones county","kingsbury","kingsbury county","lake","lake county","lawrence","lawrence county","lincoln","lincoln county","lyman","lyman county","marshall","marshall county","mccook","mccook county","mcpherson","mcpherson county","meade","meade county","mellette","mellette county","miner","miner county","minnehaha","minnehaha county","moody","moody county","oglala lakota","oglala lakota county","pennington","pennington county","perkins","perkins county","potter","potter county","roberts","roberts county","sanborn","sanborn county","spink","spink county","stanley","stanley county","sully","sully county","todd","todd county","tripp","tripp county","turner","turner county","union","union county","walworth","walworth county","yankton","yankton county","ziebach","ziebach county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5ADoAOgA7ADsAPAA8AD0APQA+AD4APwA/AEAAQABBAEEA";
+export const PRICE_BAND_TOTALS: string[] = ["mgfLB18H1AdvB4oHuwetB68Hhgd7B5AHigfrB0cHoge5B8kHcwevB28HrQdHB7EH2gdqB1QHxwfEB3MH1wfmB4QHUgeqB5oHkAdGB9EHaweHB7kHRge5B+sHzwedB7kHpAdZB6cHQQdGBz8H6weMB5gHswfUB8kHogfsB9cHUgeCB90H","gAixCEUIughVCHAIoQiTCJUIbAhhCHYIcAjWCC0IiAifCK8IWQiVCFUIkwgtCJcIwAhQCDoIrQiqCFkIvQjRCGoIOAiQCIAIdggsCLcIUQhtCJ8ILAifCNYItQiDCJ8Iigg/CI0IJwgsCCUI1ghyCH4ImQi6CK8IiAjXCL0IOAhoCMMI","ZgmXCSsJoAk7CVYJhwl5CXsJUglHCVwJVgnBCRMJbgmFCZUJPwl7CTsJeQkTCX0Jpgk2CSAJkwmQCT8Jowm8CVAJHgl2CWYJXAkSCZ0JNwlTCYUJEgmFCcEJmwlpCYUJcAklCXMJDQkSCQsJwQlYCWQJfwmgCZUJbgnCCaMJHglOCakJ","TAp9ChEKhgohCjwKbQpfCmEKOAotCkIKPAqsCvkJVAprCnsKJQphCiEKXwr5CWMKjAocCgYKeQp2CiUKiQqnCjYKBApcCkwKQgr4CYMKHQo5CmsK+AlrCqwKgQpPCmsKVgoLClkK8wn4CfEJrAo+CkoKZQqGCnsKVAqtCokKBAo0Co8K","MgtjC/cKbAsHCyILUwtFC0cLHgsTCygLIguXC98KOgtRC2ELCwtHCwcLRQvfCkkLcgsCC+wKXwtcCwsLbwuSCxwL6gpCCzILKAveCmkLAwsfC1EL3gpRC5cLZws1C1ELPAvxCj8L2QreCtcKlwskCzALSwtsC2ELOguYC28L6goaC3UL","GAxJDN0LUgztCwgMOQwrDC0MBAz5Cw4MCAyCDMULIAw3DEcM8QstDO0LKwzFCy8MWAzoC9ILRQxCDPELVQx9DAIM0AsoDBgMDgzEC08M6QsFDDcMxAs3DIIMTQwbDDcMIgzXCyUMvwvEC70LggwKDBYMMQxSDEcMIAyDDFUM0AsADFsM","5A0VDqkNHg65DdQNBQ73DfkN0A3FDdoN1A1YDpEN7A0DDhMOvQ35DbkN9w2RDfsNJA60DZ4NEQ4ODr0NIQ5TDs4NnA30DeQN2g2QDRsOtQ3RDQMOkA0DDlgOGQ7nDQMO7g2jDfENiw2QDYkNWA7WDeIN/Q0eDhMO7A1ZDiEOnA3MDScO","sA/hD3UP6g+FD6AP0Q/DD8UPnA+RD6YPoA8uEF0PuA/PD98PiQ/FD4UPww9dD8cP8A+AD2oP3Q/aD4kP7Q8pEJoPaA/AD7APpg9cD+cPgQ+dD88PXA/PDy4Q5Q+zD88Pug9vD70PVw9cD1UPLhCiD64PyQ/qD98PuA8vEO0PaA+YD/MP","LhRfFPMTaBQDFB4UTxRBFEMUGhQPFCQUHhTFFNsTNhRNFF0UBxRDFAMUQRTbE0UUbhT+E+gTWxRYFAcUaxTAFBgU5hM+FC4UJBTaE2UU/xMbFE0U2hNNFMUUYxQxFE0UOBTtEzsU1RPaE9MTxRQgFCwURxRoFF0UNhTGFGsU5hMWFHEU","rBjdGHEY5hiBGJwYzRi/GMEYmBiNGKIYnBhcGVkYtBjLGNsYhRjBGIEYvxhZGMMY7Bh8GGYY2RjWGIUY6RhXGZYYZBi8GKwYohhYGOMYfRiZGMsYWBjLGFwZ4RivGMsYthhrGLkYUxhYGFEYXBmeGKoYxRjmGNsYtBhdGekYZBiUGO8Y","qCHZIW0h4iF9IZghySG7Ib0hlCGJIZ4hmCGKIlUhsCHHIdchgSG9IX0huyFVIb8h6CF4IWIh1SHSIYEh5SGFIpIhYCG4IaghniFUId8heSGVIcchVCHHIYoi3SGrIcchsiFnIbUhTyFUIU0hiiKaIaYhwSHiIdchsCGLIuUhYCGQIesh","pCrVKmkq3ip5KpQqxSq3KrkqkCqFKpoqlCq4K1EqrCrDKtMqfSq5KnkqtypRKrsq5Cp0Kl4q0SrOKn0q4SqzK44qXCq0KqQqmipQKtsqdSqRKsMqUCrDKrgr2SqnKsMqripjKrEqSypQKkkquCuWKqIqvSreKtMqrCq5K+EqXCqMKucq"];
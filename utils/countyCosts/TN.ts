@@ -0,0 +1,7 @@
+// TENNESSEE (TN) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Anderson County","Bedford County","Benton County","Bledsoe County","Blount County","Bradley County","Campbell County","Cannon County","Carroll County","Carter County","Cheatham County","Chester County","Claiborne County","Clay County","Cocke County","Coffee County","Crockett County","Cumberland County","Davidson County","DeKalb County","Decatur County","Dickson County","Dyer County","Fayette County","Fentress County","Franklin County","Gibson County","Giles County","Grainger County","Greene County","Grundy County","Hamblen County","Hamilton County","Hancock County","Hardeman County","Hardin County","Hawkins County","Haywood County","Henderson County","Henry County","Hickman County","Houston County","Humphreys County","Jackson County","Jefferson County","Johnson County","Knox County","Lake County","Lauderdale County","Lawrence County","Lewis County","Lincoln County","Loudon County","Macon County","Madison County","Marion County","Marshall County","Maury County","McMinn County","McNairy County","Meigs County","Monroe County","Montgomery County","Moore County","Morgan County","Obion County","Overton County","Perry County","Pickett County","Polk County","Putnam County","Rhea County","Roane County","Robertson County","Rutherford County","Scott County","Sequatchie County","Sevier County","Shelby County","Smith County","Stewart County","Sullivan County","Sumner County","Tipton County","Trousdale County","Unicoi County","Union County","Van Buren County","Warren County","Washington County","Wayne County","Weakley County","White County","Williamson County","Wilson County"];
+export const COUNTY_COLUMNS: string[] = ["hgGBAYIBmQGTAY0BggF6AY4BkQFyAZgBfQGDAYABkwF0AZkBggGFAXoBhwF2AZkBjAGJAYEBdAF2AZMBiQGSAYABhQGVAYQBigF6AY8BdAGVAXoBjAGLAZMBjQGQAZQBigF8AXMBgwF5AXQBcwGXAXQBewF+AZgBfwGFAXYBewF2AXcBcwGHAZQBdQF7AY4BdwGSAY8BggGXAY8BhwGVAX8BhAGCAZEBjAF7AZUBkgGIAXQBgQF0AYQBdwGGAQ==","6gHkAeUBAgL6AfMB5gHbAfQB+AHRAQEC3gHnAeIB+gHTAQIC5gHpAdsB6wHVAQIC8QHtAeQB1AHVAfsB7gH5AeIB6QH9AecB7wHbAfUB1AH+AdsB8gHwAfsB8gH2AfsB7wHeAdIB5gHaAdQB0gH/AdMB3AHhAQEC4QHpAdYB3AHWAdcB0gHsAfwB1QHdAfQB1wH5AfYB5gEAAvUB6wH9AeEB6AHmAfgB8gHdAf0B+QHtAdMB5AHTAecB1wHqAQ==","dwFyAXMBiQGDAX4BdAFsAX4BgQFkAYgBbgF0AXEBgwFmAYkBdAF2AWwBeAFnAYkBfQF6AXIBZgFnAYQBegGDAXEBdgGFAXUBewFrAYABZgGGAWsBfQF7AYQBfQGAAYQBewFuAWUBdAFrAWYBZQGHAWUBbAFwAYgBcAF2AWgBbAFoAWgBZQF4AYQBZwFtAX4BaAGDAYABdAGIAYABeAGFAXABdQF0AYIBfQFtAYUBggF5AWYBcgFlAXUBaQF3AQ==","jACKAIoAkgCQAI4AigCHAI4AkACFAJIAiACLAIkAkACFAJIAigCLAIcAjACGAJIAjgCNAIoAhQCGAJAAjQCQAIkAiwCRAIsAjQCHAI8AhQCRAIcAjgCNAJAAjgCPAJEAjQCIAIUAiwCHAIUAhQCSAIUAiACJAJIAiQCLAIYAiACGAIYAhQCMAJEAhgCIAI4AhgCQAI8AigCSAI8AjACRAIkAiwCKAJAAjgCIAJEAkACMAIUAigCFAIsAhgCMAA==","cQJpAmoCjwKGAnwCbAJeAn4CgwJSAo4CYgJtAmcChgJUAo8CbAJvAl4CcgJXAo8CewJ2AmkCVQJXAoYCdwKFAmcCbwKJAm0CeAJeAoACVQKKAl4CewJ5AoYCfAKBAocCeAJiAlMCbAJdAlUCUwKMAlQCXwJlAo4CZgJwAlgCXwJYAlkCUwJ0AogCVgJgAn4CWQKFAoACbAKNAoACcgKJAmYCbgJsAoMCewJgAokChAJ1AlQCagJUAm0CWQJyAg==","OAA4ADgAOAA4ADgAOAA3ADgAOAA3ADgANwA4ADgAOAA3ADgAOAA4ADcAOAA3ADgAOAA4ADgANwA3ADgAOAA4ADgAOAA4ADgAOAA3ADgANwA4ADcAOAA4ADgAOAA4ADgAOAA3ADcAOAA3ADcANwA4ADcANwA3ADgANwA4ADcANwA3ADcANwA4ADgANwA3ADgANwA4ADgAOAA4ADgAOAA4ADcAOAA4ADgAOAA3ADgAOAA4ADcAOAA3ADgANwA4AA==","mwCZAJkAogCgAJ0AmQCWAJ4AnwCTAKIAlwCaAJgAoACUAKIAmQCaAJYAmwCUAKIAnQCcAJkAlACUAKAAnACfAJgAmgChAJoAnACWAJ4AlAChAJYAnQCdAKAAnQCfAKAAnACXAJMAmQCWAJQAkwChAJMAlgCYAKIAmACaAJQAlgCUAJUAkwCbAKAAlACWAJ4AlQCfAJ4AmQCiAJ4AmwChAJgAmgCZAJ8AnQCWAKEAnwCcAJQAmQCTAJoAlQCbAA==","LgAtAC0AMAAvAC4ALQAsAC4ALwArADAALAAtAC0ALwArADAALQAtACwALgAsADAALgAuAC0AKwAsAC8ALgAvAC0ALQAvAC0ALgAsAC8AKwAvACwALgAuAC8ALgAvAC8ALgAsACsALQAsACsAKwAwACsALAAtADAALQAtACwALAAsACwAKwAuAC8ALAAsAC4ALAAvAC8ALQAwAC8ALgAvAC0ALQAtAC8ALgAsAC8ALwAuACsALQArAC0ALAAuAA==","GAAXABcAGQAYABgAFwAXABgAGAAWABkAFwAXABcAGAAWABkAFwAXABcAGAAXABkAGAAYABcAFgAXABgAGAAYABcAFwAYABcAGAAXABgAFgAYABcAGAAYABgAGAAYABgAGAAXABYAFwAXABYAFgAZABYAFwAXABkAFwAXABcAFwAXABcAFgAYABgAFgAXABgAFwAYABgAFwAZABgAGAAYABcAFwAXABgAGAAXABgAGAAYABYAFwAWABcAFwAYAA=="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQApACcAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBXAFkAWwBdAF8AYQBjAGUAZwBpAG8AcQBzAHUAdwBrAG0AeQB7AH0AfwCBAIMAhQCHAIkAiwCNAI8AkQCTAJUAlwCZAJsAnQCfAKEAowClAKcAqQCrAK0ArwCxALMAtQC3ALkAuwC9AA==";
+export const ALIAS_KEYS: string[] = ["anderson","anderson county","bedford","bedford county","benton","benton county","bledsoe","bledsoe county","blount","blount county","bradley","bradley county","campbell","campbell county","cannon","cannon county","carroll","carroll county","carter","carter county","cheatham","cheatham county","chester","chester county","claiborne","claiborne county","clay","clay county","cocke","cocke county","coffee","coffee county","crockett","crockett county","cumberland","cumberland county","davidson","davidson county","decatur","decatur county","dekalb","dekalb county","dickson","dickson county","dyer","dyer county","fayette","fayette county","fentress","fentress county","franklin","franklin county","gibson","gibson county","giles","giles county","grainger","grainger county","greene","greene county","grundy","grundy county","hamblen","hamblen county","hamilton","hamilton county","hancock","hancock county","hardeman","hardeman county","hardin","hardin county","hawkins","hawkins county","haywood","haywood county","henderson","henderson county","henry","henry county","hickman","hickman county","houston","houston county","humphreys","humphreys county","jackson","jackson county","jefferson","jefferson county","johnson","johnson county","knox","knox county","lake","lake county","lauderdale","lauderdale county","lawrence","lawrence county","lewis","lewis county","lincoln","lincoln county","loudon","loudon county","macon","macon county","madison","madison county","marion","marion county","marshall","marshall county","maury","maury county","mcminn","mcminn county","mcnairy","mcnairy county","meigs","meigs county","monroe","monroe county","montgomery","montgomery county","moore","moore county","morgan","morgan county","obion","obion county","overton","overton county","perry","perry county","pickett","pickett county","polk","polk county","putnam","putnam county","rhea","rhea county","roane","roane county","robertson","robertson county","rutherford","rutherford county","scott","scott county","sequatchie","sequatchie county","sevier","sevier county","shelby","shelby county","smith","smith county","stewart","stewart county","sullivan","sullivan county","sumner","sumner county","tipton","tipton county","trousdale","trousdale county","unicoi","unicoi county","union","union county","van buren","van buren county","warren","warren county","washington","washington county","wayne","wayne county","weakley","weakley county","white","white county","williamson","williamson county","wilson","wilson county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABQAFAATABMAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5ADoAOgA7ADsAPAA8AD0APQA+AD4APwA/AEAAQABBAEEAQgBCAEMAQwBEAEQARQBFAEYARgBHAEcASABIAEkASQBKAEoASwBLAEwATABNAE0ATgBOAE8ATwBQAFAAUQBRAFIAUgBTAFMAVABUAFUAVQBWAFYAVwBXAFgAWABZAFkAWgBaAFsAWwBcAFwAXQBdAF4AXgA=";
+export const PRICE_BAND_TOTALS: string[] = ["3Qm/CcMJSAolCgMKxwmSCQgKGwplCUQKoAnMCbcJJQpuCUgKxwnUCZIJ4Ql5CUgK/gntCb8JcAl5CScK7wkhCrcJ1AkxCs4J8wmRCRAKcAk0CpEJ/wn3CScKAQoUCioK8wmfCWkJyQmOCXAJaQk9CmwJlgmsCUQKrgnVCXwJlgl8CYAJaQnkCSwKdgmZCQgKgAkhChEKxwlBChAK4QkxCq4J0AnHCRwK/wmZCTEKHwrpCW4JwAlsCc4JgQneCQ==","9QrXCtsKYAs9CxsL3wqlCiALMwt4ClwLswrkCs8KPQuBCmAL3wrsCqUK+QqMCmALFgsFC9cKgwqMCj8LBws5C88K7ApJC+YKCwukCigLgwpMC6QKFwsPCz8LGQssC0ILCwuyCnwK4QqhCoMKfApVC38KqQq/ClwLwQrtCo8KqQqPCpMKfAr8CkQLiQqsCiALkwo5CykL3wpZCygL+QpJC8EK6ArfCjQLFwusCkkLNwsBC4EK2Ap/CuYKlAr2Cg==","DQzvC/MLeAxVDDMM9wu4CzgMSwyLC3QMxgv8C+cLVQyUC3gM9wsEDLgLEQyfC3gMLgwdDO8LlgufC1cMHwxRDOcLBAxhDP4LIwy3C0AMlgtkDLcLLwwnDFcMMQxEDFoMIwzFC48L+Qu0C5YLjwttDJILvAvSC3QM1AsFDKILvAuiC6YLjwsUDFwMnAu/CzgMpgtRDEEM9wtxDEAMEQxhDNQLAAz3C0wMLwy/C2EMTwwZDJQL8AuSC/4LpwsODA==","JQ0HDQsNkA1tDUsNDw3LDFANYw2eDIwN2QwUDf8MbQ2nDJANDw0cDcsMKQ2yDJANRg01DQcNqQyyDG8NNw1pDf8MHA15DRYNOw3KDFgNqQx8DcoMRw0/DW8NSQ1cDXINOw3YDKIMEQ3HDKkMogyFDaUMzwzlDIwN5wwdDbUMzwy1DLkMogwsDXQNrwzSDFANuQxpDVkNDw2JDVgNKQ15DecMGA0PDWQNRw3SDHkNZw0xDacMCA2lDBYNugwmDQ==","PQ4fDiMOqA6FDmMOJw7eDWgOew6xDaQO7A0sDhcOhQ66DagOJw40Dt4NQQ7FDagOXg5NDh8OvA3FDYcOTw6BDhcONA6RDi4OUw7dDXAOvA2UDt0NXw5XDocOYQ50DooOUw7rDbUNKQ7aDbwNtQ2dDrgN4g34DaQO+g01DsgN4g3IDcwNtQ1EDowOwg3lDWgOzA2BDnEOJw6hDnAOQQ6RDvoNMA4nDnwOXw7lDZEOfw5JDroNIA64DS4OzQ0+Dg==","VQ83DzsPwA+dD3sPPw/xDoAPkw/EDrwP/w5EDy8PnQ/NDsAPPw9MD/EOWQ/YDsAPdg9lDzcPzw7YDp8PZw+ZDy8PTA+pD0YPaw/wDogPzw6sD/AOdw9vD58PeQ+MD6IPaw/+DsgOQQ/tDs8OyA61D8sO9Q4LD7wPDQ9ND9sO9Q7bDt8OyA5cD6QP1Q74DoAP3w6ZD4kPPw+5D4gPWQ+pDw0PSA8/D5QPdw/4DqkPlw9hD80OOA/LDkYP4A5WDw==","hRFnEWsR8BHNEasRbxEXEbARwxHqEOwRJRF0EV8RzRHzEPARbxF8ERcRiRH+EPARphGVEWcR9RD+EM8RlxHJEV8RfBHZEXYRmxEWEbgR9RDcERYRpxGfEc8RqRG8EdIRmxEkEe4QcRETEfUQ7hDlEfEQGxExEewRMxF9EQERGxEBEQUR7hCMEdQR+xAeEbARBRHJEbkRbxHpEbgRiRHZETMReBFvEcQRpxEeEdkRxxGREfMQaBHxEHYRBhGGEQ==","tROXE5sTIBT9E9sTnxM9E+AT8xMQExwUSxOkE48T/RMZEyAUnxOsEz0TuRMkEyAU1hPFE5cTGxMkE/8TxxP5E48TrBMJFKYTyxM8E+gTGxMMFDwT1xPPE/8T2RPsEwIUyxNKExQToRM5ExsTFBMVFBcTQRNXExwUWROtEycTQRMnEysTFBO8EwQUIRNEE+ATKxP5E+kTnxMZFOgTuRMJFFkTqBOfE/QT1xNEEwkU9xPBExkTmBMXE6YTLBO2Ew==","LRkPGRMZmBl1GVMZFxmcGFgZaxlvGJQZqhgcGQcZdRl4GJgZFxkkGZwYMRmDGJgZThk9GQ8ZehiDGHcZPxlxGQcZJBmBGR4ZQxmbGGAZehiEGZsYTxlHGXcZURlkGXoZQxmpGHMYGRmYGHoYcxiNGXYYoBi2GJQZuBglGYYYoBiGGIoYcxg0GXwZgBijGFgZihhxGWEZFxmRGWAZMRmBGbgYIBkXGWwZTxmjGIEZbxk5GXgYEBl2GB4ZixguGQ==","pR6HHoseEB/tHssejx77HdAe4x7OHQwfCR6UHn8e7R7XHRAfjx6cHvsdqR7iHRAfxh61Hoce2R3iHe8etx7pHn8enB75HpYeux76Hdge2R38Hvodxx6/Hu8eyR7cHvIeux4IHtIdkR73Hdkd0h0FH9Ud/x0VHgwfFx6dHuUd/x3lHekd0h2sHvQe3x0CHtAe6R3pHtkejx4JH9geqR75HhcemB6PHuQexx4CHvke5x6xHtcdiB7VHZYe6h2mHg==","lSl3KXspACrdKbspfym5KMAp0ymMKPwpxyiEKW8p3SmVKAAqfymMKbkomSmgKAAqtimlKXcplyigKN8ppynZKW8pjCnpKYYpqym4KMgplyjsKbgotymvKd8puSnMKeIpqynGKJAogSm1KJcokCj1KZMovSjTKPwp1SiNKaMovSijKKcokCicKeQpnSjAKMAppyjZKckpfyn5KcgpmSnpKdUoiCl/KdQptynAKOkp1ymhKZUoeCmTKIYpqCiWKQ==","hTRnNGs08DTNNKs0bzR3M7A0wzRKM+w0hTN0NF80zTRTM/A0bzR8NHcziTReM/A0pjSVNGc0VTNeM880lzTJNF80fDTZNHY0mzR2M7g0VTPcNHYzpzSfNM80qTS8NNI0mzSEM04zcTRzM1UzTjPlNFEzezORM+w0kzN9NGEzezNhM2UzTjOMNNQ0WzN+M7A0ZTPJNLk0bzTpNLg0iTTZNJMzeDRvNMQ0pzR+M9k0xzSRNFMzaDRRM3Y0ZjOGNA=="];
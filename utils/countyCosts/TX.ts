@@ -0,0 +1,7 @@
+// TEXAS (TX) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Anderson County","Andrews County","Angelina County","Aransas County","Archer County","Armstrong County","Atascosa County","Austin County","Bailey County","Bandera County","Bastrop County","Baylor County","Bee County","Bell County","Bexar County","Blanco County","Borden County","Bosque County","Bowie County","Brazoria County","Brazos County","Brewster County","Briscoe County","Brooks County","Brown County","Burleson County","Burnet County","Caldwell County","Calhoun County","Callahan County","Cameron County","Camp County","Carson County","Cass County","Castro County","Chambers County","Cherokee County","Childress County","Clay County","Cochran County","Coke County","Coleman County","Collin County","Collingsworth County","Colorado County","Comal County","Comanche County","Concho County","Cooke County","Coryell County","Cottle County","Crane County","Crockett County","Crosby County","Culberson County","Dallam County","Dallas County","Dawson County","DeWitt County","Deaf Smith County","Delta County","Denton County","Dickens County","Dimmit County","Donley County","Duval County","Eastland County","Ector County","Edwards County","El Paso County","Ellis County","Erath County","Falls County","Fannin County","Fayette County","Fisher County","Floyd County","Foard County","Fort Bend County","Franklin County","Freestone County","Frio County","Gaines County","Galveston County","Garza County","Gillespie County","Glasscock County","Goliad County","Gonzales County","Gray County","Grayson County","Gregg County","Grimes County","Guadalupe County","Hale County","Hall County","Hamilton County","Hansford County","Hardeman County","Hardin County","Harris County","Harrison County","Hartley County","Haskell County","Hays County","Hemphill County","Henderson County","Hidalgo County","Hill County","Hockley County","Hood County","Hopkins County","Houston County","Howard County","Hudspeth County","Hunt County","Hutchinson County","Irion County","Jack County","Jackson County","Jasper County","Jeff Davis County","Jefferson County","Jim Hogg County","Jim Wells County","Johnson County","Jones County","Karnes County","Kaufman County","Kendall County","Kenedy County","Kent County","Kerr County","Kimble County","King County","Kinney County","Kleberg County","Knox County","La Salle County","Lamar County","Lamb County","Lampasas County","Lavaca County","Lee County","Leon County","Liberty County","Limestone County","Lipscomb County","Live Oak County","Llano County","Loving County","Lubbock County","Lynn County","Madison County","Marion County","Martin County","Mason County","Matagorda County","Maverick County","McCulloch County","McLennan County","McMullen County","Medina County","Menard County","Midland County","Milam County","Mills County","Mitchell County","Montague County","Montgomery County","Moore County","Morris County","Motley County","Nacogdoches County","Navarro County","Newton County","Nolan County","Nueces County","Ochiltree County","Oldham County","Orange County","Palo Pinto County","Panola County","Parker County","Parmer County","Pecos County","Polk County","Potter County","Presidio County","Rains County","Randall County","Reagan County","Real County","Red River County","Reeves County","Refugio County","Roberts County","Robertson County","Rockwall County","Runnels County","Rusk County","Sabine County","San Augustine County","San Jacinto County","San Patricio County","San Saba County","Schleicher County","Scurry County","Shackelford County","Shelby County","Sherman County","Smith County","Somervell County","Starr County","Stephens County","Sterling County","Stonewall County","Sutton County","Swisher County","Tarrant County","Taylor County","Terrell County","Terry County","Throckmorton County","Titus County","Tom Green County","Travis County","Trinity County","Tyler County","Upshur County","Upton County","Uvalde County","Val Verde County","Van Zandt County","Victoria County","Walker County","Waller County","Ward County","Washington County","Webb County","Wharton County","Wheeler County","Wichita County","Wilbarger County","Willacy County","Williamson County","Wilson County","Winkler County","Wise County","Wood County","Yoakum County","Young County","Zapata County","Zavala County"];
+export const COUNTY_COLUMNS: string[] = ["pAGhAaABtgGwAZgBoAGTAZgBngGmAaUBnAGuAZ0BnAGUAZgBuAGWAacBrQG1AaEBoQGjAZQBkAGxAbUBtgGTAakBnAGmAaQBmwGRAaEBqgGWAbEBrAGZAZABpwGTAacBrgGpAZEBpAGRAZsBtgGTAawBrAGbAawBmQGnAZgBlgGiAa0BpwGzAa4BmAGcAZABmQGpAbgBqQGtAbEBrgGnAY8BlgGnAZEBkgGfAZ0BsgGeAZcBpgGPAZkBtwG0AZsBnQGdAbQBoQG3AZsBqQGZAbYBpwGuAbABtQGZAZYBsAGXAaIBnAG2AaABnQGtAakBrwGhAbIBtQGzAasBowGlAasBkQGiAZ8BtwG3AZUBpAGWAa4BsAGZAZkBoQGtAZEBlAGbAbQBtgGhAbIBmgGsAawBkAG2AZYBkwGRAZwBsgGUAZkBkgGoAbYBqQGWAaUBsgGTAZgBpQGXAa4BjwGTAZwBrgGdAZsBsAGfAZkBpAGdAbMBkgGPAZkBngGYAZ4BmQGSAZkBtQG4AbEBkQGwAaABswGrAaoBlgGzAaMBnAGPAaUBqQG0Aa0BsAGlAbYBkQGoAacBtAG0AZQBlAGdAaMBqwG1Aa0BswGvAbMBkgGpAZsBqwGkAa8BpwGRAagBogGmAaQBlgGuAZQBpAG0AZABmQGZAbcBkgG2AQ==","DQIJAggCJAIcAv4BCAL4Af4BBgIQAg8CAwIaAgUCAwL5Af4BJgL8ARECGQIjAgkCCQILAvkB9AEdAiICJAL4ARQCAwIQAg0CAgL1AQkCFAL7AR0CFwIAAvQBEQL4ARECGQIUAvUBDgL1AQECIwL4ARcCFwICAhcCAAIRAv4B/AELAhgCEQIgAhoC/gEEAvQB/wETAiYCFAIYAh0CGgIRAvMB/AERAvYB9wEHAgQCHwIGAv0BEALzAf8BJQIhAgICBQIEAiECCgIlAgECEwIAAiQCEQIZAhwCIgIAAvsBHAL9AQsCAwIjAggCBAIYAhMCGwIKAh8CIwIgAhYCDAIPAhYC9gELAgcCJQIlAvoBDQL8ARoCHAIAAv8BCgIYAvUB+QECAiECJAIJAh4CAAIXAhcC9AEkAvsB+AH1AQMCHwL6Af8B9wESAiQCEwL7AQ8CHwL4Af4BDwL9ARkC8wH4AQMCGgIFAgICHAIHAgACDgIFAiAC9gHyAf8BBgL+AQYC/wH2AQACIwImAh0C9QEcAggCIAIWAhUC/AEgAgsCAwLyAQ4CEwIhAhkCHAIOAiMC9gESAhECIQIiAvkB+QEEAgwCFQIiAhkCIAIbAiAC9wETAgECFgINAhsCEQL1ARICCgIPAg0C+wEaAvkBDgIhAvQBAAIAAiUC9gEkAg==","/gH6AfkBFAIMAvAB+QHpAe8B9wEBAgAC9AEKAvYB9AHqAe8BFgLtAQICCQITAvoB+gH8AeoB5gENAhICFALpAQUC9AEBAv4B8wHnAfoBBQLtAQ0CCALxAeYBAgLpAQICCgIFAucB/wHnAfMBEwLpAQgCCALzAQgC8QECAu8B7QH8AQkCAgIRAgsC7wH1AeYB8QEEAhYCBQIJAg4CCgICAuUB7gECAugB6QH4AfUBDwL3Ae4BAQLlAfEBFQIRAvMB9gH1AREC+wEVAvMBBALxARQCAgIKAg0CEgLxAe0BDALuAfwB9AETAvkB9QEJAgQCCwL7AQ8CEwIRAgcC/QEAAgcC6AH8AfgBFQIVAuwB/gHuAQsCDQLxAfEB+wEJAucB6wHzARECFAL6AQ8C8gEIAggC5gEUAu0B6gHnAfQBDwLrAfAB6QEDAhQCBALtAQACDwLpAe8BAALvAQoC5QHpAfQBCwL2AfMBDQL4AfEB/wH2ARAC6AHkAfEB9wHwAfcB8AHoAfEBEwIWAg4C5wENAvkBEQIHAgYC7QEQAvwB9AHkAf8BBAIRAgkCDAL/ARMC6AEDAgICEQISAuoB6wH1Af0BBgISAgkCEAIMAhEC6QEEAvMBBwL+AQwCAgLnAQMC+wEAAv4B7QEKAusB/wERAuYB8QHxARUC6AEUAg==","lgCVAJQAnACaAJEAlACQAJEAlACXAJYAkwCZAJMAkwCQAJEAnQCRAJcAmQCcAJQAlQCVAJAAjwCaAJwAnACQAJgAkwCWAJYAkwCPAJUAmACRAJoAmQCSAI4AlwCQAJcAmQCYAI8AlgCPAJIAnACQAJkAmQCTAJkAkgCXAJEAkQCVAJkAlwCbAJkAkQCTAI8AkgCXAJ0AmACZAJoAmQCXAI4AkQCXAI8AjwCUAJMAmwCUAJEAlgCOAJIAnQCbAJMAkwCTAJsAlQCcAJIAlwCSAJwAlwCZAJoAnACSAJEAmgCRAJUAkwCcAJQAkwCZAJcAmgCVAJsAnACbAJgAlQCWAJgAjwCVAJQAnACcAJAAlgCRAJkAmgCSAJIAlQCZAI8AkACTAJsAnACUAJsAkgCZAJkAjgCcAJEAkACPAJMAmwCQAJIAjwCXAJwAlwCRAJYAmwCQAJEAlgCRAJkAjgCQAJMAmQCTAJMAmgCUAJIAlgCTAJsAjwCOAJIAlACRAJQAkgCPAJIAnACdAJoAjwCaAJQAmwCYAJgAkQCbAJUAkwCOAJYAlwCbAJkAmgCWAJwAjwCXAJcAmwCcAJAAkACTAJUAmACcAJkAmwCaAJsAjwCXAJIAmACWAJoAlwCPAJcAlQCWAJYAkQCZAJAAlgCbAI4AkgCSAJwAjwCcAA==","qQGmAaUBvAG1AZ0BpQGYAZ0BowGrAaoBoQGzAaIBoAGYAZ0BvQGbAawBsgG6AaYBpgGoAZgBlQG2AboBuwGYAa4BoQGrAakBoAGWAaYBrwGaAbYBsQGeAZUBrAGYAawBswGuAZYBqQGVAaABuwGYAbEBsQGgAbEBngGsAZ0BmwGnAbIBrAG5AbQBnQGhAZUBngGuAb0BrgGyAbYBswGsAZQBmwGsAZYBlwGkAaIBtwGjAZwBqwGUAZ4BvAG5AaABogGiAbkBpgG8AaABrgGeAbwBrAGzAbUBugGeAZoBtQGcAacBoQG7AaUBogGyAa4BtAGmAbcBugG5AbABqAGqAbABlgGnAaQBvAG8AZoBqQGbAbQBtQGeAZ4BpgGyAZYBmQGgAbkBuwGmAbcBnwGxAbEBlQG7AZoBmAGWAaEBtwGZAZ0BlwGtAbsBrgGaAaoBtwGYAZ0BqgGcAbMBlAGYAaABtAGiAaABtQGkAZ4BqQGiAbgBlwGTAZ4BowGdAaMBnQGXAZ4BugG9AbYBlQG1AaUBuQGwAa8BmwG4AagBoAGTAaoBrgG5AbIBtQGqAbsBlgGtAawBuQG6AZgBmQGiAagBsAG6AbIBuAG0AbkBlwGuAaABsAGpAbQBrAGVAa0BpwGrAakBmgGzAZkBqQG5AZUBngGeAbwBlwG8AQ==","NQA1ADUANQA1ADUANQA0ADQANQA1ADUANQA1ADUANQA0ADQANQA0ADUANQA1ADUANQA1ADQANAA1ADUANQA0ADUANQA1ADUANQA0ADUANQA0ADUANQA1ADQANQA0ADUANQA1ADQANQA0ADUANQA0ADUANQA1ADUANQA1ADQANAA1ADUANQA1ADUANAA1ADQANQA1ADUANQA1ADUANQA1ADQANAA1ADQANAA1ADUANQA1ADQANQA0ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADQANQA0ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADUANAA1ADUANQA1ADQANQA0ADUANQA1ADUANQA1ADQANAA1ADUANQA1ADUANQA1ADUANAA1ADQANAA0ADUANQA0ADUANAA1ADUANQA0ADUANQA0ADQANQA0ADUANAA0ADUANQA1ADUANQA1ADUANQA1ADUANAA0ADUANQA1ADUANQA0ADUANQA1ADUANAA1ADUANQA1ADUANAA1ADUANQA0ADUANQA1ADUANQA1ADUANAA1ADUANQA1ADQANAA1ADUANQA1ADUANQA1ADUANAA1ADUANQA1ADUANQA0ADUANQA1ADUANAA1ADQANQA1ADQANQA1ADUANAA1AA==","tACyALIAvAC5AK8AsgCsAK4AsQC1ALQAsAC4ALEAsACtAK4AvACuALUAuAC7ALIAsgCzAK0AqwC5ALsAuwCsALYAsAC1ALQAsACsALIAtgCuALkAtwCvAKsAtQCsALUAuAC2AKwAtACrALAAuwCsALcAtwCwALcArwC1AK4ArgCzALcAtQC6ALgArgCwAKsArwC2ALwAtgC3ALkAuAC1AKsArgC1AKwArACyALEAugCxAK4AtQCrAK8AvAC7ALAAsQCxALsAswC8ALAAtgCvALwAtQC4ALkAuwCvAK4AuQCuALMAsAC7ALIAsQC3ALYAuACzALoAuwC6ALcAswC0ALcArACzALIAvAC8AK0AtACuALgAuQCvAK8AswC3AKwArQCwALsAuwCyALoArwC3ALcAqwC7AK4ArACsALAAugCtAK8ArAC1ALsAtgCuALQAugCsAK4AtACuALgAqwCsALAAuACxALAAuQCyAK8AtACxALoArACrAK8AsQCvALEArwCsAK8AuwC8ALkAqwC5ALIAugC3ALYArgC6ALMAsACrALQAtgC7ALgAuQC0ALsArAC1ALUAuwC7AK0ArQCxALMAtwC7ALgAugC5ALoArAC2ALAAtwC0ALkAtQCrALUAswC0ALQArgC4AK0AtAC7AKsArwCvALwArAC8AA==","MQAwADAAMwAyAC8AMAAvAC8AMAAxADEAMAAyADAAMAAvAC8AMwAvADEAMgAzADAAMAAwAC8ALgAyADMAMwAvADEAMAAxADEAMAAuADAAMQAvADIAMQAvAC4AMQAvADEAMgAxAC4AMQAuAC8AMwAvADEAMQAwADEALwAxAC8ALwAwADIAMQAyADIALwAwAC4ALwAxADMAMQAyADIAMgAxAC4ALwAxAC4ALgAwADAAMgAwAC8AMQAuAC8AMwAyADAAMAAwADIAMAAzAC8AMQAvADMAMQAyADIAMwAvAC8AMgAvADAAMAAzADAAMAAyADEAMgAwADIAMwAyADEAMAAxADEALgAwADAAMwAzAC8AMQAvADIAMgAvAC8AMAAyAC4ALwAwADIAMwAwADIALwAxADEALgAzAC8ALwAuADAAMgAvAC8ALgAxADMAMQAvADEAMgAvAC8AMQAvADIALgAvADAAMgAwADAAMgAwAC8AMQAwADIALgAuAC8AMAAvADAALwAuAC8AMwAzADIALgAyADAAMgAxADEALwAyADAAMAAuADEAMQAyADIAMgAxADMALgAxADEAMgAyAC8ALwAwADAAMQAzADIAMgAyADIALgAxAC8AMQAxADIAMQAuADEAMAAxADEALwAyAC8AMQAyAC4ALwAvADMALgAzAA==","HAAbABsAHQAcABsAGwAaABsAGwAcABwAGwAcABsAGwAaABsAHQAbABwAHAAdABsAGwAbABoAGgAcAB0AHQAaABwAGwAcABwAGwAaABsAHAAbABwAHAAbABoAHAAaABwAHAAcABoAHAAaABsAHQAaABwAHAAbABwAGwAcABsAGwAbABwAHAAdABwAGwAbABoAGwAcAB0AHAAcABwAHAAcABoAGwAcABoAGgAbABsAHAAbABsAHAAaABsAHQAdABsAGwAbAB0AGwAdABsAHAAbAB0AHAAcABwAHQAbABsAHAAbABsAGwAdABsAGwAcABwAHAAbABwAHQAdABwAGwAcABwAGgAbABsAHQAdABsAHAAbABwAHAAbABsAGwAcABoAGgAbAB0AHQAbABwAGwAcABwAGgAdABsAGgAaABsAHAAaABsAGgAcAB0AHAAbABwAHAAaABsAHAAbABwAGgAaABsAHAAbABsAHAAbABsAHAAbAB0AGgAaABsAGwAbABsAGwAaABsAHQAdABwAGgAcABsAHQAcABwAGwAdABsAGwAaABwAHAAdABwAHAAcAB0AGgAcABwAHQAdABoAGgAbABsAHAAdABwAHQAcAB0AGgAcABsAHAAcABwAHAAaABwAGwAcABwAGwAcABoAHAAdABoAGwAbAB0AGgAdAA=="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBXAFkAWwBdAF8AYQBjAGUAZwBpAGsAbQBvAHEAcwB7AHUAdwB5AH0AfwCBAIMAhQCHAIkAjQCLAI8AkQCTAJUAlwCZAJsAnQCfAKEAowClAKcAqQCrAK0ArwCxALMAtQC3ALkAuwC9AL8AwQDDAMUAxwDJAMsAzQDPANEA0wDVANcA2QDbAN0A3wDhAOMA5QDnAOkA6wDtAO8A8QDzAPUA9wD5APsA/QD/AAEBAwEFAQcBCQELAQ0BDwERARMBGwEVARcBGQEdAR8BIQEjASUBJwEpASsBLQEvATEBOQE7AT0BPwFBAUMBMwE1ATcBRQFHAUkBSwFNAU8BUQFTAVUBVwFZAVsBXQFfAWEBYwFlAWcBaQFrAW0BbwFxAXMBdQF3AXkBewF9AX8BgQGDAYUBhwGJAYsBjQGPAZEBkwGVAZcBmQGbAZ0BnwGhAaMBpQGnAakBqwGtAa8BsQGzAbUBtwG5AbsBvQG/AcEBwwHFAccByQHLAc0BzwHRAdMB1QHXAdkB2wHdAd8B4QHjAeUB5wHpAesB7QHvAfEB8wH1AfcB+QH7AQ==";
+export const ALIAS_KEYS: string[] = ["anderson","anderson county","andrews","andrews county","angelina","angelina county","aransas","aransas county","archer","archer county","armstrong","armstrong county","atascosa","atascosa county","austin","austin county","bailey","bailey county","bandera","bandera county","bastrop","bastrop county","baylor","baylor county","bee","bee county","bell","bell county","bexar","bexar county","blanco","blanco county","borden","borden county","bosque","bosque county","bowie","bowie county","brazoria","brazoria county","brazos","brazos county","brewster","brewster county","briscoe","briscoe county","brooks","brooks county","brown","brown county","burleson","burleson county","burnet","burnet county","caldwell","caldwell county","calhoun","calhoun county","callahan","callahan county","cameron","cameron county","camp","camp county","carson","carson county","cass","cass county","castro","castro county","chambers","chambers county","cherokee","cherokee county","childress","childress county","clay","clay county","cochran","cochran county","coke","coke county","coleman","coleman county","collin","collin county","collingsworth","collingsworth county","colorado","colorado county","comal","comal county","comanche","comanche county","concho","concho county","cooke","cooke county","coryell","coryell county","cottle","cottle county","crane","crane county","crockett","crockett county","crosby","crosby county","culberson","culberson county","dallam","dallam county","dallas","dallas county","dawson","dawson county","deaf smith","deaf smith county","delta","delta county","denton","denton county","dewitt","dewitt county","dickens","dickens county","dimmit","dimmit county","donley","donley county","duval","duval county","eastland","eastland county","ector","ector county","edwards","edwards county","el paso","el paso county","ellis","ellis county","erath","erath county","falls","falls county","fannin","fannin county","fayette","fayette county","fisher","fisher county","floyd","floyd county","foard","foard county","fort bend","fort bend county","franklin","franklin county","freestone","freestone county","frio","frio county","gaines","gaines county","galveston","galveston county","garza","garza county","gillespie","gillespie county","glasscock","glasscock county","goliad","goliad county","gonzales","gonzales county","gray","gray county","grayson","grayson county","gregg","gregg county","grimes","grimes county","guadalupe","guadalupe county","hale","hale county","hall","hall county","hamilton","hamilton county","hansford","hansford county","hardeman","hardeman county","hardin","hardin county","harris","harris county","harrison","harrison county","hartley","hartley county","haskell","haskell county","hays","hays county","hemphill","hemphill county","henderson","henderson county","hidalgo","hidalgo county","hill","hill county","hockley","hockley county","hood","hood county","hopkins","hopkins county","houston","houston county","howard","howard county","hudspeth","hudspeth county","hunt","hunt county","hutchinson","hutchinson county","irion","irion county","jack","jack county","jackson","jackson county","jasper","jasper county","jeff davis","jeff davis county","jefferson","jefferson county","jim hogg","jim hogg county","jim wells","jim wells county","johnson","johnson county","jones","jones county","karnes","karnes county","kaufman","kaufman county","kendall","kendall county","kenedy","kenedy county","kent","kent county","kerr","kerr county","kimble","kimble county","king","king county","kinney","kinney county","kleberg","kleberg county","knox","knox county","la salle","la salle county","lamar","lamar county","lamb","lamb county","lampasas","lampasas county","lavaca","lavaca county","lee","lee county","leon","leon county","liberty","liberty county","limestone","limestone county","lipscomb","lipscomb county","live oak","live oak county","llano","llano county","loving","loving county","lubbock","lubbock county","lynn","lynn county","madison","madison county","marion","marion county","martin","martin county","mason","mason county","matagorda","matagorda county","maverick","maverick county","mcculloch","mcculloch county","mclennan","mclennan county","mcmullen","mcmullen county","medina","medina county","menard","menard county","midland","midland county","milam","milam county","mills","mills county","mitchell","mitchell county","montague","montague county","montgomery","montgomery county","moore","moore county","morris","morris county","motley","motley county","nacogdoches","nacogdoches county","navarro","navarro county","newton","newton county","nolan","nolan county","nueces","nueces county","ochiltree","ochiltree county","oldham","oldham county","orange","orange county","palo pinto","palo pinto county","panola","panola county","parker","parker county","parmer","parmer county","pecos","pecos county","polk","polk county","potter","potter county","presidio","presidio county","rains","rains county","randall","randall county","reagan","reagan county","real","real county","red river","red river county","reeves","reeves county","refugio","refugio county","roberts","roberts county","robertson","robertson county","rockwall","rockwall county","runnels","runnels county","rusk","rusk county","sabine","sabine county","san augustine","san augustine county","san jacinto","san jacinto county","san patricio","san patricio county","san saba","san saba county","schleicher","schleicher county","scurry","scurry county","shackelford","shackelford county","shelby","shelby county","sherman","sherman county","smith","smith county","somervell","somervell county","starr","starr county","stephens","stephens county","sterling","sterling county","stonewall","stonewall county","sutton","sutton county","swisher","swisher county","tarrant","tarrant county","taylor","taylor county","terrell","terrell county","terry","terry county","throckmorton","throckmorton county","titus","titus county","tom green","tom green county","travis","travis county","trinity","trinity county","tyler","tyler county","upshur","upshur county","upton","upton county","uvalde","uvalde county","val verde","val verde county","van zandt","van zandt county","victoria","victoria county","walker","walker county","waller","waller county","ward","ward county","washington","washington county","webb","webb county","wharton","wharton county","wheeler","wheeler county","wichita","wichita county","wilbarger","wilbarger county","willacy","willacy county","williamson","williamson county","wilson","wilson county","winkler","winkler county","wise","wise county","wood","wood county","yoakum","yoakum county","young","young county","zapata","zapata county","zavala","zavala county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5ADsAOwA8ADwAPQA9ADoAOgA+AD4APwA/AEAAQABBAEEAQgBCAEMAQwBEAEQARQBFAEYARgBHAEcASABIAEkASQBKAEoASwBLAEwATABNAE0ATgBOAE8ATwBQAFAAUQBRAFIAUgBTAFMAVABUAFUAVQBWAFYAVwBXAFgAWABZAFkAWgBaAFsAWwBcAFwAXQBdAF4AXgBfAF8AYABgAGEAYQBiAGIAYwBjAGQAZABlAGUAZgBmAGcAZwBoAGgAaQBpAGoAagBrAGsAbABsAG0AbQBuAG4AbwBvAHAAcABxAHEAcgByAHMAcwB0AHQAdQB1AHYAdgB3AHcAeAB4AHkAeQB6AHoAewB7AHwAfAB9AH0AfgB+AH8AfwCAAIAAgQCBAIIAggCDAIMAhACEAIUAhQCGAIYAhwCHAIgAiACJAIkAigCKAIsAiwCMAIwAjQCNAI4AjgCPAI8AkACQAJEAkQCSAJIAkwCTAJQAlACVAJUAlgCWAJcAlwCYAJgAmQCZAJoAmgCbAJsAnACcAJ0AnQCeAJ4AnwCfAKAAoAChAKEAogCiAKMAowCkAKQApQClAKYApgCnAKcAqACoAKkAqQCqAKoAqwCrAKwArACtAK0ArgCuAK8ArwCwALAAsQCxALIAsgCzALMAtAC0ALUAtQC2ALYAtwC3ALgAuAC5ALkAugC6ALsAuwC8ALwAvQC9AL4AvgC/AL8AwADAAMEAwQDCAMIAwwDDAMQAxADFAMUAxgDGAMcAxwDIAMgAyQDJAMoAygDLAMsAzADMAM0AzQDOAM4AzwDPANAA0ADRANEA0gDSANMA0wDUANQA1QDVANYA1gDXANcA2ADYANkA2QDaANoA2wDbANwA3ADdAN0A3gDeAN8A3wDgAOAA4QDhAOIA4gDjAOMA5ADkAOUA5QDmAOYA5wDnAOgA6ADpAOkA6gDqAOsA6wDsAOwA7QDtAO4A7gDvAO8A8ADwAPEA8QDyAPIA8wDzAPQA9AD1APUA9gD2APcA9wD4APgA+QD5APoA+gD7APsA/AD8AP0A/QA=";
+export const PRICE_BAND_TOTALS: string[] = ["+AnlCeAJWwo3CrYJ4AmVCa8J1wkECv4JywktCtIJygmZCa8JYwqnCQgKKQpVCuQJ5QnuCZkJhQk7ClMKWQqVCRQKywkDCvgJxwmKCeUJFgqlCTsKIgq8CYQJCAqVCQgKLAoUCooJ+gmICcQJVwqVCSIKIgrHCSIKvAkICq8JpwnsCScKCApKCi8KrwnNCYUJuwkRCmMKFAonCjwKLQoICoAJqAkICowJkAncCdAJQwrXCasJAwqACbsJXwpNCscJ0gnQCU0K6AleCsQJEQq8CVsKCAosCjgKUwq8CaUJNwqrCewJywlXCuAJ0AknChEKMgroCUMKVQpKCh0K8An+CR0KjAnsCdwJXgpeCqAJ+AmoCS8KOAq8CbsJ6AknCooJmwnHCU0KWQrkCUIKvwkiCiIKhAlZCqUJlgmKCcsJQwqcCbkJkAkMClkKEQqlCf4JQwqVCa8J/gmsCSwKgAmVCcoJLwrSCccJOArcCbwJ+gnSCUgKjgl9CbsJ1wm2CdcJuQmOCbwJVQpjCjwKiAk4CuAJSgodChgKpwlICu4Jygl9CfwJEQpNCikKNwr8CVcKjAkMCggKTQpRCpkJmwnQCfAJGwpTCikKSAo0CkoKkAkRCsQJHQr4CTQKCAqICQwK6gkACvgJpQktCpsJ+glNCoQJvAm8CV4KjglbCg==","AQvuCukKZAtAC78K6QqZCrMK4AoNCwcL1Ao2C9sK0wqdCrMKbAurChELMgteC+0K7gr3Cp0KiQpEC1wLYguZCh0L1AoMCwEL0AqOCu4KHwupCkQLKwvFCogKEQuZChELNQsdC44KAwuMCs0KYAuZCisLKwvQCisLxQoRC7MKqwr1CjALEQtTCzgLswrWCokKxAoaC2wLHQswC0ULNgsRC4QKrAoRC5AKlArlCtkKTAvgCq8KDAuECsQKaAtWC9AK2wrZClYL8QpnC80KGgvFCmQLEQs1C0ELXAvFCqkKQAuvCvUK1ApgC+kK2QowCxoLOwvxCkwLXgtTCyYL+QoHCyYLkAr1CuUKZwtnC6QKAQusCjgLQQvFCsQK8QowC44KnwrQClYLYgvtCksLyAorCysLiApiC6kKmgqOCtQKTAugCsIKlAoVC2ILGgupCgcLTAuZCrMKBwuwCjULhAqZCtMKOAvbCtAKQQvlCsUKAwvbClELkgqBCsQK4Aq/CuAKwgqSCsUKXgtsC0ULjApBC+kKUwsmCyELqwpRC/cK0wqBCgULGgtWCzILQAsFC2ALkAoVCxELVgtaC50KnwrZCvkKJAtcCzILUQs9C1MLlAoaC80KJgsBCz0LEQuMChUL8woJCwELqQo2C58KAwtWC4gKxQrFCmcLkgpkCw==","Cgz3C/ILbQxJDMgL8gudC7cL6QsWDBAM3Qs/DOQL3AuhC7cLdQyvCxoMOwxnDPYL9wsADKELjQtNDGUMawydCyYM3QsVDAoM2QuSC/cLKAytC00MNAzOC4wLGgydCxoMPgwmDJILDAyQC9YLaQydCzQMNAzZCzQMzgsaDLcLrwv+CzkMGgxcDEEMtwvfC40LzQsjDHUMJgw5DE4MPwwaDIgLsAsaDJQLmAvuC+ILVQzpC7MLFQyIC80LcQxfDNkL5AviC18M+gtwDNYLIwzOC20MGgw+DEoMZQzOC60LSQyzC/4L3QtpDPIL4gs5DCMMRAz6C1UMZwxcDC8MAgwQDC8MlAv+C+4LcAxwDKgLCgywC0EMSgzOC80L+gs5DJILowvZC18Mawz2C1QM0Qs0DDQMjAtrDK0LnguSC90LVQykC8sLmAseDGsMIwytCxAMVQydC7cLEAy0Cz4MiAudC9wLQQzkC9kLSgzuC84LDAzkC1oMlguFC80L6QvIC+kLywuWC84LZwx1DE4MkAtKDPILXAwvDCoMrwtaDAAM3AuFCw4MIwxfDDsMSQwODGkMlAseDBoMXwxjDKELowviCwIMLQxlDDsMWgxGDFwMmAsjDNYLLwwKDEYMGgyQCx4M/AsSDAoMrQs/DKMLDAxfDIwLzgvOC3AMlgttDA==","Ew0ADfsMdg1SDdEM+wyhDLsM8gwfDRkN5gxIDe0M5QylDLsMfg2zDCMNRA1wDf8MAA0JDaUMkQxWDW4NdA2hDC8N5gweDRMN4gyWDAANMQ2xDFYNPQ3XDJAMIw2hDCMNRw0vDZYMFQ2UDN8Mcg2hDD0NPQ3iDD0N1wwjDbsMswwHDUINIw1lDUoNuwzoDJEM1gwsDX4NLw1CDVcNSA0jDYwMtAwjDZgMnAz3DOsMXg3yDLcMHg2MDNYMeg1oDeIM7QzrDGgNAw15Dd8MLA3XDHYNIw1HDVMNbg3XDLEMUg23DAcN5gxyDfsM6wxCDSwNTQ0DDV4NcA1lDTgNCw0ZDTgNmAwHDfcMeQ15DawMEw20DEoNUw3XDNYMAw1CDZYMpwziDGgNdA3/DF0N2gw9DT0NkAx0DbEMogyWDOYMXg2oDNQMnAwnDXQNLA2xDBkNXg2hDLsMGQ24DEcNjAyhDOUMSg3tDOIMUw33DNcMFQ3tDGMNmgyJDNYM8gzRDPIM1AyaDNcMcA1+DVcNlAxTDfsMZQ04DTMNswxjDQkN5QyJDBcNLA1oDUQNUg0XDXINmAwnDSMNaA1sDaUMpwzrDAsNNg1uDUQNYw1PDWUNnAwsDd8MOA0TDU8NIw2UDCcNBQ0bDRMNsQxIDacMFQ1oDZAM1wzXDHkNmgx2DQ==","HA4JDgQOfw5bDtoNBA6lDb8N+w0oDiIO7w1RDvYN7g2pDb8Nhw63DSwOTQ55DggOCQ4SDqkNlQ1fDncOfQ6lDTgO7w0nDhwO6w2aDQkOOg61DV8ORg7gDZQNLA6lDSwOUA44DpoNHg6YDegNew6lDUYORg7rDUYO4A0sDr8Ntw0QDksOLA5uDlMOvw3xDZUN3w01DocOOA5LDmAOUQ4sDpANuA0sDpwNoA0ADvQNZw77DbsNJw6QDd8Ngw5xDusN9g30DXEODA6CDugNNQ7gDX8OLA5QDlwOdw7gDbUNWw67DRAO7w17DgQO9A1LDjUOVg4MDmcOeQ5uDkEOFA4iDkEOnA0QDgAOgg6CDrANHA64DVMOXA7gDd8NDA5LDpoNqw3rDXEOfQ4IDmYO4w1GDkYOlA19DrUNpg2aDe8NZw6sDd0NoA0wDn0ONQ61DSIOZw6lDb8NIg68DVAOkA2lDe4NUw72DesNXA4ADuANHg72DWwOng2NDd8N+w3aDfsN3Q2eDeANeQ6HDmAOmA1cDgQObg5BDjwOtw1sDhIO7g2NDSAONQ5xDk0OWw4gDnsOnA0wDiwOcQ51DqkNqw30DRQOPw53Dk0ObA5YDm4OoA01DugNQQ4cDlgOLA6YDTAODg4kDhwOtQ1RDqsNHg5xDpQN4A3gDYIOng1/Dg==","JQ8SDw0PiA9kD+MODQ+pDsMOBA8xDysP+A5aD/8O9w6tDsMOkA+7DjUPVg+CDxEPEg8bD60OmQ5oD4APhg+pDkEP+A4wDyUP9A6eDhIPQw+5DmgPTw/pDpgONQ+pDjUPWQ9BD54OJw+cDvEOhA+pDk8PTw/0Dk8P6Q41D8MOuw4ZD1QPNQ93D1wPww76DpkO6A4+D5APQQ9UD2kPWg81D5QOvA41D6AOpA4JD/0OcA8ED78OMA+UDugOjA96D/QO/w79DnoPFQ+LD/EOPg/pDogPNQ9ZD2UPgA/pDrkOZA+/DhkP+A6EDw0P/Q5UDz4PXw8VD3APgg93D0oPHQ8rD0oPoA4ZDwkPiw+LD7QOJQ+8DlwPZQ/pDugOFQ9UD54Orw70DnoPhg8RD28P7A5PD08PmA6GD7kOqg6eDvgOcA+wDuYOpA45D4YPPg+5DisPcA+pDsMOKw/ADlkPlA6pDvcOXA//DvQOZQ8JD+kOJw//DnUPog6RDugOBA/jDgQP5g6iDukOgg+QD2kPnA5lDw0Pdw9KD0UPuw51DxsP9w6RDikPPg96D1YPZA8pD4QPoA45DzUPeg9+D60Orw79Dh0PSA+AD1YPdQ9hD3cPpA4+D/EOSg8lD2EPNQ+cDjkPFw8tDyUPuQ5aD68OJw96D5gO6Q7pDosPog6IDw==","NxEkER8RmhF2EfUQHxGxEMsQFhFDET0RChFsERERCRG1EMsQohHDEEcRaBGUESMRJBEtEbUQoRB6EZIRmBGxEFMRChFCETcRBhGmECQRVRHBEHoRYRH7EKAQRxGxEEcRaxFTEaYQORGkEAMRlhGxEGERYREGEWER+xBHEcsQwxArEWYRRxGJEW4RyxAMEaEQ+hBQEaIRUxFmEXsRbBFHEZwQxBBHEagQrBAbEQ8RghEWEccQQhGcEPoQnhGMEQYREREPEYwRJxGdEQMRUBH7EJoRRxFrEXcRkhH7EMEQdhHHECsRChGWER8RDxFmEVARcREnEYIRlBGJEVwRLxE9EVwRqBArERsRnRGdEbwQNxHEEG4RdxH7EPoQJxFmEaYQtxAGEYwRmBEjEYER/hBhEWERoBCYEcEQshCmEAoRghG4EPgQrBBLEZgRUBHBED0RghGxEMsQPRHIEGsRnBCxEAkRbhEREQYRdxEbEfsQOREREYcRqhCZEPoQFhH1EBYR+BCqEPsQlBGiEXsRpBB3ER8RiRFcEVcRwxCHES0RCRGZEDsRUBGMEWgRdhE7EZYRqBBLEUcRjBGQEbUQtxAPES8RWhGSEWgRhxFzEYkRrBBQEQMRXBE3EXMRRxGkEEsRKRE/ETcRwRBsEbcQORGMEaAQ+xD7EJ0RqhCaEQ==","SRM2EzETrBOIEwcTMRO5EtMSKBNVE08THBN+EyMTGxO9EtMStBPLElkTehOmEzUTNhM/E70SqRKME6QTqhO5EmUTHBNUE0kTGBOuEjYTZxPJEowTcxMNE6gSWRO5ElkTfRNlE64SSxOsEhUTqBO5EnMTcxMYE3MTDRNZE9MSyxI9E3gTWRObE4AT0xIeE6kSDBNiE7QTZRN4E40TfhNZE6QSzBJZE7AStBItEyETlBMoE88SVBOkEgwTsBOeExgTIxMhE54TOROvExUTYhMNE6wTWRN9E4kTpBMNE8kSiBPPEj0THBOoEzETIRN4E2ITgxM5E5QTphObE24TQRNPE24TsBI9Ey0TrxOvE8QSSRPMEoATiRMNEwwTORN4E64SvxIYE54TqhM1E5MTEBNzE3MTqBKqE8kSuhKuEhwTlBPAEgoTtBJdE6oTYhPJEk8TlBO5EtMSTxPQEn0TpBK5EhsTgBMjExgTiRMtEw0TSxMjE5kTshKhEgwTKBMHEygTChOyEg0TphO0E40TrBKJEzETmxNuE2kTyxKZEz8TGxOhEk0TYhOeE3oTiBNNE6gTsBJdE1kTnhOiE70SvxIhE0ETbBOkE3oTmROFE5sTtBJiExUTbhNJE4UTWROsEl0TOxNRE0kTyRJ+E78SSxOeE6gSDRMNE68TshKsEw==","dhhjGF4Y2Ri1GDQYXhjNF+cXVRiCGHwYSRirGFAYSBjRF+cX4RjfF4YYpxjTGGIYYxhsGNEXvRe5GNEY1xjNF5IYSRiBGHYYRRjCF2MYlBjdF7kYoBg6GLwXhhjNF4YYqhiSGMIXeBjAF0IY1RjNF6AYoBhFGKAYOhiGGOcX3xdqGKUYhhjIGK0Y5xdLGL0XORiPGOEYkhilGLoYqxiGGLgX4BeGGMQXyBdaGE4YwRhVGOMXgRi4FzkY3RjLGEUYUBhOGMsYZhjcGEIYjxg6GNkYhhiqGLYY0Rg6GN0XtRjjF2oYSRjVGF4YThilGI8YsBhmGMEY0xjIGJsYbhh8GJsYxBdqGFoY3BjcGNgXdhjgF60Ythg6GDkYZhilGMIX0xdFGMsY1xhiGMAYPRigGKAYvBfXGN0XzhfCF0kYwRjUFzcYyBeKGNcYjxjdF3wYwRjNF+cXfBjkF6oYuBfNF0gYrRhQGEUYthhaGDoYeBhQGMYYxhe1FzkYVRg0GFUYNxjGFzoY0xjhGLoYwBe2GF4YyBibGJYY3xfGGGwYSBi1F3oYjxjLGKcYtRh6GNUYxBeKGIYYyxjPGNEX0xdOGG4YmRjRGKcYxhiyGMgYyBePGEIYmxh2GLIYhhjAF4oYaBh+GHYY3RerGNMXeBjLGLwXOhg6GNwYxhfZGA==","ox2QHYsdBh7iHWEdix3hHPscgh2vHakddh3YHX0ddR3lHPscDh7zHLMd1B0AHo8dkB2ZHeUc0RzmHf4dBB7hHL8ddh2uHaMdch3WHJAdwR3xHOYdzR1nHdAcsx3hHLMd1x2/HdYcpR3UHG8dAh7hHM0dzR1yHc0dZx2zHfsc8xyXHdIdsx31Hdod+xx4HdEcZh28HQ4evx3SHecd2B2zHcwc9ByzHdgc3ByHHXsd7h2CHfccrh3MHGYdCh74HXIdfR17Hfgdkx0JHm8dvB1nHQYesx3XHeMd/h1nHfEc4h33HJcddh0CHosdex3SHbwd3R2THe4dAB71Hcgdmx2pHcgd2ByXHYcdCR4JHuwcox30HNod4x1nHWYdkx3SHdYc5xxyHfgdBB6PHe0dah3NHc0d0BwEHvEc4hzWHHYd7h3oHGQd3By3HQQevB3xHKkd7h3hHPscqR34HNcdzBzhHHUd2h19HXId4x2HHWcdpR19HfMd2hzJHGYdgh1hHYIdZB3aHGcdAB4OHucd1BzjHYsd9R3IHcMd8xzzHZkddR3JHKcdvB34HdQd4h2nHQIe2By3HbMd+B38HeUc5xx7HZsdxh3+HdQd8x3fHfUd3By8HW8dyB2jHd8dsx3UHLcdlR2rHaMd8RzYHeccpR34HdAcZx1nHQke2hwGHg==","/SfqJ+UnYCg8KLsn5ScJJyMn3CcJKAMo0CcyKNcnzycNJyMnaCgbJw0oLihaKOkn6ifzJw0n+SZAKFgoXigJJxko0CcIKP0nzCf+JuonGygZJ0AoJyjBJ/gmDSgJJw0oMSgZKP4m/yf8JsknXCgJJycoJyjMJycowScNKCMnGyfxJywoDShPKDQoIyfSJ/kmwCcWKGgoGSgsKEEoMigNKPQmHCcNKAAnBCfhJ9UnSCjcJx8nCCj0JsAnZChSKMwn1yfVJ1Io7SdjKMknFijBJ2AoDSgxKD0oWCjBJxknPCgfJ/En0CdcKOUn1ScsKBYoNyjtJ0goWihPKCIo9ScDKCIoACfxJ+EnYyhjKBQn/SccJzQoPSjBJ8An7ScsKP4mDyfMJ1IoXijpJ0coxCcnKCco+CZeKBknCif+JtAnSCgQJ74nBCcRKF4oFigZJwMoSCgJJyMnAyggJzEo9CYJJ88nNCjXJ8wnPSjhJ8En/yfXJ00oAifxJsAn3Ce7J9wnvicCJ8EnWihoKEEo/CY9KOUnTygiKB0oGydNKPMnzyfxJgEoFihSKC4oPCgBKFwoACcRKA0oUihWKA0nDyfVJ/UnIChYKC4oTSg5KE8oBCcWKMknIij9JzkoDSj8JhEo7ycFKP0nGScyKA8n/ydSKPgmwSfBJ2MoAidgKA==","VzJEMj8yujKWMhUyPzIxMUsxNjJjMl0yKjKMMjEyKTI1MUsxwjJDMWcyiDK0MkMyRDJNMjUxITGaMrIyuDIxMXMyKjJiMlcyJjImMUQydTJBMZoygTIbMiAxZzIxMWcyizJzMiYxWTIkMSMytjIxMYEygTImMoEyGzJnMksxQzFLMoYyZzKpMo4ySzEsMiExGjJwMsIyczKGMpsyjDJnMhwxRDFnMigxLDE7Mi8yojI2MkcxYjIcMRoyvjKsMiYyMTIvMqwyRzK9MiMycDIbMroyZzKLMpcysjIbMkExljJHMUsyKjK2Mj8yLzKGMnAykTJHMqIytDKpMnwyTzJdMnwyKDFLMjsyvTK9MjwxVzJEMY4ylzIbMhoyRzKGMiYxNzEmMqwyuDJDMqEyHjKBMoEyIDG4MkExMjEmMSoyojI4MRgyLDFrMrgycDJBMV0yojIxMUsxXTJIMYsyHDExMSkyjjIxMiYylzI7MhsyWTIxMqcyKjEZMRoyNjIVMjYyGDIqMRsytDLCMpsyJDGXMj8yqTJ8MncyQzGnMk0yKTIZMVsycDKsMogyljJbMrYyKDFrMmcyrDKwMjUxNzEvMk8yejKyMogypzKTMqkyLDFwMiMyfDJXMpMyZzIkMWsySTJfMlcyQTGMMjcxWTKsMiAxGzIbMr0yKjG6Mg=="];
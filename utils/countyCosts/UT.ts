@@ -0,0 +1,7 @@
+// UTAH (UT) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Beaver County","Box Elder County","Cache County","Carbon County","Daggett County","Davis County","Duchesne County","Emery County","Garfield County","Grand County","Iron County","Juab County","Kane County","Millard County","Morgan County","Piute County","Rich County","Salt Lake County","San Juan County","Sanpete County","Sevier County","Summit County","Tooele County","Uintah County","Utah County","Wasatch County","Washington County","Wayne County","Weber County"];
+export const COUNTY_COLUMNS: string[] = ["nAGiAZgBrwGlAYsBqgGjAaEBmwGqAakBsAGnAY4BnwGOAZUBlQGXAagBpwGyAY8BogGyAYwBmgGoAQ==","8AH4AewBBwL8AdwBAgL6AfcB7wEBAgACCQL+AeAB9AHgAegB6AHrAQAC/gELAuEB+AELAt0B7gH/AQ==","+gECAvUBEQIGAuYBDAIEAgEC+QELAgoCEwIIAukB/gHpAfEB8QH0AQoCCAIVAuoBAgIVAucB+AEJAg==","gQCDAH8AhwCEAHsAhQCDAIIAgACFAIUAhwCEAHwAggB8AH4AfgB/AIUAhACHAH0AgwCHAHwAgACEAA==","8AH4AewBBwL8AdwBAgL6AfcB7wEBAgACCQL+AeAB9AHgAegB6AHrAQAC/gELAuEB+AELAt0B7gH/AQ==","NQA1ADUANQA1ADQANQA1ADUANQA1ADUANQA1ADQANQA0ADUANQA1ADUANQA1ADQANQA1ADQANQA1AA==","owCmAKIAqwCnAJ0AqQCmAKYAowCpAKkArACoAJ4ApQCeAKEAoQCiAKgAqACsAJ4ApgCsAJ0AowCoAA==","LQAuAC0ALwAuACsALwAuAC4ALQAvAC8ALwAuACwALgAsACwALAAtAC8ALgAwACwALgAwACsALQAvAA==","FwAYABcAGAAYABYAGAAYABgAFwAYABgAGQAYABcAGAAXABcAFwAXABgAGAAZABcAGAAZABYAFwAYAA=="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5AA==";
+export const ALIAS_KEYS: string[] = ["beaver","beaver county","box elder","box elder county","cache","cache county","carbon","carbon county","daggett","daggett county","davis","davis county","duchesne","duchesne county","emery","emery county","garfield","garfield county","grand","grand county","iron","iron county","juab","juab county","kane","kane county","millard","millard county","morgan","morgan county","piute","piute county","rich","rich county","salt lake","salt lake county","san juan","san juan county","sanpete","sanpete county","sevier","sevier county","summit","summit county","tooele","tooele county","uintah","uintah county","utah","utah county","wasatch","wasatch county","washington","washington county","wayne","wayne county","weber","weber county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAA=";
+export const PRICE_BAND_TOTALS: string[] = ["5wkMCtMJUAodCoYJOAoTCgcK4gk1CjEKWQomCpgJ+wmYCcEJwQnPCS8KJgpiCp0JDApiCosJ3gkrCg==","8AoVC9wKWQsmC4oKQQscCxAL6wo+CzoLYgsvC5wKBAucCsoKygrYCjgLLwtrC6EKFQtrC48K5wo0Cw==","+QseDOULYgwvDI4LSgwlDBkM9AtHDEMMaww4DKALDQygC9ML0wvhC0EMOAx0DKULHgx0DJML8As9DA==","Ag0nDe4Maw04DZIMUw0uDSIN/QxQDUwNdA1BDaQMFg2kDNwM3AzqDEoNQQ19DakMJw19DZcM+QxGDQ==","Cw4wDvcNdA5BDpYNXA43DisOBg5ZDlUOfQ5KDqgNHw6oDeUN5Q3zDVMOSg6GDq0NMA6GDpsNAg5PDg==","FA85DwAPfQ9KD5oOZQ9ADzQPDw9iD14Phg9TD6wOKA+sDu4O7g78DlwPUw+PD7EOOQ+PD58OCw9YDw==","JhFLERIRjxFcEaIQdxFSEUYRIRF0EXARmBFlEbQQOhG0EAARABEOEW4RZRGhEbkQSxGhEacQHRFqEQ==","OBNdEyQToRNuE6oSiRNkE1gTMxOGE4ITqhN3E7wSTBO8EhITEhMgE4ATdxOzE8ESXROzE68SLxN8Ew==","ZRiKGFEYzhibGL4XthiRGIUYYBizGK8Y1xikGNAXeRjQFz8YPxhNGK0YpBjgGNUXihjgGMMXXBipGA==","kh23HX4d+x3IHdIc4x2+HbIdjR3gHdwdBB7RHeQcph3kHGwdbB16Hdod0R0NHukctx0NHtcciR3WHQ==","7CcRKNgnVSgiKPomPSgYKAwo5yc6KDYoXigrKAwnACgMJ8YnxifUJzQoKyhnKBEnEShnKP8m4ycwKA==","RjJrMjIyrzJ8MiIxlzJyMmYyQTKUMpAyuDKFMjQxWjI0MSAyIDIuMo4yhTLBMjkxazLBMicxPTKKMg=="];
@@ -0,0 +1,7 @@
+// VIRGINIA (VA) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Accomack County","Albemarle County","Alleghany County","Amelia County","Amherst County","Appomattox County","Arlington County","Augusta County","Bath County","Bedford County","Bland County","Botetourt County","Brunswick County","Buchanan County","Buckingham County","Campbell County","Caroline County","Carroll County","Charles City County","Charlotte County","Chesterfield County","Clarke County","Craig County","Culpeper County","Cumberland County","Dickenson County","Dinwiddie County","Essex County","Fairfax County","Fauquier County","Floyd County","Fluvanna County","Franklin County","Frederick County","Giles County","Gloucester County","Goochland County","Grayson County","Greene County","Greensville County","Halifax County","Hanover County","Henrico County","Henry County","Highland County","Isle of Wight County","James City County","King George County","King William County","King and Queen County","Lancaster County","Lee County","Loudoun County","Louisa County","Lunenburg County","Madison County","Mathews County","Mecklenburg County","Middlesex County","Montgomery County","Nelson County","New Kent County","Northampton County","Northumberland County","Nottoway County","Orange County","Page County","Patrick County","Pittsylvania County","Powhatan County","Prince Edward County","Prince George County","Prince William County","Pulaski County","Rappahannock County","Richmond County","Roanoke County","Rockbridge County","Rockingham County","Russell County","Scott County","Shenandoah County","Smyth County","Southampton County","Spotsylvania County","Stafford County","Surry County","Sussex County","Tazewell County","Warren County","Washington County","Westmoreland County","Wise County","Wythe County","York County"];
+export const COUNTY_COLUMNS: string[] = ["ywG7AbkBrAHYAcABtAGsAb0BvAG9AdQBzAGwAbUBvgG0AcsB1QHBAbkBwAG0Ac0B2AHXAdIBywG/AbABywG8AcUB2AGuAbMBxgHEAdEB0gHGAcEByQGuAdUBvQHBAccBvQGzAbYBrgG/AcYBsAGsAdABtQG6AbABygG7AdcBsQHCAc8BvgG7AcUBxAHGAdEB1AG1AawBuAHLAc0BxgG2Ab4BzQHMAbABwAHSAc4BwgHAAcUBrQG0AawBrgG7AQ==","IQIPAg0C/QExAhQCBwL9ARECEAIRAiwCIwIBAggCEgIGAiICLgIWAg0CFAIHAiQCMQIwAioCIgITAgICIgIQAhsCMQL/AQUCHAIaAikCKgIcAhUCHwL/AS4CEgIWAh0CEQIFAgkC/wEUAhsCAQL9ASgCCAINAgECIQIOAjACAwIXAicCEgIOAhsCGQIcAikCLQIIAv0BCwIiAiQCGwIJAhICJAIjAgICFAIqAiUCFwIVAhoC/gEHAv0B/wEPAg==","uwGsAasBngHIAbEBpgGeAa4BrQGuAcQBvQGhAacBrwGlAbwBxQGyAasBsQGmAb4ByAHHAcIBvAGwAaIBvAGtAbYByAGfAaQBtwG1AcIBwwG3AbIBuQGfAcYBrwGyAbgBrgGlAagBnwGwAbYBoQGeAcEBpgGrAaEBuwGsAccBogGzAcABrwGsAbYBtQG3AcEBxQGmAZ4BqQG8Ab4BtgGoAa8BvQG9AaIBsQHDAb8BswGxAbYBnwGmAZ4BoAGsAQ==","ngCYAJgAkwCiAJoAlgCTAJkAmQCZAKEAngCUAJYAmQCWAJ4AoQCaAJgAmgCWAJ8AogCiAKAAngCaAJUAngCYAJwAogCUAJUAnACbAKAAoACcAJoAnQCUAKEAmQCaAJwAmQCWAJcAlACaAJwAlACTAKAAlgCYAJQAnQCYAKIAlQCbAJ8AmQCYAJwAmwCcAKAAoQCWAJMAlwCeAJ8AnACXAJkAngCeAJQAmgCgAJ8AmwCaAJwAlACWAJMAlACYAA==","/QLjAuACygISA+sC2ALKAuYC5QLmAgwD/wLQAtkC6ALWAv0CDgPtAuAC6wLYAgEDEgMSAwkD/gLpAtEC/gLkAvQCEgPNAtUC9QLyAggDCQP1AuwC+gLNAg8D5wLtAvcC5QLWAtsCzQLqAvQC0ALKAgYD2QLhAtAC/ALiAhID0gLuAgQD6ALiAvQC8QL2AgcDDQPZAsoC3gL+AgED9ALbAugCAAMAA9AC6wIJAwMD7gLrAvMCzALYAsoCzQLjAg==","PQA8ADwAPAA9ADwAPAA8ADwAPAA8AD0APQA8ADwAPAA8AD0APQA8ADwAPAA8AD0APQA9AD0APQA8ADwAPQA8AD0APQA8ADwAPQA9AD0APQA9ADwAPQA8AD0APAA8AD0APAA8ADwAPAA8AD0APAA8AD0APAA8ADwAPQA8AD0APAA8AD0APAA8AD0APQA9AD0APQA8ADwAPAA9AD0APQA8ADwAPQA9ADwAPAA9AD0APAA8AD0APAA8ADwAPAA8AA==","rQCnAKYAoQCyAKkApQChAKgApwCoALAArQCjAKUAqACkAK0AsQCpAKYAqQClAK4AsgCyALAArQCoAKMArQCnAKsAsgCiAKQAqwCrAK8AsACrAKkArACiALEAqACpAKwAqACkAKUAogCpAKsAowCiAK8ApQCnAKMArQCnALIAowCqAK8AqACnAKsAqgCrAK8AsQClAKEApgCtAK4AqwClAKgArgCuAKMAqQCwAK4AqgCpAKsAogClAKIAogCnAA==","MQAwADAALgAzADAALwAuADAAMAAwADIAMgAvAC8AMAAvADIAMwAwADAAMAAvADIAMwAzADIAMgAwAC8AMgAwADEAMwAuAC8AMQAxADIAMgAxADAAMQAuADMAMAAwADEAMAAvAC8ALgAwADEALwAuADIALwAwAC8AMQAwADMALwAxADIAMAAwADEAMQAxADIAMwAvAC4ALwAyADIAMQAvADAAMgAyAC8AMAAyADIAMQAwADEALgAvAC4ALgAwAA==","GgAZABkAGAAbABkAGQAYABkAGQAZABsAGgAYABkAGQAZABoAGwAZABkAGQAZABoAGwAbABoAGgAZABkAGgAZABoAGwAYABkAGgAaABoAGgAaABkAGgAYABsAGQAZABoAGQAZABkAGAAZABoAGAAYABoAGQAZABgAGgAZABsAGQAaABoAGQAZABoAGgAaABoAGwAZABgAGQAaABoAGgAZABkAGgAaABgAGQAaABoAGgAZABoAGAAZABgAGAAZAA=="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJAAlACkAKwAtAC8AMQAzADUAOQA7AD0APwBBAEMARQBHAEkASwBNAE8AUQBTAFUAVwBZAFsAXQBfAGMAZQBhAGcAaQBrAG0AbwBxAHMAdQB3AHkAfQB/AIMAhQCHAIkAiwCNAI8AkQCTAJUAmQCbAJ0AnwChAKMApQCnAKkAqwCtAK8AsQCzALUAtwC5ALsAvwDBAMMAxQDHAA==";
+export const ALIAS_KEYS: string[] = ["accomack","accomack county","albemarle","albemarle county","alleghany","alleghany county","amelia","amelia county","amherst","amherst county","appomattox","appomattox county","arlington","arlington county","augusta","augusta county","bath","bath county","bedford","bedford county","bland","bland county","botetourt","botetourt county","brunswick","brunswick county","buchanan","buchanan county","buckingham","buckingham county","campbell","campbell county","caroline","caroline county","carroll","carroll county","charles city","charles city county","charlotte","charlotte county","chesterfield","chesterfield county","clarke","clarke county","craig","craig county","culpeper","culpeper county","cumberland","cumberland county","dickenson","dickenson county","dinwiddie","dinwiddie county","essex","essex county","fairfax","fairfax county","fauquier","fauquier county","floyd","floyd county","fluvanna","fluvanna county","franklin","franklin county","frederick","frederick county","giles","giles county","gloucester","gloucester county","goochland","goochland county","grayson","grayson county","greene","greene county","greensville","greensville county","halifax","halifax county","hanover","hanover county","henrico","henrico county","henry","henry county","highland","highland county","isle of wight","isle of wight county","james city","james city county","king and queen","king and queen county","king george","king george county","king william","king william county","lancaster","lancaster county","lee","lee county","loudoun","loudoun county","louisa","louisa county","lunenburg","lunenburg county","madison","madison county","mathews","mathews county","mecklenburg","mecklenburg county","middlesex","middlesex county","montgomery","montgomery county","nelson","nelson county","new kent","new kent county","northampton","northampton county","northumberland","northumberland county","nottoway","nottoway county","orange","orange county","page","page county","patrick","patrick county","pittsylvania","pittsylvania county","powhatan","powhatan county","prince edward","prince edward county","prince george","prince george county","prince william","prince william county","pulaski","pulaski county","rappahannock","rappahannock county","richmond","richmond county","roanoke","roanoke county","rockbridge","rockbridge county","rockingham","rockingham county","russell","russell county","scott","scott county","shenandoah","shenandoah county","smyth","smyth county","southampton","southampton county","spotsylvania","spotsylvania county","stafford","stafford county","surry","surry county","sussex","sussex county","tazewell","tazewell county","warren","warren county","washington","washington county","westmoreland","westmoreland county","wise","wise county","wythe","wythe county","york","york county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAxADEALwAvADAAMAAyADIAMwAzADQANAA1ADUANgA2ADcANwA4ADgAOQA5ADoAOgA7ADsAPAA8AD0APQA+AD4APwA/AEAAQABBAEEAQgBCAEMAQwBEAEQARQBFAEYARgBHAEcASABIAEkASQBKAEoASwBLAEwATABNAE0ATgBOAE8ATwBQAFAAUQBRAFIAUgBTAFMAVABUAFUAVQBWAFYAVwBXAFgAWABZAFkAWgBaAFsAWwBcAFwAXQBdAF4AXgA=";
+export const PRICE_BAND_TOTALS: string[] = ["awsNCwQLtwq2CygL6Aq3ChgLEwsYC58LcwvMCuwKHQvjCm4LpwsuCwQLKAvoCnoLtguzC5QLbwsiC9EKbwsRC00LtgvBCt4KUQtHC5ALlQtRCywLYAvBCqkLGwsuC1cLFwvhCvIKwQolC04LzAq4CosL6woHC8wKaAsLC7ML1Ao2C4ULHQsLC00LRAtSC44LpAvrCrcK+wpvC3oLTgvyCh0Ldwt1C84KKAuVC38LNgspC0sLvgroCrgKwgoNCw==","nAw5DDAM4wvnDFQMFAzjC0QMPwxEDNAMpAz4CxgMSQwPDJ8M2AxaDDAMVAwUDKsM5wzkDMUMoAxODP0LoAw9DH4M5wztCwoMggx4DMEMxgyCDFgMkQztC9oMRwxaDIgMQwwNDB4M7QtRDH8M+AvkC7wMFwwzDPgLmQw3DOQMAAxiDLYMSQw3DH4MdQyDDL8M1QwXDOMLJwygDKsMfwweDEkMqAymDPoLVAzGDLAMYgxVDHwM6gsUDOQL7gs5DA==","zQ1lDVwNDw0YDoANQA0PDXANaw1wDQEO1Q0kDUQNdQ07DdANCQ6GDVwNgA1ADdwNGA4VDvYN0Q16DSkN0Q1pDa8NGA4ZDTYNsw2pDfIN9w2zDYQNwg0ZDQsOcw2GDbkNbw05DUoNGQ19DbANJA0QDe0NQw1fDSQNyg1jDRUOLA2ODecNdQ1jDa8Npg20DfANBg5DDQ8NUw3RDdwNsA1KDXUN2Q3XDSYNgA33DeENjg2BDa0NFg1ADRANGg1lDQ==","/g6RDogOOw5JD6wObA47DpwOlw6cDjIPBg9QDnAOoQ5nDgEPOg+yDogOrA5sDg0PSQ9GDycPAg+mDlUOAg+VDuAOSQ9FDmIO5A7aDiMPKA/kDrAO8w5FDjwPnw6yDuoOmw5lDnYORQ6pDuEOUA48Dh4Pbw6LDlAO+w6PDkYPWA66DhgPoQ6PDuAO1w7lDiEPNw9vDjsOfw4CDw0P4Q52DqEOCg8ID1IOrA4oDxIPug6tDt4OQg5sDjwORg6RDg==","LxC9D7QPZw96ENgPmA9nD8gPww/ID2MQNxB8D5wPzQ+TDzIQaxDeD7QP2A+YDz4QehB3EFgQMxDSD4EPMxDBDxEQehBxD44PFRALEFQQWRAVENwPJBBxD20Qyw/eDxsQxw+RD6IPcQ/VDxIQfA9oD08Qmw+3D3wPLBC7D3cQhA/mD0kQzQ+7DxEQCBAWEFIQaBCbD2cPqw8zED4QEhCiD80POxA5EH4P2A9ZEEMQ5g/ZDw8Qbg+YD2gPcg+9Dw==","YBHpEOAQkxCrEQQRxBCTEPQQ7xD0EJQRaBGoEMgQ+RC/EGMRnBEKEeAQBBHEEG8RqxGoEYkRZBH+EK0QZBHtEEIRqxGdELoQRhE8EYURihFGEQgRVRGdEJ4R9xAKEUwR8xC9EM4QnRABEUMRqBCUEIARxxDjEKgQXRHnEKgRsBASEXoR+RDnEEIRORFHEYMRmRHHEJMQ1xBkEW8RQxHOEPkQbBFqEaoQBBGKEXQREhEFEUARmhDEEJQQnhDpEA==","whNBEzgT6xINFFwTHBPrEkwTRxNME/YTyhMAEyATURMXE8UT/hNiEzgTXBMcE9ETDRQKFOsTxhNWEwUTxhNFE6QTDRT1EhITqBOeE+cT7BOoE2ATtxP1EgAUTxNiE64TSxMVEyYT9RJZE6UTABPsEuITHxM7EwATvxM/EwoUCBNqE9wTURM/E6QTmxOpE+UT+xMfE+sSLxPGE9ETpRMmE1ETzhPMEwITXBPsE9YTahNdE6IT8hIcE+wS9hJBEw==","JBaZFZAVQxVvFrQVdBVDFaQVnxWkFVgWLBZYFXgVqRVvFScWYBa6FZAVtBV0FTMWbxZsFk0WKBauFV0VKBadFQYWbxZNFWoVChYAFkkWThYKFrgVGRZNFWIWpxW6FRAWoxVtFX4VTRWxFQcWWBVEFUQWdxWTFVgVIRaXFWwWYBXCFT4WqRWXFQYW/RULFkcWXRZ3FUMVhxUoFjMWBxZ+FakVMBYuFloVtBVOFjgWwhW1FQQWShV0FUQVThWZFQ==","GRx1G2wbHxtkHJAbUBsfG4AbexuAG00cIRw0G1QbhRtLGxwcVRyWG2wbkBtQGygcZBxhHEIcHRyKGzkbHRx5G/sbZBwpG0Yb/xv1Gz4cQxz/G5QbDhwpG1ccgxuWGwUcfxtJG1obKRuNG/wbNBsgGzkcUxtvGzQbFhxzG2EcPBueGzMchRtzG/sb8hsAHDwcUhxTGx8bYxsdHCgc/BtaG4UbJRwjHDYbkBtDHC0cnhuRG/kbJhtQGyAbKht1Gw==","DiJRIUgh+yBZImwhLCH7IFwhVyFcIUIiFiIQITAhYSEnIREiSiJyIUghbCEsIR0iWSJWIjciEiJmIRUhEiJVIfAhWSIFISIh9CHqITMiOCL0IXAhAyIFIUwiXyFyIfohWyElITYhBSFpIfEhECH8IC4iLyFLIRAhCyJPIVYiGCF6ISgiYSFPIfAh5yH1ITEiRyIvIfsgPyESIh0i8SE2IWEhGiIYIhIhbCE4IiIieiFtIe4hAiEsIfwgBiFRIQ==","+C0JLQAtsyxDLiQt5CyzLBQtDy0ULSwuAC7ILOgsGS3fLPstNC4qLQAtJC3kLAcuQy5ALiEu/C0eLc0s/C0NLdotQy69LNos3i3ULR0uIi7eLSgt7S29LDYuFy0qLeQtEy3dLO4svSwhLdstyCy0LBgu5ywDLcgs9S0HLUAu0CwyLRIuGS0HLdot0S3fLRsuMS7nLLMs9yz8LQcu2y3uLBktBC4CLsosJC0iLgwuMi0lLdgtuizkLLQsviwJLQ==","4jnBOLg4azgtOtw4nDhrOMw4xzjMOBY66jmAOKA40TiXOOU5HjriOLg43DicOPE5LToqOgs65jnWOIU45jnFOMQ5LTp1OJI4yDm+OQc6DDrIOeA41zl1OCA6zzjiOM45yziVOKY4dTjZOMU5gDhsOAI6nzi7OIA43zm/OCo6iDjqOPw50Ti/OMQ5uznJOQU6GzqfOGs4rzjmOfE5xTmmONE47jnsOYI43DgMOvY56jjdOMI5cjicOGw4djjBOA=="];
@@ -0,0 +1,7 @@
+// VERMONT (VT) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Addison County","Bennington County","Caledonia County","Chittenden County","Essex County","Franklin County","Grand Isle County","Lamoille County","Orange County","Orleans County","Rutland County","Washington County","Windham County","Windsor County"];
+export const COUNTY_COLUMNS: string[] = ["mwGoAaYBlQGoAaIBiwGQAasBnAGoAYwBkgGjAQ==","6wH6AfgB4wH5AfIB2AHdAf0B6wH6AdgB4AHzAQ==","jAGZAZcBhgGYAZMBfQGBAZwBjQGZAX4BhAGUAQ==","jwCUAJMAjQCUAJIAigCLAJUAjwCUAIoAjACSAA==","GQMzAy8DDQMxAyYD+wIDAzgDGgMyA/wCCAMoAw==","OgA6ADoAOQA6ADoAOQA5ADoAOgA6ADkAOQA6AA==","kgCXAJYAkACXAJUAjQCOAJgAkgCXAI0AjwCVAA==","KQArACoAKQAqACoAKAAoACsAKQAqACgAKAAqAA==","FQAWABYAFQAWABYAFAAVABYAFQAWABUAFQAWAA=="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAA==";
+export const ALIAS_KEYS: string[] = ["addison","addison county","bennington","bennington county","caledonia","caledonia county","chittenden","chittenden county","essex","essex county","franklin","franklin county","grand isle","grand isle county","lamoille","lamoille county","orange","orange county","orleans","orleans county","rutland","rutland county","washington","washington county","windham","windham county","windsor","windsor county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQA=";
+export const PRICE_BAND_TOTALS: string[] = ["rAr8Cu8Kgwr3CtYKSwpkCgwLrwr6Ck8KcwrbCg==","zgseDBEMoAsZDPgLaAuBCy4M0QscDGwLkAv9Cw==","8AxADTMNvQw7DRoNhQyeDFAN8ww+DYkMrQwfDQ==","Eg5iDlUO2g1dDjwOog27DXIOFQ5gDqYNyg1BDg==","NA+ED3cP9w5/D14Pvw7YDpQPNw+CD8MO5w5jDw==","VhCmEJkQFBChEIAQ3A/1D7YQWRCkEOAPBBCFEA==","mhLqEt0SThLlEsQSFhIvEvoSnRLoEhoSPhLJEg==","3hQuFSEViBQpFQgVUBRpFD4V4RQsFVQUeBQNFQ==","iBrYGssaGRrTGrIa4Rn6GegaixrWGuUZCRq3Gg==","MiCCIHUgqh99IFwgch+LH5IgNSCAIHYfmh9hIA==","hivWK8krzCrRK7ArlCqtKuYriSvUK5gqvCq1Kw==","2jYqNx037jUlNwQ3tjXPNTo33TYoN7o13jUJNw=="];
@@ -0,0 +1,7 @@
+// WASHINGTON (WA) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Adams County","Asotin County","Benton County","Chelan County","Clallam County","Clark County","Columbia County","Cowlitz County","Douglas County","Ferry County","Franklin County","Garfield County","Grant County","Grays Harbor County","Island County","Jefferson County","King County","Kitsap County","Kittitas County","Klickitat County","Lewis County","Lincoln County","Mason County","Okanogan County","Pacific County","Pend Oreille County","Pierce County","San Juan County","Skagit County","Skamania County","Snohomish County","Spokane County","Stevens County","Thurston County","Wahkiakum County","Walla Walla County","Whatcom County","Whitman County","Yakima County"];
+export const COUNTY_COLUMNS: string[] = ["0AHYAdYB6QHlAdoB1gHYAdAB3QHeAd4B7gHHAdMB6wHKAdkB6gHYAcQB1wHIAcsB7gHDAesBzwHvAeIBxwHxAeIB7wHQAdkB1wHPAc8B","SgJVAlICagJlAlYCUgJUAkoCWwJcAlwCcAI+Ak4CbQJDAlYCawJUAjsCUwJAAkQCcQI6AmwCSQJyAmACPgJ0AmECcgJKAlYCUwJJAkkC","GQIjAiACNwIyAiQCIQIiAhkCKQIqAikCPAIOAh0COQISAiQCNwIiAgwCIgIQAhMCPQILAjgCGAI+Ai4CDgJAAi4CPgIZAiQCIQIYAhgC","oQCkAKMAqgCoAKQAowCkAKEApQCmAKYAqwCeAKIAqgCfAKQAqgCkAJ0AowCeAJ8AqwCcAKoAoQCsAKcAngCsAKcArAChAKQAowChAKEA","YwJtAmoChAJ/Am8CawJtAmMCdAJ2AnUCigJWAmcChgJbAm8ChQJtAlMCbAJYAlwCiwJSAoYCYgKMAnoCVgKPAnsCjAJiAm8CbAJiAmIC","OQA6ADkAOgA6ADoAOQA6ADkAOgA6ADoAOgA5ADkAOgA5ADoAOgA6ADkAOgA5ADkAOgA5ADoAOQA6ADoAOQA6ADoAOgA5ADoAOgA5ADkA","yADLAMoA0wDRAMwAywDLAMgAzgDOAM4A1QDEAMkA1ADFAMwA0wDLAMMAywDFAMYA1QDCANMAyADWANAAxADWANAA1gDIAMwAywDIAMgA","NQA2ADYAOAA4ADYANgA2ADUANwA3ADcAOQA0ADYAOAA1ADYAOAA2ADQANgA0ADUAOQA0ADgANQA5ADcANAA5ADcAOQA1ADYANgA1ADUA","HQAdAB0AHgAeAB0AHQAdAB0AHgAeAB4AHwAcAB0AHwAcAB0AHgAdABwAHQAcAB0AHwAcAB8AHQAfAB4AHAAfAB4AHwAdAB0AHQAdAB0A"];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0A";
+export const ALIAS_KEYS: string[] = ["adams","adams county","asotin","asotin county","benton","benton county","chelan","chelan county","clallam","clallam county","clark","clark county","columbia","columbia county","cowlitz","cowlitz county","douglas","douglas county","ferry","ferry county","franklin","franklin county","garfield","garfield county","grant","grant county","grays harbor","grays harbor county","island","island county","jefferson","jefferson county","king","king county","kitsap","kitsap county","kittitas","kittitas county","klickitat","klickitat county","lewis","lewis county","lincoln","lincoln county","mason","mason county","okanogan","okanogan county","pacific","pacific county","pend oreille","pend oreille county","pierce","pierce county","san juan","san juan county","skagit","skagit county","skamania","skamania county","snohomish","snohomish county","spokane","spokane county","stevens","stevens county","thurston","thurston county","wahkiakum","wahkiakum county","walla walla","walla walla county","whatcom","whatcom county","whitman","whitman county","yakima","yakima county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYA";
+export const PRICE_BAND_TOTALS: string[] = ["bguhC48LAwzsC6gLkgufC24LvwvFC8MLHgw4C4ALDgxMC6cLBgyfCysLmwtAC1ILIQwlCwsMagsnDNgLOAswDNoLJwxtC6cLmgtqC2oL","iwzDDKwMJQ0ODcoMrwzBDIsM4QznDOUMQA1VDJ0MMA1pDMkMKA3BDEgMvQxdDG8MQw1CDC0NhwxJDfoMVQxSDfwMSQ2KDMkMvAyHDIcM","qA3lDckNRw4wDuwNzA3jDagNAw4JDgcOYg5yDboNUg6GDesNSg7jDWUN3w16DYwNZQ5fDU8OpA1rDhwOcg10Dh4Oaw6nDesN3g2kDaQN","xQ4HD+YOaQ9SDw4P6Q4FD8UOJQ8rDykPhA+PDtcOdA+jDg0PbA8FD4IOAQ+XDqkOhw98DnEPwQ6NDz4Pjw6WD0APjQ/EDg0PAA/BDsEO","4g8pEAMQixB0EDAQBhAnEOIPRxBNEEsQphCsD/QPlhDADy8QjhAnEJ8PIxC0D8YPqRCZD5MQ3g+vEGAQrA+4EGIQrxDhDy8QIhDeD94P","/xBLESARrRGWEVIRIxFJEf8QaRFvEW0RyBHJEBERuBHdEFERsBFJEbwQRRHREOMQyxG2ELUR+xDREYIRyRDaEYQR0RH+EFERRBH7EPsQ","OROPE1oT8RPaE5YTXRONEzkTrROzE7ETDBQDE0sT/BMXE5UT9BONE/YSiRMLEx0TDxTwEvkTNRMVFMYTAxMeFMgTFRQ4E5UTiBM1EzUT","cxXTFZQVNRYeFtoVlxXRFXMV8RX3FfUVUBY9FYUVQBZRFdkVOBbRFTAVzRVFFVcVUxYqFT0WbxVZFgoWPRViFgwWWRZyFdkVzBVvFW8V","BBt9GyUb3xvIG4QbKBt7GwQbmxuhG58b+hvOGhYb6hviGoMb4ht7G8EadxvWGuga/Ru7GucbABsDHLQbzhoMHLYbAxwDG4MbdhsAGwAb","lSAnIbYgiSFyIS4huSAlIZUgRSFLIUkhpCFfIKcglCFzIC0hjCElIVIgISFnIHkgpyFMIJEhkSCtIV4hXyC2IWAhrSGUIC0hICGRIJEg","tyt7LNgr3SzGLIIs2yt5LLcrmSyfLJ0s+CyBK8kr6CyVK4Es4Cx5LHQrdSyJK5sr+yxuK+UssysBLbIsgSsKLbQsAS22K4EsdCyzK7Mr","2TbPN/o2MTgaONY3/TbNN9k27TfzN/E3TDijNus2PDi3NtU3NDjNN5Y2yTerNr02TziQNjk41TZVOAY4ozZeOAg4VTjYNtU3yDfVNtU2"];
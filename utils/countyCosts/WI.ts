@@ -0,0 +1,7 @@
+// WISCONSIN (WI) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Adams County","Ashland County","Barron County","Bayfield County","Brown County","Buffalo County","Burnett County","Calumet County","Chippewa County","Clark County","Columbia County","Crawford County","Dane County","Dodge County","Door County","Douglas County","Dunn County","Eau Claire County","Florence County","Fond du Lac County","Forest County","Grant County","Green County","Green Lake County","Iowa County","Iron County","Jackson County","Jefferson County","Juneau County","Kenosha County","Kewaunee County","La Crosse County","Lafayette County","Langlade County","Lincoln County","Manitowoc County","Marathon County","Marinette County","Marquette County","Menominee County","Milwaukee County","Monroe County","Oconto County","Oneida County","Outagamie County","Ozaukee County","Pepin County","Pierce County","Polk County","Portage County","Price County","Racine County","Richland County","Rock County","Rusk County","Sauk County","Sawyer County","Shawano County","Sheboygan County","St. Croix County","Taylor County","Trempealeau County","Vernon County","Vilas County","Walworth County","Washburn County","Washington County","Waukesha County","Waupaca County","Waushara County","Winnebago County","Wood County"];
+export const COUNTY_COLUMNS: string[] = ["bgGDAWgBbwF0AXwBfQFuAWgBdgFzAXEBeAGFAWwBbgF7AXoBZwF3AYgBhgF0AWgBZAGBAXsBhAF8AWwBcgFpAYkBaAF0AX8BZQGEAWUBbAGDAXYBhAF7AXIBewF4AYMBZwGGAWkBhQF4AYcBcwF5AYUBbgF+AXgBhgGBAYABZQFoAXoBZgFuAYcBcwF6AW4B","xgHfAb4ByAHOAdcB2AHFAb8B0AHMAckB0wHiAcMBxgHWAdUBvQHRAeYB5AHOAb8BuQHdAdcB4QHXAcMBywHAAecBvgHNAdsBuwHhAbsBxAHgAdAB4gHWAcsB1gHSAeABvQHkAcAB4wHSAeUBzAHTAeMBxQHaAdMB4wHeAdwBuwG/AdUBvAHGAeUBzAHUAcUB","ZAF4AV4BZgFqAXIBcgFkAV8BbAFpAWcBbgF6AWIBZAFxAXABXgFtAX4BewFqAV8BWgF2AXEBeQFyAWIBaAFgAX4BXgFqAXUBWwF6AVsBYwF5AWwBegFxAWgBcQFuAXkBXQF8AWABewFuAX0BaQFvAXsBZAF0AW4BewF3AXUBXAFfAXABXAFkAX0BaQFvAWQB","iACQAIYAiQCLAI0AjgCIAIYAiwCKAIkAjACRAIcAiACNAI0AhgCMAJIAkQCLAIYAhQCPAI0AkACNAIgAigCHAJIAhgCLAI8AhQCRAIUAiACQAIsAkQCNAIoAjQCMAJAAhgCRAIcAkQCMAJIAigCMAJEAiACOAIwAkQCPAI8AhQCGAI0AhQCIAJIAigCNAIgA","YwKFAlgCZQJtAnkCewJiAlkCbwJrAmcCdAKIAl4CYwJ4AnYCVwJxAo4CigJtAlkCUQKBAnkChgJ5Al8CaQJbAo8CWAJsAn4CUwKHAlMCYAKGAnACiAJ3AmkCeAJyAoYCVgKLAlsCiQJzAowCawJ0AokCYgJ+AnQCigKCAoACVAJZAncCVAJiAowCawJ2AmIC","NQA1ADQANQA1ADUANQA1ADQANQA1ADUANQA1ADQANQA1ADUANAA1ADUANQA1ADQANAA1ADUANQA1ADQANQA0ADUANAA1ADUANAA1ADQANQA1ADUANQA1ADUANQA1ADUANAA1ADQANQA1ADUANQA1ADUANQA1ADUANQA1ADUANAA0ADUANAA1ADUANQA1ADUA","lwCfAJQAmACaAJ0AnQCXAJUAmgCZAJgAmwCgAJYAlwCcAJwAlACbAKIAoQCaAJUAkwCfAJ0AoACdAJYAmQCVAKIAlACZAJ4AkwCgAJMAlgCgAJoAoACcAJkAnACbAKAAlAChAJUAoQCbAKEAmQCbAKEAlwCeAJsAoQCfAJ4AkwCVAJwAlACXAKEAmQCcAJcA","LAAvACwALQAtAC4ALgAsACwALQAtAC0ALgAvACwALAAuAC4ALAAuADAALwAtACwAKwAvAC4ALwAuACwALQAsADAALAAtAC8AKwAvACsALAAvAC0ALwAuAC0ALgAuAC8ALAAvACwALwAuADAALQAuAC8ALAAuAC4ALwAvAC8AKwAsAC4AKwAsADAALQAuACwA","FwAYABcAFwAXABgAGAAXABcAFwAXABcAGAAYABcAFwAYABgAFwAYABkAGAAXABcAFgAYABgAGAAYABcAFwAXABkAFwAXABgAFgAYABYAFwAYABcAGAAYABcAGAAYABgAFgAZABcAGAAYABkAFwAYABgAFwAYABgAGAAYABgAFgAXABgAFgAXABkAFwAYABcA"];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAC8AMQAzADUANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATgBPAFEAUwBVAFcAWQBbAF0AXwBhAGMAZQBnAGkAawBvAHEAcwB1AG0AdwB5AHsAfQB/AIEAgwCFAIcAiQCLAI0A";
+export const ALIAS_KEYS: string[] = ["adams","adams county","ashland","ashland county","barron","barron county","bayfield","bayfield county","brown","brown county","buffalo","buffalo county","burnett","burnett county","calumet","calumet county","chippewa","chippewa county","clark","clark county","columbia","columbia county","crawford","crawford county","dane","dane county","dodge","dodge county","door","door county","douglas","douglas county","dunn","dunn county","eau claire","eau claire county","florence","florence county","fond du lac","fond du lac county","forest","forest county","grant","grant county","green","green county","green lake","green lake county","iowa","iowa county","iron","iron county","jackson","jackson county","jefferson","jefferson county","juneau","juneau county","kenosha","kenosha county","kewaunee","kewaunee county","la crosse","la crosse county","lafayette","lafayette county","langlade","langlade county","lincoln","lincoln county","manitowoc","manitowoc county","marathon","marathon county","marinette","marinette county","marquette","marquette county","menominee","menominee county","milwaukee","milwaukee county","monroe","monroe county","oconto","oconto county","oneida","oneida county","outagamie","outagamie county","ozaukee","ozaukee county","pepin","pepin county","pierce","pierce county","polk","polk county","portage","portage county","price","price county","racine","racine county","richland","richland county","rock","rock county","rusk","rusk county","saint croix","saint croix county","sauk","sauk county","sawyer","sawyer county","shawano","shawano county","sheboygan","sheboygan county","taylor","taylor county","trempealeau","trempealeau county","vernon","vernon county","vilas","vilas county","walworth","walworth county","washburn","washburn county","washington","washington county","waukesha","waukesha county","waupaca","waupaca county","waushara","waushara county","winnebago","winnebago county","wood","wood county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2ADsAOwA3ADcAOAA4ADkAOQA6ADoAPAA8AD0APQA+AD4APwA/AEAAQABBAEEAQgBCAEMAQwBEAEQARQBFAEYARgBHAEcA";
+export const PRICE_BAND_TOTALS: string[] = ["ZgneCT0JcAmLCbcJvAlkCUEJkwmDCXYJownqCVMJZgmyCa0JOgmcCQAK8QmLCUEJJQnTCbUJ5Am3CVUJfglHCQMKPQmICcoJKwnnCSsJXQniCZQJ6QmxCX4JsgmgCeIJNwn0CUcJ7gmhCfoJgwmlCe4JZAnFCaMJ8AnWCc4JLQlBCa4JMAllCfoJgwmrCWQJ","bwrnCkEKeQqUCsAKxQptCkUKnAqMCn8KrArzClcKbwq7CrYKPgqlCgkL+gqUCkUKKQrcCr4K7QrAClkKhwpLCgwLQQqRCtMKLwrwCi8KZgrrCp0K8gq6CocKuwqpCusKOwr9CksK9wqqCgMLjAquCvcKbQrOCqwK+QrfCtcKMQpFCrcKNApuCgMLjAq0Cm0K","eAvwC0ULggudC8kLzgt2C0kLpQuVC4gLtQv8C1sLeAvEC78LQguuCxIMAwydC0kLLQvlC8cL9gvJC10LkAtPCxUMRQuaC9wLMwv5CzMLbwv0C6YL+wvDC5ALxAuyC/QLPwsGDE8LAAyzCwwMlQu3CwAMdgvXC7ULAgzoC+ALNQtJC8ALOAt3CwwMlQu9C3YL","gQz5DEkMiwymDNIM1wx/DE0MrgyeDJEMvgwFDV8MgQzNDMgMRgy3DBsNDA2mDE0MMQzuDNAM/wzSDGEMmQxTDB4NSQyjDOUMNwwCDTcMeAz9DK8MBA3MDJkMzQy7DP0MQwwPDVMMCQ28DBUNngzADAkNfwzgDL4MCw3xDOkMOQxNDMkMPAyADBUNngzGDH8M","ig0CDk0NlA2vDdsN4A2IDVENtw2nDZoNxw0ODmMNig3WDdENSg3ADSQOFQ6vDVENNQ33DdkNCA7bDWUNog1XDScOTQ2sDe4NOw0LDjsNgQ0GDrgNDQ7VDaIN1g3EDQYORw0YDlcNEg7FDR4Opw3JDRIOiA3pDccNFA76DfINPQ1RDdINQA2JDR4Opw3PDYgN","kw4LD1EOnQ64DuQO6Q6RDlUOwA6wDqMO0A4XD2cOkw7fDtoOTg7JDi0PHg+4DlUOOQ4AD+IOEQ/kDmkOqw5bDjAPUQ61DvcOPw4UDz8Oig4PD8EOFg/eDqsO3w7NDg8PSw4hD1sOGw/ODicPsA7SDhsPkQ7yDtAOHQ8DD/sOQQ5VDtsORA6SDicPsA7YDpEO","pRAdEVkQrxDKEPYQ+xCjEF0Q0hDCELUQ4hApEW8QpRDxEOwQVhDbED8RMBHKEF0QQRASEfQQIxH2EHEQvRBjEEIRWRDHEAkRRxAmEUcQnBAhEdMQKBHwEL0Q8RDfECERUxAzEWMQLRHgEDkRwhDkEC0RoxAEEeIQLxEVEQ0RSRBdEO0QTBCkEDkRwhDqEKMQ","txIvE2ESwRLcEggTDRO1EmUS5BLUEscS9BI7E3cStxIDE/4SXhLtElETQhPcEmUSSRIkEwYTNRMIE3kSzxJrElQTYRLZEhsTTxI4E08SrhIzE+USOhMCE88SAxPxEjMTWxJFE2sSPxPyEksT1BL2Ej8TtRIWE/QSQRMnEx8TURJlEv8SVBK2EksT1BL8ErUS","5BdcGHUX7hcJGDUYOhjiF3kXERgBGPQXIRhoGIsX5BcwGCsYchcaGH4YbxgJGHkXXRdRGDMYYhg1GI0X/Bd/F4EYdRcGGEgYYxdlGGMX2xdgGBIYZxgvGPwXMBgeGGAYbxdyGH8XbBgfGHgYARgjGGwY4hdDGCEYbhhUGEwYZRd5FywYaBfjF3gYARgpGOIX","ER2JHYkcGx02HWIdZx0PHY0cPh0uHSEdTh2VHZ8cER1dHVgdhhxHHasdnB02HY0ccRx+HWAdjx1iHaEcKR2THK4diRwzHXUddxySHXccCB2NHT8dlB1cHSkdXR1LHY0dgxyfHZMcmR1MHaUdLh1QHZkdDx1wHU4dmx2BHXkdeRyNHFkdfBwQHaUdLh1WHQ8d","ayfjJ7EmdSeQJ7wnwSdpJ7UmmCeIJ3snqCfvJ8cmaye3J7InriahJwUo9ieQJ7UmmSbYJ7on6Se8J8kmgye7JggosSaNJ88nnybsJ58mYifnJ5kn7ie2J4MntyelJ+cnqyb5J7sm8yemJ/8niCeqJ/MnaSfKJ6gn9SfbJ9MnoSa1JrMnpCZqJ/8niCewJ2kn","xTE9MtkwzzHqMRYyGzLDMd0w8jHiMdUxAjJJMu8wxTERMgwy1jD7MV8yUDLqMd0wwTAyMhQyQzIWMvEw3THjMGIy2TDnMSkyxzBGMscwvDFBMvMxSDIQMt0xETL/MUEy0zBTMuMwTTIAMlky4jEEMk0ywzEkMgIyTzI1Mi0yyTDdMA0yzDDEMVky4jEKMsMx"];
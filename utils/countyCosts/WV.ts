@@ -0,0 +1,7 @@
+// WEST VIRGINIA (WV) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Barbour County","Berkeley County","Boone County","Braxton County","Brooke County","Cabell County","Calhoun County","Clay County","Doddridge County","Fayette County","Gilmer County","Grant County","Greenbrier County","Hampshire County","Hancock County","Hardy County","Harrison County","Jackson County","Jefferson County","Kanawha County","Lewis County","Lincoln County","Logan County","Marion County","Marshall County","Mason County","McDowell County","Mercer County","Mineral County","Mingo County","Monongalia County","Monroe County","Morgan County","Nicholas County","Ohio County","Pendleton County","Pleasants County","Pocahontas County","Preston County","Putnam County","Raleigh County","Randolph County","Ritchie County","Roane County","Summers County","Taylor County","Tucker County","Tyler County","Upshur County","Wayne County","Webster County","Wetzel County","Wirt County","Wood County","Wyoming County"];
+export const COUNTY_COLUMNS: string[] = ["bgFpAXcBaAFfAV0BcwFlAWABeQFkAXYBZAF1AWcBXgFgAWwBdAF2AVcBZQF3AXcBVwFZAXgBcQFyAVcBWQFnAVkBYAFkAWMBagFdAWcBXgFhAWQBXgFaAWIBdgF0AXUBcgFkAWEBcgFyAV8BWQE=","vwG5AcoBuAGtAaoBxQG1Aa8BzQG0AcoBtAHIAbcBrAGuAb0BxwHJAaMBtAHKAcsBowGmAcwBwwHEAaMBpgG3AaYBrwGzAbIBuwGrAbcBrAGwAbQBrAGnAbEByQHHAcgBxAGzAa8BxQHEAa0BpQE=","ZAFfAW0BXgFVAVMBaAFbAVcBbwFaAWwBWgFrAV0BVAFWAWIBagFsAU0BWwFtAW0BTQFQAW4BZwFnAU0BUAFdAVABVwFaAVkBYAFTAV0BVAFXAVoBVAFQAVkBbAFqAWoBZwFaAVcBaAFoAVUBTwE=","egB4AH0AeAB1AHQAewB3AHUAfQB2AHwAdgB8AHcAdAB1AHkAfAB8AHIAdwB9AH0AcgBzAH0AewB7AHIAcwB3AHMAdQB2AHYAeAB0AHcAdAB1AHYAdABzAHYAfAB8AHwAewB2AHUAewB7AHUAcwA=","SQJAAlcCQAIxAi0CUAI7AjMCWwI5AlYCOQJUAj0CLwIyAkYCUwJWAiMCOgJXAlgCJAIoAloCTQJPAiMCKAI+AigCMwI5AjcCQwIuAj0CMAI0AjkCLwIpAjYCVgJTAlQCTwI4AjQCUAJPAjECJwI=","NQA1ADUANQA1ADQANQA1ADUANQA1ADUANQA1ADUANQA1ADUANQA1ADQANQA1ADUANAA0ADUANQA1ADQANAA1ADQANQA1ADUANQA0ADUANQA1ADUANQA0ADUANQA1ADUANQA1ADUANQA1ADUANAA=","hACCAIcAggB/AH4AhgCBAH8AiACAAIcAgACGAIEAfgB/AIMAhgCHAHsAgQCHAIcAfAB8AIgAhQCFAHsAfACBAHwAfwCAAIAAgwB+AIEAfgB/AIAAfgB9AIAAhwCGAIYAhQCAAH8AhQCFAH4AfAA=","KgAqACsAKgApACgAKwApACkALAApACsAKQArACkAKAApACoAKwArACgAKQArACsAKAAoACsAKwArACgAKAApACgAKQApACkAKgAoACkAKAApACkAKAAoACkAKwArACsAKwApACkAKwArACgAKAA=","FAAUABQAFAATABMAFAATABMAFAATABQAEwAUABMAEwATABQAFAAUABMAEwAUABQAEwATABQAFAAUABMAEwATABMAEwATABMAFAATABMAEwATABMAEwATABMAFAAUABQAFAATABMAFAAUABMAEwA="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtADEAMwA1AC8ANwA5ADsAPQA/AEEAQwBFAEcASQBLAE0ATwBRAFMAVQBXAFkAWwBdAF8AYQBjAGUAZwBpAGsAbQA=";
+export const ALIAS_KEYS: string[] = ["barbour","barbour county","berkeley","berkeley county","boone","boone county","braxton","braxton county","brooke","brooke county","cabell","cabell county","calhoun","calhoun county","clay","clay county","doddridge","doddridge county","fayette","fayette county","gilmer","gilmer county","grant","grant county","greenbrier","greenbrier county","hampshire","hampshire county","hancock","hancock county","hardy","hardy county","harrison","harrison county","jackson","jackson county","jefferson","jefferson county","kanawha","kanawha county","lewis","lewis county","lincoln","lincoln county","logan","logan county","marion","marion county","marshall","marshall county","mason","mason county","mcdowell","mcdowell county","mercer","mercer county","mineral","mineral county","mingo","mingo county","monongalia","monongalia county","monroe","monroe county","morgan","morgan county","nicholas","nicholas county","ohio","ohio county","pendleton","pendleton county","pleasants","pleasants county","pocahontas","pocahontas county","preston","preston county","putnam","putnam county","raleigh","raleigh county","randolph","randolph county","ritchie","ritchie county","roane","roane county","summers","summers county","taylor","taylor county","tucker","tucker county","tyler","tyler county","upshur","upshur county","wayne","wayne county","webster","webster county","wetzel","wetzel county","wirt","wirt county","wood","wood county","wyoming","wyoming county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgAXABcAGAAYABkAGQAaABoAGwAbABwAHAAdAB0AHgAeAB8AHwAgACAAIQAhACIAIgAjACMAJAAkACUAJQAmACYAJwAnACgAKAApACkAKgAqACsAKwAsACwALQAtAC4ALgAvAC8AMAAwADEAMQAyADIAMwAzADQANAA1ADUANgA2AA==";
+export const PRICE_BAND_TOTALS: string[] = ["HwkCCVEJ/wjLCLgIOQntCNIIXgnmCE0J5ghGCfUIwwjPCBQJQglMCZYI6whRCVMJmAilCFkJMAk0CZYIpQj2CKUI0gjlCOAICgm6CPUIxAjVCOYIwwipCN0ITAlCCUUJNAnkCNQINwk1CckIogg=","KAoLCloKCArUCbwJQgr2CdsJZwrvCVYK7wlPCv4JzAnYCR0KSwpVCpoJ9AlaClwKnAmpCWIKOQo9CpoJqQn/CakJ2wnuCekJEwq+Cf4JzQneCe8JzAmtCeYJVQpLCk4KPQrtCd0JQAo+CtIJpgk=","MQsUC2MLEQvdCsAKSwv/CuQKcAv4Cl8L+ApYCwcL1QrhCiYLVAteC54K/QpjC2ULoAqtCmsLQgtGC54KrQoIC60K5Ar3CvIKHAvCCgcL1grnCvgK1QqxCu8KXgtUC1cLRgv2CuYKSQtHC9sKqgo=","OgwdDGwMGgzmC8QLVAwIDO0LeQwBDGgMAQxhDBAM3gvqCy8MXQxnDKILBgxsDG4MpAuxC3QMSwxPDKILsQsRDLEL7QsADPsLJQzGCxAM3wvwCwEM3gu1C/gLZwxdDGAMTwz/C+8LUgxQDOQLrgs=","Qw0mDXUNIw3vDMgMXQ0RDfYMgg0KDXENCg1qDRkN5wzzDDgNZg1wDaYMDw11DXcNqAy1DH0NVA1YDaYMtQwaDbUM9gwJDQQNLg3KDBkN6Az5DAoN5wy5DAENcA1mDWkNWA0IDfgMWw1ZDe0Msgw=","TA4vDn4OLA74DcwNZg4aDv8Niw4TDnoOEw5zDiIO8A38DUEObw55DqoNGA5+DoAOrA25DYYOXQ5hDqoNuQ0jDrkN/w0SDg0ONw7ODSIO8Q0CDhMO8A29DQoOeQ5vDnIOYQ4RDgEOZA5iDvYNtg0=","XhBBEJAQPhAKENQPeBAsEBEQnRAlEIwQJRCFEDQQAhAOEFMQgRCLELIPKhCQEJIQtA/BD5gQbxBzELIPwQ81EMEPERAkEB8QSRDWDzQQAxAUECUQAhDFDxwQixCBEIQQcxAjEBMQdhB0EAgQvg8=","cBJTEqISUBIcEtwRihI+EiMSrxI3Ep4SNxKXEkYSFBIgEmUSkxKdEroRPBKiEqQSvBHJEaoSgRKFEroRyRFHEskRIxI2EjESWxLeEUYSFRImEjcSFBLNES4SnRKTEpYShRI1EiUSiBKGEhoSxhE=","nReAF88XfRdJF/AWtxdrF1AX3BdkF8sXZBfEF3MXQRdNF5IXwBfKF84WaRfPF9EX0BbdFtcXrheyF84W3RZ0F90WUBdjF14XiBfyFnMXQhdTF2QXQRfhFlsXyhfAF8MXshdiF1IXtRezF0cX2hY=","yhytHPwcqhx2HAQc5ByYHH0cCR2RHPgckRzxHKAcbhx6HL8c7Rz3HOIblhz8HP4c5BvxGwQd2xzfHOIb8RuhHPEbfRyQHIsctRwGHKAcbxyAHJEcbhz1G4gc9xztHPAc3xyPHH8c4hzgHHQc7hs=","JCcHJ1YnBCfQJiwmPifyJtcmYyfrJlIn6yZLJ/omyCbUJhknRydRJwom8CZWJ1gnDCYZJl4nNSc5JwomGSb7Jhkm1ybqJuUmDycuJvomySbaJusmyCYdJuImUSdHJ0onOSfpJtkmPCc6J84mFiY=","fjFhMbAxXjEqMVQwmDFMMTExvTFFMawxRTGlMVQxIjEuMXMxoTGrMTIwSjGwMbIxNDBBMLgxjzGTMTIwQTBVMUEwMTFEMT8xaTFWMFQxIzE0MUUxIjFFMDwxqzGhMaQxkzFDMTMxljGUMSgxPjA="];
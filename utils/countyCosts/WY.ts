@@ -0,0 +1,7 @@
+// WYOMING (WY) county costs - generated by generate_counties.py, do not edit
+export const COUNTY_NAMES: string[] = ["Albany County","Big Horn County","Campbell County","Carbon County","Converse County","Crook County","Fremont County","Goshen County","Hot Springs County","Johnson County","Laramie County","Lincoln County","Natrona County","Niobrara County","Park County","Platte County","Sheridan County","Sublette County","Sweetwater County","Teton County","Uinta County","Washakie County","Weston County"];
+export const COUNTY_COLUMNS: string[] = ["XQFqAWUBdgFkAWYBXAFlAXQBbgFXAWUBbQFiAXEBZwFjAVgBXQFqAW0BVwFmAQ==","qgG7AbQByQGzAbYBqgG0AccBvwGjAbQBvgGxAcMBtwGyAaQBqwG7Ab4BpAG2AQ==","qgG7AbQByQGzAbYBqgG0AccBvwGjAbQBvgGxAcMBtwGyAaQBqwG7Ab4BpAG2AQ==","YQBkAGMAZwBiAGMAYABjAGcAZQBfAGMAZQBiAGYAYwBiAF8AYQBkAGUAXwBjAA==","nAGrAaUBuQGkAacBmwGlAbcBsAGVAaYBrgGiAbQBqAGjAZYBnAGsAa8BlQGnAQ==","MQAxADEAMQAxADEAMQAxADEAMQAwADEAMQAxADEAMQAxADEAMQAxADEAMQAxAA==","lgCcAJkAoQCZAJoAlgCZAKAAnQCTAJkAnQCYAJ8AmgCYAJQAlgCcAJ0AlACaAA==","KAAqACkAKwApACkAKAApACsAKgAoACkAKgApACsAKQApACgAKAAqACoAKAApAA==","FQAWABUAFgAVABUAFQAVABYAFgAUABUAFgAVABYAFQAVABUAFQAWABYAFQAVAA=="];
+export const COUNTY_FIPS: string = "AQADAAUABwAJAAsADQAPABEAEwAVABcAGQAbAB0AHwAhACMAJQAnACkAKwAtAA==";
+export const ALIAS_KEYS: string[] = ["albany","albany county","big horn","big horn county","campbell","campbell county","carbon","carbon county","converse","converse county","crook","crook county","fremont","fremont county","goshen","goshen county","hot springs","hot springs county","johnson","johnson county","laramie","laramie county","lincoln","lincoln county","natrona","natrona county","niobrara","niobrara county","park","park county","platte","platte county","sheridan","sheridan county","sublette","sublette county","sweetwater","sweetwater county","teton","teton county","uinta","uinta county","washakie","washakie county","weston","weston county"];
+export const ALIAS_ROWS: string = "AAAAAAEAAQACAAIAAwADAAQABAAFAAUABgAGAAcABwAIAAgACQAJAAoACgALAAsADAAMAA0ADQAOAA4ADwAPABAAEAARABEAEgASABMAEwAUABQAFQAVABYAFgA=";
+export const PRICE_BAND_TOTALS: string[] = ["dgjACKEI/wicCKkIcwihCPYI0whQCKIIzgiTCOYIrQiXCFsIeAjBCM8IWQipCA==","awm1CZYJ9AmRCZ4JaAmWCesJyAlACZcJwwmICdsJogmMCVAJbQm2CcQJTgmeCQ==","YAqqCosK6QqGCpMKXQqLCuAKvQowCowKuAp9CtAKlwqBCkUKYgqrCrkKQwqTCg==","VQufC4AL3gt7C4gLUguAC9ULsgsgC4ELrQtyC8ULjAt2CzoLVwugC64LOAuICw==","SgyUDHUM0wxwDH0MRwx1DMoMpwwQDHYMogxnDLoMgQxrDC8MTAyVDKMMLQx9DA==","Pw2JDWoNyA1lDXINPA1qDb8NnA0ADWsNlw1cDa8Ndg1gDSQNQQ2KDZgNIg1yDQ==","KQ9zD1QPsg9PD1wPJg9UD6kPhg/gDlUPgQ9GD5kPYA9KDw4PKw90D4IPDA9cDw==","ExFdET4RnBE5EUYREBE+EZMRcBHAED8RaxEwEYMRShE0EfgQFRFeEWwR9hBGEQ==","3BUmFgcWZRYCFg8W2RUHFlwWORZwFQgWNBb5FUwWExb9FcEV3hUnFjUWvxUPFg==","pRrvGtAaLhvLGtgaohrQGiUbAhsgGtEa/RrCGhUb3BrGGooapxrwGv4aiBrYGg==","NySBJGIkwCRdJGokNCRiJLcklCSAI2MkjyRUJKckbiRYJBwkOSSCJJAkGiRqJA==","yS0TLvQtUi7vLfwtxi30LUkuJi7gLPUtIS7mLTkuAC7qLa4tyy0ULiIurC38LQ=="];
@@ -0,0 +1,240 @@
+/**
+ * County cost chunk manifest - generated by generate_counties.py, do not edit
+ * STATE_DEFAULTS resolve synchronously; county rows live in one lazily imported chunk per state.
+ * Chunk columns are base64 little-endian Uint16 arrays of value * FIELD_SCALES[field].
+ * COUNTY_FIPS (row-aligned) and ALIAS_ROWS are packed the same way; ALIAS_KEYS are sorted
+ * normalized county names and short aliases, so they double as an autocomplete prefix table.
+ * Unless --no-price-bands is given, PRICE_BAND_TOTALS holds one packed column per PRICE_BANDS entry: each
+ * county's total third-party closing cost (flat fees + title rate * price) at that price.
+ */
+
+export interface StateCostChunk {
+  COUNTY_NAMES: string[];
+  COUNTY_COLUMNS: string[];
+  COUNTY_FIPS: string;
+  ALIAS_KEYS: string[];
+  ALIAS_ROWS: string;
+  PRICE_BAND_TOTALS?: string[];
+}
+
+export const FIELDS: string[] = ["inspectionCost","appraisalCost","surveyFee","pestInspectionCost","lawyerFee","titleInsuranceCost","recordingFees","creditReportFee","floodDeterminationFee"];
+export const FIELD_SCALES: number[] = [1,1,1,1,1,10000,1,1,1];
+
+// State code by 2-digit state FIPS, for geoid lookups
+export const STATE_BY_FIPS: Record<string, string> = {
+  '01': 'AL',
+  '02': 'AK',
+  '04': 'AZ',
+  '05': 'AR',
+  '06': 'CA',
+  '08': 'CO',
+  '09': 'CT',
+  '10': 'DE',
+  '11': 'DC',
+  '12': 'FL',
+  '13': 'GA',
+  '15': 'HI',
+  '16': 'ID',
+  '17': 'IL',
+  '18': 'IN',
+  '19': 'IA',
+  '20': 'KS',
+  '21': 'KY',
+  '22': 'LA',
+  '23': 'ME',
+  '24': 'MD',
+  '25': 'MA',
+  '26': 'MI',
+  '27': 'MN',
+  '28': 'MS',
+  '29': 'MO',
+  '30': 'MT',
+  '31': 'NE',
+  '32': 'NV',
+  '33': 'NH',
+  '34': 'NJ',
+  '35': 'NM',
+  '36': 'NY',
+  '37': 'NC',
+  '38': 'ND',
+  '39': 'OH',
+  '40': 'OK',
+  '41': 'OR',
+  '42': 'PA',
+  '44': 'RI',
+  '45': 'SC',
+  '46': 'SD',
+  '47': 'TN',
+  '48': 'TX',
+  '49': 'UT',
+  '50': 'VT',
+  '51': 'VA',
+  '53': 'WA',
+  '54': 'WV',
+  '55': 'WI',
+  '56': 'WY',
+};
+
+// State Default costs in FIELDS order
+export const STATE_DEFAULTS: Record<string, number[]> = {
+  'AK': [600,775,750,230,875,0.0065,260,62,40],
+  'AL': [360,440,350,130,550,0.0055,130,42,22],
+  'AR': [330,410,320,115,500,0.005,120,38,22],
+  'AZ': [450,560,590,115,425,0.0058,180,49,26],
+  'CA': [600,775,750,250,1000,0.006,325,68,48],
+  'CO': [450,560,590,140,550,0.0058,190,51,28],
+  'CT': [525,600,500,200,1000,0.007,200,50,28],
+  'DC': [600,700,625,205,1100,0.007,250,60,32],
+  'DE': [415,495,400,140,700,0.006,155,46,24],
+  'FL': [475,600,590,180,750,0.006,200,55,40],
+  'GA': [420,525,405,150,675,0.0061,165,49,26],
+  'HI': [700,950,875,300,1100,0.007,375,85,65],
+  'IA': [330,410,320,115,500,0.005,120,38,18],
+  'ID': [360,440,440,115,425,0.0051,155,42,22],
+  'IL': [375,465,365,140,675,0.0058,165,49,24],
+  'IN': [360,440,350,130,550,0.0055,130,42,22],
+  'KS': [375,465,365,140,625,0.0055,155,46,24],
+  'KY': [360,440,350,130,550,0.0055,130,42,22],
+  'LA': [375,465,365,140,625,0.0055,155,46,35],
+  'MA': [525,600,500,200,1000,0.007,200,50,28],
+  'MD': [475,565,465,165,800,0.0065,180,49,26],
+  'ME': [425,500,375,140,775,0.006,145,42,22],
+  'MI': [375,465,365,140,625,0.0055,155,46,24],
+  'MN': [390,490,380,140,675,0.0058,165,49,25],
+  'MO': [360,440,350,130,550,0.0055,130,42,22],
+  'MS': [330,410,320,115,500,0.005,120,38,18],
+  'MT': [360,440,440,100,425,0.0051,155,42,22],
+  'NC': [395,490,385,140,625,0.006,155,46,24],
+  'ND': [295,375,290,100,425,0.0045,105,36,15],
+  'NE': [315,395,310,115,500,0.005,120,38,18],
+  'NH': [450,535,435,160,875,0.0065,165,46,24],
+  'NJ': [525,610,550,180,1050,0.0065,230,55,31],
+  'NM': [375,465,465,130,425,0.0055,165,46,24],
+  'NV': [415,500,510,115,425,0.0055,180,49,22],
+  'NY': [625,750,725,200,1200,0.007,275,62,35],
+  'OH': [375,465,365,140,625,0.0055,155,46,24],
+  'OK': [330,410,320,115,500,0.005,120,38,18],
+  'OR': [450,560,510,150,550,0.0058,190,51,28],
+  'PA': [440,525,425,150,750,0.0063,165,49,26],
+  'RI': [475,565,465,180,925,0.0065,175,46,25],
+  'SC': [390,480,380,135,600,0.0058,150,44,22],
+  'SD': [305,385,300,108,450,0.0048,112,38,16],
+  'TN': [390,490,375,140,625,0.0058,155,46,24],
+  'TX': [420,525,510,150,425,0.0055,180,49,28],
+  'UT': [415,500,510,130,500,0.0055,165,46,24],
+  'VA': [450,535,435,155,750,0.0063,170,49,26],
+  'VT': [415,495,400,145,800,0.006,148,42,22],
+  'WA': [475,600,550,165,625,0.006,205,55,30],
+  'WI': [375,465,365,140,625,0.0055,155,46,24],
+  'WV': [360,440,350,120,575,0.0055,130,42,20],
+  'WY': [360,440,440,100,425,0.0051,155,42,22],
+};
+
+// Purchase prices tabulated in each chunk's PRICE_BAND_TOTALS (empty with --no-price-bands)
+export const PRICE_BANDS: number[] = [50000,100000,150000,200000,250000,300000,400000,500000,750000,1000000,1500000,2000000];
+
+// State Default closing-cost totals at each PRICE_BANDS entry
+export const STATE_DEFAULT_BAND_TOTALS: Record<string, number[]> = {
+  'AK': [3917,4242,4567,4892,5217,5542,6192,6842,8467,10092,13342,16592],
+  'AL': [2299,2574,2849,3124,3399,3674,4224,4774,6149,7524,10274,13024],
+  'AR': [2105,2355,2605,2855,3105,3355,3855,4355,5605,6855,9355,11855],
+  'AZ': [2685,2975,3265,3555,3845,4135,4715,5295,6745,8195,11095,13995],
+  'CA': [4116,4416,4716,5016,5316,5616,6216,6816,8316,9816,12816,15816],
+  'CO': [2849,3139,3429,3719,4009,4299,4879,5459,6909,8359,11259,14159],
+  'CT': [3453,3803,4153,4503,4853,5203,5903,6603,8353,10103,13603,17103],
+  'DC': [3922,4272,4622,4972,5322,5672,6372,7072,8822,10572,14072,17572],
+  'DE': [2675,2975,3275,3575,3875,4175,4775,5375,6875,8375,11375,14375],
+  'FL': [3190,3490,3790,4090,4390,4690,5290,5890,7390,8890,11890,14890],
+  'GA': [2720,3025,3330,3635,3940,4245,4855,5465,6990,8515,11565,14615],
+  'HI': [4800,5150,5500,5850,6200,6550,7250,7950,9700,11450,14950,18450],
+  'IA': [2101,2351,2601,2851,3101,3351,3851,4351,5601,6851,9351,11851],
+  'ID': [2254,2509,2764,3019,3274,3529,4039,4549,5824,7099,9649,12199],
+  'IL': [2548,2838,3128,3418,3708,3998,4578,5158,6608,8058,10958,13858],
+  'IN': [2299,2574,2849,3124,3399,3674,4224,4774,6149,7524,10274,13024],
+  'KS': [2470,2745,3020,3295,3570,3845,4395,4945,6320,7695,10445,13195],
+  'KY': [2299,2574,2849,3124,3399,3674,4224,4774,6149,7524,10274,13024],
+  'LA': [2481,2756,3031,3306,3581,3856,4406,4956,6331,7706,10456,13206],
+  'MA': [3453,3803,4153,4503,4853,5203,5903,6603,8353,10103,13603,17103],
+  'MD': [3050,3375,3700,4025,4350,4675,5325,5975,7600,9225,12475,15725],
+  'ME': [2724,3024,3324,3624,3924,4224,4824,5424,6924,8424,11424,14424],
+  'MI': [2470,2745,3020,3295,3570,3845,4395,4945,6320,7695,10445,13195],
+  'MN': [2604,2894,3184,3474,3764,4054,4634,5214,6664,8114,11014,13914],
+  'MO': [2299,2574,2849,3124,3399,3674,4224,4774,6149,7524,10274,13024],
+  'MS': [2101,2351,2601,2851,3101,3351,3851,4351,5601,6851,9351,11851],
+  'MT': [2239,2494,2749,3004,3259,3514,4024,4534,5809,7084,9634,12184],
+  'NC': [2560,2860,3160,3460,3760,4060,4660,5260,6760,8260,11260,14260],
+  'ND': [1866,2091,2316,2541,2766,2991,3441,3891,5016,6141,8391,10641],
+  'NE': [2061,2311,2561,2811,3061,3311,3811,4311,5561,6811,9311,11811],
+  'NH': [3015,3340,3665,3990,4315,4640,5290,5940,7565,9190,12440,15690],
+  'NJ': [3556,3881,4206,4531,4856,5181,5831,6481,8106,9731,12981,16231],
+  'NM': [2370,2645,2920,3195,3470,3745,4295,4845,6220,7595,10345,13095],
+  'NV': [2491,2766,3041,3316,3591,3866,4416,4966,6341,7716,10466,13216],
+  'NY': [4222,4572,4922,5272,5622,5972,6672,7372,9122,10872,14372,17872],
+  'OH': [2470,2745,3020,3295,3570,3845,4395,4945,6320,7695,10445,13195],
+  'OK': [2101,2351,2601,2851,3101,3351,3851,4351,5601,6851,9351,11851],
+  'OR': [2779,3069,3359,3649,3939,4229,4809,5389,6839,8289,11189,14089],
+  'PA': [2845,3160,3475,3790,4105,4420,5050,5680,7255,8830,11980,15130],
+  'RI': [3181,3506,3831,4156,4481,4806,5456,6106,7731,9356,12606,15856],
+  'SC': [2491,2781,3071,3361,3651,3941,4521,5101,6551,8001,10901,13801],
+  'SD': [1954,2194,2434,2674,2914,3154,3634,4114,5314,6514,8914,11314],
+  'TN': [2535,2825,3115,3405,3695,3985,4565,5145,6595,8045,10945,13845],
+  'TX': [2562,2837,3112,3387,3662,3937,4487,5037,6412,7787,10537,13287],
+  'UT': [2565,2840,3115,3390,3665,3940,4490,5040,6415,7790,10540,13290],
+  'VA': [2885,3200,3515,3830,4145,4460,5090,5720,7295,8870,12020,15170],
+  'VT': [2767,3067,3367,3667,3967,4267,4867,5467,6967,8467,11467,14467],
+  'WA': [3005,3305,3605,3905,4205,4505,5105,5705,7205,8705,11705,14705],
+  'WI': [2470,2745,3020,3295,3570,3845,4395,4945,6320,7695,10445,13195],
+  'WV': [2312,2587,2862,3137,3412,3687,4237,4787,6162,7537,10287,13037],
+  'WY': [2239,2494,2749,3004,3259,3514,4024,4534,5809,7084,9634,12184],
+};
+
+// One dynamic import per state that has county rows
+export const STATE_CHUNKS: Record<string, () => Promise<StateCostChunk>> = {
+  'AL': () => import('./AL'),
+  'AR': () => import('./AR'),
+  'AZ': () => import('./AZ'),
+  'CA': () => import('./CA'),
+  'CO': () => import('./CO'),
+  'DE': () => import('./DE'),
+  'FL': () => import('./FL'),
+  'GA': () => import('./GA'),
+  'HI': () => import('./HI'),
+  'IA': () => import('./IA'),
+  'ID': () => import('./ID'),
+  'IL': () => import('./IL'),
+  'IN': () => import('./IN'),
+  'KS': () => import('./KS'),
+  'KY': () => import('./KY'),
+  'MA': () => import('./MA'),
+  'MD': () => import('./MD'),
+  'ME': () => import('./ME'),
+  'MI': () => import('./MI'),
+  'MN': () => import('./MN'),
+  'MO': () => import('./MO'),
+  'MS': () => import('./MS'),
+  'MT': () => import('./MT'),
+  'NC': () => import('./NC'),
+  'ND': () => import('./ND'),
+  'NE': () => import('./NE'),
+  'NH': () => import('./NH'),
+  'NJ': () => import('./NJ'),
+  'NM': () => import('./NM'),
+  'NV': () => import('./NV'),
+  'NY': () => import('./NY'),
+  'OH': () => import('./OH'),
+  'OK': () => import('./OK'),
+  'OR': () => import('./OR'),
+  'PA': () => import('./PA'),
+  'RI': () => import('./RI'),
+  'SC': () => import('./SC'),
+  'SD': () => import('./SD'),
+  'TN': () => import('./TN'),
+  'TX': () => import('./TX'),
+  'UT': () => import('./UT'),
+  'VA': () => import('./VA'),
+  'VT': () => import('./VT'),
+  'WA': () => import('./WA'),
+  'WI': () => import('./WI'),
+  'WV': () => import('./WV'),
+  'WY': () => import('./WY'),
+};
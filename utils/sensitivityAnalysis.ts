@@ -23,6 +23,8 @@ export interface RehabSensitivityScenario {
 /**
  * Generate purchase price sensitivity analysis
  * Shows how profit changes when purchase price varies
+ * closingCostAtPrice (calculateLoan passes its title insurance + transfer tax model) lets the
+ * price-dependent part of closing costs move with each scenario's purchase price
  */
 export function generatePurchaseSensitivity(
   basePurchasePrice: number,
@@ -33,9 +35,11 @@ export function generatePurchaseSensitivity(
   totalHoldingCosts: number,
   totalExitCosts: number,
   financingPercent: number,
-  maxLTVPercent: number = 0.75
+  maxLTVPercent: number = 0.75,
+  closingCostAtPrice?: (price: number) => number
 ): PurchaseSensitivityScenario[] {
   const scenarios = [-0.05, -0.02, 0, 0.05, 0.10, 0.15, 0.20];
+  const baseClosingCostAtPrice = closingCostAtPrice ? closingCostAtPrice(basePurchasePrice) : 0;
   
   return scenarios.map(percent => {
     const adjustedPurchasePrice = basePurchasePrice * (1 + percent);
@@ -53,9 +57,12 @@ export function generatePurchaseSensitivity(
     const adjustedGap = Math.max(0, adjustedPurchasePrice - purchaseLoanPortion);
     
     // Total buying costs = closing costs + gap
-    // Note: Closing costs may change slightly with purchase price (transfer tax, etc.)
-    // For simplicity, we'll keep closing costs constant and only adjust gap
-    const adjustedBuyingCosts = totalClosingCosts + adjustedGap;
+    // Closing costs shift by the county closing-cost change between the base and adjusted price
+    // when closingCostAtPrice is given; otherwise they are kept constant and only the gap moves
+    const closingCostChange = closingCostAtPrice
+      ? closingCostAtPrice(adjustedPurchasePrice) - baseClosingCostAtPrice
+      : 0;
+    const adjustedBuyingCosts = totalClosingCosts + closingCostChange + adjustedGap;
     
     // Total project cost basis = loan + buying costs + holding costs + exit costs
     // Note: Loan already includes purchase price and rehab budget (up to financing %)